@@ -1,9 +1,10 @@
 """Health and observability endpoints.
 
-Three endpoints:
+Four endpoints:
   GET /health        — liveness (is the process up?)
   GET /health/ready  — readiness (DB + AI provider reachable?)
   GET /metrics       — real operational metrics from DB + cost tracker
+  GET /metrics/prom  — in-process counters and latency histograms (Prometheus text)
 """
 
 from __future__ import annotations
@@ -12,8 +13,11 @@ import logging
 from datetime import UTC, datetime
 
 from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
 
 from app.core.logging_config import correlation_id_ctx
+from app.core.metrics import REGISTRY
+from app.services.ai.cascade import CascadingAIClient
 
 logger = logging.getLogger(__name__)
 
@@ -83,6 +87,10 @@ def metrics(request: Request) -> dict:
       cost_limit_usd  — configured daily cost ceiling (MAX_DAILY_COST_USD)
       queue_depth     — items currently awaiting human review
       items           — full status breakdown counts
+      dedup_index     — message_id Bloom/LRU sizing, estimated false-positive
+                        rate and lookup outcomes (null when disabled)
+      model_cascade   — per-model calls, acceptance/escalation counts, hit
+                        rate, latency and cost (null when no cascade is set)
 
     Returns:
         Structured dict with status, data, and metadata.
@@ -115,6 +123,8 @@ def metrics(request: Request) -> dict:
             "cost_limit_usd": settings.max_daily_cost_usd,
             "queue_depth": db_snapshot["queue_depth"],
             "items": item_counts,
+            "dedup_index": workflow_service.dedup_stats(),
+            "model_cascade": _cascade_stats(request),
         },
         "metadata": {
             "version": "1.0.0",
@@ -124,6 +134,23 @@ def metrics(request: Request) -> dict:
     }
 
 
+@router.get("/metrics/prom", response_class=PlainTextResponse)
+def metrics_prometheus() -> PlainTextResponse:
+    """In-process metrics in Prometheus text exposition format.
+
+    Served entirely from the in-memory registry — per-stage pipeline latency
+    histograms, ingest outcome counters, AI token/cost totals, and HTTP
+    request timings — so scrapes never query the database.
+
+    Returns:
+        Plain-text exposition (format version 0.0.4).
+    """
+    return PlainTextResponse(
+        REGISTRY.render_prometheus(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
@@ -152,7 +179,7 @@ def _check_storage(request: Request) -> str:
 def _check_ai_provider(request: Request) -> str:
     """Check that the configured AI provider is reachable.
 
-    For 'mock': always returns ok (no external call needed).
+    For 'mock' and 'simulated': always returns ok (no external call needed).
     For 'anthropic': verifies the API key is present (no live call is made
     to avoid latency and cost during readiness polling).
 
@@ -165,7 +192,7 @@ def _check_ai_provider(request: Request) -> str:
     settings = request.app.state.settings
     provider = settings.ai_provider
 
-    if provider == "mock":
+    if provider in ("mock", "simulated"):
         return "ok"
 
     if provider == "anthropic":
@@ -178,3 +205,18 @@ def _check_ai_provider(request: Request) -> str:
         return "error: anthropic_api_key not set"
 
     return f"error: unknown provider '{provider}'"
+
+
+def _cascade_stats(request: Request) -> dict | None:
+    """Return per-tier cascade statistics, or None when no cascade is configured.
+
+    Args:
+        request: FastAPI request (provides app.state.ai_client).
+
+    Returns:
+        CascadingAIClient.stats() output, or None.
+    """
+    ai_client = getattr(request.app.state, "ai_client", None)
+    if isinstance(ai_client, CascadingAIClient):
+        return ai_client.stats()
+    return None
@@ -17,13 +17,101 @@ class Settings(BaseSettings):
     app_env: str = "development"
     log_level: str = "INFO"
 
-    # AI provider: "anthropic" or "mock"
+    # Async logging: records buffered for the background writer (0 = synchronous)
+    log_queue_size: int = 10_000
+    # Behaviour when the log queue is full: "drop" or "block"
+    log_overflow_policy: str = "drop"
+    # Per-logger level overrides, e.g. {"app.services.routing_service": "WARNING"}
+    log_levels: dict[str, str] = {}
+    # 1-in-N sampling below WARNING, keyed by logger name or "logger:message"
+    log_sampling: dict[str, int] = {}
+
+    # JSON backend for storage and logs: "auto" (orjson when installed), "orjson", "stdlib"
+    json_codec: str = "auto"
+
+    # Span tracing (off by default): exporter "jsonl" appends to tracing_path, "memory" keeps in-process
+    tracing_enabled: bool = False
+    tracing_exporter: str = "jsonl"
+    tracing_path: str = "data/traces.jsonl"
+
+    # AI provider: "anthropic", "mock", or "simulated" (load/chaos testing)
     ai_provider: str = "mock"
     anthropic_api_key: str | None = None
     ai_model: str = "claude-sonnet-4-6"
+    # Cheap-model-first cascade, e.g. ["claude-haiku-4-5", "claude-sonnet-4-6"]:
+    # results that fail validation or land in the review band escalate to
+    # the next model. Empty = single model (ai_model)
+    ai_cascade_models: list[str] = []
+    # Stream AI responses: stop at the closing brace, abort malformed output early
+    ai_streaming_enabled: bool = False
+    # "text" (JSON object in the reply) | "tool" (forced tool call whose input
+    # schema is AIExtractionOutput; structurally valid, no text parsing)
+    ai_output_mode: str = "text"
+    # Follow-up turns asking for a corrected object when the AI output fails
+    # JSON parsing or schema validation (0 = fail the extraction at once)
+    ai_repair_max_attempts: int = 1
+    # Request hedging: a second identical call is sent when the first has not
+    # returned by this percentile of recent latency, within a hedge budget
+    ai_hedge_enabled: bool = False
+    ai_hedge_percentile: float = 95.0
+    ai_hedge_budget_ratio: float = 0.05
+    ai_hedge_min_samples: int = 20
+
+    # Simulated provider: log-normal latency with a slow tail, injected failure
+    # rates (0.0–1.0 per call), and a tokens-per-minute quota (0 = unlimited)
+    sim_latency_median_ms: float = 800.0
+    sim_latency_sigma: float = 0.5
+    sim_tail_probability: float = 0.01
+    sim_tail_multiplier: float = 8.0
+    sim_rate_limit_rate: float = 0.0
+    sim_timeout_rate: float = 0.0
+    sim_malformed_rate: float = 0.0
+    sim_timeout_s: float = 10.0
+    sim_tokens_per_minute: int = 0
+    sim_seed: int | None = None
+
+    # Estimated-token budget for the email body in extraction prompts (after quoted
+    # history, signatures, disclaimers and base64 are stripped); capped at 10k chars
+    prompt_max_body_tokens: int = 2500
+
+    # Keyword table for type/priority hints and mock responses: optional JSON file
+    # of {group: [[keyword, label], ...]}, re-read when its mtime changes
+    keyword_table_path: str | None = None
+    keyword_table_reload_s: float = 5.0
+
+    # Keyword-first extraction tier: rule-based results whose confidence reaches
+    # the threshold (and satisfy the type rules) skip the AI call entirely
+    keyword_tier_enabled: bool = False
+    keyword_tier_threshold: float = 0.85
+    # Also validate keyword-tier results against schemas/extraction_schema.json
+    # (off: they are trusted as built from Pydantic-typed values)
+    schema_validation_strict: bool = False
 
     # Cost controls (AI features must degrade gracefully at this limit)
     max_daily_cost_usd: float = 10.0
+    # Keep spend and in-flight reservations in the SQLite ledger so the limit
+    # holds across worker processes and restarts; reads are cached this long
+    cost_ledger_enabled: bool = True
+    cost_ledger_refresh_s: float = 1.0
+    cost_reservation_ttl_s: float = 600.0
+
+    # AI circuit breaker: opens after circuit_failure_threshold transient
+    # failures within circuit_window_s, probes after circuit_reset_timeout_s
+    # (+ up to circuit_reopen_jitter of it) with circuit_probe_budget calls.
+    # Shared through SQLite so every worker process sees one circuit.
+    circuit_failure_threshold: int = 5
+    circuit_window_s: float = 60.0
+    circuit_reset_timeout_s: float = 30.0
+    circuit_probe_budget: int = 1
+    circuit_reopen_jitter: float = 0.2
+    circuit_shared: bool = True
+
+    # In-process message_id dedup front: Bloom filter sized for the expected
+    # item count at the target false-positive rate, plus an LRU of final results
+    dedup_index_enabled: bool = True
+    dedup_bloom_capacity: int = 1_000_000
+    dedup_bloom_fp_rate: float = 0.01
+    dedup_lru_size: int = 10_000
 
     # Routing confidence thresholds
     auto_approve_threshold: float = 0.85
@@ -14,13 +14,23 @@ DEFAULT_AUTO_REJECT_THRESHOLD: float = 0.50
 # AI extraction limits
 MAX_PROMPT_BODY_CHARS: int = 10_000
 AI_MAX_TOKENS: int = 1024
+# Input tokens the provider adds for its tool-use system prompt when a
+# specific tool is forced (tool_choice {"type": "tool"}), on top of the
+# tool definition itself.
+TOOL_USE_SYSTEM_TOKENS: int = 313
 
 # ID generation
 STABLE_ID_LENGTH: int = 16
 
-# Cost tracking — USD per 1M tokens (Claude Sonnet, 2026-Q1 pricing)
-CLAUDE_SONNET_INPUT_COST_PER_1M: float = 3.00
-CLAUDE_SONNET_OUTPUT_COST_PER_1M: float = 15.00
+# Cost tracking — USD per 1M tokens as (input, output), 2026-Q1 list pricing.
+# Models not listed (and the simulated provider) are priced as DEFAULT_PRICED_MODEL.
+MODEL_PRICING_PER_1M: dict[str, tuple[float, float]] = {
+    "claude-haiku-4-5": (1.00, 5.00),
+    "claude-sonnet-4-5": (3.00, 15.00),
+    "claude-sonnet-4-6": (3.00, 15.00),
+    "claude-opus-4-1": (15.00, 75.00),
+}
+DEFAULT_PRICED_MODEL: str = "claude-sonnet-4-6"
 
 # Audit event type identifiers
 EVENT_INGESTED: str = "ingested"
@@ -28,6 +38,7 @@ EVENT_INGEST_FAILED: str = "ingest_failed"
 EVENT_APPROVED: str = "approved"
 EVENT_REJECTED: str = "rejected"
 EVENT_DESTINATIONS_WRITTEN: str = "destinations_written"
+EVENT_REROUTED: str = "rerouted"
 EVENT_SLACK_NOTIFIED: str = "slack_notified"
 
 # Actor name for automated system events
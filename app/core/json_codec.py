@@ -0,0 +1,263 @@
+"""Pluggable JSON codec used by storage, read paths, and structured logging.
+
+Two backends share one interface:
+  StdlibCodec — the standard library json module (always available)
+  OrjsonCodec — orjson, a native-code encoder/decoder (used when installed)
+
+Both backends emit compact, UTF-8 (non-ASCII-escaped) JSON. This replaced
+the spaced, ASCII-escaped json.dumps() defaults used before the codec layer;
+loads() accepts both formats, so older rows and log lines still decode.
+
+Strings, ints, bools, nulls and container layout are byte-identical across
+backends. Floats decode to the same value but may be spelled differently:
+orjson omits the exponent sign and writes small exponents in positional form
+(1e+20 → 1e20, 1.5e-05 → 0.000015). orjson writes NaN and ±Infinity as null,
+where stdlib writes the non-standard NaN/Infinity tokens. Integers outside
+the 64-bit range, which orjson cannot encode (and would decode as floats),
+are serialised and parsed by the stdlib module instead.
+
+Objects that are not natively JSON-serialisable (datetimes, UUIDs,
+dataclasses) are rendered with str() by dumps_log(), matching the previous
+json.dumps(default=str) behaviour in both backends.
+
+Select the backend once at startup with configure_json_codec(name), where
+name is "auto" (orjson if importable, else stdlib), "orjson", or "stdlib".
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+_COMPACT_SEPARATORS = (",", ":")
+# orjson decodes integers outside the 64-bit range as floats; any integer
+# that wide has at least 19 digits, so such documents go to the stdlib parser
+_LONG_DIGIT_RUN = re.compile(r"[0-9]{19}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"[0-9]{19}")
+
+
+class JSONCodec(Protocol):
+    """Interface shared by all JSON backends."""
+
+    name: str
+
+    def dumps(self, obj: Any) -> str:
+        """Serialise obj to a compact JSON string."""
+        ...
+
+    def dumps_log(self, obj: Any) -> str:
+        """Serialise obj to JSON, rendering unknown types with str()."""
+        ...
+
+    def loads(self, data: str | bytes) -> Any:
+        """Deserialise a JSON document."""
+        ...
+
+
+class StdlibCodec:
+    """JSON codec backed by the standard library json module."""
+
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> str:
+        """Serialise obj to a compact JSON string.
+
+        Args:
+            obj: JSON-serialisable value.
+
+        Returns:
+            Compact JSON text with non-ASCII characters left unescaped.
+        """
+        return json.dumps(obj, separators=_COMPACT_SEPARATORS, ensure_ascii=False)
+
+    def dumps_log(self, obj: Any) -> str:
+        """Serialise obj to JSON, rendering unknown types with str().
+
+        Args:
+            obj: Log entry dict, possibly containing arbitrary extras.
+
+        Returns:
+            Compact JSON text.
+        """
+        return json.dumps(obj, separators=_COMPACT_SEPARATORS, ensure_ascii=False, default=str)
+
+    def loads(self, data: str | bytes) -> Any:
+        """Deserialise a JSON document.
+
+        Args:
+            data: JSON text or UTF-8 bytes.
+
+        Returns:
+            Decoded Python value.
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """JSON codec backed by orjson.
+
+    Datetimes and dataclasses are passed through to the str() fallback and
+    non-string dict keys are coerced, matching StdlibCodec except for float
+    spelling and NaN/Infinity (see the module docstring). Values orjson
+    refuses to encode, such as integers beyond 64 bits, are handed to
+    StdlibCodec, as are documents containing a digit run long enough to be
+    such an integer.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Import orjson and precompute option flags.
+
+        Raises:
+            ImportError: If orjson is not installed.
+        """
+        import orjson
+
+        self._orjson = orjson
+        self._stdlib = StdlibCodec()
+        self._options = (
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_NON_STR_KEYS
+        )
+
+    def dumps(self, obj: Any) -> str:
+        """Serialise obj to a compact JSON string.
+
+        Args:
+            obj: JSON-serialisable value.
+
+        Returns:
+            Compact JSON text with non-ASCII characters left unescaped.
+
+        Raises:
+            TypeError: If obj is not JSON-serialisable by either backend.
+        """
+        try:
+            return self._orjson.dumps(obj, option=self._options).decode("utf-8")
+        except self._orjson.JSONEncodeError:
+            return self._stdlib.dumps(obj)
+
+    def dumps_log(self, obj: Any) -> str:
+        """Serialise obj to JSON, rendering unknown types with str().
+
+        Args:
+            obj: Log entry dict, possibly containing arbitrary extras.
+
+        Returns:
+            Compact JSON text.
+        """
+        try:
+            return self._orjson.dumps(obj, default=str, option=self._options).decode("utf-8")
+        except self._orjson.JSONEncodeError:
+            return self._stdlib.dumps_log(obj)
+
+    def loads(self, data: str | bytes) -> Any:
+        """Deserialise a JSON document.
+
+        Args:
+            data: JSON text or UTF-8 bytes.
+
+        Returns:
+            Decoded Python value.
+        """
+        if isinstance(data, bytes):
+            wide = _LONG_DIGIT_RUN_BYTES.search(data) is not None
+        else:
+            wide = _LONG_DIGIT_RUN.search(data) is not None
+        if wide:
+            return self._stdlib.loads(data)
+        return self._orjson.loads(data)
+
+
+def _build_codec(name: str) -> JSONCodec:
+    """Instantiate the codec named by name.
+
+    Args:
+        name: "auto", "orjson", or "stdlib".
+
+    Returns:
+        Codec instance. "auto" falls back to stdlib when orjson is missing.
+
+    Raises:
+        ValueError: If name is not a known backend.
+        ImportError: If "orjson" is requested explicitly but not installed.
+    """
+    if name == "stdlib":
+        return StdlibCodec()
+    if name == "orjson":
+        return OrjsonCodec()
+    if name == "auto":
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            return StdlibCodec()
+    raise ValueError(f"Unknown JSON codec: {name!r}")
+
+
+_codec: JSONCodec = _build_codec("auto")
+
+
+def configure_json_codec(name: str = "auto") -> JSONCodec:
+    """Select the process-wide JSON backend.
+
+    Args:
+        name: "auto", "orjson", or "stdlib".
+
+    Returns:
+        The active codec instance.
+    """
+    global _codec
+    _codec = _build_codec(name)
+    logger.debug("JSON codec configured", extra={"json_codec": _codec.name})
+    return _codec
+
+
+def get_codec() -> JSONCodec:
+    """Return the active codec instance.
+
+    Returns:
+        The codec selected by configure_json_codec() (auto-detected by default).
+    """
+    return _codec
+
+
+def dumps(obj: Any) -> str:
+    """Serialise obj with the active codec.
+
+    Args:
+        obj: JSON-serialisable value.
+
+    Returns:
+        Compact JSON text.
+    """
+    return _codec.dumps(obj)
+
+
+def dumps_log(obj: Any) -> str:
+    """Serialise a log entry with the active codec, stringifying unknown types.
+
+    Args:
+        obj: Log entry dict.
+
+    Returns:
+        Compact JSON text.
+    """
+    return _codec.dumps_log(obj)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialise a JSON document with the active codec.
+
+    Args:
+        data: JSON text or UTF-8 bytes.
+
+    Returns:
+        Decoded Python value.
+    """
+    return _codec.loads(data)
@@ -1,16 +1,40 @@
 """Structured JSON logging with correlation_id propagation.
 
 Sets up a JSON formatter that embeds correlation_id from contextvars in
-every log entry. Call configure_logging() once at application startup.
+every log entry. Call configure_logging() once at application startup and
+shutdown_logging() on exit to flush buffered records.
+
+Records are handed to a bounded in-memory queue by a QueueHandler on the
+calling thread; a QueueListener thread does the JSON formatting and stdout
+I/O so the event loop never blocks on log output. Everything that depends
+on the emitting context — the correlation_id contextvar, the record
+timestamp, and the dropped-record count — is captured at emit time.
+
+Overflow policy when the queue is full:
+  drop  — discard the record and count it (default; never stalls requests)
+  block — wait up to block_timeout_s for space, then drop and count
+A WARNING summarising dropped records is enqueued once space frees up.
+
+High-volume success-path events can be sampled with LogSamplingFilter:
+only 1 in N matching records below WARNING is kept, and each kept record
+carries sample_rate and sample_weight (the number of events it stands for)
+so log-based counts stay correct. WARNING and above are never sampled.
+Residual suppressed counts are emitted as a summary on shutdown.
 """
 
 from __future__ import annotations
 
-import json
+import atexit
+import copy
 import logging
+import queue
 import sys
+import threading
 from contextvars import ContextVar
 from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core import json_codec
 
 correlation_id_ctx: ContextVar[str] = ContextVar("correlation_id", default="")
 
@@ -49,6 +73,9 @@ class JSONFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         """Render a LogRecord as a JSON string.
 
+        The timestamp comes from record.created (emit time), not format time,
+        so entries formatted on the listener thread keep accurate timings.
+
         Args:
             record: The log record to format.
 
@@ -57,7 +84,7 @@ class JSONFormatter(logging.Formatter):
             correlation_id, and any extra fields passed via extra={}.
         """
         log_entry: dict = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -72,19 +99,317 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_entry, default=str)
+        return json_codec.dumps_log(log_entry)
+
+
+OVERFLOW_DROP = "drop"
+OVERFLOW_BLOCK = "block"
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler with a bounded queue, overflow policy, and drop accounting.
+
+    prepare() runs on the emitting thread: it snapshots correlation_id and
+    the rendered message but leaves JSON formatting to the listener thread.
+    """
 
+    def __init__(
+        self,
+        log_queue: queue.Queue[logging.LogRecord],
+        *,
+        overflow_policy: str = OVERFLOW_DROP,
+        block_timeout_s: float = 0.05,
+    ) -> None:
+        """Initialise with a bounded queue and an overflow policy.
+
+        Args:
+            log_queue: Bounded queue shared with the QueueListener.
+            overflow_policy: "drop" or "block".
+            block_timeout_s: Maximum wait for queue space under the "block" policy.
+
+        Raises:
+            ValueError: If overflow_policy is not recognised.
+        """
+        if overflow_policy not in (OVERFLOW_DROP, OVERFLOW_BLOCK):
+            raise ValueError(f"Unknown log overflow policy: {overflow_policy!r}")
+        super().__init__(log_queue)
+        self._log_queue = log_queue
+        self._overflow_policy = overflow_policy
+        self._block_timeout_s = block_timeout_s
+        self.dropped_total = 0
+        self._unreported_drops = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Capture emit-time context without formatting the record.
+
+        Args:
+            record: Record produced by the logger on the calling thread.
+
+        Returns:
+            Shallow copy with message args merged and correlation_id attached.
+        """
+        prepared = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if "correlation_id" not in prepared.__dict__:
+            prepared.correlation_id = correlation_id_ctx.get("")
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put a record on the queue, applying the overflow policy when full.
+
+        Called with the handler lock held, so the drop counters need no
+        additional synchronisation.
+
+        Args:
+            record: Prepared record to hand to the listener thread.
+        """
+        if not self._put(record):
+            self.dropped_total += 1
+            self._unreported_drops += 1
+            return
+
+        if self._unreported_drops:
+            summary = logging.LogRecord(
+                name=__name__,
+                level=logging.WARNING,
+                pathname=__file__,
+                lineno=0,
+                msg="Log records dropped — queue full",
+                args=None,
+                exc_info=None,
+            )
+            summary.dropped_count = self._unreported_drops
+            summary.dropped_total = self.dropped_total
+            summary.correlation_id = ""
+            if self._put(summary):
+                self._unreported_drops = 0
+
+    def _put(self, record: logging.LogRecord) -> bool:
+        try:
+            if self._overflow_policy == OVERFLOW_BLOCK:
+                self._log_queue.put(record, timeout=self._block_timeout_s)
+            else:
+                self._log_queue.put_nowait(record)
+        except queue.Full:
+            return False
+        return True
+
+
+class LogSamplingFilter(logging.Filter):
+    """Keep 1 in N records for configured loggers/events below WARNING.
+
+    Rules map a key to N, where the key is either a logger name (which also
+    covers its child loggers) or "<logger name>:<message template>" for a
+    single event. Event rules take precedence over logger rules, and the
+    most specific logger rule wins. Sampling is deterministic: the first
+    occurrence of each event is kept, then every Nth after it.
+
+    Each kept record is annotated with:
+      sample_rate   — the configured N
+      sample_weight — events represented by this record (itself plus the
+                      records suppressed since the previous kept one)
+    """
+
+    def __init__(self, rules: dict[str, int]) -> None:
+        """Initialise with sampling rules.
+
+        Args:
+            rules: Mapping of logger name or "logger:message" to N (≥ 1).
+
+        Raises:
+            ValueError: If any rate is below 1.
+        """
+        super().__init__()
+        invalid = {key: rate for key, rate in rules.items() if rate < 1}
+        if invalid:
+            raise ValueError(f"Log sample rates must be >= 1: {invalid}")
+        self._rules = dict(rules)
+        self._rate_cache: dict[tuple[str, str], int] = {}
+        self._pending: dict[tuple[str, str], int] = {}
+        self._seen: dict[tuple[str, str], int] = {}
+        self._emitted: dict[tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if the record should be emitted.
+
+        Args:
+            record: Candidate log record.
 
-def configure_logging(log_level: str = "INFO") -> None:
+        Returns:
+            False for records sampled away; True otherwise.
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.name, str(record.msg))
+        rate = self._rate_cache.get(key)
+        if rate is None:
+            rate = self._resolve_rate(*key)
+            self._rate_cache[key] = rate
+        if rate == 1:
+            return True
+
+        with self._lock:
+            seen = self._seen.get(key, 0)
+            self._seen[key] = seen + 1
+            if seen % rate:
+                self._pending[key] = self._pending.get(key, 0) + 1
+                return False
+            weight = self._pending.pop(key, 0) + 1
+            self._emitted[key] = self._emitted.get(key, 0) + 1
+
+        record.sample_rate = rate
+        record.sample_weight = weight
+        return True
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return per-event sampling counters.
+
+        Returns:
+            Mapping of "logger:message" to seen, emitted, and suppressed counts.
+        """
+        with self._lock:
+            return {
+                f"{name}:{msg}": {
+                    "seen": seen,
+                    "emitted": self._emitted.get((name, msg), 0),
+                    "suppressed": seen - self._emitted.get((name, msg), 0),
+                }
+                for (name, msg), seen in self._seen.items()
+            }
+
+    def drain_pending(self) -> dict[str, int]:
+        """Return and reset counts suppressed since each event's last kept record.
+
+        Returns:
+            Mapping of "logger:message" to residual suppressed count.
+        """
+        with self._lock:
+            pending = {f"{name}:{msg}": count for (name, msg), count in self._pending.items()}
+            self._pending.clear()
+        return pending
+
+    def _resolve_rate(self, logger_name: str, message: str) -> int:
+        event_rate = self._rules.get(f"{logger_name}:{message}")
+        if event_rate is not None:
+            return event_rate
+        name = logger_name
+        while name:
+            if name in self._rules:
+                return self._rules[name]
+            name = name.rpartition(".")[0]
+        return 1
+
+
+_listener: QueueListener | None = None
+_queue_handler: BoundedQueueHandler | None = None
+_sampling_filter: LogSamplingFilter | None = None
+_level_overrides: list[str] = []
+_atexit_registered = False
+
+
+def configure_logging(
+    log_level: str = "INFO",
+    *,
+    queue_size: int = 10_000,
+    overflow_policy: str = OVERFLOW_DROP,
+    logger_levels: dict[str, str] | None = None,
+    sampling: dict[str, int] | None = None,
+) -> None:
     """Configure the root logger with JSON output to stdout.
 
+    Safe to call repeatedly: any listener started by a previous call is
+    stopped (and drained) before the new configuration is installed.
+
     Args:
         log_level: Logging level string (DEBUG, INFO, WARNING, ERROR, CRITICAL).
+        queue_size: Maximum buffered records. 0 disables the background
+            thread and writes synchronously on the calling thread.
+        overflow_policy: "drop" or "block" — behaviour when the queue is full.
+        logger_levels: Per-logger level overrides, e.g. {"app.services.routing_service": "WARNING"}.
+        sampling: LogSamplingFilter rules; empty or None disables sampling.
     """
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(JSONFormatter())
+    global _listener, _queue_handler, _sampling_filter, _atexit_registered
+
+    shutdown_logging()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JSONFormatter())
 
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+
+    for logger_name in _level_overrides:
+        logging.getLogger(logger_name).setLevel(logging.NOTSET)
+    _level_overrides.clear()
+    for logger_name, level in (logger_levels or {}).items():
+        logging.getLogger(logger_name).setLevel(getattr(logging, level.upper(), logging.INFO))
+        _level_overrides.append(logger_name)
+
+    _sampling_filter = LogSamplingFilter(sampling) if sampling else None
+
+    if queue_size <= 0:
+        if _sampling_filter is not None:
+            stream_handler.addFilter(_sampling_filter)
+        root_logger.addHandler(stream_handler)
+        return
+
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    _queue_handler = BoundedQueueHandler(log_queue, overflow_policy=overflow_policy)
+    if _sampling_filter is not None:
+        _queue_handler.addFilter(_sampling_filter)
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    root_logger.addHandler(_queue_handler)
+
+    if not _atexit_registered:
+        atexit.register(shutdown_logging)
+        _atexit_registered = True
+
+
+def shutdown_logging() -> None:
+    """Stop the background listener after flushing all queued records.
+
+    Residual sampled-away counts are logged first so totals reconcile. The
+    listener's output handlers are re-attached to the root logger so
+    records emitted after shutdown are still written (synchronously).
+    """
+    global _listener, _queue_handler
+    if _sampling_filter is not None:
+        residual = _sampling_filter.drain_pending()
+        if residual:
+            logging.getLogger(__name__).warning(
+                "Sampled log events summary", extra={"suppressed_counts": residual}
+            )
+    if _listener is None or _queue_handler is None:
+        return
+
+    _listener.stop()
+    root_logger = logging.getLogger()
+    root_logger.removeHandler(_queue_handler)
+    for output_handler in _listener.handlers:
+        root_logger.addHandler(output_handler)
+    _listener = None
+    _queue_handler = None
+
+
+def dropped_log_records() -> int:
+    """Return the number of records dropped because the log queue was full.
+
+    Returns:
+        Total drops since the current configure_logging() call.
+    """
+    return _queue_handler.dropped_total if _queue_handler is not None else 0
+
+
+def log_sampling_stats() -> dict[str, dict[str, int]]:
+    """Return per-event sampling counters for the active configuration.
+
+    Returns:
+        Mapping of "logger:message" to seen/emitted/suppressed counts;
+        empty when sampling is disabled.
+    """
+    return _sampling_filter.stats() if _sampling_filter is not None else {}
@@ -0,0 +1,465 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+Three instrument types, all thread-safe and label-aware:
+  Counter   — monotonically increasing total (inc)
+  Gauge     — point-in-time value (set, inc, or a callback evaluated at scrape)
+  Histogram — cumulative bucketed distribution with _sum and _count (observe, time)
+
+Instruments register themselves on a MetricsRegistry; REGISTRY is the
+process-wide default and is rendered by GET /metrics/prom. Nothing here
+touches the database, so scrapes stay cheap regardless of table size.
+
+Application instruments shared across layers are declared at the bottom
+of this module so every service observes into the same series.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class _Metric:
+    """Shared label handling for all instrument types."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialise with a metric name, help text, and label names.
+
+        Args:
+            name: Prometheus metric name.
+            help_text: One-line description rendered as # HELP.
+            labelnames: Ordered label names every observation must supply.
+        """
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(sorted(labels))}"
+            )
+        return tuple(str(labels[label]) for label in self.labelnames)
+
+    def _format_labels(self, values: LabelValues, extra: tuple[str, str] | None = None) -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, values)]
+        if extra is not None:
+            pairs.append(f'{extra[0]}="{extra[1]}"')
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> list[str]:
+        """Return Prometheus exposition lines for this metric."""
+        header = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.metric_type}"]
+        return header + self._render_samples()
+
+    def _render_samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialise an empty counter (see _Metric for arguments)."""
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Increase the counter for the given label set.
+
+        Args:
+            amount: Non-negative increment.
+            **labels: Label values for every declared label name.
+
+        Raises:
+            ValueError: If amount is negative or labels do not match.
+        """
+        if amount < 0:
+            raise ValueError("Counter increments must be non-negative")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Return the current total for a label set (0.0 if never incremented)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{self._format_labels(key)} {_number(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Point-in-time value, set directly or computed by a callback at scrape time."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        """Initialise an empty gauge (see _Metric for arguments)."""
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {}
+        self._functions: dict[LabelValues, Callable[[], float]] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """Adjust the gauge by amount (may be negative)."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def set_function(self, fn: Callable[[], float], **labels: str) -> None:
+        """Compute the gauge value by calling fn at every scrape.
+
+        Args:
+            fn: Zero-argument callable returning the current value.
+            **labels: Label values for every declared label name.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._functions[key] = fn
+
+    def value(self, **labels: str) -> float:
+        """Return the current value for a label set."""
+        key = self._key(labels)
+        fn = self._functions.get(key)
+        return float(fn()) if fn is not None else self._values.get(key, 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, fn in functions.items():
+            values[key] = float(fn())
+        return [
+            f"{self.name}{self._format_labels(key)} {_number(value)}"
+            for key, value in sorted(values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed upper-bound buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Initialise with sorted bucket upper bounds (+Inf is implicit).
+
+        Args:
+            name: Prometheus metric name.
+            help_text: One-line description.
+            labelnames: Ordered label names.
+            buckets: Increasing finite upper bounds.
+        """
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [per-bucket counts (+Inf last)], sum, count
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation.
+
+        Args:
+            value: Observed value (seconds for latency histograms).
+            **labels: Label values for every declared label name.
+        """
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0, 0.0])
+                self._series[key] = series
+            series[0][index] += 1
+            series[1][0] += value
+            series[1][1] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observe the wall-clock duration of the with-block in seconds.
+
+        Args:
+            **labels: Label values for every declared label name.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        """Return the number of observations for a label set."""
+        series = self._series.get(self._key(labels))
+        return int(series[1][1]) if series else 0
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            snapshot = {key: (list(b), list(t)) for key, (b, t) in self._series.items()}
+        lines: list[str] = []
+        for key, (bucket_counts, (total, count)) in sorted(snapshot.items()):
+            cumulative = 0
+            for upper, bucket_count in zip((*self.buckets, math.inf), bucket_counts):
+                cumulative += bucket_count
+                le = "+Inf" if upper == math.inf else _number(upper)
+                lines.append(
+                    f"{self.name}_bucket{self._format_labels(key, ('le', le))} {cumulative}"
+                )
+            lines.append(f"{self.name}_sum{self._format_labels(key)} {_number(total)}")
+            lines.append(f"{self.name}_count{self._format_labels(key)} {int(count)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of named instruments rendered together."""
+
+    def __init__(self) -> None:
+        """Initialise an empty registry."""
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Return the counter called name, creating it on first use."""
+        return self._get_or_create(Counter, name, help_text, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Return the gauge called name, creating it on first use."""
+        return self._get_or_create(Gauge, name, help_text, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram called name, creating it on first use."""
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is None:
+                existing = Histogram(name, help_text, labelnames, buckets)
+                self._metrics[name] = existing
+        if not isinstance(existing, Histogram):
+            raise ValueError(f"Metric {name!r} already registered as {existing.metric_type}")
+        return existing
+
+    def render_prometheus(self) -> str:
+        """Render every registered metric in Prometheus text format 0.0.4.
+
+        Returns:
+            Exposition text ending with a newline.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, cls: type, name: str, help_text: str, labelnames: Sequence[str]):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is None:
+                existing = cls(name, help_text, labelnames)
+                self._metrics[name] = existing
+        if not isinstance(existing, cls):
+            raise ValueError(f"Metric {name!r} already registered as {existing.metric_type}")
+        return existing
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+REGISTRY = MetricsRegistry()
+
+# ---------------------------------------------------------------------------
+# Application instruments
+# ---------------------------------------------------------------------------
+
+PIPELINE_STAGE_SECONDS = REGISTRY.histogram(
+    "ops_pipeline_stage_duration_seconds",
+    "Wall time spent in each stage of WorkflowService.ingest.",
+    ["stage"],
+)
+INGEST_TOTAL = REGISTRY.counter(
+    "ops_ingest_total",
+    "Ingested messages by routing outcome.",
+    ["outcome"],
+)
+AI_CALLS_TOTAL = REGISTRY.counter(
+    "ops_ai_calls_total",
+    "Completed AI provider calls.",
+    ["model"],
+)
+AI_TOKENS_TOTAL = REGISTRY.counter(
+    "ops_ai_tokens_total",
+    "AI tokens consumed by direction (input/output).",
+    ["model", "direction"],
+)
+AI_COST_USD_TOTAL = REGISTRY.counter(
+    "ops_ai_cost_usd_total",
+    "AI spend in USD.",
+    ["model"],
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "ops_http_request_duration_seconds",
+    "HTTP request wall time by method and route template.",
+    ["method", "route"],
+)
+HTTP_REQUESTS_TOTAL = REGISTRY.counter(
+    "ops_http_requests_total",
+    "HTTP requests by method, route template, and status code.",
+    ["method", "route", "status"],
+)
+LOG_RECORDS_DROPPED = REGISTRY.gauge(
+    "ops_log_records_dropped",
+    "Log records dropped because the async log queue was full.",
+)
+AI_COST_TODAY_USD = REGISTRY.gauge(
+    "ops_ai_cost_today_usd",
+    "AI spend since midnight UTC as seen by the cost tracker.",
+)
+AI_TTFT_SECONDS = REGISTRY.histogram(
+    "ops_ai_time_to_first_token_seconds",
+    "Time from sending a streamed AI request to its first text delta.",
+    ["model"],
+)
+AI_STREAM_ABORTS_TOTAL = REGISTRY.counter(
+    "ops_ai_stream_aborts_total",
+    "Streamed AI responses cut off early as malformed or off-schema, by reason.",
+    ["model", "reason"],
+)
+AI_REPAIR_ATTEMPTS_TOTAL = REGISTRY.counter(
+    "ops_ai_repair_attempts_total",
+    "Repair turns sent for invalid AI output, by original failure and outcome (repaired, failed).",
+    ["failure", "outcome"],
+)
+AI_REPAIR_COST_USD = REGISTRY.counter(
+    "ops_ai_repair_cost_usd_total",
+    "AI spend on repair turns.",
+)
+AI_REPAIR_SECONDS = REGISTRY.histogram(
+    "ops_ai_repair_duration_seconds",
+    "Provider call latency of repair turns.",
+)
+AI_CASCADE_TOTAL = REGISTRY.counter(
+    "ops_ai_cascade_total",
+    "Model cascade tier outcomes (accepted, invalid_output, review_band, failed).",
+    ["tier", "outcome"],
+)
+AI_CASCADE_CALL_SECONDS = REGISTRY.histogram(
+    "ops_ai_cascade_call_duration_seconds",
+    "Provider call latency per model cascade tier.",
+    ["tier"],
+)
+AI_CASCADE_COST_USD = REGISTRY.counter(
+    "ops_ai_cascade_cost_usd_total",
+    "AI spend per model cascade tier.",
+    ["tier"],
+)
+AI_HEDGES_TOTAL = REGISTRY.counter(
+    "ops_ai_hedges_total",
+    "Slow AI calls that crossed the hedge trigger, by outcome "
+    "(primary_won, hedge_won, both_failed, skipped_budget, skipped_cost_limit).",
+    ["outcome"],
+)
+AI_HEDGE_EXTRA_COST_USD = REGISTRY.counter(
+    "ops_ai_hedge_extra_cost_usd_total",
+    "AI spend on the losing call of hedged pairs.",
+)
+AI_CIRCUIT_TRANSITIONS_TOTAL = REGISTRY.counter(
+    "ops_ai_circuit_transitions_total",
+    "AI circuit breaker state transitions (closed, open, half_open).",
+    ["from_state", "to_state"],
+)
+AI_CIRCUIT_STATE = REGISTRY.gauge(
+    "ops_ai_circuit_state",
+    "AI circuit breaker state: 0 closed, 1 half-open, 2 open.",
+)
+AI_COST_RESERVED_USD = REGISTRY.gauge(
+    "ops_ai_cost_reserved_usd",
+    "Estimated cost held by in-flight AI calls against today's budget.",
+)
+AI_COST_RESERVATION_ERROR_USD = REGISTRY.histogram(
+    "ops_ai_cost_reservation_error_usd",
+    "Reserved minus actual cost per AI call (positive = over-reserved).",
+    ["model"],
+    buckets=(-0.01, -0.001, 0, 0.001, 0.0025, 0.005, 0.01, 0.02, 0.05),
+)
+AI_INPUT_TOKEN_ESTIMATE_ERROR = REGISTRY.histogram(
+    "ops_ai_input_token_estimate_error_ratio",
+    "Relative error of the local input-token estimate: (estimated - actual) / actual.",
+    ["model"],
+    buckets=(-0.5, -0.25, -0.1, -0.05, 0, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+DEDUP_LOOKUPS_TOTAL = REGISTRY.counter(
+    "ops_dedup_lookups_total",
+    "message_id dedup checks by outcome (lru_hit, bloom_negative, bloom_positive, false_positive).",
+    ["outcome"],
+)
+DEDUP_BLOOM_BYTES = REGISTRY.gauge(
+    "ops_dedup_bloom_bytes",
+    "Memory used by the message_id Bloom filter bit array.",
+)
+DEDUP_BLOOM_FP_RATE = REGISTRY.gauge(
+    "ops_dedup_bloom_estimated_fp_rate",
+    "Estimated false-positive rate of the message_id Bloom filter at its current fill.",
+)
+EXTRACTION_TIER_TOTAL = REGISTRY.counter(
+    "ops_extraction_tier_total",
+    "Completed extractions by the tier that produced them (keyword, ai).",
+    ["tier"],
+)
+PROMPT_TOKENS_SAVED = REGISTRY.histogram(
+    "ops_prompt_tokens_saved",
+    "Estimated body tokens removed per prompt by pre-processing and truncation.",
+    buckets=(0, 50, 100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000),
+)
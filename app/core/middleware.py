@@ -6,20 +6,37 @@ CorrelationIDMiddleware
   - Sets the value in correlation_id_ctx so every log entry in that request
     automatically carries it (JSONFormatter reads from the same contextvar).
   - Echoes the value back as X-Correlation-ID in the response header.
+  - Attaches the remote trace context (traceparent header, else derived from
+    the correlation ID) so spans started during the request join one trace.
+  - Records per-request wall time in the ops_http_request_duration_seconds
+    histogram by route template (and logs it at DEBUG).
+
+Implemented as a pure ASGI middleware rather than a BaseHTTPMiddleware
+subclass: the downstream app runs in the same task with the original
+receive/send channels, so there is no extra task or memory-stream hop per
+request and streaming responses (NDJSON, SSE) are passed through unbuffered.
 """
 
 from __future__ import annotations
 
+import logging
+import time
 import uuid
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging_config import correlation_id_ctx
+from app.core.metrics import HTTP_REQUEST_SECONDS, HTTP_REQUESTS_TOTAL
+from app.core.tracing import attach_remote_context, detach_context
+
+logger = logging.getLogger(__name__)
+
+_CORRELATION_HEADER = b"x-correlation-id"
+_TRACEPARENT_HEADER = b"traceparent"
 
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
+class CorrelationIDMiddleware:
     """Assign a unique correlation ID to every HTTP request.
 
     The ID is sourced from the incoming X-Correlation-ID header (allowing
@@ -29,21 +46,92 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
     is returned to the caller in the X-Correlation-ID response header.
     """
 
-    async def dispatch(self, request: Request, call_next) -> Response:  # type: ignore[override]
-        """Wrap a request with correlation ID injection and response header.
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the next ASGI application in the chain.
 
         Args:
-            request: Incoming HTTP request.
-            call_next: Next middleware or route handler in the chain.
+            app: Downstream ASGI application or middleware.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Handle one ASGI connection, tagging HTTP requests with a correlation ID.
 
-        Returns:
-            Response with X-Correlation-ID header attached.
+        Args:
+            scope: ASGI connection scope.
+            receive: ASGI receive channel.
+            send: ASGI send channel.
         """
-        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        correlation_id = _header_value(scope, _CORRELATION_HEADER) or str(uuid.uuid4())
         token = correlation_id_ctx.set(correlation_id)
+        trace_token = attach_remote_context(
+            _header_value(scope, _TRACEPARENT_HEADER), correlation_id
+        )
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_correlation_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", [])
+                MutableHeaders(scope=message)["X-Correlation-ID"] = correlation_id
+            await send(message)
+
         try:
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_correlation_id)
         finally:
+            elapsed = time.perf_counter() - start
+            route = _route_template(scope)
+            HTTP_REQUEST_SECONDS.observe(elapsed, method=scope["method"], route=route)
+            HTTP_REQUESTS_TOTAL.inc(method=scope["method"], route=route, status=str(status_code))
+            # Timing already goes to HTTP_REQUEST_SECONDS; the per-request
+            # record is only for debugging.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Request complete",
+                    extra={
+                        "method": scope["method"],
+                        "path": scope["path"],
+                        "status_code": status_code,
+                        "duration_ms": round(elapsed * 1000, 2),
+                    },
+                )
+            detach_context(trace_token)
             correlation_id_ctx.reset(token)
-        response.headers["X-Correlation-ID"] = correlation_id
-        return response
+
+
+def _header_value(scope: Scope, name: bytes) -> str | None:
+    """Return the first value of a request header from the raw ASGI scope.
+
+    Args:
+        scope: ASGI HTTP scope.
+        name: Lower-cased header name as bytes.
+
+    Returns:
+        Decoded header value, or None when absent or empty.
+    """
+    for header_name, header_value in scope["headers"]:
+        if header_name == name:
+            return header_value.decode("latin-1") or None
+    return None
+
+
+def _route_template(scope: Scope) -> str:
+    """Return the matched route's path template, keeping metric cardinality bounded.
+
+    FastAPI records the matched APIRoute in the scope during routing; raw
+    paths are never used as labels because they embed item and job IDs.
+
+    Args:
+        scope: ASGI HTTP scope after the downstream app has run.
+
+    Returns:
+        Path template such as "/api/v1/items/{item_id}", or "unmatched".
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
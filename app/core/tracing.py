@@ -0,0 +1,408 @@
+"""Lightweight span tracing with OpenTelemetry-compatible identifiers.
+
+Spans carry W3C trace context IDs (32-hex trace_id, 16-hex span_id) and
+export as OTLP-style JSON dicts, so output can be loaded by OTel tooling
+without adding the SDK as a dependency.
+
+Context propagation:
+  - The current span lives in a contextvar, so nested `start_span` blocks
+    become children automatically, across awaits and asyncio tasks.
+  - CorrelationIDMiddleware calls attach_remote_context() per request: an
+    incoming `traceparent` header continues the caller's trace; otherwise the
+    trace_id is derived from the correlation ID so logs and spans join up.
+
+When tracing is disabled (the default) start_span() yields a shared no-op
+span and traced() calls straight through — no IDs, clocks, or allocations.
+
+Exporters:
+  InMemorySpanExporter   — keeps finished spans in a list (tests, offline analysis)
+  JsonlFileSpanExporter  — appends one JSON object per span to a file
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import re
+import secrets
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeVar
+
+from app.core import json_codec
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+STATUS_UNSET = "UNSET"
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+
+EXPORTER_MEMORY = "memory"
+EXPORTER_JSONL = "jsonl"
+
+_TRACEPARENT_RE = re.compile(r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_ZERO_TRACE_ID = "0" * 32
+_ZERO_SPAN_ID = "0" * 16
+
+
+@dataclass(frozen=True, slots=True)
+class SpanContext:
+    """Identifiers that locate a span within a trace.
+
+    span_id is empty for a remote context derived from a correlation ID —
+    the trace is known but there is no upstream parent span.
+    """
+
+    trace_id: str
+    span_id: str
+
+
+class Span:
+    """A timed, attributed unit of work within a trace."""
+
+    __slots__ = (
+        "name",
+        "context",
+        "parent_span_id",
+        "attributes",
+        "status",
+        "status_message",
+        "start_time_ns",
+        "end_time_ns",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        context: SpanContext,
+        parent_span_id: str | None,
+        attributes: dict[str, Any],
+    ) -> None:
+        """Start a span now.
+
+        Args:
+            name: Operation name, e.g. "workflow.ingest".
+            context: This span's trace and span IDs.
+            parent_span_id: Parent span ID, or None for a root span.
+            attributes: Initial key/value attributes.
+        """
+        self.name = name
+        self.context = context
+        self.parent_span_id = parent_span_id
+        self.attributes = attributes
+        self.status = STATUS_UNSET
+        self.status_message = ""
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns = 0
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach or overwrite one attribute."""
+        self.attributes[key] = value
+
+    def set_status(self, status: str, message: str = "") -> None:
+        """Set the span status (STATUS_OK or STATUS_ERROR)."""
+        self.status = status
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Mark the span failed and record the exception type and message."""
+        self.set_status(STATUS_ERROR, str(exc))
+        self.attributes["exception.type"] = type(exc).__name__
+        self.attributes["exception.message"] = str(exc)
+
+    def end(self) -> None:
+        """Stamp the end time (idempotent)."""
+        if not self.end_time_ns:
+            self.end_time_ns = time.time_ns()
+
+    @property
+    def duration_ms(self) -> float:
+        """Elapsed time in milliseconds (0.0 while the span is open)."""
+        if not self.end_time_ns:
+            return 0.0
+        return (self.end_time_ns - self.start_time_ns) / 1_000_000
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return an OTLP/JSON-style representation of the span."""
+        return {
+            "traceId": self.context.trace_id,
+            "spanId": self.context.span_id,
+            "parentSpanId": self.parent_span_id or "",
+            "name": self.name,
+            "startTimeUnixNano": self.start_time_ns,
+            "endTimeUnixNano": self.end_time_ns,
+            "attributes": self.attributes,
+            "status": {"code": self.status, "message": self.status_message},
+        }
+
+
+class _NoopSpan:
+    """Stand-in yielded when tracing is disabled; every method does nothing."""
+
+    __slots__ = ()
+
+    context = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Ignore the attribute."""
+
+    def set_status(self, status: str, message: str = "") -> None:
+        """Ignore the status."""
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Ignore the exception."""
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter(Protocol):
+    """Destination for finished spans."""
+
+    def export(self, span: Span) -> None:
+        """Receive one finished span."""
+        ...
+
+    def shutdown(self) -> None:
+        """Flush and release resources."""
+        ...
+
+
+class InMemorySpanExporter:
+    """Collects finished spans in memory, in completion order."""
+
+    def __init__(self) -> None:
+        """Initialise with no spans."""
+        self._spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Append a finished span."""
+        with self._lock:
+            self._spans.append(span)
+
+    def finished_spans(self) -> list[Span]:
+        """Return a copy of all spans exported so far."""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Discard all collected spans."""
+        with self._lock:
+            self._spans.clear()
+
+    def shutdown(self) -> None:
+        """Nothing to release."""
+
+
+class JsonlFileSpanExporter:
+    """Appends each finished span as one JSON line to a file."""
+
+    def __init__(self, path: str) -> None:
+        """Open path for appending, creating parent directories if needed.
+
+        Args:
+            path: Output file path.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._file = open(path, "a", encoding="utf-8")  # noqa: SIM115 — closed in shutdown()
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Write one span as a JSON line."""
+        line = json_codec.dumps(span.to_dict())
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        """Close the output file."""
+        with self._lock:
+            self._file.close()
+
+
+_exporter: SpanExporter | None = None
+_current_context: ContextVar[SpanContext | None] = ContextVar("span_context", default=None)
+
+
+def configure_tracing(
+    enabled: bool = False,
+    *,
+    exporter: str = EXPORTER_JSONL,
+    path: str = "data/traces.jsonl",
+) -> SpanExporter | None:
+    """Enable or disable tracing process-wide.
+
+    Safe to call repeatedly; any previously configured exporter is shut down.
+
+    Args:
+        enabled: When False, all tracing calls take the no-op fast path.
+        exporter: "jsonl" (append to path) or "memory" (InMemorySpanExporter).
+        path: Output file for the jsonl exporter.
+
+    Returns:
+        The active exporter, or None when tracing is disabled.
+
+    Raises:
+        ValueError: If exporter is not a recognised name.
+    """
+    global _exporter
+    shutdown_tracing()
+    if not enabled:
+        return None
+    if exporter == EXPORTER_MEMORY:
+        _exporter = InMemorySpanExporter()
+    elif exporter == EXPORTER_JSONL:
+        _exporter = JsonlFileSpanExporter(path)
+    else:
+        raise ValueError(f"Unknown span exporter: {exporter!r}")
+    return _exporter
+
+
+def shutdown_tracing() -> None:
+    """Shut down the active exporter and disable tracing."""
+    global _exporter
+    if _exporter is not None:
+        _exporter.shutdown()
+        _exporter = None
+
+
+def tracing_enabled() -> bool:
+    """Return True when spans are being recorded."""
+    return _exporter is not None
+
+
+@contextmanager
+def start_span(name: str, **attributes: Any) -> Iterator[Span | _NoopSpan]:
+    """Record the with-block as a span, child of the current span if any.
+
+    Exceptions escaping the block mark the span STATUS_ERROR and propagate.
+
+    Args:
+        name: Operation name.
+        **attributes: Initial span attributes.
+
+    Yields:
+        The live Span, or NOOP_SPAN when tracing is disabled.
+    """
+    exporter = _exporter
+    if exporter is None:
+        yield NOOP_SPAN
+        return
+
+    parent = _current_context.get()
+    context = SpanContext(parent.trace_id if parent else _new_trace_id(), _new_span_id())
+    span = Span(name, context, (parent.span_id or None) if parent else None, attributes)
+    token = _current_context.set(context)
+    try:
+        yield span
+    except BaseException as exc:
+        span.record_exception(exc)
+        raise
+    finally:
+        _current_context.reset(token)
+        span.end()
+        exporter.export(span)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorate a synchronous function so each call is recorded as a span.
+
+    Args:
+        name: Span name for every call.
+
+    Returns:
+        Decorator that leaves the function's signature unchanged.
+    """
+
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _exporter is None:
+                return fn(*args, **kwargs)
+            with start_span(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def attach_remote_context(
+    traceparent: str | None, correlation_id: str
+) -> Token[SpanContext | None] | None:
+    """Make an incoming trace the parent of spans started in this context.
+
+    Args:
+        traceparent: W3C traceparent header value, if supplied.
+        correlation_id: Request correlation ID, used to derive a trace_id
+            when there is no valid traceparent.
+
+    Returns:
+        Token for detach_context(), or None when tracing is disabled.
+    """
+    if _exporter is None:
+        return None
+    remote = parse_traceparent(traceparent) if traceparent else None
+    if remote is None:
+        remote = SpanContext(trace_id_from_correlation_id(correlation_id), "")
+    return _current_context.set(remote)
+
+
+def detach_context(token: Token[SpanContext | None] | None) -> None:
+    """Restore the span context saved by attach_remote_context()."""
+    if token is not None:
+        _current_context.reset(token)
+
+
+def parse_traceparent(value: str) -> SpanContext | None:
+    """Parse a W3C traceparent header.
+
+    Args:
+        value: Header value, e.g. "00-<trace_id>-<parent_id>-01".
+
+    Returns:
+        SpanContext of the remote parent, or None if the value is invalid.
+    """
+    match = _TRACEPARENT_RE.match(value.strip().lower())
+    if match is None:
+        return None
+    version, trace_id, span_id, _flags = match.groups()
+    if version == "ff" or trace_id == _ZERO_TRACE_ID or span_id == _ZERO_SPAN_ID:
+        return None
+    return SpanContext(trace_id, span_id)
+
+
+def trace_id_from_correlation_id(correlation_id: str) -> str:
+    """Derive a stable 32-hex trace_id from a correlation ID.
+
+    UUIDs map to their own hex form so the trace_id is recognisable in logs;
+    any other string is hashed.
+
+    Args:
+        correlation_id: Correlation ID from the request.
+
+    Returns:
+        32-character lowercase hex trace_id.
+    """
+    try:
+        return uuid.UUID(correlation_id).hex
+    except ValueError:
+        return hashlib.sha256(correlation_id.encode("utf-8")).hexdigest()[:32]
+
+
+def _new_trace_id() -> str:
+    return secrets.token_hex(16)
+
+
+def _new_span_id() -> str:
+    return secrets.token_hex(8)
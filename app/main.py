@@ -3,6 +3,7 @@
 Creates and configures the application with:
 - CorrelationIDMiddleware: UUID per request, sets contextvars, echoes header
 - Structured JSON logging (via configure_logging)
+- Optional span tracing (via configure_tracing)
 - Lifespan context for startup/shutdown resource management
 - CORS middleware
 - Structured error handler for BaseAppError
@@ -16,25 +17,56 @@ from __future__ import annotations
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.api.routes import audit, batch, health, process, review
-from app.config import get_settings
+from app.config import Settings, get_settings
 from app.core.exceptions import BaseAppError
-from app.core.logging_config import configure_logging, correlation_id_ctx
+from app.core.json_codec import configure_json_codec
+from app.core.logging_config import (
+    configure_logging,
+    correlation_id_ctx,
+    dropped_log_records,
+    shutdown_logging,
+)
+from app.core.metrics import (
+    AI_CIRCUIT_STATE,
+    AI_COST_RESERVED_USD,
+    AI_COST_TODAY_USD,
+    DEDUP_BLOOM_BYTES,
+    DEDUP_BLOOM_FP_RATE,
+    LOG_RECORDS_DROPPED,
+)
 from app.core.middleware import CorrelationIDMiddleware
-from app.services.ai.client import CircuitBreaker, DailyCostTracker, get_ai_client
+from app.core.tracing import configure_tracing, shutdown_tracing
+from app.services.ai.client import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
+    AIClient,
+    CircuitBreaker,
+    DailyCostTracker,
+    get_ai_client,
+)
+from app.services.ai.cost_ledger import LedgerCostTracker
+from app.services.ai.shared_breaker import SharedCircuitBreaker
 from app.services.batch_service import BatchService
 from app.services.extraction_service import ExtractionService
+from app.services.keyword_matcher import configure_keyword_table
+from app.services.message_index import MessageIdIndex
 from app.services.review_service import ReviewService
 from app.services.workflow_service import WorkflowService
 from app.storage import Storage
 
 logger = logging.getLogger(__name__)
 
+# ops_ai_circuit_state gauge values
+_CIRCUIT_STATE_VALUES = {BREAKER_CLOSED: 0, BREAKER_HALF_OPEN: 1, BREAKER_OPEN: 2}
+
 
 @asynccontextmanager
 async def lifespan(application: FastAPI) -> AsyncGenerator[None, None]:
@@ -42,26 +74,60 @@ async def lifespan(application: FastAPI) -> AsyncGenerator[None, None]:
 
     Initialises storage, AI client, and service instances on startup.
     Resources are stored on app.state so routes can access them via Request.
+    An AI client passed to create_app() replaces the configured provider.
 
     Args:
         application: The FastAPI application instance.
     """
     settings = get_settings()
-    configure_logging(settings.log_level)
+    configure_json_codec(settings.json_codec)
+    configure_logging(
+        settings.log_level,
+        queue_size=settings.log_queue_size,
+        overflow_policy=settings.log_overflow_policy,
+        logger_levels=settings.log_levels,
+        sampling=settings.log_sampling,
+    )
+    configure_keyword_table(
+        settings.keyword_table_path, reload_interval_s=settings.keyword_table_reload_s
+    )
+    configure_tracing(
+        settings.tracing_enabled,
+        exporter=settings.tracing_exporter,
+        path=settings.tracing_path,
+    )
 
     storage = Storage(settings.sqlite_path)
-    cost_tracker = DailyCostTracker()
-    circuit_breaker = CircuitBreaker()
-    ai_client = get_ai_client(settings, cost_tracker=cost_tracker, circuit_breaker=circuit_breaker)
-    extraction_service = ExtractionService(ai_client=ai_client)
+    cost_tracker = _build_cost_tracker(settings, storage)
+    circuit_breaker = _build_circuit_breaker(settings, storage)
+    ai_client: AIClient = application.state.ai_client_override or get_ai_client(
+        settings, cost_tracker=cost_tracker, circuit_breaker=circuit_breaker
+    )
+    extraction_service = ExtractionService(
+        ai_client=ai_client,
+        keyword_tier_threshold=(
+            settings.keyword_tier_threshold if settings.keyword_tier_enabled else None
+        ),
+        max_body_tokens=settings.prompt_max_body_tokens,
+        review_band=(settings.auto_reject_threshold, settings.auto_approve_threshold),
+        max_repair_attempts=settings.ai_repair_max_attempts,
+        strict_schema_validation=settings.schema_validation_strict,
+    )
+    message_index = _build_message_index(settings, storage)
 
     application.state.storage = storage
     application.state.settings = settings
     application.state.cost_tracker = cost_tracker
+    application.state.ai_client = ai_client
+    AI_COST_TODAY_USD.set_function(cost_tracker.cached_total_today)
+    AI_COST_RESERVED_USD.set_function(cost_tracker.cached_reserved_usd)
+    AI_CIRCUIT_STATE.set_function(lambda: _CIRCUIT_STATE_VALUES[circuit_breaker.cached_state])
+    LOG_RECORDS_DROPPED.set_function(dropped_log_records)
     application.state.workflow_service = WorkflowService(
         storage=storage,
         settings=settings,
         extraction_service=extraction_service,
+        message_index=message_index,
     )
     application.state.review_service = ReviewService(
         storage=storage,
@@ -78,17 +144,102 @@ async def lifespan(application: FastAPI) -> AsyncGenerator[None, None]:
             "app_env": settings.app_env,
             "ai_provider": settings.ai_provider,
             "auto_approve_threshold": settings.auto_approve_threshold,
+            "keyword_tier_enabled": settings.keyword_tier_enabled,
         },
     )
 
     yield
 
     logger.info("Application shutting down")
+    shutdown_tracing()
+    shutdown_logging()
+
+
+def _build_cost_tracker(settings: Settings, storage: Storage) -> DailyCostTracker:
+    """Build the daily cost tracker, shared via the storage ledger if enabled.
 
+    Args:
+        settings: Application settings (cost_ledger_* fields).
+        storage: Storage holding the cost ledger tables.
+
+    Returns:
+        LedgerCostTracker, or an in-process DailyCostTracker when
+        COST_LEDGER_ENABLED is false.
+    """
+    if not settings.cost_ledger_enabled:
+        return DailyCostTracker()
+    return LedgerCostTracker(
+        storage,
+        refresh_interval_s=settings.cost_ledger_refresh_s,
+        reservation_ttl_s=settings.cost_reservation_ttl_s,
+    )
+
+
+def _build_circuit_breaker(settings: Settings, storage: Storage) -> CircuitBreaker:
+    """Build the AI circuit breaker, shared via storage if enabled.
+
+    Args:
+        settings: Application settings (circuit_* fields).
+        storage: Storage holding the circuit_breakers table.
 
-def create_app() -> FastAPI:
+    Returns:
+        SharedCircuitBreaker, or an in-process CircuitBreaker when
+        CIRCUIT_SHARED is false.
+    """
+    options: dict[str, Any] = {
+        "failure_threshold": settings.circuit_failure_threshold,
+        "window_seconds": settings.circuit_window_s,
+        "reset_timeout_s": settings.circuit_reset_timeout_s,
+        "probe_budget": settings.circuit_probe_budget,
+        "reopen_jitter": settings.circuit_reopen_jitter,
+    }
+    if not settings.circuit_shared:
+        return CircuitBreaker(**options)
+    return SharedCircuitBreaker(storage, **options)
+
+
+def _build_message_index(settings: Settings, storage: Storage) -> MessageIdIndex | None:
+    """Build the message_id Bloom/LRU index from stored items, if enabled.
+
+    Args:
+        settings: Application settings (dedup_* fields).
+        storage: Storage to stream existing message_ids from.
+
+    Returns:
+        Loaded MessageIdIndex, or None when DEDUP_INDEX_ENABLED is false.
+    """
+    if not settings.dedup_index_enabled:
+        return None
+    message_index = MessageIdIndex(
+        capacity=settings.dedup_bloom_capacity,
+        fp_rate=settings.dedup_bloom_fp_rate,
+        lru_size=settings.dedup_lru_size,
+    )
+    loaded = message_index.load(storage.iter_message_ids())
+    index_stats = message_index.stats()
+    DEDUP_BLOOM_BYTES.set_function(lambda: message_index.stats()["bloom_bytes"])
+    DEDUP_BLOOM_FP_RATE.set_function(lambda: message_index.stats()["estimated_fp_rate"])
+    log = logger.warning if loaded > settings.dedup_bloom_capacity else logger.info
+    log(
+        "Message index loaded",
+        extra={
+            "message_ids": loaded,
+            "bloom_capacity": index_stats["bloom_capacity"],
+            "bloom_bytes": index_stats["bloom_bytes"],
+            "estimated_fp_rate": index_stats["estimated_fp_rate"],
+        },
+    )
+    return message_index
+
+
+def create_app(*, ai_client: AIClient | None = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
+    Args:
+        ai_client: AI client to use instead of the one built from settings
+            (benchmarks inject a latency-simulating mock). The lifespan still
+            wires every service around it.
+
     Returns:
         Configured FastAPI application with all routers and middleware attached.
     """
@@ -101,6 +252,7 @@ def create_app() -> FastAPI:
         ),
         lifespan=lifespan,
     )
+    application.state.ai_client_override = ai_client
 
     # CorrelationIDMiddleware is added last so it is outermost — it runs
     # first on every incoming request and last on every outgoing response.
@@ -66,7 +66,7 @@ class EmailRepository:
         status: str,
         confidence: float,
         extraction: dict,
-    ) -> None:
+    ) -> bool:
         """Persist a new intake item to storage.
 
         Args:
@@ -75,15 +75,20 @@ class EmailRepository:
             status: Initial routing status.
             confidence: Extraction confidence score.
             extraction: Serialisable extraction dict.
+
+        Returns:
+            True if inserted, False if an item for this message already existed.
         """
-        self._storage.create_item(
+        created = self._storage.create_item(
             item_id=item_id,
             message_id=message_id,
             status=status,
             confidence=confidence,
             extraction=extraction,
         )
-        logger.debug("Item created", extra={"item_id": item_id, "status": status})
+        if created:
+            logger.debug("Item created", extra={"item_id": item_id, "status": status})
+        return created
 
     def list_items_paginated(
         self, page: int, page_size: int, *, status: str | None = None
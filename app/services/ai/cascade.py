@@ -0,0 +1,141 @@
+"""Cheap-model-first cascade across AI clients.
+
+CascadingAIClient holds an ordered list of tiers (cheapest/fastest first)
+and per-tier statistics. ExtractionService drives the cascade: it sends
+the prompt to the first tier and escalates to the next one when
+
+  - the response fails _parse_and_validate  ("invalid_output"), or
+  - compute_confidence lands in the human-review band  ("review_band")
+
+The last tier's result is final. Provider errors (cost limit, open circuit,
+exhausted retries) propagate rather than escalate — every tier shares the
+same cost tracker and circuit breaker.
+
+Per-tier outcomes, call latency and cost go to ops_ai_cascade_* metrics and
+to stats(), which GET /metrics and the eval harness report.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.metrics import AI_CASCADE_CALL_SECONDS, AI_CASCADE_COST_USD, AI_CASCADE_TOTAL
+from app.services.ai.client import AICallResult, AIClient
+
+OUTCOME_ACCEPTED = "accepted"
+ESCALATE_INVALID_OUTPUT = "invalid_output"
+ESCALATE_REVIEW_BAND = "review_band"
+OUTCOME_FAILED = "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class CascadeTier:
+    """One model in the cascade."""
+
+    name: str
+    client: AIClient
+
+
+@dataclass(slots=True)
+class _TierStats:
+    calls: int = 0
+    latency_ms_total: float = 0.0
+    cost_usd_total: float = 0.0
+    outcomes: dict[str, int] = field(default_factory=dict)
+
+
+class CascadingAIClient(AIClient):
+    """Ordered AI clients, cheapest first, with per-tier hit statistics."""
+
+    def __init__(self, tiers: Sequence[CascadeTier]) -> None:
+        """Initialise with at least one tier.
+
+        Args:
+            tiers: Tiers in escalation order (cheapest first).
+
+        Raises:
+            ValueError: If tiers is empty or names repeat.
+        """
+        if not tiers:
+            raise ValueError("CascadingAIClient needs at least one tier")
+        names = [tier.name for tier in tiers]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicate cascade tier names: {names}")
+        self._tiers = tuple(tiers)
+        self._stats = {tier.name: _TierStats() for tier in tiers}
+
+    @property
+    def tiers(self) -> tuple[CascadeTier, ...]:
+        """Tiers in escalation order."""
+        return self._tiers
+
+    async def complete(self, system: str, user: str, *, prompt_version: str = "") -> AICallResult:
+        """Complete with the first tier only (callers that do not escalate).
+
+        Args:
+            system: System prompt.
+            user: User-turn message.
+            prompt_version: Prompt version tag embedded in the result.
+
+        Returns:
+            The first tier's AICallResult.
+        """
+        return await self._tiers[0].client.complete(system, user, prompt_version=prompt_version)
+
+    def record(self, tier: str, outcome: str, ai_results: Sequence[AICallResult] = ()) -> None:
+        """Record how one tier's attempt at an email ended.
+
+        Latency and cost are summed over every provider call the attempt
+        made (the extraction call plus any repair turns), so the cascade
+        cost matches what the cost tracker charged.
+
+        Args:
+            tier: Tier name.
+            outcome: OUTCOME_ACCEPTED, ESCALATE_INVALID_OUTPUT,
+                ESCALATE_REVIEW_BAND or OUTCOME_FAILED.
+            ai_results: Results of the attempt's provider calls, in order;
+                empty when the provider returned none.
+        """
+        stats = self._stats[tier]
+        stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+        AI_CASCADE_TOTAL.inc(tier=tier, outcome=outcome)
+        if not ai_results:
+            return
+        latency_ms = sum(result.latency_ms for result in ai_results)
+        cost_usd = sum(result.cost_usd for result in ai_results)
+        stats.calls += 1
+        stats.latency_ms_total += latency_ms
+        stats.cost_usd_total += cost_usd
+        AI_CASCADE_CALL_SECONDS.observe(latency_ms / 1000, tier=tier)
+        AI_CASCADE_COST_USD.inc(cost_usd, tier=tier)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-tier call counts, hit rate, latency and cost.
+
+        hit_rate is the share of a tier's completed calls whose result was
+        accepted without escalating.
+
+        Returns:
+            Dict of tier name → stats, in escalation order.
+        """
+        report: dict[str, dict[str, Any]] = {}
+        for tier in self._tiers:
+            stats = self._stats[tier.name]
+            accepted = stats.outcomes.get(OUTCOME_ACCEPTED, 0)
+            report[tier.name] = {
+                "calls": stats.calls,
+                "accepted": accepted,
+                "escalated": {
+                    reason: stats.outcomes.get(reason, 0)
+                    for reason in (ESCALATE_INVALID_OUTPUT, ESCALATE_REVIEW_BAND)
+                },
+                "failed": stats.outcomes.get(OUTCOME_FAILED, 0),
+                "hit_rate": round(accepted / stats.calls, 4) if stats.calls else 0.0,
+                "avg_latency_ms": (
+                    round(stats.latency_ms_total / stats.calls, 1) if stats.calls else 0.0
+                ),
+                "cost_usd": round(stats.cost_usd_total, 6),
+            }
+        return report
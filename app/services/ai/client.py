@@ -2,9 +2,11 @@
 
 Four components:
 - AICallResult      — Pydantic result model (text, tokens, cost, latency)
-- DailyCostTracker  — Accumulates USD cost per calendar day, enforces daily limit
-- CircuitBreaker    — Opens after N failures in a rolling time window
+- DailyCostTracker  — Accumulates USD cost per calendar day, enforces daily limit,
+                      and holds reservations for calls still in flight
+- CircuitBreaker    — Closed/open/half-open breaker over a rolling failure window
 - AIClient / MockAIClient / AnthropicClient — Provider abstraction
+  (SimulatedAIClient in simulated.py adds latency, failures and quotas for load tests)
 
 Use get_ai_client(settings, cost_tracker, circuit_breaker) at startup.
 The cost_tracker and circuit_breaker should be singletons shared across requests.
@@ -13,26 +15,51 @@ The cost_tracker and circuit_breaker should be singletons shared across requests
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import random
 import time
 from abc import ABC, abstractmethod
 from collections import deque
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import UTC, date, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel
 
 from app.config import Settings
 from app.core.constants import (
     AI_MAX_TOKENS,
-    CLAUDE_SONNET_INPUT_COST_PER_1M,
-    CLAUDE_SONNET_OUTPUT_COST_PER_1M,
+    DEFAULT_PRICED_MODEL,
+    MODEL_PRICING_PER_1M,
+    TOOL_USE_SYSTEM_TOKENS,
 )
-from app.core.exceptions import CostLimitExceeded, RetryableError
+from app.core.exceptions import CostLimitExceeded, RateLimitExceeded, RetryableError
 from app.core.logging_config import correlation_id_ctx
+from app.core.metrics import (
+    AI_CALLS_TOTAL,
+    AI_CIRCUIT_TRANSITIONS_TOTAL,
+    AI_COST_RESERVATION_ERROR_USD,
+    AI_COST_USD_TOTAL,
+    AI_HEDGE_EXTRA_COST_USD,
+    AI_HEDGES_TOTAL,
+    AI_INPUT_TOKEN_ESTIMATE_ERROR,
+    AI_STREAM_ABORTS_TOTAL,
+    AI_TOKENS_TOTAL,
+    AI_TTFT_SECONDS,
+)
+from app.core.tracing import start_span
+from app.services.ai.hedging import HedgePolicy
+from app.services.ai.prompts import EXTRACTION_TOOL, EXTRACTION_TOOL_NAME
+from app.services.ai.streaming import JSONStreamGuard
+from app.services.ai.tokens import estimate_tokens
+from app.services.keyword_matcher import GROUP_MOCK_RESPONSE, get_keyword_matcher
+
+if TYPE_CHECKING:
+    from anthropic.types import ToolChoiceToolParam
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +78,23 @@ class AICallResult(BaseModel):
     latency_ms: float
     model: str
     prompt_version: str
+    # Streaming only: time to the first text delta, and why the stream was
+    # cut off early (see app/services/ai/streaming.py), if it was.
+    ttft_ms: float | None = None
+    stream_abort: str | None = None
+    # Tool output mode only: the arguments of the forced extraction tool
+    # call, already decoded (text holds the same object as JSON).
+    tool_input: dict[str, Any] | None = None
+
+
+# Output modes: "text" asks for a JSON object in the reply text; "tool"
+# forces a call to EXTRACTION_TOOL, whose input schema is AIExtractionOutput.
+OUTPUT_MODE_TEXT = "text"
+OUTPUT_MODE_TOOL = "tool"
+OUTPUT_MODES = (OUTPUT_MODE_TEXT, OUTPUT_MODE_TOOL)
+
+# Input tokens added by the tool definition and the provider's tool-use prompt
+TOOL_INPUT_TOKENS = estimate_tokens(json.dumps(EXTRACTION_TOOL)) + TOOL_USE_SYSTEM_TOKENS
 
 
 # ---------------------------------------------------------------------------
@@ -97,15 +141,106 @@ _MOCK_VAGUE: dict[str, Any] = {
     "extraction_notes": ["mock extraction — no keyword match, low confidence expected"],
 }
 
+# mock_response keyword-table label → canned payload
+_MOCK_PAYLOADS: dict[str, dict[str, Any]] = {
+    "purchase_request": _MOCK_PURCHASE,
+    "customer_issue": _MOCK_ISSUE,
+    "ops_change": _MOCK_OPS,
+}
+
 
 # ---------------------------------------------------------------------------
 # Cost tracking
 # ---------------------------------------------------------------------------
 
 
+@dataclass(frozen=True, slots=True)
+class CallEstimate:
+    """Pre-call estimate of a provider call's size and worst-case cost."""
+
+    tokens_in: int
+    cost_usd: float
+    # Cost of the input alone: what an abandoned (cancelled) call is charged
+    input_cost_usd: float = 0.0
+
+
+def model_pricing(model: str) -> tuple[float, float]:
+    """Return (input, output) USD per million tokens for a model.
+
+    Args:
+        model: Model identifier.
+
+    Returns:
+        The model's MODEL_PRICING_PER_1M entry, or DEFAULT_PRICED_MODEL's.
+    """
+    return MODEL_PRICING_PER_1M.get(model, MODEL_PRICING_PER_1M[DEFAULT_PRICED_MODEL])
+
+
+def price_call(model: str, tokens_in: int, tokens_out: int) -> float:
+    """Return the USD cost of a call at the model's per-token pricing.
+
+    Args:
+        model: Model identifier.
+        tokens_in: Input tokens.
+        tokens_out: Output tokens.
+
+    Returns:
+        Cost in USD.
+    """
+    input_per_1m, output_per_1m = model_pricing(model)
+    return (tokens_in * input_per_1m + tokens_out * output_per_1m) / 1_000_000
+
+
+def estimate_call(
+    system: str,
+    user: str,
+    *,
+    model: str = DEFAULT_PRICED_MODEL,
+    max_output_tokens: int = AI_MAX_TOKENS,
+    extra_input_tokens: int = 0,
+) -> CallEstimate:
+    """Estimate input tokens locally and price the call at its worst case.
+
+    Output is priced at max_output_tokens, so the reservation only shrinks
+    when the call completes.
+
+    Args:
+        system: System prompt.
+        user: User-turn message.
+        model: Model whose pricing applies.
+        max_output_tokens: Output token cap sent with the request.
+        extra_input_tokens: Input tokens sent besides the prompts (tool
+            definitions; see TOOL_INPUT_TOKENS).
+
+    Returns:
+        CallEstimate with estimated input tokens and worst-case cost.
+    """
+    tokens_in = estimate_tokens(system) + estimate_tokens(user) + extra_input_tokens
+    input_cost_usd = price_call(model, tokens_in, 0)
+    return CallEstimate(
+        tokens_in=tokens_in,
+        cost_usd=input_cost_usd + price_call(model, 0, max_output_tokens),
+        input_cost_usd=input_cost_usd,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class CostReservation:
+    """Budget held by DailyCostTracker for one in-flight call."""
+
+    amount_usd: float
+    day: date
+    # Set by trackers that persist reservations (see cost_ledger.py)
+    reservation_id: str | None = None
+
+
 class DailyCostTracker:
     """Accumulates AI API spend per calendar day (UTC) and enforces a daily limit.
 
+    Calls reserve their estimated cost before they start and reconcile it
+    with the actual cost when they finish, so a burst of concurrent calls
+    cannot overshoot the limit by more than the estimation error.
+
     Resets automatically at UTC midnight. Not thread-safe for concurrent writes,
     but safe for the single-process async use case.
     """
@@ -114,6 +249,7 @@ class DailyCostTracker:
         """Initialise with zero cost for today."""
         self._date: date = datetime.now(UTC).date()
         self._total_usd: float = 0.0
+        self._reserved_usd: float = 0.0
 
     def add(self, cost_usd: float) -> None:
         """Add cost_usd to today's running total, resetting if the date changed.
@@ -121,11 +257,99 @@ class DailyCostTracker:
         Args:
             cost_usd: Cost in USD to record for this call.
         """
+        self._roll_over()
+        self._total_usd += cost_usd
+
+    def reserve(self, cost_usd: float, limit_usd: float) -> CostReservation:
+        """Hold cost_usd of today's budget for a call about to start.
+
+        Args:
+            cost_usd: Estimated (worst-case) cost of the call.
+            limit_usd: Maximum permitted daily spend in USD.
+
+        Returns:
+            CostReservation to pass to commit() or release().
+
+        Raises:
+            CostLimitExceeded: When spent + reserved + cost_usd would exceed limit_usd.
+        """
+        self._roll_over()
+        committed = self._total_usd + self._reserved_usd
+        if committed + cost_usd > limit_usd:
+            raise CostLimitExceeded(
+                f"Estimated call cost ${cost_usd:.4f} would exceed the remaining daily budget "
+                f"(limit: ${limit_usd:.2f}, used: ${self._total_usd:.4f}, "
+                f"reserved: ${self._reserved_usd:.4f})",
+                context={
+                    "estimated_usd": cost_usd,
+                    "total_usd": self._total_usd,
+                    "reserved_usd": self._reserved_usd,
+                    "limit_usd": limit_usd,
+                },
+            )
+        self._reserved_usd += cost_usd
+        return CostReservation(amount_usd=cost_usd, day=self._date)
+
+    def commit(self, reservation: CostReservation, cost_usd: float) -> None:
+        """Replace a reservation with the call's actual cost.
+
+        Args:
+            reservation: Value returned by reserve().
+            cost_usd: Actual cost of the completed call.
+        """
+        self.release(reservation)
+        self.add(cost_usd)
+
+    def release(self, reservation: CostReservation) -> None:
+        """Return a reservation's budget without recording any spend.
+
+        Reservations from a previous day are ignored; the reset already
+        dropped them.
+
+        Args:
+            reservation: Value returned by reserve().
+        """
+        self._roll_over()
+        if reservation.day == self._date:
+            self._reserved_usd = max(0.0, self._reserved_usd - reservation.amount_usd)
+
+    def reserved_usd(self) -> float:
+        """Return the budget currently held by in-flight calls.
+
+        Returns:
+            Reserved USD for today, zero if the date has rolled over.
+        """
+        return self.cached_reserved_usd()
+
+    def cached_total_today(self) -> float:
+        """Return today's spend as last seen by this process, without any I/O.
+
+        Used by the cost gauges so a metrics scrape never refreshes a shared
+        view (see LedgerCostTracker).
+
+        Returns:
+            Total USD spent today, zero if the date has rolled over.
+        """
+        if datetime.now(UTC).date() != self._date:
+            return 0.0
+        return self._total_usd
+
+    def cached_reserved_usd(self) -> float:
+        """Return the reserved budget as last seen by this process, without any I/O.
+
+        Returns:
+            Reserved USD for today, zero if the date has rolled over.
+        """
+        if datetime.now(UTC).date() != self._date:
+            return 0.0
+        return self._reserved_usd
+
+    def _roll_over(self) -> None:
         today = datetime.now(UTC).date()
         if today != self._date:
             self._date = today
             self._total_usd = 0.0
-        self._total_usd += cost_usd
+            self._reserved_usd = 0.0
 
     def total_today(self) -> float:
         """Return accumulated cost since midnight UTC, zero if date has rolled over.
@@ -133,9 +357,7 @@ class DailyCostTracker:
         Returns:
             Total USD spent today.
         """
-        if datetime.now(UTC).date() != self._date:
-            return 0.0
-        return self._total_usd
+        return self.cached_total_today()
 
     def check_limit(self, limit_usd: float) -> None:
         """Raise CostLimitExceeded if today's total has reached the configured limit.
@@ -159,46 +381,182 @@ class DailyCostTracker:
 # ---------------------------------------------------------------------------
 
 
-class CircuitBreaker:
-    """Opens after failure_threshold failures within a rolling window_seconds window.
+BREAKER_CLOSED = "closed"
+BREAKER_OPEN = "open"
+BREAKER_HALF_OPEN = "half_open"
 
-    When open, callers should skip the AI call and surface a RetryableError
-    rather than hammering a failing provider.
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit breaker over a rolling failure window.
+
+    - closed:    calls pass; failure_threshold failures within window_seconds open it
+    - open:      calls are refused until reset_timeout_s (plus up to
+                 reopen_jitter of it, so breakers opened together do not
+                 all probe at once) has elapsed, then it turns half-open
+    - half_open: up to probe_budget calls pass as probes; a probe success
+                 closes the circuit, a failure re-opens it. Probes that never
+                 report back are written off after another reset_timeout_s.
+
+    A success reported while open (a call that started before the circuit
+    opened) is ignored. Transitions are counted in
+    ops_ai_circuit_transitions_total.
+
+    State lives on the instance; SharedCircuitBreaker (shared_breaker.py)
+    keeps it in storage so every worker process sees the same circuit.
     """
 
     def __init__(
         self,
         failure_threshold: int = 5,
         window_seconds: float = 60.0,
+        *,
+        reset_timeout_s: float | None = None,
+        probe_budget: int = 1,
+        reopen_jitter: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
     ) -> None:
-        """Initialise with threshold and time window.
+        """Initialise a closed breaker.
 
         Args:
             failure_threshold: Number of failures within the window to open the circuit.
             window_seconds: Rolling window length in seconds.
+            reset_timeout_s: Time spent open before probing (default: window_seconds).
+            probe_budget: Calls admitted concurrently while half-open.
+            reopen_jitter: Extra fraction of reset_timeout_s, drawn uniformly, added
+                to each open period.
+            clock: Time source in seconds (injectable for tests).
+            rng: Random source for the jitter (injectable for tests).
         """
         self._threshold = failure_threshold
         self._window = window_seconds
+        self._reset_timeout = window_seconds if reset_timeout_s is None else reset_timeout_s
+        self._probe_budget = probe_budget
+        self._reopen_jitter = reopen_jitter
+        self._clock = clock
+        self._rng = rng or random.Random()
         self._failures: deque[float] = deque()
+        self._state = BREAKER_CLOSED
+        # open: when probing may start; half_open: when unreported probes expire
+        self._deadline = 0.0
+        self._probes_in_flight = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._synced(write=False):
+            return self._current_state(self._clock())[0]
+
+    @property
+    def cached_state(self) -> str:
+        """State as last loaded by this process, without synchronising.
+
+        Used by the circuit-state gauge so a metrics scrape never reads
+        shared storage (see SharedCircuitBreaker).
+        """
+        return self._current_state(self._clock())[0]
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go to the provider now.
+
+        While half-open this claims one of the probe slots; the caller must
+        then report record_success(), record_failure() or release_probe().
+
+        Returns:
+            True if the call may proceed.
+        """
+        with self._synced(write=True):
+            self._advance(self._clock())
+            if self._state == BREAKER_CLOSED:
+                return True
+            if self._state == BREAKER_HALF_OPEN and self._probes_in_flight < self._probe_budget:
+                self._probes_in_flight += 1
+                return True
+            return False
 
     def record_success(self) -> None:
-        """Clear all failure records — circuit closes immediately."""
-        self._failures.clear()
+        """Clear failures while closed; close the circuit after a half-open probe."""
+        with self._synced(write=True):
+            self._advance(self._clock())
+            if self._state == BREAKER_OPEN:
+                return
+            if self._state == BREAKER_HALF_OPEN:
+                self._transition(BREAKER_CLOSED)
+            self._failures.clear()
+            self._probes_in_flight = 0
 
     def record_failure(self) -> None:
-        """Record a failure timestamp and prune stale entries outside the window."""
-        now = time.monotonic()
-        self._failures.append(now)
-        self._prune(now)
+        """Record a failure; open the circuit at the threshold or on a failed probe."""
+        with self._synced(write=True):
+            now = self._clock()
+            self._advance(now)
+            self._failures.append(now)
+            self._prune(now)
+            if self._state == BREAKER_HALF_OPEN or (
+                self._state == BREAKER_CLOSED and len(self._failures) >= self._threshold
+            ):
+                self._open(now)
+
+    def release_probe(self) -> None:
+        """Return a half-open probe slot for a call that ended without a verdict."""
+        with self._synced(write=True):
+            if self._state == BREAKER_HALF_OPEN and self._probes_in_flight > 0:
+                self._probes_in_flight -= 1
 
     def is_open(self) -> bool:
-        """Return True if too many recent failures have triggered the open state.
+        """Return True while calls are being refused.
 
         Returns:
-            True when failure count within the window >= failure_threshold.
+            True when open, or half-open with every probe slot taken.
         """
-        self._prune(time.monotonic())
-        return len(self._failures) >= self._threshold
+        with self._synced(write=False):
+            state, probes_in_flight = self._current_state(self._clock())
+            if state == BREAKER_HALF_OPEN:
+                return probes_in_flight >= self._probe_budget
+            return state == BREAKER_OPEN
+
+    @contextmanager
+    def _synced(self, *, write: bool) -> Iterator[None]:
+        """Load shared state before a read or update and store it after.
+
+        The in-process breaker has nothing to synchronise.
+        """
+        yield
+
+    def _current_state(self, now: float) -> tuple[str, int]:
+        """Return (state, probes in flight) as _advance() would leave them."""
+        if now < self._deadline or self._state == BREAKER_CLOSED:
+            return self._state, self._probes_in_flight
+        return BREAKER_HALF_OPEN, 0
+
+    def _advance(self, now: float) -> None:
+        """Apply time-driven transitions (open → half-open, probe expiry)."""
+        if now < self._deadline:
+            return
+        if self._state == BREAKER_OPEN:
+            self._transition(BREAKER_HALF_OPEN)
+            self._probes_in_flight = 0
+            self._deadline = now + self._reset_timeout
+        elif self._state == BREAKER_HALF_OPEN and self._probes_in_flight:
+            self._probes_in_flight = 0
+            self._deadline = now + self._reset_timeout
+
+    def _open(self, now: float) -> None:
+        self._transition(BREAKER_OPEN)
+        self._probes_in_flight = 0
+        jitter = self._rng.uniform(0.0, self._reopen_jitter)
+        self._deadline = now + self._reset_timeout * (1.0 + jitter)
+
+    def _transition(self, to_state: str) -> None:
+        if to_state == self._state:
+            return
+        AI_CIRCUIT_TRANSITIONS_TOTAL.inc(from_state=self._state, to_state=to_state)
+        log = logger.warning if to_state == BREAKER_OPEN else logger.info
+        log(
+            "Circuit breaker state change",
+            extra={"from_state": self._state, "to_state": to_state},
+        )
+        self._state = to_state
 
     def _prune(self, now: float) -> None:
         cutoff = now - self._window
@@ -256,15 +614,8 @@ class MockAIClient(AIClient):
         if self._fixed_response is not None:
             response_text = self._fixed_response
         else:
-            lower = user.lower()
-            if any(kw in lower for kw in ("purchase", "order", "item:", "buy", "procure")):
-                payload = _MOCK_PURCHASE
-            elif any(kw in lower for kw in ("error", "issue", "billing", "incident", "500", "bug")):
-                payload = _MOCK_ISSUE
-            elif any(kw in lower for kw in ("change", "update", "deploy", "config")):
-                payload = _MOCK_OPS
-            else:
-                payload = _MOCK_VAGUE
+            match = get_keyword_matcher().first_match(user, GROUP_MOCK_RESPONSE)
+            payload = _MOCK_PAYLOADS.get(match[1], _MOCK_VAGUE) if match else _MOCK_VAGUE
             response_text = json.dumps(payload)
             logger.debug(
                 "MockAIClient returning canned response",
@@ -292,6 +643,9 @@ class AnthropicClient(AIClient):
         cost_tracker: DailyCostTracker,
         circuit_breaker: CircuitBreaker,
         max_daily_cost_usd: float,
+        hedge_policy: HedgePolicy | None = None,
+        streaming: bool = False,
+        output_mode: str = OUTPUT_MODE_TEXT,
     ) -> None:
         """Initialise with API credentials and shared control objects.
 
@@ -301,7 +655,18 @@ class AnthropicClient(AIClient):
             cost_tracker: Shared daily cost accumulator.
             circuit_breaker: Shared failure-tracking circuit breaker.
             max_daily_cost_usd: Refuse new calls when this daily limit is reached.
+            hedge_policy: If set, slow calls are hedged with a second request.
+            streaming: Stream responses and stop reading at the closing brace
+                or at the first sign of malformed output (see _raw_stream).
+                Ignored in tool output mode.
+            output_mode: "text" (JSON in the reply) or "tool" (forced
+                EXTRACTION_TOOL call; see _raw_tool_call).
+
+        Raises:
+            ValueError: If output_mode is not one of OUTPUT_MODES.
         """
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(f"Unknown AI output mode: {output_mode!r}")
         import anthropic
 
         self._client = anthropic.AsyncAnthropic(api_key=api_key)
@@ -309,6 +674,9 @@ class AnthropicClient(AIClient):
         self._cost_tracker = cost_tracker
         self._circuit_breaker = circuit_breaker
         self._max_daily_cost = max_daily_cost_usd
+        self._hedge_policy = hedge_policy
+        self._streaming = streaming
+        self._output_mode = output_mode
 
     async def complete(self, system: str, user: str, *, prompt_version: str = "") -> AICallResult:
         """Call Claude with cost-limit check, circuit-breaker guard, and retry.
@@ -322,38 +690,125 @@ class AnthropicClient(AIClient):
             AICallResult with real token counts, cost, and latency.
 
         Raises:
-            CostLimitExceeded: If the daily budget is exhausted.
+            CostLimitExceeded: If the daily budget is exhausted or the call's
+                estimated cost would exceed what remains of it.
             RetryableError: If the circuit breaker is open.
             TimeoutError | ConnectionError | OSError: If all retry attempts fail.
         """
-        self._cost_tracker.check_limit(self._max_daily_cost)
+        tool_mode = self._output_mode == OUTPUT_MODE_TOOL
+        if tool_mode:
+            raw_call = self._raw_tool_call
+        else:
+            raw_call = self._raw_stream if self._streaming else self._raw_complete
+        return await _guarded_complete(
+            lambda: raw_call(system, user, prompt_version=prompt_version),
+            model=self._model,
+            cost_tracker=self._cost_tracker,
+            circuit_breaker=self._circuit_breaker,
+            max_daily_cost_usd=self._max_daily_cost,
+            prompt_version=prompt_version,
+            estimate=estimate_call(
+                system,
+                user,
+                model=self._model,
+                extra_input_tokens=TOOL_INPUT_TOKENS if tool_mode else 0,
+            ),
+            hedge_policy=self._hedge_policy,
+        )
 
-        if self._circuit_breaker.is_open():
-            raise RetryableError(
-                "Circuit breaker open — AI provider temporarily unavailable",
-                context={"model": self._model},
-            )
+    async def _raw_tool_call(self, system: str, user: str, *, prompt_version: str) -> AICallResult:
+        """Single API call forced to answer through EXTRACTION_TOOL.
 
-        ai_result = await _call_with_retry(
-            lambda: self._raw_complete(system, user, prompt_version=prompt_version),
-            circuit_breaker=self._circuit_breaker,
+        Args:
+            system: System prompt.
+            user: User-turn message.
+            prompt_version: Embedded in the returned result.
+
+        Returns:
+            AICallResult whose tool_input holds the tool call's arguments.
+            If the reply has no tool call, tool_input is None and text holds
+            the reply text, so it goes through the normal text parsing.
+        """
+        tool_choice: ToolChoiceToolParam = {"type": "tool", "name": EXTRACTION_TOOL_NAME}
+        start = time.monotonic()
+        response = await self._client.messages.create(
+            model=self._model,
+            max_tokens=AI_MAX_TOKENS,
+            system=system,
+            messages=[{"role": "user", "content": user}],
+            tools=[EXTRACTION_TOOL],
+            tool_choice=tool_choice,
         )
-        self._cost_tracker.add(ai_result.cost_usd)
-        self._circuit_breaker.record_success()
-
-        logger.info(
-            "AI call complete",
-            extra={
-                "model": ai_result.model,
-                "tokens_in": ai_result.tokens_in,
-                "tokens_out": ai_result.tokens_out,
-                "cost_usd": ai_result.cost_usd,
-                "latency_ms": round(ai_result.latency_ms, 1),
-                "prompt_version": prompt_version,
-                "correlation_id": correlation_id_ctx.get(""),
-            },
+        latency_ms = (time.monotonic() - start) * 1000
+
+        tool_input: dict[str, Any] | None = None
+        texts: list[str] = []
+        for block in response.content:
+            if block.type == "tool_use" and block.name == EXTRACTION_TOOL_NAME:
+                tool_input = dict(block.input)  # type: ignore[arg-type]
+                break
+            if block.type == "text":
+                texts.append(block.text)
+        tokens_in: int = response.usage.input_tokens
+        tokens_out: int = response.usage.output_tokens
+        return AICallResult(
+            text=json.dumps(tool_input) if tool_input is not None else "".join(texts),
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cost_usd=price_call(self._model, tokens_in, tokens_out),
+            latency_ms=latency_ms,
+            model=self._model,
+            prompt_version=prompt_version,
+            tool_input=tool_input,
+        )
+
+    async def _raw_stream(self, system: str, user: str, *, prompt_version: str) -> AICallResult:
+        """Single streamed API call, checked incrementally by JSONStreamGuard.
+
+        Reading stops, and the stream is closed, as soon as the root JSON
+        object closes or the guard aborts. A stream closed early never
+        receives its final usage event, so output tokens are estimated from
+        the text received.
+
+        Args:
+            system: System prompt.
+            user: User-turn message.
+            prompt_version: Embedded in the returned result.
+
+        Returns:
+            AICallResult with the JSON object text (or the text received
+            before an abort), time to first token, and total latency.
+        """
+        guard = JSONStreamGuard()
+        ttft_ms: float | None = None
+        start = time.monotonic()
+        async with self._client.messages.stream(
+            model=self._model,
+            max_tokens=AI_MAX_TOKENS,
+            system=system,
+            messages=[{"role": "user", "content": user}],
+        ) as stream:
+            async for delta in stream.text_stream:
+                if ttft_ms is None:
+                    ttft_ms = (time.monotonic() - start) * 1000
+                if guard.feed(delta):
+                    break
+            usage = stream.current_message_snapshot.usage
+        latency_ms = (time.monotonic() - start) * 1000
+
+        tokens_in: int = usage.input_tokens
+        tokens_out: int = max(usage.output_tokens, estimate_tokens(guard.raw))
+        return AICallResult(
+            text=guard.text,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cost_usd=price_call(self._model, tokens_in, tokens_out),
+            latency_ms=latency_ms,
+            model=self._model,
+            prompt_version=prompt_version,
+            ttft_ms=ttft_ms,
+            stream_abort=guard.abort_reason,
         )
-        return ai_result
 
     async def _raw_complete(self, system: str, user: str, *, prompt_version: str) -> AICallResult:
         """Single raw API call with token counting and cost calculation.
@@ -377,10 +832,7 @@ class AnthropicClient(AIClient):
 
         tokens_in: int = response.usage.input_tokens
         tokens_out: int = response.usage.output_tokens
-        cost_usd = (
-            tokens_in * CLAUDE_SONNET_INPUT_COST_PER_1M / 1_000_000
-            + tokens_out * CLAUDE_SONNET_OUTPUT_COST_PER_1M / 1_000_000
-        )
+        cost_usd = price_call(self._model, tokens_in, tokens_out)
 
         return AICallResult(
             text=response.content[0].text,  # type: ignore[union-attr]
@@ -393,6 +845,244 @@ class AnthropicClient(AIClient):
         )
 
 
+async def _guarded_complete(
+    call_fn: Callable[[], Awaitable[AICallResult]],
+    *,
+    model: str,
+    cost_tracker: DailyCostTracker,
+    circuit_breaker: CircuitBreaker,
+    max_daily_cost_usd: float,
+    prompt_version: str,
+    estimate: CallEstimate | None = None,
+    hedge_policy: HedgePolicy | None = None,
+) -> AICallResult:
+    """Run a provider call behind the cost limit, circuit breaker, and retry.
+
+    Shared by every real or simulated provider so they behave identically
+    under failure: budget check, cost reservation, breaker check, retried
+    call, then cost reconciliation, breaker, metrics, and log bookkeeping
+    on success. The reservation is released if the call fails.
+
+    Args:
+        call_fn: Async no-arg callable performing one raw provider call.
+        model: Model identifier for error context.
+        cost_tracker: Shared daily cost accumulator.
+        circuit_breaker: Shared failure-tracking circuit breaker.
+        max_daily_cost_usd: Refuse the call when this daily limit is reached.
+        prompt_version: Prompt version tag for logging.
+        estimate: Pre-call estimate from estimate_call(); its cost is
+            reserved for the duration of the call. None skips reservation.
+        hedge_policy: If set, each attempt may be hedged (see _call_with_hedge).
+
+    Returns:
+        AICallResult from the first successful attempt.
+
+    Raises:
+        CostLimitExceeded: If the daily budget is exhausted, or the estimated
+            cost would exceed what remains of it.
+        RetryableError: If the circuit breaker is open.
+        RateLimitExceeded | TimeoutError | ConnectionError | OSError: If all retries fail.
+    """
+    cost_tracker.check_limit(max_daily_cost_usd)
+    reservation = (
+        cost_tracker.reserve(estimate.cost_usd, max_daily_cost_usd)
+        if estimate is not None
+        else None
+    )
+
+    try:
+        if not circuit_breaker.allow_request():
+            raise RetryableError(
+                "Circuit breaker open — AI provider temporarily unavailable",
+                context={"model": model},
+            )
+        attempt_fn: Callable[[], Awaitable[AICallResult]] = call_fn
+        if hedge_policy is not None:
+            attempt_fn = functools.partial(
+                _call_with_hedge,
+                call_fn,
+                hedge_policy,
+                cost_tracker=cost_tracker,
+                estimate=estimate,
+                max_daily_cost_usd=max_daily_cost_usd,
+            )
+        try:
+            ai_result = await _call_with_retry(attempt_fn, circuit_breaker=circuit_breaker)
+        except BaseException:
+            circuit_breaker.release_probe()
+            raise
+    except BaseException:
+        if reservation is not None:
+            cost_tracker.release(reservation)
+        raise
+
+    if estimate is not None and reservation is not None:
+        cost_tracker.commit(reservation, ai_result.cost_usd)
+        _record_estimate_error(estimate, ai_result)
+    else:
+        cost_tracker.add(ai_result.cost_usd)
+    circuit_breaker.record_success()
+    _record_call_metrics(ai_result)
+
+    logger.info(
+        "AI call complete",
+        extra={
+            "model": ai_result.model,
+            "tokens_in": ai_result.tokens_in,
+            "tokens_out": ai_result.tokens_out,
+            "cost_usd": ai_result.cost_usd,
+            "latency_ms": round(ai_result.latency_ms, 1),
+            "ttft_ms": None if ai_result.ttft_ms is None else round(ai_result.ttft_ms, 1),
+            "prompt_version": prompt_version,
+            "correlation_id": correlation_id_ctx.get(""),
+        },
+    )
+    return ai_result
+
+
+def _record_call_metrics(ai_result: AICallResult) -> None:
+    """Add a completed call's tokens and cost to the in-process metrics registry.
+
+    Args:
+        ai_result: Result of a successful provider call.
+    """
+    AI_CALLS_TOTAL.inc(model=ai_result.model)
+    AI_TOKENS_TOTAL.inc(ai_result.tokens_in, model=ai_result.model, direction="input")
+    AI_TOKENS_TOTAL.inc(ai_result.tokens_out, model=ai_result.model, direction="output")
+    AI_COST_USD_TOTAL.inc(ai_result.cost_usd, model=ai_result.model)
+    if ai_result.ttft_ms is not None:
+        AI_TTFT_SECONDS.observe(ai_result.ttft_ms / 1000, model=ai_result.model)
+    if ai_result.stream_abort is not None:
+        AI_STREAM_ABORTS_TOTAL.inc(model=ai_result.model, reason=ai_result.stream_abort)
+
+
+def _record_estimate_error(estimate: CallEstimate, ai_result: AICallResult) -> None:
+    """Observe how far the pre-call estimate was from the provider's figures.
+
+    Args:
+        estimate: Estimate the call's reservation was based on.
+        ai_result: Result of the completed call.
+    """
+    AI_COST_RESERVATION_ERROR_USD.observe(
+        estimate.cost_usd - ai_result.cost_usd, model=ai_result.model
+    )
+    if ai_result.tokens_in > 0:
+        AI_INPUT_TOKEN_ESTIMATE_ERROR.observe(
+            (estimate.tokens_in - ai_result.tokens_in) / ai_result.tokens_in,
+            model=ai_result.model,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Hedging
+# ---------------------------------------------------------------------------
+
+
+async def _call_with_hedge(
+    call_fn: Callable[[], Awaitable[AICallResult]],
+    policy: HedgePolicy,
+    *,
+    cost_tracker: DailyCostTracker,
+    estimate: CallEstimate | None,
+    max_daily_cost_usd: float,
+) -> AICallResult:
+    """Run call_fn, issuing an identical second call if the first is slow.
+
+    If the first call has not returned after policy.hedge_delay_s(), and
+    the hedge budget and the daily cost limit allow it, a second call is
+    started; the first to succeed wins and the other is cancelled. A
+    failure only surfaces when both calls have failed.
+
+    The hedge reserves its own estimated cost. The winner's cost is
+    recorded by the caller; the loser is charged its actual cost if it
+    completed, its estimated input cost if it was cancelled (input is
+    billed once the provider accepts the request), and nothing if it failed.
+
+    Args:
+        call_fn: Async no-arg callable performing one raw provider call.
+        policy: Hedge trigger and budget; every completed call's latency is fed back.
+        cost_tracker: Shared daily cost accumulator.
+        estimate: Pre-call estimate used to reserve and charge the hedge.
+        max_daily_cost_usd: Daily limit the hedge reservation must fit under.
+
+    Returns:
+        AICallResult of the first call to succeed.
+
+    Raises:
+        The primary call's exception if every issued call failed.
+    """
+    policy.note_call()
+    delay = policy.hedge_delay_s()
+    start = time.monotonic()
+    primary = asyncio.ensure_future(call_fn())
+    tasks = [primary]
+    try:
+        if delay is not None:
+            await asyncio.wait(tasks, timeout=delay)
+        if delay is None or primary.done():
+            result = await primary
+            policy.observe(time.monotonic() - start)
+            return result
+
+        if not policy.try_acquire():
+            AI_HEDGES_TOTAL.inc(outcome="skipped_budget")
+            result = await primary
+            policy.observe(time.monotonic() - start)
+            return result
+        try:
+            reservation = (
+                cost_tracker.reserve(estimate.cost_usd, max_daily_cost_usd)
+                if estimate is not None
+                else None
+            )
+        except CostLimitExceeded:
+            AI_HEDGES_TOTAL.inc(outcome="skipped_cost_limit")
+            result = await primary
+            policy.observe(time.monotonic() - start)
+            return result
+
+        hedge_start = time.monotonic()
+        tasks.append(asyncio.ensure_future(call_fn()))
+        starts = {id(primary): start, id(tasks[1]): hedge_start}
+        winner: asyncio.Future[AICallResult] | None = None
+        pending: set[asyncio.Future[AICallResult]] = set(tasks)
+        while winner is None and pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if winner is None and task.exception() is None:
+                    winner = task
+                    policy.observe(time.monotonic() - starts[id(task)])
+
+        loser = tasks[1] if winner is primary else primary
+        if not loser.done():
+            # Censored sample: the loser took at least this long
+            policy.observe(time.monotonic() - starts[id(loser)])
+        extra_cost = _hedge_loser_cost(loser, estimate)
+        if reservation is not None:
+            cost_tracker.commit(reservation, extra_cost)
+        else:
+            cost_tracker.add(extra_cost)
+        AI_HEDGE_EXTRA_COST_USD.inc(extra_cost)
+
+        if winner is None:
+            AI_HEDGES_TOTAL.inc(outcome="both_failed")
+            return primary.result()  # re-raises the primary's exception
+        AI_HEDGES_TOTAL.inc(outcome="primary_won" if winner is primary else "hedge_won")
+        return winner.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _hedge_loser_cost(loser: asyncio.Future[AICallResult], estimate: CallEstimate | None) -> float:
+    """Cost to charge for the call that did not win a hedged race."""
+    if loser.done() and not loser.cancelled():
+        return 0.0 if loser.exception() is not None else loser.result().cost_usd
+    return estimate.input_cost_usd if estimate is not None else 0.0
+
+
 # ---------------------------------------------------------------------------
 # Retry helper
 # ---------------------------------------------------------------------------
@@ -407,6 +1097,10 @@ async def _call_with_retry(
 ) -> AICallResult:
     """Retry call_fn on transient errors with exponential backoff and jitter.
 
+    RateLimitExceeded is retried too, waiting at least its retry_after hint;
+    it does not count towards the circuit breaker because a throttling
+    provider is healthy, just busy.
+
     Args:
         call_fn: Async no-arg callable returning AICallResult.
         circuit_breaker: If provided, record_failure() is called on each transient error.
@@ -422,13 +1116,17 @@ async def _call_with_retry(
     last_exc: BaseException | None = None
     for attempt in range(max_attempts):
         try:
-            return await call_fn()
-        except (TimeoutError, ConnectionError, OSError) as exc:
+            with start_span("ai.attempt", attempt=attempt + 1, max_attempts=max_attempts):
+                return await call_fn()
+        except (RateLimitExceeded, TimeoutError, ConnectionError, OSError) as exc:
             last_exc = exc
-            if circuit_breaker is not None:
+            rate_limited = isinstance(exc, RateLimitExceeded)
+            if circuit_breaker is not None and not rate_limited:
                 circuit_breaker.record_failure()
             if attempt < max_attempts - 1:
                 delay = base_delay * (2**attempt) + random.uniform(0, 0.5)
+                if isinstance(exc, RateLimitExceeded):
+                    delay = max(delay, exc.retry_after)
                 logger.warning(
                     "AI call failed, retrying",
                     extra={
@@ -455,24 +1153,105 @@ def get_ai_client(
     """Return the appropriate AI client for the current configuration.
 
     Args:
-        settings: Application settings; inspects ai_provider and anthropic_api_key.
+        settings: Application settings; inspects ai_provider, anthropic_api_key
+            and ai_cascade_models.
         cost_tracker: Optional shared tracker (created if not provided).
         circuit_breaker: Optional shared circuit breaker (created if not provided).
 
     Returns:
-        AnthropicClient if provider is "anthropic" and a key is set, else MockAIClient.
+        AnthropicClient if provider is "anthropic" and a key is set,
+        SimulatedAIClient if provider is "simulated", else MockAIClient.
+        With AI_CASCADE_MODELS set, a real or simulated provider is wrapped
+        in a CascadingAIClient with one client per model, all sharing the
+        tracker and breaker.
     """
-    if settings.ai_provider == "anthropic" and settings.anthropic_api_key:
-        tracker = cost_tracker or DailyCostTracker()
-        breaker = circuit_breaker or CircuitBreaker()
-        logger.info("Using AnthropicClient", extra={"model": settings.ai_model})
-        return AnthropicClient(
-            api_key=settings.anthropic_api_key,
-            model=settings.ai_model,
-            cost_tracker=tracker,
-            circuit_breaker=breaker,
+    use_anthropic = settings.ai_provider == "anthropic" and bool(settings.anthropic_api_key)
+    if settings.ai_provider != "simulated" and not use_anthropic:
+        logger.info("Using MockAIClient", extra={"ai_provider": settings.ai_provider})
+        return MockAIClient()
+
+    tracker = cost_tracker or DailyCostTracker()
+    breaker = circuit_breaker or CircuitBreaker()
+    if not settings.ai_cascade_models:
+        return _provider_client(settings, None, tracker, breaker)
+
+    from app.services.ai.cascade import CascadeTier, CascadingAIClient
+
+    logger.info(
+        "Using CascadingAIClient",
+        extra={"ai_provider": settings.ai_provider, "models": settings.ai_cascade_models},
+    )
+    return CascadingAIClient(
+        [
+            CascadeTier(model, _provider_client(settings, model, tracker, breaker, tier=index))
+            for index, model in enumerate(settings.ai_cascade_models)
+        ]
+    )
+
+
+def _provider_client(
+    settings: Settings,
+    model: str | None,
+    cost_tracker: DailyCostTracker,
+    circuit_breaker: CircuitBreaker,
+    *,
+    tier: int = 0,
+) -> AIClient:
+    """Build the configured real or simulated provider client for one model.
+
+    Args:
+        settings: Application settings.
+        model: Model to call; None uses the provider's default.
+        cost_tracker: Shared daily cost accumulator.
+        circuit_breaker: Shared circuit breaker.
+        tier: Cascade position, used to give each simulated tier its own seed.
+
+    Returns:
+        SimulatedAIClient or AnthropicClient.
+    """
+    if settings.ai_provider == "simulated":
+        from app.services.ai.simulated import SIMULATED_MODEL, SimulatedAIClient
+
+        logger.info("Using SimulatedAIClient", extra={"ai_provider": settings.ai_provider})
+        return SimulatedAIClient(
+            cost_tracker=cost_tracker,
+            circuit_breaker=circuit_breaker,
             max_daily_cost_usd=settings.max_daily_cost_usd,
+            latency_median_ms=settings.sim_latency_median_ms,
+            latency_sigma=settings.sim_latency_sigma,
+            tail_probability=settings.sim_tail_probability,
+            tail_multiplier=settings.sim_tail_multiplier,
+            rate_limit_rate=settings.sim_rate_limit_rate,
+            timeout_rate=settings.sim_timeout_rate,
+            malformed_rate=settings.sim_malformed_rate,
+            timeout_s=settings.sim_timeout_s,
+            tokens_per_minute=settings.sim_tokens_per_minute,
+            seed=None if settings.sim_seed is None else settings.sim_seed + tier,
+            hedge_policy=_build_hedge_policy(settings),
+            model=model or SIMULATED_MODEL,
+            streaming=settings.ai_streaming_enabled,
+            output_mode=settings.ai_output_mode,
         )
 
-    logger.info("Using MockAIClient", extra={"ai_provider": settings.ai_provider})
-    return MockAIClient()
+    logger.info("Using AnthropicClient", extra={"model": model or settings.ai_model})
+    return AnthropicClient(
+        api_key=settings.anthropic_api_key or "",
+        model=model or settings.ai_model,
+        cost_tracker=cost_tracker,
+        circuit_breaker=circuit_breaker,
+        max_daily_cost_usd=settings.max_daily_cost_usd,
+        hedge_policy=_build_hedge_policy(settings),
+        streaming=settings.ai_streaming_enabled,
+        output_mode=settings.ai_output_mode,
+    )
+
+
+def _build_hedge_policy(settings: Settings) -> HedgePolicy | None:
+    """Return a HedgePolicy from settings, or None when hedging is disabled."""
+    if not settings.ai_hedge_enabled:
+        return None
+    return HedgePolicy(
+        settings.ai_hedge_percentile,
+        budget_ratio=settings.ai_hedge_budget_ratio,
+        min_samples=settings.ai_hedge_min_samples,
+    )
@@ -0,0 +1,182 @@
+"""Daily cost tracker backed by the shared SQLite ledger.
+
+DailyCostTracker keeps spend in a process-local float, so each worker of a
+multi-worker deployment enforces MAX_DAILY_COST_USD on its own and a
+restart forgets the day's spend. LedgerCostTracker keeps the same
+interface but records spend and in-flight reservations in the storage
+layer (cost_ledger / cost_reservations tables):
+
+  - reserve() is a BEGIN IMMEDIATE transaction, so reservations from every
+    worker on the host are checked against one total
+  - commit() adds actual spend and drops the reservation in one transaction
+  - total_today() / reserved_usd() — and therefore check_limit() — read a
+    cached view refreshed at most every refresh_interval_s, updated
+    immediately by this worker's own writes
+  - the cost gauges read that cached view through cached_total_today() /
+    cached_reserved_usd(), which never refresh it, so a metrics scrape
+    does not touch the database
+
+Reservations left behind by a worker that died mid-call stop counting
+after reservation_ttl_s and are deleted by the next reserve().
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from app.core.exceptions import CostLimitExceeded
+from app.services.ai.client import CostReservation, DailyCostTracker
+from app.storage import Storage
+
+DEFAULT_REFRESH_INTERVAL_S = 1.0
+# Comfortably longer than a fully retried provider call
+DEFAULT_RESERVATION_TTL_S = 600.0
+
+
+class LedgerCostTracker(DailyCostTracker):
+    """DailyCostTracker whose totals live in the shared storage ledger."""
+
+    def __init__(
+        self,
+        storage: Storage,
+        *,
+        refresh_interval_s: float = DEFAULT_REFRESH_INTERVAL_S,
+        reservation_ttl_s: float = DEFAULT_RESERVATION_TTL_S,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialise and load today's totals from the ledger.
+
+        Args:
+            storage: Storage holding the cost_ledger tables.
+            refresh_interval_s: Maximum age of the cached totals used by
+                total_today(), reserved_usd() and check_limit().
+            reservation_ttl_s: Age after which an uncommitted reservation
+                is treated as abandoned.
+            clock: Monotonic clock for cache refreshes (injectable for tests).
+            wall_clock: Unix-time clock for reservation timestamps.
+        """
+        super().__init__()
+        self._storage = storage
+        self._refresh_interval = refresh_interval_s
+        self._reservation_ttl = reservation_ttl_s
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._refreshed_at = 0.0
+        self._refresh()
+
+    def add(self, cost_usd: float) -> None:
+        """Record cost_usd against today's shared total.
+
+        Args:
+            cost_usd: Cost in USD to record for this call.
+        """
+        self._roll_over()
+        self._storage.commit_cost(self._date.isoformat(), None, cost_usd)
+        self._total_usd += cost_usd
+
+    def reserve(self, cost_usd: float, limit_usd: float) -> CostReservation:
+        """Atomically hold cost_usd of today's shared budget.
+
+        Args:
+            cost_usd: Estimated (worst-case) cost of the call.
+            limit_usd: Maximum permitted daily spend in USD.
+
+        Returns:
+            CostReservation carrying the ledger reservation ID.
+
+        Raises:
+            CostLimitExceeded: When spent + reserved + cost_usd, across all
+                workers, would exceed limit_usd.
+        """
+        self._roll_over()
+        now = self._wall_clock()
+        reservation_id = uuid.uuid4().hex
+        reserved, spent, held = self._storage.reserve_cost(
+            self._date.isoformat(),
+            reservation_id,
+            cost_usd,
+            limit_usd,
+            now_ts=now,
+            stale_before_ts=now - self._reservation_ttl,
+        )
+        self._set_cache(spent, held + cost_usd if reserved else held)
+        if not reserved:
+            raise CostLimitExceeded(
+                f"Estimated call cost ${cost_usd:.4f} would exceed the remaining daily budget "
+                f"(limit: ${limit_usd:.2f}, used: ${spent:.4f}, reserved: ${held:.4f})",
+                context={
+                    "estimated_usd": cost_usd,
+                    "total_usd": spent,
+                    "reserved_usd": held,
+                    "limit_usd": limit_usd,
+                },
+            )
+        return CostReservation(amount_usd=cost_usd, day=self._date, reservation_id=reservation_id)
+
+    def commit(self, reservation: CostReservation, cost_usd: float) -> None:
+        """Replace a reservation with the call's actual cost in one transaction.
+
+        Args:
+            reservation: Value returned by reserve().
+            cost_usd: Actual cost of the completed call.
+        """
+        self._roll_over()
+        self._storage.commit_cost(self._date.isoformat(), reservation.reservation_id, cost_usd)
+        self._total_usd += cost_usd
+        self._forget(reservation)
+
+    def release(self, reservation: CostReservation) -> None:
+        """Drop a reservation without recording any spend.
+
+        Args:
+            reservation: Value returned by reserve().
+        """
+        self._roll_over()
+        if reservation.reservation_id is not None:
+            self._storage.release_cost(reservation.reservation_id)
+        self._forget(reservation)
+
+    def total_today(self) -> float:
+        """Return today's spend across all workers (cached view).
+
+        Returns:
+            Total USD spent today, at most refresh_interval_s stale.
+        """
+        self._refresh_if_due()
+        return self._total_usd
+
+    def reserved_usd(self) -> float:
+        """Return budget held by in-flight calls across all workers (cached view).
+
+        Returns:
+            Reserved USD for today, at most refresh_interval_s stale.
+        """
+        self._refresh_if_due()
+        return self._reserved_usd
+
+    def _refresh_if_due(self) -> None:
+        if (
+            datetime.now(UTC).date() != self._date
+            or self._clock() - self._refreshed_at >= self._refresh_interval
+        ):
+            self._refresh()
+
+    def _refresh(self) -> None:
+        self._roll_over()
+        spent, reserved = self._storage.cost_totals(
+            self._date.isoformat(), stale_before_ts=self._wall_clock() - self._reservation_ttl
+        )
+        self._set_cache(spent, reserved)
+
+    def _set_cache(self, spent: float, reserved: float) -> None:
+        self._total_usd = spent
+        self._reserved_usd = reserved
+        self._refreshed_at = self._clock()
+
+    def _forget(self, reservation: CostReservation) -> None:
+        if reservation.day == self._date:
+            self._reserved_usd = max(0.0, self._reserved_usd - reservation.amount_usd)
@@ -0,0 +1,97 @@
+"""Request hedging policy for provider calls.
+
+A hedge is a second, identical provider call issued when the first has not
+returned within a high percentile of recently observed latency; whichever
+finishes first wins and the other is cancelled (see _call_with_hedge in
+client.py). Because only calls already in the slow tail are hedged, a p95
+trigger adds roughly 5% more calls while cutting the tail to about
+p95 + p50.
+
+HedgePolicy decides when, and whether, to hedge:
+
+  - delay: the configured percentile of the last `window` call latencies;
+    no hedging until min_samples latencies have been observed
+  - budget: each call earns budget_ratio hedge tokens (capped at
+    max_burst) and each hedge spends one, so hedges stay under
+    budget_ratio of calls — and of spend — even when the provider is
+    uniformly slow and every call crosses the trigger
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+
+DEFAULT_HEDGE_PERCENTILE = 95.0
+DEFAULT_HEDGE_BUDGET_RATIO = 0.05
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+
+
+class HedgePolicy:
+    """Latency-percentile hedge trigger with a token-bucket hedge budget."""
+
+    def __init__(
+        self,
+        percentile: float = DEFAULT_HEDGE_PERCENTILE,
+        *,
+        budget_ratio: float = DEFAULT_HEDGE_BUDGET_RATIO,
+        min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES,
+        window: int = 500,
+        max_burst: float = 10.0,
+    ) -> None:
+        """Initialise with an empty latency window and an empty budget.
+
+        Args:
+            percentile: Observed-latency percentile (0–100) after which a hedge fires.
+            budget_ratio: Hedges allowed per call, on average.
+            min_samples: Latencies to observe before hedging starts.
+            window: Number of recent latencies the percentile is taken over.
+            max_burst: Cap on accumulated hedge tokens.
+        """
+        if not 0.0 < percentile < 100.0:
+            raise ValueError(f"percentile must be in (0, 100), got {percentile}")
+        self._percentile = percentile
+        self._budget_ratio = budget_ratio
+        self._min_samples = min_samples
+        self._max_burst = max_burst
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._delay_s: float | None = None
+        self._tokens = 0.0
+
+    def observe(self, latency_s: float) -> None:
+        """Record one provider call's latency.
+
+        Args:
+            latency_s: Wall time of the call in seconds.
+        """
+        self._latencies.append(latency_s)
+        self._delay_s = None
+
+    def hedge_delay_s(self) -> float | None:
+        """Return how long to wait before hedging, or None if not enough data.
+
+        Returns:
+            The configured percentile of recent latencies, in seconds.
+        """
+        if len(self._latencies) < self._min_samples:
+            return None
+        if self._delay_s is None:
+            ordered = sorted(self._latencies)
+            rank = math.ceil(self._percentile / 100.0 * len(ordered)) - 1
+            self._delay_s = ordered[max(rank, 0)]
+        return self._delay_s
+
+    def note_call(self) -> None:
+        """Earn budget_ratio hedge tokens for a primary call."""
+        self._tokens = min(self._max_burst, self._tokens + self._budget_ratio)
+
+    def try_acquire(self) -> bool:
+        """Spend one hedge token if available.
+
+        Returns:
+            True if a hedge may be issued.
+        """
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
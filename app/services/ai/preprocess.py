@@ -0,0 +1,209 @@
+"""Email body pre-processing before prompt rendering.
+
+prepare_body() removes content that costs tokens without helping
+extraction, then enforces the prompt body budget:
+
+  1. base64 blobs       — inline attachments and data: URIs
+  2. reply history      — everything after "On … wrote:" / "Original Message"
+                          / Outlook "From: … Sent: …" headers, plus ">" quoted lines
+  3. signature          — everything after an RFC 3676 "-- " delimiter (dash,
+                          dash, space) in the last lines, and "Sent from my …" lines
+  4. disclaimers        — trailing confidentiality / legal notice paragraphs
+                          (all-caps headers or full legal phrases)
+  5. truncation         — if still over budget, keep the head and tail of
+                          the body with an omission marker in the middle
+
+Reply history and signatures are only dropped when real content remains
+above them, "Forwarded message" blocks are kept, and only paragraphs after
+the last content paragraph (never the first) are treated as disclaimers, so
+a request that merely mentions privileged access or a confidential project
+is never cut. Every removal is described by a
+note ("prompt_trimmed:<kind>:<chars>", "prompt_truncated:<chars>") that
+ExtractionService appends to extraction_notes after confidence scoring,
+so trimming never changes the score.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from app.core.constants import MAX_PROMPT_BODY_CHARS
+from app.services.ai.tokens import CHARS_PER_TOKEN, estimate_tokens
+
+DEFAULT_MAX_BODY_TOKENS = MAX_PROMPT_BODY_CHARS // CHARS_PER_TOKEN
+
+# Share of the truncated budget kept from the start of the body; the rest
+# comes from the end, where sign-offs often restate deadlines and asks.
+_HEAD_FRACTION = 0.7
+# Minimum non-whitespace characters that must remain above a signature, and
+# above reply history, for it to be dropped. The reply bar is higher so a
+# short "FYI, see below" forward keeps the thread that carries the request.
+_MIN_CONTENT_CHARS = 20
+_MIN_REPLY_CONTENT_CHARS = 80
+# A signature delimiter further from the end than this is a section
+# separator inside the message, not the start of a signature block.
+_MAX_SIGNATURE_LINES = 15
+
+_BASE64_RE = re.compile(
+    r"(?:data:[\w/+.-]+;base64,)?(?:[A-Za-z0-9+/]{76,}={0,2}[ \t]*(?:\r?\n|$))+"
+    r"|(?:data:[\w/+.-]+;base64,)?[A-Za-z0-9+/]{100,}={0,2}"
+)
+_REPLY_HEADER_RE = re.compile(
+    r"^[ \t]*(?:On\b[^\n]{0,200}\bwrote:"
+    r"|-{2,}[ \t]*Original Message[ \t]*-{2,}"
+    r"|From:[^\n]*\n(?:[^\n]*\n){0,2}?[ \t]*Sent:[^\n]*)[ \t]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_QUOTED_LINE_RE = re.compile(r"^[ \t]*>[^\n]*(?:\n|$)", re.MULTILINE)
+_SIGNATURE_DELIMITER_RE = re.compile(r"^-- \r?$", re.MULTILINE)
+_SENT_FROM_RE = re.compile(r"^[ \t]*Sent from my [^\n]*(?:\n|$)", re.MULTILINE | re.IGNORECASE)
+# Case-sensitive on purpose: "Confidential project…" or "Privileged access
+# needed…" is a request; "CONFIDENTIALITY NOTICE:" or a full legal sentence
+# is boilerplate.
+_DISCLAIMER_RE = re.compile(
+    r"^[ \t]*(?:(?:CONFIDENTIALITY NOTICE|CONFIDENTIAL|DISCLAIMER|LEGAL NOTICE"
+    r"|PRIVILEGED(?: (?:AND|&) CONFIDENTIAL)?)\b"
+    r"|(?:This (?:e-?mail|message|communication)(?: and any (?:attachments?|files))?"
+    r"|The information (?:contained )?in this (?:e-?mail|message))"
+    r" (?:is|are|may be|may contain|contains?)\b[^\n]{0,80}?"
+    r"\b(?:confidential|privileged|intended (?:solely|only|exclusively) for"
+    r"|intended for the (?:named )?(?:addressee|recipient)))"
+)
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n[ \t]*\n")
+_EXCESS_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedBody:
+    """Pre-processed body text plus a record of what was removed."""
+
+    text: str
+    original_tokens: int
+    tokens: int
+    notes: list[str] = field(default_factory=list)
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated prompt tokens removed from the body."""
+        return self.original_tokens - self.tokens
+
+
+def prepare_body(body: str, *, max_tokens: int = DEFAULT_MAX_BODY_TOKENS) -> PreparedBody:
+    """Strip low-value content from an email body and fit it to a token budget.
+
+    Args:
+        body: Raw email body.
+        max_tokens: Estimated-token budget for the body; it is also capped
+            at MAX_PROMPT_BODY_CHARS characters.
+
+    Returns:
+        PreparedBody with the text to render and notes describing each cut.
+    """
+    notes: list[str] = []
+    text = body
+
+    text = _remove(_BASE64_RE, text, "base64", notes, replacement="[base64 data removed]\n")
+    text = _strip_reply_history(text, notes)
+    text = _remove(_QUOTED_LINE_RE, text, "quoted_reply", notes)
+    text = _strip_signature(text, notes)
+    text = _strip_disclaimers(text, notes)
+    text = _EXCESS_BLANK_LINES_RE.sub("\n\n", text).strip()
+
+    max_chars = min(MAX_PROMPT_BODY_CHARS, max_tokens * CHARS_PER_TOKEN)
+    if len(text) > max_chars:
+        truncated = truncate_middle(text, max_chars)
+        notes.append(f"prompt_truncated:{len(text) - len(truncated)}")
+        text = truncated
+
+    return PreparedBody(
+        text=text,
+        original_tokens=estimate_tokens(body),
+        tokens=estimate_tokens(text),
+        notes=notes,
+    )
+
+
+def truncate_middle(text: str, max_chars: int) -> str:
+    """Shorten text to about max_chars, keeping its head and tail.
+
+    Cuts fall on whitespace where possible, and a marker records how many
+    characters were omitted.
+
+    Args:
+        text: Text to shorten.
+        max_chars: Target length (the marker adds a few dozen characters).
+
+    Returns:
+        text unchanged if it fits, else head + omission marker + tail.
+    """
+    if len(text) <= max_chars:
+        return text
+    head_end = _cut_at_space(text, int(max_chars * _HEAD_FRACTION), backwards=True)
+    tail_start = _cut_at_space(text, len(text) - (max_chars - head_end), backwards=False)
+    omitted = tail_start - head_end
+    return f"{text[:head_end].rstrip()}\n\n[… {omitted} characters omitted …]\n\n{text[tail_start:].lstrip()}"
+
+
+def _cut_at_space(text: str, index: int, *, backwards: bool) -> int:
+    """Move index to a nearby whitespace boundary (within 200 chars), if any."""
+    if backwards:
+        space = text.rfind(" ", max(0, index - 200), index)
+    else:
+        space = text.find(" ", index, index + 200)
+    return index if space == -1 else space
+
+
+def _remove(
+    pattern: re.Pattern[str], text: str, kind: str, notes: list[str], replacement: str = ""
+) -> str:
+    removed = 0
+
+    def replace(match: re.Match[str]) -> str:
+        nonlocal removed
+        removed += len(match.group(0))
+        return replacement
+
+    result = pattern.sub(replace, text)
+    if removed:
+        notes.append(f"prompt_trimmed:{kind}:{removed}")
+    return result
+
+
+def _strip_reply_history(text: str, notes: list[str]) -> str:
+    for match in _REPLY_HEADER_RE.finditer(text):
+        above = text[: match.start()]
+        if _has_content(above, _MIN_REPLY_CONTENT_CHARS):
+            notes.append(f"prompt_trimmed:reply_history:{len(text) - match.start()}")
+            return above
+    return text
+
+
+def _strip_signature(text: str, notes: list[str]) -> str:
+    for match in _SIGNATURE_DELIMITER_RE.finditer(text):
+        if text.count("\n", match.end()) > _MAX_SIGNATURE_LINES:
+            continue
+        if _has_content(text[: match.start()]):
+            notes.append(f"prompt_trimmed:signature:{len(text) - match.start()}")
+            text = text[: match.start()]
+        break
+    return _remove(_SENT_FROM_RE, text, "sent_from", notes)
+
+
+def _strip_disclaimers(text: str, notes: list[str]) -> str:
+    """Drop notice paragraphs that follow the last content paragraph.
+
+    The first paragraph is always the message, so it is never dropped.
+    """
+    paragraphs = _PARAGRAPH_SPLIT_RE.split(text.rstrip())
+    keep = len(paragraphs)
+    while keep > 1 and _DISCLAIMER_RE.match(paragraphs[keep - 1]):
+        keep -= 1
+    if keep == len(paragraphs):
+        return text
+    notes.append(f"prompt_trimmed:disclaimer:{sum(len(p) for p in paragraphs[keep:])}")
+    return "\n\n".join(paragraphs[:keep])
+
+
+def _has_content(text: str, min_chars: int = _MIN_CONTENT_CHARS) -> bool:
+    return len("".join(text.split())) >= min_chars
@@ -9,12 +9,30 @@ Two versions are provided:
 - email_extraction_v2: Concise instruction prompt (lower cost, slightly less verbose)
 
 Use get_prompt(name, **kwargs) to obtain (system, user, version) for any named template.
+
+REPAIR_SYSTEM_PROMPT / build_repair_prompt() form the follow-up turn that
+asks for a corrected object after an output fails parsing or validation. It
+carries only the previous output and the errors, not the email.
+
+EXTRACTION_TOOL is the tool definition used by the "tool" output mode: its
+input_schema is AIExtractionOutput's JSON schema, and the provider is forced
+to call it, so the response arrives as a structured object instead of text.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from app.core.constants import MAX_PROMPT_BODY_CHARS
+from app.models.email import AIExtractionOutput
+from app.services.ai.preprocess import truncate_middle
+
+if TYPE_CHECKING:
+    from anthropic.types import ToolParam
+
 VERSION = "email_extraction_v1"
 VERSION_V2 = "email_extraction_v2"
+REPAIR_VERSION = "extraction_repair_v1"
 
 SYSTEM_PROMPT = """\
 You are an ops workflow intake processor for a mid-size company.
@@ -60,6 +78,41 @@ Required fields:
 Infer request_type and priority from context. Use null when a field is not stated.
 """
 
+REPAIR_SYSTEM_PROMPT = """\
+You fix JSON objects that failed validation. Reply with the corrected object \
+only — a single JSON object, no explanation, no markdown.
+
+Fields:
+- request_type: "purchase_request" | "customer_issue" | "ops_change" | "general_inquiry" | "other"
+- priority: "low" | "medium" | "high" | "urgent"
+- due_date: "YYYY-MM-DD" or null
+- company: string or null
+- description: string
+- line_items: [{"item": "name", "qty": integer >= 1}]
+- extraction_notes: [strings]
+
+Keep every value that is already valid and change only what the errors require. \
+If the output was cut off, complete it from what is there; do not invent details.
+"""
+
+_REPAIR_TEMPLATE = """\
+Previous output:
+{previous_output}
+
+Errors:
+{errors}
+"""
+
+# Cap on the previous output quoted back in a repair turn
+MAX_REPAIR_OUTPUT_CHARS = 8_000
+
+EXTRACTION_TOOL_NAME = "record_extraction"
+EXTRACTION_TOOL: ToolParam = {
+    "name": EXTRACTION_TOOL_NAME,
+    "description": "Record the structured fields extracted from the inbound email.",
+    "input_schema": AIExtractionOutput.model_json_schema(),
+}
+
 _USER_TEMPLATE = """\
 From: {from_name} <{from_email}>
 Subject: {subject}
@@ -79,6 +132,9 @@ def build_prompt(
 ) -> str:
     """Render the user-turn message for an email extraction request.
 
+    Bodies longer than MAX_PROMPT_BODY_CHARS are cut down to their head and
+    tail; callers normally pass a body already fitted by prepare_body().
+
     Args:
         from_name: Sender display name.
         from_email: Sender email address.
@@ -94,7 +150,23 @@ def build_prompt(
         from_email=from_email,
         subject=subject,
         received_at=received_at,
-        body=body,
+        body=truncate_middle(body, MAX_PROMPT_BODY_CHARS),
+    )
+
+
+def build_repair_prompt(previous_output: str, errors: list[str]) -> str:
+    """Render the user turn asking for a corrected extraction object.
+
+    Args:
+        previous_output: The response that failed parsing or validation.
+        errors: One line per problem found in it.
+
+    Returns:
+        Formatted repair prompt string.
+    """
+    return _REPAIR_TEMPLATE.format(
+        previous_output=truncate_middle(previous_output, MAX_REPAIR_OUTPUT_CHARS),
+        errors="\n".join(f"- {error}" for error in errors),
     )
 
 
@@ -0,0 +1,127 @@
+"""Circuit breaker whose state is shared by every worker via storage.
+
+A per-process CircuitBreaker lets each uvicorn worker discover a failing
+provider on its own — N workers send N× threshold failing calls — and
+after the open period every worker probes at once. SharedCircuitBreaker
+runs the same closed/open/half-open state machine, but the state lives in
+the circuit_breakers table:
+
+  - updates (allow_request while not closed, record_failure, probe
+    results) are read-modify-write transactions under SQLite's write
+    lock, so the failure window, the jittered reopen deadline and the
+    half-open probe budget are global
+  - the hot path — allow_request() and record_success() while closed with
+    no recorded failures — uses a cached view refreshed at most every
+    refresh_interval_s and never touches the database
+  - the circuit-state gauge reads cached_state, the last-loaded view,
+    so a metrics scrape never touches the database either
+
+Timestamps are wall-clock (time.time) so they mean the same in every process.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from app.services.ai.client import BREAKER_CLOSED, CircuitBreaker
+from app.storage import Storage
+
+DEFAULT_BREAKER_NAME = "ai_provider"
+DEFAULT_REFRESH_INTERVAL_S = 0.5
+
+
+class SharedCircuitBreaker(CircuitBreaker):
+    """CircuitBreaker whose state is stored in the shared SQLite database."""
+
+    def __init__(
+        self,
+        storage: Storage,
+        name: str = DEFAULT_BREAKER_NAME,
+        *,
+        failure_threshold: int = 5,
+        window_seconds: float = 60.0,
+        reset_timeout_s: float | None = None,
+        probe_budget: int = 1,
+        reopen_jitter: float = 0.2,
+        refresh_interval_s: float = DEFAULT_REFRESH_INTERVAL_S,
+        clock: Callable[[], float] = time.time,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialise and load the stored state, if any.
+
+        Args:
+            storage: Storage holding the circuit_breakers table.
+            name: Breaker name; workers using the same name share one circuit.
+            failure_threshold: Number of failures within the window to open the circuit.
+            window_seconds: Rolling window length in seconds.
+            reset_timeout_s: Time spent open before probing (default: window_seconds).
+            probe_budget: Calls admitted concurrently, across workers, while half-open.
+            reopen_jitter: Extra fraction of reset_timeout_s added to each open period.
+            refresh_interval_s: Maximum age of the cached state used on the hot path.
+            clock: Wall-clock time source in seconds (injectable for tests).
+            rng: Random source for the jitter (injectable for tests).
+        """
+        super().__init__(
+            failure_threshold,
+            window_seconds,
+            reset_timeout_s=reset_timeout_s,
+            probe_budget=probe_budget,
+            reopen_jitter=reopen_jitter,
+            clock=clock,
+            rng=rng,
+        )
+        self._storage = storage
+        self.name = name
+        self._refresh_interval = refresh_interval_s
+        self._refreshed_at = float("-inf")
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go to the provider now (see CircuitBreaker).
+
+        Returns:
+            True if the call may proceed.
+        """
+        if self._closed_in_cache():
+            return True
+        return super().allow_request()
+
+    def record_success(self) -> None:
+        """Clear failures while closed; close the circuit after a half-open probe."""
+        if self._closed_in_cache() and not self._failures:
+            return
+        super().record_success()
+
+    @contextmanager
+    def _synced(self, *, write: bool) -> Iterator[None]:
+        if not write:
+            if self._clock() - self._refreshed_at >= self._refresh_interval:
+                self._load(self._storage.get_circuit_breaker(self.name) or {})
+            yield
+            return
+        with self._storage.circuit_breaker_transaction(self.name) as record:
+            self._load(record)
+            yield
+            record.update(
+                state=self._state,
+                failures=list(self._failures),
+                deadline=self._deadline,
+                probes_in_flight=self._probes_in_flight,
+            )
+
+    def _closed_in_cache(self) -> bool:
+        now = self._clock()
+        if now - self._refreshed_at >= self._refresh_interval:
+            self._load(self._storage.get_circuit_breaker(self.name) or {})
+        return self._state == BREAKER_CLOSED
+
+    def _load(self, record: dict[str, Any]) -> None:
+        self._state = record.get("state", BREAKER_CLOSED)
+        self._failures = deque(record.get("failures", ()))
+        self._deadline = record.get("deadline", 0.0)
+        self._probes_in_flight = record.get("probes_in_flight", 0)
+        self._refreshed_at = self._clock()
@@ -0,0 +1,314 @@
+"""Simulated AI provider for load, soak, and chaos testing.
+
+SimulatedAIClient answers with MockAIClient's keyword-matched extractions
+but behaves like a remote provider:
+  - Latency is log-normal around a median, with an occasional slow tail.
+  - Token counts are derived from prompt and response length, so cost
+    tracking and the daily budget see realistic spend.
+  - 429 rate limits, timeouts, and truncated (malformed) JSON are injected
+    at configurable per-call rates.
+  - A tokens-per-minute quota is enforced over a sliding 60-second window;
+    calls over quota are rejected with RateLimitExceeded and a retry_after.
+  - With streaming=True the response arrives in small deltas: the first
+    after _SIM_TTFT_FRACTION of the sampled latency, the rest spread over
+    the remainder, read through the same JSONStreamGuard as AnthropicClient.
+  - With output_mode="tool" the answer comes back as decoded tool input,
+    the tool definition is counted towards input tokens, and injected
+    truncation does not apply (it is the failure tool mode removes).
+
+Calls go through the same cost-limit / circuit-breaker / retry path as
+AnthropicClient, so those mechanisms are exercised under realistic timing.
+Select with AI_PROVIDER=simulated; tune with the SIM_* settings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+
+from app.core.exceptions import RateLimitExceeded
+from app.services.ai.client import (
+    OUTPUT_MODE_TEXT,
+    OUTPUT_MODE_TOOL,
+    OUTPUT_MODES,
+    TOOL_INPUT_TOKENS,
+    AICallResult,
+    AIClient,
+    CircuitBreaker,
+    DailyCostTracker,
+    MockAIClient,
+    _guarded_complete,
+    estimate_call,
+    price_call,
+)
+from app.services.ai.hedging import HedgePolicy
+from app.services.ai.streaming import JSONStreamGuard
+from app.services.ai.tokens import estimate_tokens
+
+SIMULATED_MODEL = "simulated"
+
+_QUOTA_WINDOW_S = 60.0
+_INJECTED_RETRY_AFTER_S = 1.0
+# Streaming: share of the sampled latency spent before the first delta, and
+# characters per delta.
+_SIM_TTFT_FRACTION = 0.3
+_SIM_STREAM_CHUNK_CHARS = 16
+
+
+class SimulatedAIClient(AIClient):
+    """Mock extractions delivered with provider-like latency, failures, and quotas."""
+
+    def __init__(
+        self,
+        *,
+        cost_tracker: DailyCostTracker | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        max_daily_cost_usd: float = 10.0,
+        latency_median_ms: float = 800.0,
+        latency_sigma: float = 0.5,
+        tail_probability: float = 0.01,
+        tail_multiplier: float = 8.0,
+        rate_limit_rate: float = 0.0,
+        timeout_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        timeout_s: float = 10.0,
+        tokens_per_minute: int = 0,
+        seed: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        hedge_policy: HedgePolicy | None = None,
+        model: str = SIMULATED_MODEL,
+        streaming: bool = False,
+        output_mode: str = OUTPUT_MODE_TEXT,
+    ) -> None:
+        """Initialise the latency model, failure rates, and quota.
+
+        Args:
+            cost_tracker: Shared daily cost accumulator.
+            circuit_breaker: Shared failure-tracking circuit breaker.
+            max_daily_cost_usd: Refuse new calls when this daily limit is reached.
+            latency_median_ms: Median of the log-normal latency distribution.
+            latency_sigma: Log-space standard deviation (0 = constant latency).
+            tail_probability: Chance a call lands in the slow tail.
+            tail_multiplier: Latency multiplier applied to tail calls.
+            rate_limit_rate: Chance a call is rejected with an injected 429.
+            timeout_rate: Chance a call hangs for timeout_s then raises TimeoutError.
+            malformed_rate: Chance the response text is truncated, invalid JSON.
+            timeout_s: Time an injected timeout takes to surface.
+            tokens_per_minute: Sliding-window token quota; 0 disables it.
+            seed: Random seed for reproducible runs.
+            clock: Monotonic clock, injectable for tests.
+            hedge_policy: If set, slow calls are hedged with a second request.
+            model: Model name reported in results; also selects the pricing
+                (unknown names, like the default, use DEFAULT_PRICED_MODEL's).
+            streaming: Deliver the response in deltas checked by JSONStreamGuard.
+                Ignored in tool output mode.
+            output_mode: "text" or "tool" (see AnthropicClient).
+
+        Raises:
+            ValueError: If output_mode is not one of OUTPUT_MODES.
+        """
+        if output_mode not in OUTPUT_MODES:
+            raise ValueError(f"Unknown AI output mode: {output_mode!r}")
+        self._cost_tracker = cost_tracker or DailyCostTracker()
+        self._circuit_breaker = circuit_breaker or CircuitBreaker()
+        self._max_daily_cost = max_daily_cost_usd
+        self._mu = math.log(max(latency_median_ms, 1e-3) / 1000)
+        self._sigma = latency_sigma
+        self._tail_probability = tail_probability
+        self._tail_multiplier = tail_multiplier
+        self._rate_limit_rate = rate_limit_rate
+        self._timeout_rate = timeout_rate
+        self._malformed_rate = malformed_rate
+        self._timeout_s = timeout_s
+        self._tokens_per_minute = tokens_per_minute
+        self._rng = random.Random(seed)
+        self._clock = clock
+        self._mock = MockAIClient()
+        self._hedge_policy = hedge_policy
+        self._model = model
+        self._tool_mode = output_mode == OUTPUT_MODE_TOOL
+        self._streaming = streaming and not self._tool_mode
+        # (timestamp, tokens) consumed within the quota window
+        self._usage: deque[tuple[float, int]] = deque()
+        self._usage_total = 0
+
+    async def complete(self, system: str, user: str, *, prompt_version: str = "") -> AICallResult:
+        """Simulate a provider call behind the cost limit, circuit breaker, and retry.
+
+        Args:
+            system: System prompt (counted towards input tokens).
+            user: User-turn message (keyword-matched and counted).
+            prompt_version: Prompt version tag embedded in the result.
+
+        Returns:
+            AICallResult with estimated tokens, cost, and simulated latency.
+
+        Raises:
+            CostLimitExceeded: If the daily budget is exhausted or the call's
+                estimated cost would exceed what remains of it.
+            RetryableError: If the circuit breaker is open.
+            RateLimitExceeded | TimeoutError: If every retry attempt fails.
+        """
+        return await _guarded_complete(
+            lambda: self._raw_complete(system, user, prompt_version=prompt_version),
+            model=self._model,
+            cost_tracker=self._cost_tracker,
+            circuit_breaker=self._circuit_breaker,
+            max_daily_cost_usd=self._max_daily_cost,
+            prompt_version=prompt_version,
+            estimate=estimate_call(
+                system,
+                user,
+                model=self._model,
+                extra_input_tokens=TOOL_INPUT_TOKENS if self._tool_mode else 0,
+            ),
+            hedge_policy=self._hedge_policy,
+        )
+
+    def sample_latency_s(self) -> float:
+        """Draw one latency in seconds from the log-normal-with-tail model."""
+        latency = self._rng.lognormvariate(self._mu, self._sigma)
+        if self._rng.random() < self._tail_probability:
+            latency *= self._tail_multiplier
+        return latency
+
+    async def _raw_complete(self, system: str, user: str, *, prompt_version: str) -> AICallResult:
+        """One simulated provider round trip.
+
+        Args:
+            system: System prompt.
+            user: User-turn message.
+            prompt_version: Embedded in the returned result.
+
+        Returns:
+            AICallResult with estimated tokens and measured latency.
+
+        Raises:
+            RateLimitExceeded: On an injected 429 or when over the TPM quota.
+            TimeoutError: On an injected timeout.
+        """
+        tokens_in = estimate_tokens(system) + estimate_tokens(user)
+        if self._tool_mode:
+            tokens_in += TOOL_INPUT_TOKENS
+        self._admit(tokens_in)
+
+        if self._rng.random() < self._rate_limit_rate:
+            raise RateLimitExceeded(
+                "Simulated provider rate limit (429)",
+                retry_after=_INJECTED_RETRY_AFTER_S,
+                context={"model": self._model, "injected": True},
+            )
+        if self._rng.random() < self._timeout_rate:
+            await asyncio.sleep(self._timeout_s)
+            raise TimeoutError(f"Simulated provider timeout after {self._timeout_s:.1f}s")
+
+        start = time.monotonic()
+        latency_s = self.sample_latency_s()
+        if not self._streaming:
+            await asyncio.sleep(latency_s)
+        mock_result = await self._mock.complete(system, user, prompt_version=prompt_version)
+        text = mock_result.text
+        if self._rng.random() < self._malformed_rate and not self._tool_mode:
+            text = text[: len(text) // 2]
+        ttft_ms: float | None = None
+        stream_abort: str | None = None
+        if self._streaming:
+            ttft_ms, text, stream_abort = await self._stream(text, latency_s, start)
+        latency_ms = (time.monotonic() - start) * 1000
+
+        tokens_out = estimate_tokens(text)
+        self._record_usage(tokens_out)
+        cost_usd = price_call(self._model, tokens_in, tokens_out)
+        return AICallResult(
+            text=text,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cost_usd=cost_usd,
+            latency_ms=latency_ms,
+            model=self._model,
+            prompt_version=prompt_version,
+            ttft_ms=ttft_ms,
+            stream_abort=stream_abort,
+            tool_input=json.loads(text) if self._tool_mode else None,
+        )
+
+    async def _stream(
+        self, text: str, latency_s: float, start: float
+    ) -> tuple[float, str, str | None]:
+        """Deliver text in deltas over latency_s, stopping when the guard does.
+
+        Args:
+            text: Full response the simulated model would produce.
+            latency_s: Sampled latency for the whole response.
+            start: time.monotonic() at which the call started.
+
+        Returns:
+            (ttft_ms, text read, abort reason or None).
+        """
+        guard = JSONStreamGuard()
+        chunks = [
+            text[i : i + _SIM_STREAM_CHUNK_CHARS]
+            for i in range(0, len(text), _SIM_STREAM_CHUNK_CHARS)
+        ] or [""]
+        await asyncio.sleep(latency_s * _SIM_TTFT_FRACTION)
+        ttft_ms = (time.monotonic() - start) * 1000
+        per_chunk_s = latency_s * (1 - _SIM_TTFT_FRACTION) / len(chunks)
+        for index, chunk in enumerate(chunks):
+            if index:
+                await asyncio.sleep(per_chunk_s)
+            if guard.feed(chunk):
+                break
+        return ttft_ms, guard.text, guard.abort_reason
+
+    def _admit(self, tokens_in: int) -> None:
+        """Charge tokens_in against the TPM quota or raise RateLimitExceeded.
+
+        Args:
+            tokens_in: Input tokens for the call being admitted.
+
+        Raises:
+            RateLimitExceeded: When the call would exceed the quota; retry_after
+                is the time until enough usage ages out of the window.
+        """
+        if not self._tokens_per_minute:
+            return
+        now = self._clock()
+        self._prune(now)
+        if self._usage_total + tokens_in > self._tokens_per_minute:
+            retry_after = self._seconds_until_available(now, tokens_in)
+            raise RateLimitExceeded(
+                "Simulated tokens-per-minute quota exceeded",
+                retry_after=retry_after,
+                context={
+                    "model": self._model,
+                    "tokens_per_minute": self._tokens_per_minute,
+                    "tokens_requested": tokens_in,
+                },
+            )
+        self._record_usage(tokens_in)
+
+    def _record_usage(self, tokens: int) -> None:
+        if not self._tokens_per_minute:
+            return
+        self._usage.append((self._clock(), tokens))
+        self._usage_total += tokens
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - _QUOTA_WINDOW_S
+        while self._usage and self._usage[0][0] <= cutoff:
+            _, tokens = self._usage.popleft()
+            self._usage_total -= tokens
+
+    def _seconds_until_available(self, now: float, tokens: int) -> float:
+        freed = 0
+        needed = self._usage_total + tokens - self._tokens_per_minute
+        for timestamp, used in self._usage:
+            freed += used
+            if freed >= needed:
+                return max(timestamp + _QUOTA_WINDOW_S - now, 0.0)
+        return _QUOTA_WINDOW_S
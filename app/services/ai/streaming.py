@@ -0,0 +1,263 @@
+"""Incremental JSON checking for streamed AI responses.
+
+JSONStreamGuard is fed text chunks as they arrive and decides, character by
+character, whether the stream is still on track to become a valid
+AIExtractionOutput object. Streaming clients stop reading as soon as it
+reports a result:
+
+  - complete — the root object's closing brace arrived; anything after it
+               (a closing code fence, trailing prose) is never read
+  - aborted  — the stream cannot become a valid extraction:
+                 not_json      first non-blank output is not "{" (or a ``` fence)
+                 invalid_json  a key or separator is where JSON forbids it
+                 wrong_type    a known field's value has the wrong JSON type
+                 invalid_enum  request_type / priority is not an allowed value
+
+Only structure and the fields' top-level value types are checked here; full
+validation still happens in ExtractionService._parse_and_validate. Unknown
+keys are allowed because the model ignores them.
+"""
+
+from __future__ import annotations
+
+from typing import get_args
+
+from app.models.email import Priority, RequestType
+
+ABORT_NOT_JSON = "not_json"
+ABORT_INVALID_JSON = "invalid_json"
+ABORT_WRONG_TYPE = "wrong_type"
+ABORT_INVALID_ENUM = "invalid_enum"
+
+# JSON value kinds by first character
+_STRING, _OBJECT, _ARRAY, _NULL, _SCALAR = "string", "object", "array", "null", "scalar"
+
+# Allowed value kinds for each AIExtractionOutput field
+EXTRACTION_FIELD_KINDS: dict[str, frozenset[str]] = {
+    "request_type": frozenset({_STRING}),
+    "priority": frozenset({_STRING}),
+    "due_date": frozenset({_STRING, _NULL}),
+    "company": frozenset({_STRING, _NULL}),
+    "description": frozenset({_STRING}),
+    "line_items": frozenset({_ARRAY}),
+    "extraction_notes": frozenset({_ARRAY}),
+}
+EXTRACTION_FIELD_ENUMS: dict[str, frozenset[str]] = {
+    "request_type": frozenset(get_args(RequestType)),
+    "priority": frozenset(get_args(Priority)),
+}
+
+# Parser positions inside the root object
+_BEFORE_ROOT = 0
+_FENCE = 1
+_EXPECT_KEY = 2
+_KEY = 3
+_EXPECT_COLON = 4
+_EXPECT_VALUE = 5
+_VALUE = 6
+_AFTER_VALUE = 7
+_DONE = 8
+
+_WHITESPACE = frozenset(" \t\r\n")
+
+
+class JSONStreamGuard:
+    """Incremental checker for one streamed JSON object."""
+
+    def __init__(
+        self,
+        field_kinds: dict[str, frozenset[str]] | None = None,
+        field_enums: dict[str, frozenset[str]] | None = None,
+    ) -> None:
+        """Initialise for a new stream.
+
+        Args:
+            field_kinds: Allowed value kinds per top-level key
+                (default: EXTRACTION_FIELD_KINDS).
+            field_enums: Allowed string values per top-level key
+                (default: EXTRACTION_FIELD_ENUMS).
+        """
+        self._field_kinds = EXTRACTION_FIELD_KINDS if field_kinds is None else field_kinds
+        self._field_enums = EXTRACTION_FIELD_ENUMS if field_enums is None else field_enums
+        self._chunks: list[str] = []
+        self._consumed = 0
+        self._root_start = -1
+        self._root_end = -1
+        self._position = _BEFORE_ROOT
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._key: list[str] = []
+        self._current_key = ""
+        self._value_kind = ""
+        self._value: list[str] = []
+        self.abort_reason: str | None = None
+
+    @property
+    def complete(self) -> bool:
+        """True once the root object's closing brace has arrived."""
+        return self._position == _DONE and self.abort_reason is None
+
+    @property
+    def done(self) -> bool:
+        """True once the stream is complete or aborted (stop reading)."""
+        return self._position == _DONE
+
+    @property
+    def raw(self) -> str:
+        """All text fed so far."""
+        return "".join(self._chunks)
+
+    @property
+    def text(self) -> str:
+        """The root object's text when complete, else everything fed so far."""
+        if self.complete:
+            return self.raw[self._root_start : self._root_end]
+        return self.raw
+
+    def feed(self, chunk: str) -> bool:
+        """Consume the next chunk of streamed text.
+
+        Args:
+            chunk: Text delta from the provider.
+
+        Returns:
+            True when the caller should stop reading (complete or aborted).
+        """
+        if self._position == _DONE:
+            return True
+        self._chunks.append(chunk)
+        for char in chunk:
+            self._step(char)
+            self._consumed += 1
+            if self._position == _DONE:
+                break
+        return self._position == _DONE
+
+    def _step(self, char: str) -> None:
+        position = self._position
+        if position == _VALUE:
+            self._step_value(char)
+        elif position == _BEFORE_ROOT:
+            if char in _WHITESPACE:
+                return
+            if char == "{":
+                self._root_start = self._consumed
+                self._depth = 1
+                self._position = _EXPECT_KEY
+            elif char == "`":
+                self._position = _FENCE
+            else:
+                self._abort(ABORT_NOT_JSON)
+        elif position == _FENCE:
+            if char == "\n":
+                self._position = _BEFORE_ROOT
+        elif position == _EXPECT_KEY:
+            if char in _WHITESPACE:
+                return
+            if char == '"':
+                self._key = []
+                self._position = _KEY
+            elif char == "}":
+                self._finish()
+            else:
+                self._abort(ABORT_INVALID_JSON)
+        elif position == _KEY:
+            if self._escaped:
+                self._escaped = False
+                self._key.append(char)
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._current_key = "".join(self._key)
+                self._position = _EXPECT_COLON
+            else:
+                self._key.append(char)
+        elif position == _EXPECT_COLON:
+            if char == ":":
+                self._position = _EXPECT_VALUE
+            elif char not in _WHITESPACE:
+                self._abort(ABORT_INVALID_JSON)
+        elif position == _EXPECT_VALUE:
+            if char not in _WHITESPACE:
+                self._start_value(char)
+        elif position == _AFTER_VALUE:
+            if char == ",":
+                self._position = _EXPECT_KEY
+            elif char == "}":
+                self._finish()
+            elif char not in _WHITESPACE:
+                self._abort(ABORT_INVALID_JSON)
+
+    def _start_value(self, char: str) -> None:
+        if char == '"':
+            kind = _STRING
+        elif char == "{":
+            kind = _OBJECT
+        elif char == "[":
+            kind = _ARRAY
+        elif char == "n":
+            kind = _NULL
+        elif char in "-0123456789tf":
+            kind = _SCALAR
+        else:
+            self._abort(ABORT_INVALID_JSON)
+            return
+        allowed = self._field_kinds.get(self._current_key)
+        if allowed is not None and kind not in allowed:
+            self._abort(ABORT_WRONG_TYPE)
+            return
+        self._value_kind = kind
+        self._value = []
+        self._position = _VALUE
+        if kind == _STRING:
+            self._in_string = True
+        elif kind in (_OBJECT, _ARRAY):
+            self._depth += 1
+        else:
+            self._value.append(char)
+
+    def _step_value(self, char: str) -> None:
+        kind = self._value_kind
+        if self._in_string:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                self._escaped = True
+            elif char == '"':
+                self._in_string = False
+                if kind == _STRING:
+                    self._end_string_value()
+                return
+            if kind == _STRING:
+                self._value.append(char)
+        elif kind in (_OBJECT, _ARRAY):
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    self._position = _AFTER_VALUE
+        elif char in _WHITESPACE or char in ",}":
+            # End of a bare scalar (number, true, false, null)
+            self._position = _AFTER_VALUE
+            self._step(char)
+        else:
+            self._value.append(char)
+
+    def _end_string_value(self) -> None:
+        allowed = self._field_enums.get(self._current_key)
+        if allowed is not None and "".join(self._value) not in allowed:
+            self._abort(ABORT_INVALID_ENUM)
+            return
+        self._position = _AFTER_VALUE
+
+    def _finish(self) -> None:
+        self._root_end = self._consumed + 1
+        self._position = _DONE
+
+    def _abort(self, reason: str) -> None:
+        self.abort_reason = reason
+        self._position = _DONE
@@ -0,0 +1,37 @@
+"""Local token estimation for prompt budgeting and cost reservation.
+
+Estimates are computed without calling the provider's tokenizer, so they
+are cheap enough to run on every message before a prompt is built and
+before every provider call. The model is deliberately simple:
+
+  - ~4 characters per token for ASCII text (English prose, JSON, code)
+  - +1 token per 2 extra UTF-8 bytes, so accented and non-Latin text —
+    which BPE tokenizers split much more finely — is not under-counted
+
+Provider-reported input tokens are compared with these estimates on every
+call (ops_ai_input_token_estimate_error_ratio) so drift is visible.
+"""
+
+from __future__ import annotations
+
+import math
+
+# Rough English average; close enough for prompt budgets and load shaping.
+CHARS_PER_TOKEN = 4
+# Extra UTF-8 bytes (beyond one per character) per additional token.
+_EXTRA_BYTES_PER_TOKEN = 2
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate a token count for text (at least 1 for non-empty text).
+
+    Args:
+        text: Prompt or response text.
+
+    Returns:
+        Estimated token count; 0 for an empty string.
+    """
+    if text.isascii():
+        return math.ceil(len(text) / CHARS_PER_TOKEN)
+    extra_bytes = len(text.encode("utf-8")) - len(text)
+    return math.ceil(len(text) / CHARS_PER_TOKEN + extra_bytes / _EXTRA_BYTES_PER_TOKEN)
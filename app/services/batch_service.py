@@ -6,7 +6,9 @@ processes each email concurrently via asyncio.gather. Progress counters
 email so GET /batch/{id} reflects live progress.
 
 Error isolation: ExtractionError on a single email increments failed_count
-and does not abort the rest of the batch.
+and does not abort the rest of the batch. Provider-level errors that outlast
+retries (rate limits, open circuit breaker, exhausted budget) are isolated
+the same way.
 
 Idempotency: WorkflowService.ingest() deduplicates by message_id. Emails
 with a previously-seen message_id return an idempotent_return result that
@@ -20,7 +22,7 @@ import logging
 import uuid
 from typing import Any
 
-from app.core.exceptions import ExtractionError
+from app.core.exceptions import BaseAppError, ExtractionError
 from app.models.batch import BatchJob
 from app.models.email import InboxMessage
 from app.storage import Storage
@@ -93,8 +95,9 @@ class BatchService:
     async def _process_one(self, job_id: str, email: InboxMessage) -> None:
         """Process a single email and update batch progress atomically.
 
-        Catches ExtractionError so one failure does not abort the batch.
-        All other exceptions are re-raised after marking the email as failed.
+        Catches ExtractionError and other BaseAppErrors (rate limit, circuit
+        open, cost limit) so one failure does not abort the batch. Unexpected
+        exceptions propagate.
 
         Args:
             job_id: Batch job to update on completion.
@@ -113,6 +116,17 @@ class BatchService:
                 "Batch email failed — extraction error",
                 extra={"job_id": job_id, "message_id": email.message_id, "error": str(exc)},
             )
+        except BaseAppError as exc:
+            self._storage.increment_batch_result(job_id, succeeded=False)
+            logger.warning(
+                "Batch email failed — provider unavailable",
+                extra={
+                    "job_id": job_id,
+                    "message_id": email.message_id,
+                    "error_code": exc.error_code,
+                    "error": str(exc),
+                },
+            )
 
     def _get_job_or_raise(self, job_id: str) -> BatchJob:
         """Return a BatchJob or raise RuntimeError if absent (should never happen).
@@ -1,9 +1,39 @@
 """AI extraction service.
 
 Pipeline for a single message:
-  build_prompt → call AI → parse JSON → validate schema → score confidence
+  prepare_body → build_prompt → call AI → parse JSON → validate schema → score confidence
   → return Extraction
 
+Optional keyword tier: when keyword_tier_threshold is set, the rule-based
+keyword extractor runs first. If its result is type-compliant and scores at
+least the threshold under compute_confidence, it is returned without calling
+the AI provider; everything else escalates to the AI pipeline above.
+
+prepare_body strips quoted history, signatures, disclaimers and base64 from
+the body and fits it to the prompt token budget. Its notes are appended to
+extraction_notes after confidence is scored, and the estimated tokens saved
+are observed in ops_prompt_tokens_saved.
+
+With a CascadingAIClient, the AI step tries each model tier in turn,
+cheapest first, and escalates when the output fails parsing/validation or
+its confidence lands in the human-review band (between the auto-reject and
+auto-approve thresholds). The final tier and any escalation reasons are
+appended to extraction_notes after scoring ("model_tier:<name>",
+"escalated:<tier>:<reason>").
+
+When max_repair_attempts > 0, an output that fails JSON parsing or schema
+validation gets a short follow-up turn (build_repair_prompt: the failed
+output plus its errors, not the email) asking for a corrected object. A
+successful repair is noted as "repaired:<failure>:<attempts>" after scoring,
+and attempts, outcomes, cost and latency go to ops_ai_repair_* metrics.
+With a cascade, repair is tried before escalating to the next tier.
+
+In the "tool" output mode the provider returns the extraction as a decoded
+tool call (AICallResult.tool_input), which is validated directly and skips
+fence stripping and JSON parsing. A streaming provider that cut its
+response off early (AICallResult.stream_abort) fails the extraction without
+parsing, which a cascade treats as invalid output.
+
 ExtractionError (from app.core.exceptions) is raised on any failure in
 this pipeline and should be caught by the caller to map to an HTTP 422.
 """
@@ -11,38 +41,125 @@ this pipeline and should be caught by the caller to map to an HTTP 422.
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from pydantic import ValidationError
 
+from app.core.constants import DEFAULT_AUTO_APPROVE_THRESHOLD, DEFAULT_AUTO_REJECT_THRESHOLD
 from app.core.exceptions import BaseAppError, ExtractionError
+from app.core.metrics import (
+    AI_REPAIR_ATTEMPTS_TOTAL,
+    AI_REPAIR_COST_USD,
+    AI_REPAIR_SECONDS,
+    EXTRACTION_TIER_TOTAL,
+    PIPELINE_STAGE_SECONDS,
+    PROMPT_TOKENS_SAVED,
+)
+from app.core.tracing import start_span
 from app.models.email import AIExtractionOutput, Extraction, InboxMessage, Requester
-from app.services.ai.client import AIClient
-from app.services.ai.prompts import SYSTEM_PROMPT, VERSION, build_prompt
+from app.services.ai.cascade import (
+    ESCALATE_INVALID_OUTPUT,
+    ESCALATE_REVIEW_BAND,
+    OUTCOME_ACCEPTED,
+    OUTCOME_FAILED,
+    CascadingAIClient,
+)
+from app.services.ai.client import AICallResult, AIClient
+from app.services.ai.preprocess import DEFAULT_MAX_BODY_TOKENS, prepare_body
+from app.services.ai.prompts import (
+    REPAIR_SYSTEM_PROMPT,
+    REPAIR_VERSION,
+    SYSTEM_PROMPT,
+    VERSION,
+    build_prompt,
+    build_repair_prompt,
+)
 from app.services.confidence_service import compute_confidence
+from app.services.keyword_extractor import extract as keyword_extract
+from app.services.keyword_extractor import load_schema_validator
 from app.utils import stable_id
 
 logger = logging.getLogger(__name__)
 
+TIER_KEYWORD = "keyword"
+TIER_AI = "ai"
+
+# ExtractionError context["failure"] for unusable AI output
+FAILURE_NON_JSON = "non_json"
+FAILURE_SCHEMA_MISMATCH = "schema_mismatch"
+FAILURE_STREAM_ABORTED = "stream_aborted"
+# Failures a repair turn can fix: there is a complete output to correct
+_REPAIRABLE = (FAILURE_NON_JSON, FAILURE_SCHEMA_MISMATCH)
+_MAX_REPORTED_ERRORS = 10
+
+REPAIR_REPAIRED = "repaired"
+REPAIR_FAILED = "failed"
+
+# Keyword extractor notes that mark a real ambiguity. Its other notes
+# ("type_hint:order->…", "company_explicit", "due:none") record evidence or
+# absences that completeness scoring already accounts for, and would
+# otherwise be counted as AI-flagged ambiguities by compute_confidence.
+_KEYWORD_AMBIGUITY_NOTES = ("type_hint:none", "priority_default:", "due_parse_failed:")
+# Notes the pipeline appends after confidence scoring (prompt trimming,
+# cascade tier, repair), so they never count towards the score
+_PIPELINE_NOTE_PREFIXES = (
+    "prompt_trimmed:",
+    "prompt_truncated:",
+    "model_tier:",
+    "escalated:",
+    "repaired:",
+)
+
 
 class ExtractionService:
     """Orchestrates AI-powered field extraction for a single InboxMessage."""
 
-    def __init__(self, ai_client: AIClient) -> None:
-        """Initialise with an AI client.
+    def __init__(
+        self,
+        ai_client: AIClient,
+        *,
+        keyword_tier_threshold: float | None = None,
+        max_body_tokens: int = DEFAULT_MAX_BODY_TOKENS,
+        review_band: tuple[float, float] = (
+            DEFAULT_AUTO_REJECT_THRESHOLD,
+            DEFAULT_AUTO_APPROVE_THRESHOLD,
+        ),
+        max_repair_attempts: int = 0,
+        strict_schema_validation: bool = False,
+    ) -> None:
+        """Initialise with an AI client and optional keyword tier.
 
         Args:
-            ai_client: Provider-agnostic AI completion client.
+            ai_client: Provider-agnostic AI completion client; a
+                CascadingAIClient enables model escalation.
+            keyword_tier_threshold: Minimum confidence for a keyword extraction
+                to skip the AI call. None disables the keyword tier.
+            max_body_tokens: Estimated-token budget for the email body in the prompt.
+            review_band: (auto_reject, auto_approve) thresholds; a cascade
+                escalates results whose confidence routes to human review.
+            max_repair_attempts: Repair turns allowed after an output fails
+                parsing or validation. 0 disables repair.
+            strict_schema_validation: Validate keyword-tier results against the
+                JSON Schema as well as their Pydantic types.
         """
         self._ai = ai_client
+        self._max_repair_attempts = max_repair_attempts
+        self._max_body_tokens = max_body_tokens
+        self._review_band = review_band
+        self._keyword_tier_threshold = keyword_tier_threshold
+        self._schema_validator = (
+            load_schema_validator(None)
+            if keyword_tier_threshold is not None and strict_schema_validation
+            else None
+        )
 
     async def extract(self, message: InboxMessage) -> Extraction:
         """Extract structured fields from an InboxMessage.
 
-        Pipeline: build prompt → call AI → parse JSON → validate schema
-        → score confidence → return Extraction.
+        Pipeline: [keyword tier →] prepare body → build prompt → call AI
+        → parse JSON → validate schema → score confidence → return Extraction.
 
         Args:
             message: Validated inbox message.
@@ -54,61 +171,363 @@ class ExtractionService:
             ExtractionError: On AI failure, parse error, or schema validation failure.
         """
         input_hash = _hash_input(message.body)
-        user_prompt = build_prompt(
-            from_name=message.from_.name,
-            from_email=str(message.from_.email),
-            subject=message.subject,
-            received_at=message.received_at.isoformat(),
-            body=message.body,
-        )
+        if self._keyword_tier_threshold is not None:
+            with PIPELINE_STAGE_SECONDS.time(stage="keyword_tier"):
+                keyword_extraction = self.try_keyword_tier(message)
+            if keyword_extraction is not None:
+                EXTRACTION_TIER_TOTAL.inc(tier=TIER_KEYWORD)
+                logger.info(
+                    "Extraction complete",
+                    extra={
+                        "input_hash": input_hash,
+                        "request_type": keyword_extraction.request_type,
+                        "confidence": keyword_extraction.confidence,
+                        "tier": TIER_KEYWORD,
+                        "line_items_count": len(keyword_extraction.line_items),
+                    },
+                )
+                return keyword_extraction
+
+        with PIPELINE_STAGE_SECONDS.time(stage="prompt_build"):
+            prepared = prepare_body(message.body, max_tokens=self._max_body_tokens)
+            user_prompt = build_prompt(
+                from_name=message.from_.name,
+                from_email=str(message.from_.email),
+                subject=message.subject,
+                received_at=message.received_at.isoformat(),
+                body=prepared.text,
+            )
+        PROMPT_TOKENS_SAVED.observe(prepared.tokens_saved)
 
-        raw_response = await self._call_ai(user_prompt, input_hash=input_hash)
-        ai_output = self._parse_and_validate(raw_response, input_hash=input_hash)
-        extraction = self._build_extraction(message, ai_output)
+        if isinstance(self._ai, CascadingAIClient):
+            extraction, cascade_notes = await self._extract_cascade(
+                self._ai, message, user_prompt, input_hash=input_hash
+            )
+        else:
+            extraction = await self._extract_with(
+                self._ai, message, user_prompt, input_hash=input_hash
+            )
+            cascade_notes = []
+        if prepared.notes or cascade_notes:
+            extraction = extraction.model_copy(
+                update={
+                    "extraction_notes": [
+                        *extraction.extraction_notes,
+                        *prepared.notes,
+                        *cascade_notes,
+                    ]
+                }
+            )
 
+        EXTRACTION_TIER_TOTAL.inc(tier=TIER_AI)
         logger.info(
             "Extraction complete",
             extra={
                 "input_hash": input_hash,
                 "request_type": extraction.request_type,
                 "confidence": extraction.confidence,
+                "tier": TIER_AI,
                 "prompt_version": VERSION,
+                "prompt_tokens_saved": prepared.tokens_saved,
                 "line_items_count": len(extraction.line_items),
             },
         )
         return extraction
 
-    async def _call_ai(self, user_prompt: str, *, input_hash: str) -> str:
-        """Call the AI provider and return the raw text response.
+    def try_keyword_tier(self, message: InboxMessage) -> Extraction | None:
+        """Return the keyword extraction if it is good enough to skip the AI call.
+
+        The candidate is scored with compute_confidence — the same scorer the
+        AI path uses — counting only the keyword notes that mark an ambiguity.
+        It is accepted when the type rules are fully met (a named type, and
+        line items for a purchase_request) and the score reaches the threshold.
+
+        Args:
+            message: Validated inbox message.
+
+        Returns:
+            Extraction scored by compute_confidence, or None to escalate.
+        """
+        if self._keyword_tier_threshold is None:
+            return None
+        try:
+            candidate = keyword_extract(message, self._schema_validator)
+        except ValueError:
+            return None
+
+        ambiguities = [
+            note for note in candidate.extraction_notes if note.startswith(_KEYWORD_AMBIGUITY_NOTES)
+        ]
+        confidence_result = compute_confidence(
+            candidate.model_copy(update={"extraction_notes": ambiguities})
+        )
+        if (
+            confidence_result.type_compliance_score < 1.0
+            or confidence_result.score < self._keyword_tier_threshold
+        ):
+            return None
+        return candidate.model_copy(
+            update={
+                "confidence": confidence_result.score,
+                "extraction_notes": [*candidate.extraction_notes, f"tier:{TIER_KEYWORD}"],
+            }
+        )
+
+    async def _extract_with(
+        self,
+        client: AIClient,
+        message: InboxMessage,
+        user_prompt: str,
+        *,
+        input_hash: str,
+        on_result: Callable[[AICallResult], None] | None = None,
+    ) -> Extraction:
+        """Run call AI → parse/validate → score confidence with one client.
 
         Args:
+            client: AI client to call.
+            message: Original inbox message.
             user_prompt: Rendered user-turn message.
             input_hash: Short digest for log correlation.
+            on_result: Called with each provider result (the extraction call
+                and any repair turns) before parsing.
 
         Returns:
-            Raw text response from the provider.
+            Extraction with confidence scored.
 
         Raises:
-            BaseAppError: CostLimitExceeded / RetryableError propagate as-is.
-            ExtractionError: On any other provider failure.
+            ExtractionError: On AI failure, parse error, or schema validation failure.
         """
+        with PIPELINE_STAGE_SECONDS.time(stage="ai_call"):
+            ai_result = await self._call_ai(user_prompt, input_hash=input_hash, client=client)
+        if on_result is not None:
+            on_result(ai_result)
+        repair_notes: list[str] = []
         try:
-            ai_result = await self._ai.complete(
-                system=SYSTEM_PROMPT,
-                user=user_prompt,
-                prompt_version=VERSION,
+            with PIPELINE_STAGE_SECONDS.time(stage="parse_validate"):
+                ai_output = self._decode_output(ai_result, input_hash=input_hash)
+        except ExtractionError as exc:
+            if self._max_repair_attempts < 1 or exc.context.get("failure") not in _REPAIRABLE:
+                raise
+            with PIPELINE_STAGE_SECONDS.time(stage="repair"):
+                ai_output, attempts = await self._repair(
+                    client, ai_result.text, exc, input_hash=input_hash, on_result=on_result
+                )
+            repair_notes.append(f"repaired:{exc.context['failure']}:{attempts}")
+        with PIPELINE_STAGE_SECONDS.time(stage="confidence"):
+            extraction = self._build_extraction(message, ai_output)
+        if repair_notes:
+            extraction = extraction.model_copy(
+                update={"extraction_notes": [*extraction.extraction_notes, *repair_notes]}
+            )
+        return extraction
+
+    async def _repair(
+        self,
+        client: AIClient,
+        previous_output: str,
+        error: ExtractionError,
+        *,
+        input_hash: str,
+        on_result: Callable[[AICallResult], None] | None = None,
+    ) -> tuple[AIExtractionOutput, int]:
+        """Ask for a corrected object, up to max_repair_attempts times.
+
+        Each repair turn carries only the failed output and its errors (see
+        build_repair_prompt), so it costs a fraction of the original call.
+
+        Args:
+            client: AI client that produced the failed output.
+            previous_output: Text of the failed response.
+            error: ExtractionError raised for it (context carries
+                "failure" and "errors").
+            input_hash: Short digest for log correlation.
+            on_result: Called with each repair turn's provider result.
+
+        Returns:
+            (validated output, number of repair turns used).
+
+        Raises:
+            ExtractionError: If every repair turn also fails.
+            BaseAppError: Provider errors (cost limit, open circuit) propagate.
+        """
+        failure = error.context["failure"]
+        for attempt in range(1, self._max_repair_attempts + 1):
+            repair_result = await self._call_ai(
+                build_repair_prompt(previous_output, error.context.get("errors", [])),
+                input_hash=input_hash,
+                client=client,
+                system=REPAIR_SYSTEM_PROMPT,
+                prompt_version=REPAIR_VERSION,
+            )
+            if on_result is not None:
+                on_result(repair_result)
+            AI_REPAIR_COST_USD.inc(repair_result.cost_usd)
+            AI_REPAIR_SECONDS.observe(repair_result.latency_ms / 1000)
+            try:
+                ai_output = self._decode_output(repair_result, input_hash=input_hash)
+            except ExtractionError as exc:
+                AI_REPAIR_ATTEMPTS_TOTAL.inc(failure=failure, outcome=REPAIR_FAILED)
+                if exc.context.get("failure") not in _REPAIRABLE:
+                    raise
+                error, previous_output = exc, repair_result.text
+                continue
+            AI_REPAIR_ATTEMPTS_TOTAL.inc(failure=failure, outcome=REPAIR_REPAIRED)
+            logger.info(
+                "AI output repaired",
+                extra={"input_hash": input_hash, "failure": failure, "attempts": attempt},
             )
-        except BaseAppError:
-            raise
-        except Exception as exc:
-            logger.error(
-                "AI provider call failed",
-                extra={"input_hash": input_hash, "error": str(exc)},
+            return ai_output, attempt
+        raise error
+
+    def _decode_output(self, ai_result: AICallResult, *, input_hash: str) -> AIExtractionOutput:
+        """Turn a provider result into validated AIExtractionOutput.
+
+        Args:
+            ai_result: Provider result (text reply, tool call, or aborted stream).
+            input_hash: Short digest for log correlation.
+
+        Returns:
+            Validated AIExtractionOutput.
+
+        Raises:
+            ExtractionError: If the stream was aborted or the output is not a
+                valid extraction; context["failure"] says which.
+        """
+        if ai_result.stream_abort is not None:
+            logger.warning(
+                "AI response stream aborted",
+                extra={
+                    "input_hash": input_hash,
+                    "reason": ai_result.stream_abort,
+                    "preview": ai_result.text[:200],
+                },
             )
             raise ExtractionError(
-                f"AI provider unavailable: {exc}",
-                context={"input_hash": input_hash},
-            ) from exc
+                f"AI response stream aborted: {ai_result.stream_abort}",
+                context={
+                    "input_hash": input_hash,
+                    "failure": FAILURE_STREAM_ABORTED,
+                    "reason": ai_result.stream_abort,
+                },
+            )
+        if ai_result.tool_input is not None:
+            return self._validate_output(ai_result.tool_input, input_hash=input_hash)
+        return self._parse_and_validate(ai_result.text, input_hash=input_hash)
+
+    async def _extract_cascade(
+        self,
+        cascade: CascadingAIClient,
+        message: InboxMessage,
+        user_prompt: str,
+        *,
+        input_hash: str,
+    ) -> tuple[Extraction, list[str]]:
+        """Try each cascade tier until one produces a result worth keeping.
+
+        A tier's result is kept when it parses, validates, and its confidence
+        falls outside the review band; the last tier's result is kept either
+        way (its errors propagate).
+
+        Args:
+            cascade: Client holding the tiers, cheapest first.
+            message: Original inbox message.
+            user_prompt: Rendered user-turn message.
+            input_hash: Short digest for log correlation.
+
+        Returns:
+            (extraction, notes) where notes name the final tier and each escalation.
+
+        Raises:
+            BaseAppError: Provider errors from any tier, or ExtractionError
+                from the last tier.
+        """
+        reject_threshold, approve_threshold = self._review_band
+        notes: list[str] = []
+        last_index = len(cascade.tiers) - 1
+        for index, tier in enumerate(cascade.tiers):
+            results: list[AICallResult] = []
+            try:
+                extraction = await self._extract_with(
+                    tier.client,
+                    message,
+                    user_prompt,
+                    input_hash=input_hash,
+                    on_result=results.append,
+                )
+            except ExtractionError:
+                if not results or index == last_index:
+                    cascade.record(tier.name, OUTCOME_FAILED, results)
+                    raise
+                outcome = ESCALATE_INVALID_OUTPUT
+            except BaseAppError:
+                cascade.record(tier.name, OUTCOME_FAILED, results)
+                raise
+            else:
+                in_band = reject_threshold <= extraction.confidence <= approve_threshold
+                outcome = (
+                    ESCALATE_REVIEW_BAND if in_band and index < last_index else OUTCOME_ACCEPTED
+                )
+            cascade.record(tier.name, outcome, results)
+            if outcome == OUTCOME_ACCEPTED:
+                notes.append(f"model_tier:{tier.name}")
+                return extraction, notes
+            notes.append(f"escalated:{tier.name}:{outcome}")
+            logger.info(
+                "Escalating extraction to next model tier",
+                extra={"input_hash": input_hash, "tier": tier.name, "reason": outcome},
+            )
+        raise AssertionError("unreachable: the last cascade tier always returns or raises")
+
+    async def _call_ai(
+        self,
+        user_prompt: str,
+        *,
+        input_hash: str,
+        client: AIClient | None = None,
+        system: str = SYSTEM_PROMPT,
+        prompt_version: str = VERSION,
+    ) -> AICallResult:
+        """Call the AI provider and return its result.
+
+        Args:
+            user_prompt: Rendered user-turn message.
+            input_hash: Short digest for log correlation.
+            client: Client to call instead of the service's own.
+            system: System prompt (the repair turn uses its own).
+            prompt_version: Prompt version tag for the call.
+
+        Returns:
+            AICallResult with the raw text response.
+
+        Raises:
+            BaseAppError: CostLimitExceeded / RetryableError propagate as-is.
+            ExtractionError: On any other provider failure.
+        """
+        with start_span(
+            "extraction.call_ai", input_hash=input_hash, prompt_version=prompt_version
+        ) as span:
+            try:
+                ai_result = await (client or self._ai).complete(
+                    system=system,
+                    user=user_prompt,
+                    prompt_version=prompt_version,
+                )
+            except BaseAppError:
+                raise
+            except Exception as exc:
+                logger.error(
+                    "AI provider call failed",
+                    extra={"input_hash": input_hash, "error": str(exc)},
+                )
+                raise ExtractionError(
+                    f"AI provider unavailable: {exc}",
+                    context={"input_hash": input_hash},
+                ) from exc
+            span.set_attribute("model", ai_result.model)
+            span.set_attribute("tokens_in", ai_result.tokens_in)
+            span.set_attribute("tokens_out", ai_result.tokens_out)
+            span.set_attribute("cost_usd", ai_result.cost_usd)
 
         logger.debug(
             "AI response received",
@@ -121,7 +540,7 @@ class ExtractionService:
                 "latency_ms": round(ai_result.latency_ms, 1),
             },
         )
-        return ai_result.text
+        return ai_result
 
     def _parse_and_validate(self, raw_response: str, *, input_hash: str) -> AIExtractionOutput:
         """Parse the AI response JSON and validate with Pydantic.
@@ -140,29 +559,43 @@ class ExtractionService:
         if text.startswith("```"):
             text = text.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
 
+        # One pass: pydantic-core parses the JSON and validates the model together
         try:
-            payload: dict[str, Any] = json.loads(text)
-        except json.JSONDecodeError as exc:
+            return AIExtractionOutput.model_validate_json(text)
+        except ValidationError as exc:
+            json_errors = [error for error in exc.errors() if error["type"] == "json_invalid"]
+            if not json_errors:
+                raise _schema_mismatch(exc, input_hash=input_hash) from exc
             logger.warning(
                 "AI response not valid JSON",
                 extra={"input_hash": input_hash, "preview": raw_response[:200]},
             )
             raise ExtractionError(
                 "AI returned non-JSON response",
-                context={"input_hash": input_hash},
+                context={
+                    "input_hash": input_hash,
+                    "failure": FAILURE_NON_JSON,
+                    "errors": [f"invalid JSON: {json_errors[0]['ctx']['error']}"],
+                },
             ) from exc
 
+    def _validate_output(self, payload: Any, *, input_hash: str) -> AIExtractionOutput:
+        """Validate a decoded AI payload against AIExtractionOutput.
+
+        Args:
+            payload: Decoded JSON object (from the reply text or a tool call).
+            input_hash: Short digest for log correlation.
+
+        Returns:
+            Validated AIExtractionOutput.
+
+        Raises:
+            ExtractionError: If the payload fails schema validation.
+        """
         try:
             return AIExtractionOutput.model_validate(payload)
         except ValidationError as exc:
-            logger.warning(
-                "AI response failed schema validation",
-                extra={"input_hash": input_hash, "errors": exc.errors()},
-            )
-            raise ExtractionError(
-                f"AI output schema mismatch: {exc.error_count()} field(s) invalid",
-                context={"input_hash": input_hash},
-            ) from exc
+            raise _schema_mismatch(exc, input_hash=input_hash) from exc
 
     def _build_extraction(self, message: InboxMessage, ai_output: AIExtractionOutput) -> Extraction:
         """Combine AI output with message-envelope fields into a full Extraction.
@@ -175,9 +608,12 @@ class ExtractionService:
             Complete Extraction with request_id, requester, and confidence scored.
         """
         request_id = stable_id(message.message_id, str(message.from_.email), message.subject)
-        requester = Requester(name=message.from_.name, email=message.from_.email)
-
-        partial_extraction = Extraction(
+        # Every field below is already validated — the envelope by InboxMessage,
+        # the rest by AIExtractionOutput — so the Extraction is assembled once,
+        # without re-running EmailStr and the line-item validators.
+        requester = Requester.model_construct(name=message.from_.name, email=message.from_.email)
+        confidence_result = compute_confidence(ai_output, requester)
+        return Extraction.model_construct(
             request_id=request_id,
             request_type=ai_output.request_type,
             priority=ai_output.priority,
@@ -186,11 +622,54 @@ class ExtractionService:
             requester=requester,
             description=ai_output.description,
             line_items=ai_output.line_items,
-            confidence=0.0,
+            confidence=confidence_result.score,
             extraction_notes=ai_output.extraction_notes,
         )
-        confidence_result = compute_confidence(partial_extraction)
-        return partial_extraction.model_copy(update={"confidence": confidence_result.score})
+
+
+def _schema_mismatch(exc: ValidationError, *, input_hash: str) -> ExtractionError:
+    """Log a failed AIExtractionOutput validation and return the error to raise.
+
+    Args:
+        exc: Pydantic validation error.
+        input_hash: Short digest for log correlation.
+
+    Returns:
+        ExtractionError carrying FAILURE_SCHEMA_MISMATCH and the field errors.
+    """
+    logger.warning(
+        "AI response failed schema validation",
+        extra={"input_hash": input_hash, "errors": exc.errors()},
+    )
+    return ExtractionError(
+        f"AI output schema mismatch: {exc.error_count()} field(s) invalid",
+        context={
+            "input_hash": input_hash,
+            "failure": FAILURE_SCHEMA_MISMATCH,
+            "errors": [
+                f"{'.'.join(str(part) for part in error['loc']) or 'object'}: {error['msg']}"
+                for error in exc.errors()[:_MAX_REPORTED_ERRORS]
+            ],
+        },
+    )
+
+
+def scored_note_count(extraction_notes: list[str]) -> int:
+    """Return how many of a stored extraction's notes compute_confidence counted.
+
+    Notes appended after scoring are excluded, and a keyword-tier result was
+    scored on its ambiguity notes only, so re-scoring a stored extraction with
+    this count reproduces its original score.
+
+    Args:
+        extraction_notes: extraction_notes of an Extraction produced by ExtractionService.
+
+    Returns:
+        Note count to use for the AI-confidence component.
+    """
+    if f"tier:{TIER_KEYWORD}" in extraction_notes:
+        return sum(note.startswith(_KEYWORD_AMBIGUITY_NOTES) for note in extraction_notes)
+    return sum(not note.startswith(_PIPELINE_NOTE_PREFIXES) for note in extraction_notes)
 
 
 def _hash_input(body: str) -> str:
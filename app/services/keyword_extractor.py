@@ -7,16 +7,16 @@ and as a reference implementation for the confidence scoring inputs.
 
 from __future__ import annotations
 
-import json
 import logging
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, get_args
 
 from dateutil.parser import parse as dt_parse
-from jsonschema import Draft202012Validator
 
-from app.models.email import Extraction, InboxMessage, LineItem, Requester
+from app.models.email import Extraction, InboxMessage, LineItem, Priority, Requester, RequestType
+from app.services.keyword_matcher import GROUP_PRIORITY, GROUP_REQUEST_TYPE, get_keyword_matcher
+from app.services.schema_validator import SchemaValidator, load_validator
 from app.utils import normalize_whitespace, stable_id
 
 logger = logging.getLogger(__name__)
@@ -24,26 +24,6 @@ logger = logging.getLogger(__name__)
 _BASE_DIR = Path(__file__).resolve().parents[2]
 _DEFAULT_SCHEMA_PATH = _BASE_DIR / "schemas" / "extraction_schema.json"
 
-_PRIORITY_HINTS: dict[str, str] = {
-    "urgent": "urgent",
-    "asap": "urgent",
-    "high": "high",
-    "medium": "medium",
-    "low": "low",
-}
-
-_TYPE_HINTS: list[tuple[str, str]] = [
-    ("purchase", "purchase_request"),
-    ("order", "purchase_request"),
-    ("billing", "customer_issue"),
-    ("error", "customer_issue"),
-    ("issue", "customer_issue"),
-    ("incident", "customer_issue"),
-    ("change request", "ops_change"),
-    ("change", "ops_change"),
-    ("update", "ops_change"),
-]
-
 _COMPANY_RE = re.compile(r"\bCompany:\s*(.+)\b", re.IGNORECASE)
 _PRIORITY_RE = re.compile(r"\bPriority:\s*(urgent|high|medium|low)\b", re.IGNORECASE)
 _DUE_RE = re.compile(
@@ -52,9 +32,17 @@ _DUE_RE = re.compile(
 )
 _LINE_ITEM_RE = re.compile(r"\bItem:\s*(.+?),\s*Qty:\s*(\d+)\b", re.IGNORECASE)
 
+# Labels come from the (configurable) keyword table, so they are the only
+# extracted values not already typed by a Pydantic model
+_REQUEST_TYPES = frozenset(get_args(RequestType))
+_PRIORITIES = frozenset(get_args(Priority))
+
 
-def load_schema_validator(schema_path: str | Path | None) -> Draft202012Validator:
-    """Load a JSON Schema Draft 2020-12 validator from a file.
+def load_schema_validator(schema_path: str | Path | None) -> SchemaValidator:
+    """Load the compiled JSON Schema Draft 2020-12 validator for a file.
+
+    The schema is read and compiled once per path and mtime (see
+    app.services.schema_validator.load_validator), so repeated calls are cheap.
 
     Args:
         schema_path: Optional path to the JSON schema file. If a relative
@@ -62,7 +50,7 @@ def load_schema_validator(schema_path: str | Path | None) -> Draft202012Validato
             None, the default extraction schema path is used.
 
     Returns:
-        Configured Draft202012Validator instance.
+        Validator returning the list of SchemaErrors for an instance.
     """
     if schema_path is None:
         resolved_path = _DEFAULT_SCHEMA_PATH
@@ -72,13 +60,14 @@ def load_schema_validator(schema_path: str | Path | None) -> Draft202012Validato
             candidate_path if candidate_path.is_absolute() else _BASE_DIR / candidate_path
         )
 
-    schema = json.loads(resolved_path.read_text(encoding="utf-8"))
-    return Draft202012Validator(schema)
+    return load_validator(resolved_path)
 
 
 def detect_request_type(subject: str, body: str) -> tuple[str, list[str]]:
     """Detect request type from subject and body text using keyword matching.
 
+    The first request_type entry of the keyword table found in the text wins.
+
     Args:
         subject: Email subject line.
         body: Email body text.
@@ -86,10 +75,10 @@ def detect_request_type(subject: str, body: str) -> tuple[str, list[str]]:
     Returns:
         Tuple of (request_type, extraction_notes).
     """
-    text = (subject + " " + body).lower()
-    for keyword, mapped_type in _TYPE_HINTS:
-        if keyword in text:
-            return mapped_type, [f"type_hint:{keyword}->{mapped_type}"]
+    match = get_keyword_matcher().first_match(subject + " " + body, GROUP_REQUEST_TYPE)
+    if match is not None:
+        keyword, mapped_type = match
+        return mapped_type, [f"type_hint:{keyword}->{mapped_type}"]
     return "other", ["type_hint:none"]
 
 
@@ -108,10 +97,10 @@ def detect_priority(subject: str, body: str) -> tuple[str, list[str]]:
         detected_priority = priority_match.group(1).lower()
         return detected_priority, ["priority_explicit:body"]
 
-    text = (subject + " " + body).lower()
-    for hint, mapped_priority in _PRIORITY_HINTS.items():
-        if hint in text:
-            return mapped_priority, [f"priority_hint:{hint}"]
+    match = get_keyword_matcher().first_match(subject + " " + body, GROUP_PRIORITY)
+    if match is not None:
+        hint, mapped_priority = match
+        return mapped_priority, [f"priority_hint:{hint}"]
 
     return "medium", ["priority_default:medium"]
 
@@ -218,20 +207,25 @@ def _score_confidence(
     return max(0.0, min(1.0, round(score, 2)))
 
 
-def extract(message: InboxMessage, schema_validator: Draft202012Validator) -> Extraction:
+def extract(message: InboxMessage, schema_validator: SchemaValidator | None = None) -> Extraction:
     """Extract structured fields from a message using keyword/regex rules.
 
-    Validates the result against a JSON Schema before returning.
+    With a schema validator (strict mode) the dumped result is validated
+    against the JSON Schema before returning. Without one, only the keyword
+    table labels are checked — every other field is built from values that
+    Pydantic models have already validated.
 
     Args:
         message: Validated inbox message to extract from.
-        schema_validator: Pre-loaded Draft202012Validator for output validation.
+        schema_validator: Validator from load_schema_validator, or None to skip
+            full schema validation.
 
     Returns:
         Extraction with all fields populated and confidence scored.
 
     Raises:
-        ValueError: If the extraction fails JSON Schema validation.
+        ValueError: If a label is not a valid request_type / priority, or the
+            extraction fails JSON Schema validation.
     """
     request_type, type_notes = detect_request_type(message.subject, message.body)
     priority, priority_notes = detect_priority(message.subject, message.body)
@@ -241,7 +235,9 @@ def extract(message: InboxMessage, schema_validator: Draft202012Validator) -> Ex
 
     description = normalize_whitespace(message.body)
     request_id = stable_id(message.message_id, str(message.from_.email), message.subject)
-    requester = Requester(name=message.from_.name, email=message.from_.email)
+    # The envelope was validated by InboxMessage and the line items by LineItem;
+    # the label / schema checks below cover the rest, so no re-validation here.
+    requester = Requester.model_construct(name=message.from_.name, email=message.from_.email)
 
     all_notes: list[str] = type_notes + priority_notes + company_notes + due_notes + li_notes
 
@@ -255,10 +251,10 @@ def extract(message: InboxMessage, schema_validator: Draft202012Validator) -> Ex
         notes=all_notes,
     )
 
-    extraction = Extraction(
+    extraction = Extraction.model_construct(
         request_id=request_id,
-        request_type=request_type,  # type: ignore[arg-type]
-        priority=priority,  # type: ignore[arg-type]
+        request_type=request_type,
+        priority=priority,
         due_date=due_date,
         company=company,
         requester=requester,
@@ -268,8 +264,15 @@ def extract(message: InboxMessage, schema_validator: Draft202012Validator) -> Ex
         extraction_notes=all_notes,
     )
 
+    if schema_validator is None:
+        if request_type not in _REQUEST_TYPES or priority not in _PRIORITIES:
+            raise ValueError(
+                f"Invalid keyword label: request_type={request_type!r}, priority={priority!r}"
+            )
+        return extraction
+
     payload: dict[str, Any] = extraction.model_dump()
-    schema_errors = sorted(schema_validator.iter_errors(payload), key=lambda e: e.path)
+    schema_errors = sorted(schema_validator(payload), key=lambda e: e.path)
     if schema_errors:
         error_summary = "; ".join([f"{list(err.path)}: {err.message}" for err in schema_errors])
         raise ValueError(f"Schema validation failed: {error_summary}")
@@ -0,0 +1,364 @@
+"""Shared multi-pattern keyword matcher for rule-based classification.
+
+The keyword extractor (request type and priority hints) and MockAIClient
+(canned-response selection) classify text by ordered keyword tables: the
+first entry of a group, in table order, whose keyword occurs anywhere in the
+lower-cased text wins. KeywordMatcher compiles every group once and answers
+first_match(text, group) with those same precedence semantics.
+
+Per text, the matcher lower-cases once and tests each distinct keyword at
+most once, however many groups share it; the last text's results are kept,
+so detect_request_type() and detect_priority() on the same subject + body
+cost one pass between them. Two backends:
+
+  scan       — ordered substring tests on the lower-cased text, stopping at
+               the first hit of each group (always available)
+  automaton  — a pyahocorasick Aho–Corasick automaton that finds every
+               keyword in one pass over the text (used when installed)
+
+CPython's substring search runs at roughly 1 ns/char, so for small tables
+the scan wins; the automaton's single pass only pays off from about
+_AUTOMATON_MIN_KEYWORDS distinct keywords on 10KB bodies, and "auto"
+switches backend at that size. Measure with `python scripts/bench_keyword_matcher.py`.
+
+The table is configurable: KEYWORD_TABLE_PATH names a JSON file mapping
+group name to an ordered list of [keyword, label] pairs; groups missing
+from the file keep the built-in defaults. The file is re-read when its
+mtime changes (checked at most every KEYWORD_TABLE_RELOAD_S seconds); an
+unreadable or invalid file leaves the previous table in place.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+GROUP_REQUEST_TYPE = "request_type"
+GROUP_PRIORITY = "priority"
+GROUP_MOCK_RESPONSE = "mock_response"
+
+BACKEND_AUTO = "auto"
+BACKEND_SCAN = "scan"
+BACKEND_AUTOMATON = "automaton"
+
+# Distinct-keyword count from which one automaton pass beats per-keyword
+# substring scans on 10KB bodies (scripts/bench_keyword_matcher.py).
+_AUTOMATON_MIN_KEYWORDS = 24
+
+KeywordTable = Mapping[str, Sequence[tuple[str, str]]]
+
+DEFAULT_KEYWORD_TABLE: dict[str, list[tuple[str, str]]] = {
+    GROUP_REQUEST_TYPE: [
+        ("purchase", "purchase_request"),
+        ("order", "purchase_request"),
+        ("billing", "customer_issue"),
+        ("error", "customer_issue"),
+        ("issue", "customer_issue"),
+        ("incident", "customer_issue"),
+        ("change request", "ops_change"),
+        ("change", "ops_change"),
+        ("update", "ops_change"),
+    ],
+    GROUP_PRIORITY: [
+        ("urgent", "urgent"),
+        ("asap", "urgent"),
+        ("high", "high"),
+        ("medium", "medium"),
+        ("low", "low"),
+    ],
+    GROUP_MOCK_RESPONSE: [
+        ("purchase", "purchase_request"),
+        ("order", "purchase_request"),
+        ("item:", "purchase_request"),
+        ("buy", "purchase_request"),
+        ("procure", "purchase_request"),
+        ("error", "customer_issue"),
+        ("issue", "customer_issue"),
+        ("billing", "customer_issue"),
+        ("incident", "customer_issue"),
+        ("500", "customer_issue"),
+        ("bug", "customer_issue"),
+        ("change", "ops_change"),
+        ("update", "ops_change"),
+        ("deploy", "ops_change"),
+        ("config", "ops_change"),
+    ],
+}
+
+
+class KeywordMatcher:
+    """Compiled keyword table answering first-match queries per group."""
+
+    def __init__(self, table: KeywordTable, *, backend: str = BACKEND_AUTO) -> None:
+        """Compile table for the chosen backend.
+
+        Args:
+            table: Group name → ordered (keyword, label) pairs. Keywords are
+                matched case-insensitively as substrings.
+            backend: "auto", "scan", or "automaton".
+
+        Raises:
+            ValueError: If backend is unknown or a keyword is empty.
+            ImportError: If "automaton" is requested but pyahocorasick is missing.
+        """
+        self._groups: dict[str, tuple[tuple[str, str], ...]] = {}
+        keywords: dict[str, None] = {}
+        for group, entries in table.items():
+            compiled = []
+            for keyword, label in entries:
+                lowered = keyword.lower()
+                if not lowered:
+                    raise ValueError(f"Empty keyword in group {group!r}")
+                compiled.append((lowered, label))
+                keywords[lowered] = None
+            self._groups[group] = tuple(compiled)
+
+        self.keyword_count = len(keywords)
+        self._automaton = _build_automaton(list(keywords), backend, self.keyword_count)
+        self.backend = BACKEND_AUTOMATON if self._automaton is not None else BACKEND_SCAN
+        self._last: tuple[str, _TextScan] | None = None
+
+    @property
+    def groups(self) -> list[str]:
+        """Names of the compiled groups."""
+        return list(self._groups)
+
+    def first_match(self, text: str, group: str) -> tuple[str, str] | None:
+        """Return the highest-precedence (keyword, label) of group found in text.
+
+        Equivalent to iterating the group in table order and returning the
+        first entry whose keyword is a substring of text.lower().
+
+        Args:
+            text: Text to search.
+            group: Table group name.
+
+        Returns:
+            (keyword, label) of the first matching entry, or None. Unknown
+            groups never match.
+        """
+        entries = self._groups.get(group)
+        if not entries:
+            return None
+        scan = self._scan_for(text)
+        for keyword, label in entries:
+            if scan.contains(keyword):
+                return keyword, label
+        return None
+
+    def _scan_for(self, text: str) -> _TextScan:
+        last = self._last
+        if last is not None and last[0] == text:
+            return last[1]
+        scan = _TextScan(text.lower(), self._automaton)
+        self._last = (text, scan)
+        return scan
+
+
+class _TextScan:
+    """Keyword presence for one lower-cased text.
+
+    With an automaton every keyword is resolved in one pass up front;
+    otherwise each keyword is tested on first use and remembered.
+    """
+
+    __slots__ = ("_lowered", "_present", "_complete")
+
+    def __init__(self, lowered: str, automaton: Any | None) -> None:
+        self._lowered = lowered
+        self._present: dict[str, bool] = {}
+        self._complete = automaton is not None
+        if automaton is not None:
+            for _end, keyword in automaton.iter(lowered):
+                self._present[keyword] = True
+
+    def contains(self, keyword: str) -> bool:
+        if self._complete:
+            return keyword in self._present
+        present = self._present.get(keyword)
+        if present is None:
+            present = keyword in self._lowered
+            self._present[keyword] = present
+        return present
+
+
+def _build_automaton(keywords: list[str], backend: str, keyword_count: int) -> Any | None:
+    """Build a pyahocorasick automaton when the backend calls for one.
+
+    Args:
+        keywords: Distinct lower-cased keywords.
+        backend: "auto", "scan", or "automaton".
+        keyword_count: Number of distinct keywords (drives "auto").
+
+    Returns:
+        Finalised automaton, or None for the scan backend.
+
+    Raises:
+        ValueError: If backend is unknown.
+        ImportError: If "automaton" is requested but pyahocorasick is missing.
+    """
+    if backend == BACKEND_SCAN:
+        return None
+    if backend not in (BACKEND_AUTO, BACKEND_AUTOMATON):
+        raise ValueError(f"Unknown keyword matcher backend: {backend!r}")
+    if backend == BACKEND_AUTO and keyword_count < _AUTOMATON_MIN_KEYWORDS:
+        return None
+    try:
+        import ahocorasick
+    except ImportError:
+        if backend == BACKEND_AUTOMATON:
+            raise
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+def load_keyword_table(path: str | Path) -> dict[str, list[tuple[str, str]]]:
+    """Read a keyword table file and merge it over the built-in defaults.
+
+    Args:
+        path: JSON file mapping group name to a list of [keyword, label] pairs.
+
+    Returns:
+        Complete table: groups from the file replace the default groups.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid JSON or not in the expected shape.
+    """
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(raw, dict):
+        raise ValueError("Keyword table must be a JSON object of groups")
+    table = {group: list(entries) for group, entries in DEFAULT_KEYWORD_TABLE.items()}
+    for group, entries in raw.items():
+        if not isinstance(entries, list) or not all(
+            isinstance(entry, list) and len(entry) == 2 and all(isinstance(v, str) for v in entry)
+            for entry in entries
+        ):
+            raise ValueError(f"Keyword group {group!r} must be a list of [keyword, label] pairs")
+        table[group] = [(keyword, label) for keyword, label in entries]
+    return table
+
+
+class ReloadingKeywordMatcher:
+    """Serves a KeywordMatcher compiled from a file, recompiled when the file changes."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        reload_interval_s: float = 5.0,
+        backend: str = BACKEND_AUTO,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Load the table from path, falling back to the defaults if it is unusable.
+
+        Args:
+            path: Keyword table JSON file.
+            reload_interval_s: Minimum seconds between mtime checks.
+            backend: Matcher backend passed to KeywordMatcher.
+            clock: Monotonic clock, injectable for tests.
+        """
+        self.path = Path(path)
+        self._reload_interval_s = reload_interval_s
+        self._backend = backend
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._mtime_ns: int | None = None
+        self._checked_at = clock()
+        self._matcher = KeywordMatcher(DEFAULT_KEYWORD_TABLE, backend=backend)
+        self._reload_if_changed()
+
+    @property
+    def matcher(self) -> KeywordMatcher:
+        """The current matcher, after an mtime check if the interval has elapsed."""
+        now = self._clock()
+        if now - self._checked_at >= self._reload_interval_s:
+            self._checked_at = now
+            self._reload_if_changed()
+        return self._matcher
+
+    def _reload_if_changed(self) -> None:
+        try:
+            mtime_ns = os.stat(self.path).st_mtime_ns
+        except OSError as exc:
+            if self._mtime_ns is None:
+                logger.warning(
+                    "Keyword table not readable; using built-in table",
+                    extra={"path": str(self.path), "error": str(exc)},
+                )
+                self._mtime_ns = -1
+            return
+        if mtime_ns == self._mtime_ns:
+            return
+        with self._lock:
+            if mtime_ns == self._mtime_ns:
+                return
+            self._mtime_ns = mtime_ns
+            try:
+                matcher = KeywordMatcher(load_keyword_table(self.path), backend=self._backend)
+            except (OSError, ValueError) as exc:
+                logger.warning(
+                    "Keyword table invalid; keeping previous table",
+                    extra={"path": str(self.path), "error": str(exc)},
+                )
+                return
+            self._matcher = matcher
+        logger.info(
+            "Keyword table loaded",
+            extra={
+                "path": str(self.path),
+                "groups": matcher.groups,
+                "keywords": matcher.keyword_count,
+                "backend": matcher.backend,
+            },
+        )
+
+
+_default_matcher = KeywordMatcher(DEFAULT_KEYWORD_TABLE)
+_reloading: ReloadingKeywordMatcher | None = None
+
+
+def configure_keyword_table(
+    path: str | Path | None = None,
+    *,
+    reload_interval_s: float = 5.0,
+    backend: str = BACKEND_AUTO,
+) -> KeywordMatcher:
+    """Select the process-wide keyword table.
+
+    Args:
+        path: Keyword table JSON file, or None for the built-in table.
+        reload_interval_s: Minimum seconds between checks of the file's mtime.
+        backend: "auto", "scan", or "automaton".
+
+    Returns:
+        The active matcher.
+    """
+    global _default_matcher, _reloading
+    if path is None:
+        _reloading = None
+        _default_matcher = KeywordMatcher(DEFAULT_KEYWORD_TABLE, backend=backend)
+        return _default_matcher
+    _reloading = ReloadingKeywordMatcher(path, reload_interval_s=reload_interval_s, backend=backend)
+    return _reloading.matcher
+
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """Return the active matcher, picking up keyword table file changes."""
+    reloading = _reloading
+    if reloading is not None:
+        return reloading.matcher
+    return _default_matcher
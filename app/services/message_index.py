@@ -0,0 +1,178 @@
+"""In-process front for message_id idempotency checks.
+
+Two structures sit in front of Storage.get_by_message_id:
+
+  BloomFilter     — answers "definitely never seen" for new message_ids, so
+                    the dedup query is skipped for the common case. Rebuilt
+                    from items.message_id at startup, updated on every insert.
+  LRU of results  — recent message_id → IngestResponse for items in a final
+                    status (approved, rejected, failed), so duplicate
+                    deliveries return without touching the database.
+                    pending_review items are not cached because a reviewer
+                    can still change their status.
+
+The index is per process. A message stored by another worker is unknown to
+this process's filter; such an ingest extracts again and then loses the
+conflict-safe insert, returning the stored item — correct, just not free.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from app.core.metrics import DEDUP_LOOKUPS_TOTAL
+from app.models.email import IngestResponse
+
+_FINAL_STATUSES = frozenset({"approved", "rejected", "failed"})
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings using double hashing."""
+
+    def __init__(self, capacity: int, fp_rate: float) -> None:
+        """Size the bit array for capacity items at the target false-positive rate.
+
+        Args:
+            capacity: Expected number of distinct items.
+            fp_rate: Target false-positive probability in (0, 1).
+
+        Raises:
+            ValueError: If capacity < 1 or fp_rate is outside (0, 1).
+        """
+        if capacity < 1:
+            raise ValueError("Bloom filter capacity must be >= 1")
+        if not 0.0 < fp_rate < 1.0:
+            raise ValueError("Bloom filter fp_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.num_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def add(self, key: str) -> None:
+        """Insert key."""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        """Return False if key was definitely never added, True if it may have been."""
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key)
+        )
+
+    @property
+    def size_bytes(self) -> int:
+        """Memory used by the bit array."""
+        return len(self._bits)
+
+    def estimated_fp_rate(self) -> float:
+        """Expected false-positive probability at the current fill level."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+
+class MessageIdIndex:
+    """Bloom filter plus LRU of final ingest results, keyed by message_id."""
+
+    def __init__(
+        self, capacity: int = 1_000_000, fp_rate: float = 0.01, lru_size: int = 10_000
+    ) -> None:
+        """Initialise an empty index.
+
+        Args:
+            capacity: Expected number of stored message_ids (sizes the filter).
+            fp_rate: Target Bloom filter false-positive rate.
+            lru_size: Maximum cached IngestResponses (0 disables the LRU).
+        """
+        self._bloom = BloomFilter(capacity, fp_rate)
+        self._lru_size = lru_size
+        self._recent: OrderedDict[str, IngestResponse] = OrderedDict()
+        self._counts = {"lru_hit": 0, "bloom_negative": 0, "bloom_positive": 0, "false_positive": 0}
+
+    def load(self, message_ids: Iterable[str]) -> int:
+        """Add existing message_ids to the filter (startup rebuild).
+
+        Args:
+            message_ids: Every stored message_id.
+
+        Returns:
+            Number of message_ids loaded.
+        """
+        loaded = 0
+        for message_id in message_ids:
+            self._bloom.add(message_id)
+            loaded += 1
+        return loaded
+
+    def get_recent(self, message_id: str) -> IngestResponse | None:
+        """Return the cached idempotent response for message_id, if any."""
+        cached = self._recent.get(message_id)
+        if cached is not None:
+            self._recent.move_to_end(message_id)
+            self._count("lru_hit")
+        return cached
+
+    def might_contain(self, message_id: str) -> bool:
+        """Return False when message_id has definitely never been stored.
+
+        A True answer means the caller must confirm with the database and
+        report a miss via record_false_positive().
+        """
+        seen = message_id in self._bloom
+        self._count("bloom_positive" if seen else "bloom_negative")
+        return seen
+
+    def record_false_positive(self) -> None:
+        """Count a filter hit that the database did not confirm."""
+        self._count("false_positive")
+
+    def record(self, message_id: str, response: IngestResponse) -> None:
+        """Register a stored message_id and cache its result if the status is final.
+
+        Args:
+            message_id: Message that now has an item row.
+            response: Response describing the stored item.
+        """
+        if message_id not in self._bloom:
+            self._bloom.add(message_id)
+        if self._lru_size <= 0 or response.status not in _FINAL_STATUSES:
+            return
+        self._recent[message_id] = response.model_copy(update={"routed_to": "idempotent_return"})
+        self._recent.move_to_end(message_id)
+        while len(self._recent) > self._lru_size:
+            self._recent.popitem(last=False)
+
+    def stats(self) -> dict[str, Any]:
+        """Return size, accuracy, and hit counters for reporting.
+
+        Returns:
+            Dict with filter sizing, estimated false-positive rate, LRU
+            occupancy, and lookup outcome counts.
+        """
+        bloom = self._bloom
+        return {
+            "bloom_capacity": bloom.capacity,
+            "bloom_items": bloom.count,
+            "bloom_bytes": bloom.size_bytes,
+            "bloom_hashes": bloom.num_hashes,
+            "target_fp_rate": bloom.fp_rate,
+            "estimated_fp_rate": round(bloom.estimated_fp_rate(), 6),
+            "lru_size": len(self._recent),
+            "lru_capacity": self._lru_size,
+            **self._counts,
+        }
+
+    def _count(self, outcome: str) -> None:
+        self._counts[outcome] += 1
+        DEDUP_LOOKUPS_TOTAL.inc(outcome=outcome)
@@ -0,0 +1,249 @@
+"""Offline re-routing of stored items under new routing thresholds.
+
+Changing AUTO_APPROVE_THRESHOLD / AUTO_REJECT_THRESHOLD only affects new
+items. ReroutingService answers "what would the stored items look like
+under these thresholds?" and can apply the answer to the review queue:
+
+  1. stream   — items are read in item_id-ordered batches
+                (Storage.iter_item_batches); the table is never loaded whole
+  2. rescore  — each batch is scored with compute_confidence_batch, using the
+                note count the pipeline scored with (scored_note_count), so
+                unchanged scoring rules reproduce the stored confidence
+  3. route    — route_batch maps the scores to actions under the new
+                thresholds
+  4. report   — a transition matrix counts stored status → new status
+
+With apply=True, only pending_review items move. Each batch's moves and
+their "rerouted" audit events are written in one transaction, guarded on
+the item still being pending_review. Newly approved items are written to the
+CRM destinations like auto-approved ones. The per-item Slack alert is not
+sent for a bulk re-route; the report is the summary. Approved and rejected
+items are reported, never changed, because they may be human decisions.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from app.config import Settings
+from app.core import json_codec
+from app.core.constants import ACTOR_SYSTEM, EVENT_DESTINATIONS_WRITTEN, EVENT_REROUTED
+from app.integrations.crm_client import append_airtable_row, append_sheet_row
+from app.models.email import Status
+from app.services.confidence_service import ConfidenceColumns, compute_confidence_batch
+from app.services.extraction_service import scored_note_count
+from app.services.routing_service import route_batch
+from app.storage import Storage
+
+logger = logging.getLogger(__name__)
+
+# Statuses produced by routing; "failed" items have no extraction to re-score
+ROUTED_STATUSES: tuple[Status, ...] = ("approved", "pending_review", "rejected")
+_ACTION_TO_STATUS: dict[str, Status] = {
+    "auto_approve": "approved",
+    "human_review": "pending_review",
+    "auto_reject": "rejected",
+}
+
+
+@dataclass(slots=True)
+class ReroutingReport:
+    """Outcome of one re-routing run."""
+
+    auto_approve_threshold: float
+    auto_reject_threshold: float
+    applied_run: bool
+    scanned: int = 0
+    # Items whose re-computed confidence differs from the stored value
+    rescored_changed: int = 0
+    # stored status → new status → item count
+    transitions: dict[str, dict[str, int]] = field(
+        default_factory=lambda: {s: dict.fromkeys(ROUTED_STATUSES, 0) for s in ROUTED_STATUSES}
+    )
+    applied: int = 0
+
+    @property
+    def changed(self) -> int:
+        """Items whose status would change under the new thresholds."""
+        return sum(
+            count
+            for from_status, row in self.transitions.items()
+            for to_status, count in row.items()
+            if to_status != from_status
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the report as a JSON-serialisable dict."""
+        return {
+            "auto_approve_threshold": self.auto_approve_threshold,
+            "auto_reject_threshold": self.auto_reject_threshold,
+            "applied_run": self.applied_run,
+            "scanned": self.scanned,
+            "rescored_changed": self.rescored_changed,
+            "changed": self.changed,
+            "applied": self.applied,
+            "transitions": self.transitions,
+        }
+
+
+class ReroutingService:
+    """Re-scores and re-routes stored items in bulk."""
+
+    def __init__(self, storage: Storage, settings: Settings) -> None:
+        """Initialise with storage and settings.
+
+        Args:
+            storage: SQLite storage backend holding the items.
+            settings: Application settings (default thresholds, destination paths).
+        """
+        self._storage = storage
+        self._settings = settings
+
+    def run(
+        self,
+        *,
+        auto_approve_threshold: float | None = None,
+        auto_reject_threshold: float | None = None,
+        apply: bool = False,
+        batch_size: int = 1_000,
+    ) -> ReroutingReport:
+        """Re-route every routed item and optionally apply it to the review queue.
+
+        Args:
+            auto_approve_threshold: New approve threshold (default: settings).
+            auto_reject_threshold: New reject threshold (default: settings).
+            apply: Move pending_review items to their new status.
+            batch_size: Items read, scored and written per batch.
+
+        Returns:
+            ReroutingReport with the transition matrix and applied count.
+
+        Raises:
+            ValueError: If the reject threshold is above the approve threshold;
+                raised before any item is read or written.
+        """
+        report = ReroutingReport(
+            auto_approve_threshold=(
+                self._settings.auto_approve_threshold
+                if auto_approve_threshold is None
+                else auto_approve_threshold
+            ),
+            auto_reject_threshold=(
+                self._settings.auto_reject_threshold
+                if auto_reject_threshold is None
+                else auto_reject_threshold
+            ),
+            applied_run=apply,
+        )
+        if report.auto_reject_threshold > report.auto_approve_threshold:
+            raise ValueError(
+                f"auto_reject_threshold {report.auto_reject_threshold} is above "
+                f"auto_approve_threshold {report.auto_approve_threshold}"
+            )
+        for rows in self._storage.iter_item_batches(batch_size, statuses=ROUTED_STATUSES):
+            self._process_batch(rows, report, apply=apply)
+
+        logger.info("Re-routing complete", extra=report.to_dict())
+        return report
+
+    def _process_batch(
+        self, rows: list[dict[str, Any]], report: ReroutingReport, *, apply: bool
+    ) -> None:
+        extractions = [json_codec.loads(row["extraction_json"]) for row in rows]
+        scores = compute_confidence_batch(_columns(extractions)).score
+        new_statuses = [
+            _ACTION_TO_STATUS[action]
+            for action in route_batch(
+                scores,
+                auto_approve_threshold=report.auto_approve_threshold,
+                auto_reject_threshold=report.auto_reject_threshold,
+            ).tolist()
+        ]
+        stored_scores = np.array([row["confidence"] for row in rows], dtype=np.float64)
+
+        report.scanned += len(rows)
+        report.rescored_changed += int(np.count_nonzero(scores != stored_scores))
+        for row, new_status in zip(rows, new_statuses, strict=True):
+            report.transitions[row["status"]][new_status] += 1
+
+        if not apply:
+            return
+        changes = [
+            {
+                "item_id": row["item_id"],
+                "from_status": row["status"],
+                "to_status": new_status,
+                "confidence": score,
+                "extraction": {**extraction, "confidence": score},
+                "details": {
+                    "from_status": row["status"],
+                    "to_status": new_status,
+                    "confidence": score,
+                    "previous_confidence": row["confidence"],
+                    "auto_approve_threshold": report.auto_approve_threshold,
+                    "auto_reject_threshold": report.auto_reject_threshold,
+                },
+            }
+            for row, extraction, score, new_status in zip(
+                rows, extractions, scores.tolist(), new_statuses, strict=True
+            )
+            if row["status"] == "pending_review" and new_status != "pending_review"
+        ]
+        if not changes:
+            return
+        applied = self._storage.reroute_items(
+            changes, event_type=EVENT_REROUTED, actor=ACTOR_SYSTEM
+        )
+        report.applied += len(applied)
+        self._write_approved_to_destinations(
+            [change for change in applied if change["to_status"] == "approved"]
+        )
+
+    def _write_approved_to_destinations(self, changes: list[dict[str, Any]]) -> None:
+        events: list[tuple[str, str, str, dict]] = []
+        for change in changes:
+            extraction = change["extraction"]
+            requester = extraction.get("requester") or {}
+            row = {
+                "request_id": extraction.get("request_id", ""),
+                "request_type": extraction.get("request_type", ""),
+                "priority": extraction.get("priority", ""),
+                "due_date": extraction.get("due_date") or "",
+                "company": extraction.get("company") or "",
+                "requester_name": requester.get("name", ""),
+                "requester_email": requester.get("email", ""),
+                "confidence": change["confidence"],
+            }
+            append_sheet_row(self._settings.sheets_csv_path, row)
+            append_airtable_row(self._settings.airtable_jsonl_path, row)
+            events.append(
+                (change["item_id"], EVENT_DESTINATIONS_WRITTEN, ACTOR_SYSTEM, {"row": row})
+            )
+        if events:
+            self._storage.write_audit_many(events)
+
+
+def _columns(extractions: list[dict[str, Any]]) -> ConfidenceColumns:
+    """Build scoring columns straight from stored extraction dicts."""
+    requesters = [extraction.get("requester") or {} for extraction in extractions]
+    return ConfidenceColumns(
+        description_lengths=np.array(
+            [len((e.get("description") or "").strip()) for e in extractions], dtype=np.int64
+        ),
+        has_name=np.array(
+            [bool((r.get("name") or "").strip()) for r in requesters], dtype=np.bool_
+        ),
+        has_email=np.array([bool(r.get("email")) for r in requesters], dtype=np.bool_),
+        has_company=np.array([bool(e.get("company")) for e in extractions], dtype=np.bool_),
+        has_due_date=np.array([bool(e.get("due_date")) for e in extractions], dtype=np.bool_),
+        request_types=np.array([e.get("request_type", "") for e in extractions], dtype=np.str_),
+        has_line_items=np.array([bool(e.get("line_items")) for e in extractions], dtype=np.bool_),
+        note_counts=np.array(
+            [scored_note_count(e.get("extraction_notes") or []) for e in extractions],
+            dtype=np.int64,
+        ),
+    )
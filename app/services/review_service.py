@@ -6,11 +6,11 @@ and dispatches approved items to downstream destinations (CRM, Slack).
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any
 
 from app.config import Settings
+from app.core import json_codec
 from app.core.constants import (
     ACTOR_SYSTEM,
     EVENT_APPROVED,
@@ -60,7 +60,7 @@ class ReviewService:
                 message_id=row["message_id"],
                 status=row["status"],
                 confidence=row["confidence"],
-                extraction=json.loads(row["extraction_json"]),
+                extraction=json_codec.loads(row["extraction_json"]),
                 created_at=row["created_at"],
                 updated_at=row["updated_at"],
             ).model_dump()
@@ -130,7 +130,7 @@ class ReviewService:
         )
 
         stored_item = self._storage.get_item(item_id)
-        extraction_data: dict[str, Any] = json.loads(stored_item["extraction_json"])  # type: ignore[index]
+        extraction_data: dict[str, Any] = json_codec.loads(stored_item["extraction_json"])  # type: ignore[index]
 
         destination_row = _build_destination_row(extraction_data)
         await self._flush_to_destinations(item_id, destination_row, reviewer=action.reviewer)
@@ -6,6 +6,9 @@ Maps a confidence score to one of three actions:
   auto_reject    confidence < AUTO_REJECT_THRESHOLD
 
 Every routing decision is logged with correlation_id for auditability.
+
+route_batch() applies the same rules to an array of scores for offline
+re-routing; it does not log per item.
 """
 
 from __future__ import annotations
@@ -13,6 +16,8 @@ from __future__ import annotations
 import logging
 from typing import Literal
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import BaseModel, Field
 
 from app.core.constants import DEFAULT_AUTO_APPROVE_THRESHOLD, DEFAULT_AUTO_REJECT_THRESHOLD
@@ -93,3 +98,34 @@ def route(
         },
     )
     return decision
+
+
+def route_batch(
+    confidence: npt.NDArray[np.float64],
+    *,
+    auto_approve_threshold: float = DEFAULT_AUTO_APPROVE_THRESHOLD,
+    auto_reject_threshold: float = DEFAULT_AUTO_REJECT_THRESHOLD,
+) -> npt.NDArray[np.str_]:
+    """Return route()'s action for each score, computed on the whole array.
+
+    Args:
+        confidence: Extraction confidence scores in [0.0, 1.0].
+        auto_approve_threshold: Confidence strictly above this → auto_approve.
+        auto_reject_threshold: Confidence at or above this → human_review (else auto_reject).
+
+    Returns:
+        Array of RoutingAction strings, one per score.
+
+    Raises:
+        ValueError: If auto_reject_threshold is above auto_approve_threshold.
+    """
+    if auto_reject_threshold > auto_approve_threshold:
+        raise ValueError(
+            f"auto_reject_threshold {auto_reject_threshold} is above "
+            f"auto_approve_threshold {auto_approve_threshold}"
+        )
+    return np.where(
+        confidence > auto_approve_threshold,
+        "auto_approve",
+        np.where(confidence >= auto_reject_threshold, "human_review", "auto_reject"),
+    )
@@ -0,0 +1,231 @@
+"""JSON Schema validation compiled to specialised Python functions.
+
+compile_validator() turns a schema into one generated function whose checks
+are unrolled for that schema's properties, so validating an object costs a
+few isinstance() and membership tests instead of jsonschema's per-keyword
+dispatch. The generated function reports the same errors (path and message)
+as Draft202012Validator.iter_errors for the supported keywords:
+
+  type, enum (string values), required, properties,
+  additionalProperties (false), items (single schema), minimum, maximum
+
+plus the annotation-only keywords ($schema, $id, title, description, format —
+format is not asserted by Draft 2020-12 by default). A schema using anything
+else is validated by a Draft202012Validator wrapped to the same interface, so
+callers never need to know which path they got.
+
+load_validator() compiles a schema file once and reuses the result until the
+file's mtime changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from jsonschema import Draft202012Validator
+
+
+class SchemaError(NamedTuple):
+    """One validation failure: JSON path to the value and a jsonschema-style message."""
+
+    path: tuple[str | int, ...]
+    message: str
+
+
+SchemaValidator = Callable[[Any], list[SchemaError]]
+
+_ANNOTATIONS = frozenset({"$schema", "$id", "title", "description", "format"})
+_SUPPORTED = _ANNOTATIONS | {
+    "type",
+    "enum",
+    "required",
+    "properties",
+    "additionalProperties",
+    "items",
+    "minimum",
+    "maximum",
+}
+
+# Draft 2020-12 type checks; {v} is the value expression
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "null": "{v} is None",
+    "boolean": "isinstance({v}, bool)",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": (
+        "(isinstance({v}, int) and not isinstance({v}, bool)"
+        " or isinstance({v}, float) and {v}.is_integer())"
+    ),
+}
+
+
+def compile_validator(schema: dict[str, Any]) -> SchemaValidator:
+    """Return a function listing the schema errors for an instance.
+
+    Args:
+        schema: Draft 2020-12 JSON schema.
+
+    Returns:
+        Validator returning [] for a valid instance, else one SchemaError per
+        failure, in jsonschema's order.
+    """
+    if not _is_supported(schema):
+        return _fallback(schema)
+    generator = _CodeGenerator()
+    generator.emit(schema, "instance", "()", depth=1)
+    source = "def validate(instance):\n    errors = []\n"
+    source += "\n".join(generator.lines) + "\n    return errors\n"
+    namespace: dict[str, Any] = {"SchemaError": SchemaError, **generator.constants}
+    exec(compile(source, f"<schema {schema.get('title', '')}>", "exec"), namespace)  # noqa: S102
+    validate: SchemaValidator = namespace["validate"]
+    return validate
+
+
+def load_validator(path: str | Path) -> SchemaValidator:
+    """Return the compiled validator for a schema file, recompiling only when it changes.
+
+    Args:
+        path: JSON schema file.
+
+    Returns:
+        Validator from compile_validator, cached per (path, mtime).
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid JSON.
+    """
+    absolute = os.path.abspath(path)
+    return _load_compiled(absolute, os.stat(absolute).st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_compiled(path: str, mtime_ns: int) -> SchemaValidator:
+    return compile_validator(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def _fallback(schema: dict[str, Any]) -> SchemaValidator:
+    validator = Draft202012Validator(schema)
+
+    def validate(instance: Any) -> list[SchemaError]:
+        return [
+            SchemaError(tuple(err.path), err.message) for err in validator.iter_errors(instance)
+        ]
+
+    return validate
+
+
+def _is_supported(schema: Any) -> bool:
+    if not isinstance(schema, dict) or not set(schema) <= _SUPPORTED:
+        return False
+    types = schema.get("type", [])
+    types = types if isinstance(types, list) else [types]
+    enum = schema.get("enum", [])
+    additional = schema.get("additionalProperties", False)
+    items = schema.get("items", {})
+    return (
+        all(kind in _TYPE_CHECKS for kind in types)
+        and isinstance(enum, list)
+        and all(isinstance(value, str) for value in enum)
+        and isinstance(schema.get("required", []), list)
+        and isinstance(schema.get("properties", {}), dict)
+        and all(_is_supported(sub) for sub in schema.get("properties", {}).values())
+        and (additional is False or additional == {})
+        and (items == {} or _is_supported(items))
+        and all(
+            isinstance(schema.get(bound, 0), int | float)
+            and not isinstance(schema.get(bound), bool)
+            for bound in ("minimum", "maximum")
+        )
+    )
+
+
+class _CodeGenerator:
+    """Emits the body of a validate(instance) function for one schema."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+        self.constants: dict[str, Any] = {}
+
+    def constant(self, value: Any) -> str:
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def add(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def error(self, depth: int, path: str, message: str) -> None:
+        self.add(depth, f"errors.append(SchemaError({path}, {message}))")
+
+    def emit(self, schema: dict[str, Any], value: str, path: str, depth: int) -> None:
+        """Emit checks for value (a local name) at path (a tuple expression)."""
+        start = len(self.lines)
+        self._emit_keywords(schema, value, path, depth)
+        if len(self.lines) == start:
+            self.add(depth, "pass")
+
+    def _emit_keywords(self, schema: dict[str, Any], value: str, path: str, depth: int) -> None:
+        number = _TYPE_CHECKS["number"].format(v=value)
+        obj = _TYPE_CHECKS["object"].format(v=value)
+        for keyword, argument in schema.items():
+            if keyword == "type":
+                kinds = argument if isinstance(argument, list) else [argument]
+                check = " or ".join(_TYPE_CHECKS[kind].format(v=value) for kind in kinds)
+                suffix = self.constant(" is not of type " + ", ".join(repr(k) for k in kinds))
+                self.add(depth, f"if not ({check}):")
+                self.error(depth + 1, path, f"repr({value}) + {suffix}")
+            elif keyword == "enum":
+                allowed = self.constant(frozenset(argument))
+                suffix = self.constant(f" is not one of {argument!r}")
+                self.add(depth, f"if not (isinstance({value}, str) and {value} in {allowed}):")
+                self.error(depth + 1, path, f"repr({value}) + {suffix}")
+            elif keyword == "required" and argument:
+                self.add(depth, f"if {obj}:")
+                for name in argument:
+                    self.add(depth + 1, f"if {name!r} not in {value}:")
+                    message = self.constant(f"{name!r} is a required property")
+                    self.error(depth + 2, path, message)
+            elif keyword == "properties" and argument:
+                self.add(depth, f"if {obj}:")
+                for index, (name, subschema) in enumerate(argument.items()):
+                    child = f"{value}_{index}"
+                    self.add(depth + 1, f"if {name!r} in {value}:")
+                    self.add(depth + 2, f"{child} = {value}[{name!r}]")
+                    self.emit(subschema, child, f"{path[:-1]}{name!r},)", depth + 2)
+            elif keyword == "additionalProperties" and argument is False:
+                known = self.constant(frozenset(schema.get("properties", {})))
+                extras = f"{value}_extra"
+                self.add(depth, f"if {obj}:")
+                self.add(
+                    depth + 1,
+                    f"{extras} = sorted((k for k in {value} if k not in {known}), key=str)",
+                )
+                self.add(depth + 1, f"if {extras}:")
+                self.error(
+                    depth + 2,
+                    path,
+                    f'"Additional properties are not allowed (" + ", ".join(map(repr, {extras}))'
+                    f' + (" was" if len({extras}) == 1 else " were") + " unexpected)"',
+                )
+            elif keyword == "items" and argument:
+                index_name = f"{value}_i"
+                child = f"{value}_v"
+                self.add(depth, f"if {_TYPE_CHECKS['array'].format(v=value)}:")
+                self.add(depth + 1, f"for {index_name}, {child} in enumerate({value}):")
+                self.emit(argument, child, f"{path[:-1]}{index_name},)", depth + 2)
+            elif keyword in ("minimum", "maximum"):
+                op, word = (
+                    ("<", "less than the minimum")
+                    if keyword == "minimum"
+                    else (">", "greater than the maximum")
+                )
+                suffix = self.constant(f" is {word} of {argument!r}")
+                self.add(depth, f"if {number} and {value} {op} {argument!r}:")
+                self.error(depth + 1, path, f"repr({value}) + {suffix}")
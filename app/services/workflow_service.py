@@ -4,15 +4,21 @@ Pipeline: ExtractionService → confidence score → route()
   → persist item → write audit → dispatch to destinations (if auto_approve)
 
 Idempotent: re-submitting the same message_id returns the cached result.
+Concurrent submissions of the same message_id are coalesced onto a single
+in-flight pipeline run (single-flight), and the insert is conflict-safe so
+a race lost to another worker process also returns the stored result.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+from functools import partial
 from typing import Any
 
 from app.config import Settings
+from app.core import json_codec
 from app.core.constants import (
     ACTOR_SYSTEM,
     EVENT_DESTINATIONS_WRITTEN,
@@ -21,11 +27,14 @@ from app.core.constants import (
     EVENT_SLACK_NOTIFIED,
 )
 from app.core.exceptions import ExtractionError
+from app.core.metrics import INGEST_TOTAL, PIPELINE_STAGE_SECONDS
+from app.core.tracing import start_span
 from app.integrations.crm_client import append_airtable_row, append_sheet_row
 from app.integrations.slack_client import send_slack_summary
 from app.models.email import Extraction, InboxMessage, IngestResponse, Status
 from app.services.ai.prompts import VERSION as PROMPT_VERSION
 from app.services.extraction_service import ExtractionService
+from app.services.message_index import MessageIdIndex
 from app.services.routing_service import RoutingDecision, route
 from app.storage import Storage
 from app.utils import redact_pii, stable_id
@@ -41,6 +50,7 @@ class WorkflowService:
         storage: Storage,
         settings: Settings,
         extraction_service: ExtractionService,
+        message_index: MessageIdIndex | None = None,
     ) -> None:
         """Initialise with storage, settings, and the extraction service.
 
@@ -48,15 +58,24 @@ class WorkflowService:
             storage: SQLite storage backend.
             settings: Application configuration (thresholds, destinations).
             extraction_service: AI pipeline for field extraction.
+            message_index: Optional Bloom/LRU front for the message_id dedup
+                check; without it every ingest queries the database.
         """
         self._storage = storage
         self._settings = settings
         self._extraction = extraction_service
+        self._message_index = message_index
+        # message_id → pipeline task currently processing it (single-flight)
+        self._in_flight: dict[str, asyncio.Task[IngestResponse]] = {}
 
     async def ingest(self, message: InboxMessage) -> IngestResponse:
         """Process an inbound message through the full pipeline.
 
         Idempotent: re-submitting the same message_id returns the cached result.
+        Concurrent calls for a message_id that is already being processed
+        await that run and receive the same IngestResponse (or exception)
+        instead of paying for a second extraction. The shared run is shielded,
+        so a cancelled caller does not abort it for the others.
 
         Args:
             message: Validated inbox message.
@@ -67,21 +86,38 @@ class WorkflowService:
         Raises:
             ExtractionError: Propagated from ExtractionService (map to HTTP 422).
         """
-        existing_item = self._storage.get_by_message_id(message.message_id)
-        if existing_item:
+        with start_span("workflow.ingest", message_id=message.message_id) as span:
+            in_flight = self._in_flight.get(message.message_id)
+            if in_flight is None:
+                in_flight = asyncio.ensure_future(self._ingest(message))
+                self._in_flight[message.message_id] = in_flight
+                in_flight.add_done_callback(partial(self._forget_in_flight, message.message_id))
+            else:
+                INGEST_TOTAL.inc(outcome="coalesced")
+                logger.info(
+                    "Duplicate message_id in flight — awaiting shared result",
+                    extra={"message_id": message.message_id},
+                )
+                span.set_attribute("coalesced", True)
+            ingest_response = await asyncio.shield(in_flight)
+            span.set_attribute("item_id", ingest_response.item_id)
+            span.set_attribute("routed_to", ingest_response.routed_to)
+            return ingest_response
+
+    async def _ingest(self, message: InboxMessage) -> IngestResponse:
+        """Run the ingest pipeline; ingest() wraps this in the root span."""
+        with PIPELINE_STAGE_SECONDS.time(stage="dedup_lookup"):
+            cached_response = self._find_existing(message.message_id)
+        if cached_response is not None:
             logger.info(
                 "Duplicate message_id — returning cached result",
                 extra={
                     "message_id": message.message_id,
-                    "item_id": existing_item["item_id"],
+                    "item_id": cached_response.item_id,
                 },
             )
-            return IngestResponse(
-                item_id=existing_item["item_id"],
-                status=existing_item["status"],
-                confidence=float(existing_item["confidence"]),
-                routed_to="idempotent_return",
-            )
+            INGEST_TOTAL.inc(outcome="idempotent_return")
+            return cached_response
 
         item_id = stable_id("item", message.message_id)
         input_hash = _hash_body(message.body)
@@ -89,55 +125,82 @@ class WorkflowService:
         try:
             extraction = await self._extraction.extract(message)
         except ExtractionError as exc:
-            self._storage.create_item(
-                item_id=item_id,
-                message_id=message.message_id,
-                status="failed",
-                confidence=0.0,
-                extraction={"error": str(exc)},
-            )
-            self._storage.write_audit(
-                item_id,
-                EVENT_INGEST_FAILED,
-                ACTOR_SYSTEM,
-                {"error": str(exc), "input_hash": input_hash},
-            )
+            with PIPELINE_STAGE_SECONDS.time(stage="persist"):
+                inserted = self._storage.create_item(
+                    item_id=item_id,
+                    message_id=message.message_id,
+                    status="failed",
+                    confidence=0.0,
+                    extraction={"error": str(exc)},
+                )
+                if inserted:
+                    self._storage.write_audit(
+                        item_id,
+                        EVENT_INGEST_FAILED,
+                        ACTOR_SYSTEM,
+                        {"error": str(exc), "input_hash": input_hash},
+                    )
+                    self._remember(
+                        message.message_id,
+                        IngestResponse(
+                            item_id=item_id, status="failed", confidence=0.0, routed_to="failed"
+                        ),
+                    )
+            INGEST_TOTAL.inc(outcome="failed")
             logger.warning(
                 "Ingest failed — extraction error",
                 extra={"item_id": item_id, "error": str(exc)},
             )
             raise
 
-        routing_decision = route(
-            extraction.confidence,
-            auto_approve_threshold=self._settings.auto_approve_threshold,
-            auto_reject_threshold=self._settings.auto_reject_threshold,
-        )
-        item_status = _decision_to_status(routing_decision)
+        with PIPELINE_STAGE_SECONDS.time(stage="routing"):
+            routing_decision = route(
+                extraction.confidence,
+                auto_approve_threshold=self._settings.auto_approve_threshold,
+                auto_reject_threshold=self._settings.auto_reject_threshold,
+            )
+            item_status = _decision_to_status(routing_decision)
 
-        self._storage.create_item(
-            item_id=item_id,
-            message_id=message.message_id,
-            status=item_status,
-            confidence=extraction.confidence,
-            extraction=extraction.model_dump(),
-        )
-        self._storage.write_audit(
-            item_id,
-            EVENT_INGESTED,
-            ACTOR_SYSTEM,
-            {
-                "status": item_status,
-                "confidence": extraction.confidence,
-                "routing_action": routing_decision.action,
-                "routing_reason": routing_decision.reason,
-                "input_hash": input_hash,
-                "prompt_version": PROMPT_VERSION,
-            },
-        )
+        with PIPELINE_STAGE_SECONDS.time(stage="persist"):
+            inserted = self._storage.create_item(
+                item_id=item_id,
+                message_id=message.message_id,
+                status=item_status,
+                confidence=extraction.confidence,
+                extraction=extraction.model_dump(),
+            )
+            if not inserted:
+                stored_item = self._storage.get_by_message_id(message.message_id)
+                if stored_item is None:
+                    raise RuntimeError(f"Item for {message.message_id!r} vanished after conflict")
+                logger.info(
+                    "Concurrent ingest stored this message_id first — returning stored result",
+                    extra={"message_id": message.message_id, "item_id": stored_item["item_id"]},
+                )
+                INGEST_TOTAL.inc(outcome="idempotent_return")
+                stored_response = _idempotent_response(stored_item)
+                self._remember(message.message_id, stored_response)
+                return stored_response
+            self._storage.write_audit(
+                item_id,
+                EVENT_INGESTED,
+                ACTOR_SYSTEM,
+                {
+                    "status": item_status,
+                    "confidence": extraction.confidence,
+                    "routing_action": routing_decision.action,
+                    "routing_reason": routing_decision.reason,
+                    "input_hash": input_hash,
+                    "prompt_version": PROMPT_VERSION,
+                },
+            )
 
         if routing_decision.action == "auto_approve":
-            await self._write_to_destinations(item_id, extraction)
+            with (
+                start_span("workflow.dispatch", item_id=item_id),
+                PIPELINE_STAGE_SECONDS.time(stage="dispatch"),
+            ):
+                await self._write_to_destinations(item_id, extraction)
         elif routing_decision.action == "auto_reject":
             logger.info(
                 "Item auto-rejected",
@@ -157,12 +220,69 @@ class WorkflowService:
                 "routing_action": routing_decision.action,
             },
         )
-        return IngestResponse(
+        INGEST_TOTAL.inc(outcome=routing_decision.action)
+        ingest_response = IngestResponse(
             item_id=item_id,
             status=item_status,
             confidence=extraction.confidence,
             routed_to=routing_decision.action,
         )
+        self._remember(message.message_id, ingest_response)
+        return ingest_response
+
+    def _find_existing(self, message_id: str) -> IngestResponse | None:
+        """Return the idempotent response for an already-stored message_id, or None.
+
+        Consults the message index first: an LRU hit needs no query, and a
+        Bloom filter negative proves the message is new. Only possible
+        duplicates reach the database.
+
+        Args:
+            message_id: Incoming message identifier.
+
+        Returns:
+            IngestResponse with routed_to="idempotent_return", or None if new.
+        """
+        index = self._message_index
+        if index is not None:
+            cached_response = index.get_recent(message_id)
+            if cached_response is not None:
+                return cached_response
+            if not index.might_contain(message_id):
+                return None
+
+        existing_item = self._storage.get_by_message_id(message_id)
+        if existing_item is None:
+            if index is not None:
+                index.record_false_positive()
+            return None
+        stored_response = _idempotent_response(existing_item)
+        self._remember(message_id, stored_response)
+        return stored_response
+
+    def _remember(self, message_id: str, response: IngestResponse) -> None:
+        """Record a stored message_id in the message index, if one is configured."""
+        if self._message_index is not None:
+            self._message_index.record(message_id, response)
+
+    def dedup_stats(self) -> dict[str, Any] | None:
+        """Return message index statistics, or None when the index is disabled."""
+        return self._message_index.stats() if self._message_index is not None else None
+
+    def _forget_in_flight(self, message_id: str, task: asyncio.Task[IngestResponse]) -> None:
+        """Drop a finished pipeline run from the single-flight map.
+
+        Also marks a failed run's exception as retrieved, so asyncio does not
+        warn when every awaiting caller was cancelled before it finished.
+
+        Args:
+            message_id: Key the task was registered under.
+            task: The finished task.
+        """
+        if self._in_flight.get(message_id) is task:
+            del self._in_flight[message_id]
+        if not task.cancelled():
+            task.exception()
 
     def list_items(self, status: str | None = None) -> list[dict[str, Any]]:
         """Return a summary list of items, optionally filtered by status.
@@ -173,12 +293,10 @@ class WorkflowService:
         Returns:
             List of item summary dicts ordered by created_at descending.
         """
-        import json
-
         rows = self._storage.list_items(status=status)
         item_summaries = []
         for row in rows:
-            extraction = json.loads(row["extraction_json"])
+            extraction = json_codec.loads(row["extraction_json"])
             item_summaries.append(
                 {
                     "item_id": row["item_id"],
@@ -206,8 +324,6 @@ class WorkflowService:
         Returns:
             Item detail dict, or None if not found.
         """
-        import json
-
         row = self._storage.get_item(item_id)
         if not row:
             return None
@@ -216,7 +332,7 @@ class WorkflowService:
             "message_id": row["message_id"],
             "status": row["status"],
             "confidence": row["confidence"],
-            "extraction": json.loads(row["extraction_json"]),
+            "extraction": json_codec.loads(row["extraction_json"]),
             "created_at": row["created_at"],
             "updated_at": row["updated_at"],
         }
@@ -230,11 +346,9 @@ class WorkflowService:
         Returns:
             List of audit entry dicts in chronological order.
         """
-        import json
-
         audit_logs = self._storage.list_audit(item_id)
         for entry in audit_logs:
-            entry["details"] = json.loads(entry.pop("details_json"))
+            entry["details"] = json_codec.loads(entry.pop("details_json"))
         return audit_logs
 
     def get_all_audit_paginated(self, page: int, page_size: int) -> dict[str, Any]:
@@ -247,13 +361,11 @@ class WorkflowService:
         Returns:
             Dict with events list, total count, page, and page_size.
         """
-        import json
-
         raw_rows, total = self._storage.list_all_audit_paginated(page, page_size)
         audit_events = []
         for row in raw_rows:
             entry = dict(row)
-            entry["details"] = json.loads(entry.pop("details_json"))
+            entry["details"] = json_codec.loads(entry.pop("details_json"))
             audit_events.append(entry)
         return {
             "events": audit_events,
@@ -325,6 +437,23 @@ class WorkflowService:
         )
 
 
+def _idempotent_response(stored_item: dict[str, Any]) -> IngestResponse:
+    """Build the response returned for an already-stored message_id.
+
+    Args:
+        stored_item: Item row from Storage.get_by_message_id().
+
+    Returns:
+        IngestResponse for the stored item with routed_to="idempotent_return".
+    """
+    return IngestResponse(
+        item_id=stored_item["item_id"],
+        status=stored_item["status"],
+        confidence=float(stored_item["confidence"]),
+        routed_to="idempotent_return",
+    )
+
+
 def _decision_to_status(decision: RoutingDecision) -> Status:
     """Map a routing action to a storage status string.
 
@@ -7,21 +7,30 @@ without running Alembic migrations.
 WAL journal mode is enabled on init for concurrent-write safety under
 asyncio.gather-based batch processing.
 
+Each public method is recorded as a "storage.<method>" span when tracing
+is enabled (see app/core/tracing.py).
+
 Tables:
   items        — processed email intake items
   audit_log    — immutable audit trail
   llm_call_log — per-request AI call telemetry
   batch_jobs   — batch ingest job progress records
+  cost_ledger  — AI spend per UTC day, shared by every worker process
+  cost_reservations — estimated cost held by in-flight AI calls
+  circuit_breakers  — AI circuit breaker state shared by every worker process
 """
 
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from typing import Any
 
+from app.core import json_codec
+from app.core.tracing import traced
 from app.utils import now_utc_iso
 
 SCHEMA = """
@@ -69,6 +78,30 @@ CREATE TABLE IF NOT EXISTS batch_jobs (
   created_at TEXT NOT NULL,
   updated_at TEXT NOT NULL
 );
+
+CREATE TABLE IF NOT EXISTS cost_ledger (
+  day TEXT PRIMARY KEY,
+  spent_usd REAL NOT NULL DEFAULT 0,
+  updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS cost_reservations (
+  reservation_id TEXT PRIMARY KEY,
+  day TEXT NOT NULL,
+  amount_usd REAL NOT NULL,
+  created_ts REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_cost_reservations_day ON cost_reservations(day, created_ts);
+
+CREATE TABLE IF NOT EXISTS circuit_breakers (
+  name TEXT PRIMARY KEY,
+  state TEXT NOT NULL,
+  failures_json TEXT NOT NULL,
+  deadline REAL NOT NULL,
+  probes_in_flight INTEGER NOT NULL,
+  updated_at TEXT NOT NULL
+);
 """
 
 
@@ -95,6 +128,7 @@ class Storage:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript(SCHEMA)
 
+    @traced("storage.get_by_message_id")
     def get_by_message_id(self, message_id: str) -> dict[str, Any] | None:
         """Return the item row matching message_id, or None.
 
@@ -108,6 +142,56 @@ class Storage:
             row = conn.execute("SELECT * FROM items WHERE message_id = ?", (message_id,)).fetchone()
             return dict(row) if row else None
 
+    def iter_message_ids(self, batch_size: int = 10_000) -> Iterator[str]:
+        """Stream every stored message_id without loading all rows at once.
+
+        Args:
+            batch_size: Rows fetched per round trip.
+
+        Yields:
+            message_id values in no particular order.
+        """
+        with self._conn() as conn:
+            cursor = conn.execute("SELECT message_id FROM items")
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    yield row[0]
+
+    def iter_item_batches(
+        self, batch_size: int = 1_000, statuses: Sequence[str] | None = None
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Stream items in item_id order, one short query per batch.
+
+        Keyset pagination (item_id > last seen) keeps memory bounded by
+        batch_size and holds no read transaction open between batches, so
+        writes made while iterating are not blocked.
+
+        Args:
+            batch_size: Rows per batch.
+            statuses: Optional status filter.
+
+        Yields:
+            Lists of rows (item_id, status, confidence, extraction_json) as dicts.
+        """
+        status_filter = ""
+        status_params: tuple[str, ...] = ()
+        if statuses is not None:
+            status_filter = f" AND status IN ({','.join('?' * len(statuses))})"
+            status_params = tuple(statuses)
+        last_item_id = ""
+        with self._conn() as conn:
+            while True:
+                rows = conn.execute(
+                    "SELECT item_id, status, confidence, extraction_json FROM items "
+                    f"WHERE item_id > ?{status_filter} ORDER BY item_id LIMIT ?",
+                    (last_item_id, *status_params, batch_size),
+                ).fetchall()
+                if not rows:
+                    return
+                yield [dict(r) for r in rows]
+                last_item_id = rows[-1]["item_id"]
+
+    @traced("storage.get_item")
     def get_item(self, item_id: str) -> dict[str, Any] | None:
         """Return the item row matching item_id, or None.
 
@@ -121,6 +205,7 @@ class Storage:
             row = conn.execute("SELECT * FROM items WHERE item_id = ?", (item_id,)).fetchone()
             return dict(row) if row else None
 
+    @traced("storage.list_items")
     def list_items(self, status: str | None = None) -> list[dict[str, Any]]:
         """Return all items, optionally filtered by status.
 
@@ -139,6 +224,7 @@ class Storage:
                 rows = conn.execute("SELECT * FROM items ORDER BY created_at DESC").fetchall()
             return [dict(r) for r in rows]
 
+    @traced("storage.list_items_paginated")
     def list_items_paginated(
         self, page: int, page_size: int, status: str | None = None
     ) -> tuple[list[dict[str, Any]], int]:
@@ -170,10 +256,15 @@ class Storage:
                 ).fetchall()
             return [dict(r) for r in rows], total
 
+    @traced("storage.create_item")
     def create_item(
         self, item_id: str, message_id: str, status: str, confidence: float, extraction: dict
-    ) -> None:
-        """Insert a new item row.
+    ) -> bool:
+        """Insert a new item row unless one already exists for the ID or message_id.
+
+        Uses ON CONFLICT DO NOTHING so a concurrent writer that lost the race
+        (another worker process ingesting the same message) gets False rather
+        than an IntegrityError.
 
         Args:
             item_id: Unique item identifier.
@@ -181,14 +272,27 @@ class Storage:
             status: Initial routing status.
             confidence: Extraction confidence score.
             extraction: Full extraction dict (serialised to JSON).
+
+        Returns:
+            True if the row was inserted, False if a conflicting row already existed.
         """
         created = now_utc_iso()
         with self._conn() as conn:
-            conn.execute(
-                "INSERT INTO items(item_id, message_id, status, confidence, extraction_json, created_at, updated_at) VALUES(?,?,?,?,?,?,?)",
-                (item_id, message_id, status, confidence, json.dumps(extraction), created, created),
+            cursor = conn.execute(
+                "INSERT INTO items(item_id, message_id, status, confidence, extraction_json, created_at, updated_at) VALUES(?,?,?,?,?,?,?) ON CONFLICT DO NOTHING",
+                (
+                    item_id,
+                    message_id,
+                    status,
+                    confidence,
+                    json_codec.dumps(extraction),
+                    created,
+                    created,
+                ),
             )
+            return cursor.rowcount == 1
 
+    @traced("storage.update_status")
     def update_status(self, item_id: str, status: str) -> None:
         """Update the status of an existing item.
 
@@ -203,6 +307,7 @@ class Storage:
                 (status, updated, item_id),
             )
 
+    @traced("storage.write_audit")
     def write_audit(self, item_id: str, event_type: str, actor: str, details: dict) -> None:
         """Append an audit event for an item.
 
@@ -216,9 +321,80 @@ class Storage:
         with self._conn() as conn:
             conn.execute(
                 "INSERT INTO audit_log(item_id, event_type, actor, details_json, created_at) VALUES(?,?,?,?,?)",
-                (item_id, event_type, actor, json.dumps(details), created),
+                (item_id, event_type, actor, json_codec.dumps(details), created),
+            )
+
+    @traced("storage.write_audit_many")
+    def write_audit_many(self, events: Sequence[tuple[str, str, str, dict]]) -> None:
+        """Append several audit events in one transaction.
+
+        Args:
+            events: (item_id, event_type, actor, details) tuples.
+        """
+        created = now_utc_iso()
+        with self._conn() as conn:
+            conn.executemany(
+                "INSERT INTO audit_log(item_id, event_type, actor, details_json, created_at) VALUES(?,?,?,?,?)",
+                [
+                    (item_id, event_type, actor, json_codec.dumps(details), created)
+                    for item_id, event_type, actor, details in events
+                ],
+            )
+
+    @traced("storage.reroute_items")
+    def reroute_items(
+        self, changes: Sequence[dict[str, Any]], *, event_type: str, actor: str
+    ) -> list[dict[str, Any]]:
+        """Apply status changes and their audit events in one transaction.
+
+        Each update only applies while the item still has its expected status,
+        so an item a reviewer decided after it was read is left alone.
+
+        Args:
+            changes: Dicts with item_id, from_status, to_status, confidence,
+                extraction (dict stored as extraction_json) and details
+                (audit payload).
+            event_type: Audit event type for every applied change.
+            actor: Audit actor for every applied change.
+
+        Returns:
+            The changes that were applied.
+        """
+        updated = now_utc_iso()
+        applied: list[dict[str, Any]] = []
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            for change in changes:
+                cursor = conn.execute(
+                    "UPDATE items SET status = ?, confidence = ?, extraction_json = ?, updated_at = ? "
+                    "WHERE item_id = ? AND status = ?",
+                    (
+                        change["to_status"],
+                        change["confidence"],
+                        json_codec.dumps(change["extraction"]),
+                        updated,
+                        change["item_id"],
+                        change["from_status"],
+                    ),
+                )
+                if cursor.rowcount == 1:
+                    applied.append(change)
+            conn.executemany(
+                "INSERT INTO audit_log(item_id, event_type, actor, details_json, created_at) VALUES(?,?,?,?,?)",
+                [
+                    (
+                        change["item_id"],
+                        event_type,
+                        actor,
+                        json_codec.dumps(change["details"]),
+                        updated,
+                    )
+                    for change in applied
+                ],
             )
+        return applied
 
+    @traced("storage.list_audit")
     def list_audit(self, item_id: str) -> list[dict[str, Any]]:
         """Return all audit events for a specific item.
 
@@ -235,6 +411,7 @@ class Storage:
             ).fetchall()
             return [dict(r) for r in rows]
 
+    @traced("storage.metrics_snapshot")
     def metrics_snapshot(self) -> dict[str, Any]:
         """Return a point-in-time metrics snapshot from the database.
 
@@ -281,6 +458,7 @@ class Storage:
             "queue_depth": queue_depth,
         }
 
+    @traced("storage.create_batch_job")
     def create_batch_job(self, job_id: str, total: int) -> None:
         """Insert a new batch job record with status=running.
 
@@ -295,6 +473,7 @@ class Storage:
                 (job_id, "running", total, created, created),
             )
 
+    @traced("storage.get_batch_job")
     def get_batch_job(self, job_id: str) -> dict[str, Any] | None:
         """Return the batch job row, or None if not found.
 
@@ -308,6 +487,7 @@ class Storage:
             row = conn.execute("SELECT * FROM batch_jobs WHERE job_id = ?", (job_id,)).fetchone()
             return dict(row) if row else None
 
+    @traced("storage.increment_batch_result")
     def increment_batch_result(self, job_id: str, *, succeeded: bool) -> None:
         """Atomically increment processed plus succeeded or failed_count.
 
@@ -331,6 +511,7 @@ class Storage:
                     (updated, job_id),
                 )
 
+    @traced("storage.finalize_batch_job")
     def finalize_batch_job(self, job_id: str) -> None:
         """Mark a batch job as complete.
 
@@ -344,6 +525,7 @@ class Storage:
                 (updated, job_id),
             )
 
+    @traced("storage.list_all_audit_paginated")
     def list_all_audit_paginated(
         self, page: int, page_size: int
     ) -> tuple[list[dict[str, Any]], int]:
@@ -364,3 +546,164 @@ class Storage:
                 (page_size, offset),
             ).fetchall()
             return [dict(r) for r in rows], total
+
+    @traced("storage.reserve_cost")
+    def reserve_cost(
+        self,
+        day: str,
+        reservation_id: str,
+        amount_usd: float,
+        limit_usd: float,
+        *,
+        now_ts: float,
+        stale_before_ts: float,
+    ) -> tuple[bool, float, float]:
+        """Atomically hold amount_usd of a day's budget if it fits under limit_usd.
+
+        Runs in a BEGIN IMMEDIATE transaction, so concurrent reservations from
+        other worker processes are serialised by SQLite's write lock.
+        Reservations created before stale_before_ts (left behind by a worker
+        that died mid-call) are deleted first.
+
+        Args:
+            day: UTC date key (YYYY-MM-DD).
+            reservation_id: Unique ID for the new reservation.
+            amount_usd: Estimated cost to hold.
+            limit_usd: Maximum permitted spend for the day.
+            now_ts: Current Unix timestamp, stored with the reservation.
+            stale_before_ts: Unix timestamp before which reservations expire.
+
+        Returns:
+            (reserved, spent_usd, reserved_usd): whether the reservation was
+            made, plus the day's spend and active reservations before it.
+        """
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("DELETE FROM cost_reservations WHERE created_ts < ?", (stale_before_ts,))
+            spent, reserved = self._cost_totals(conn, day)
+            if spent + reserved + amount_usd > limit_usd:
+                return False, spent, reserved
+            conn.execute(
+                "INSERT INTO cost_reservations(reservation_id, day, amount_usd, created_ts) VALUES(?,?,?,?)",
+                (reservation_id, day, amount_usd, now_ts),
+            )
+            return True, spent, reserved
+
+    @traced("storage.commit_cost")
+    def commit_cost(self, day: str, reservation_id: str | None, cost_usd: float) -> None:
+        """Record actual spend for a day and drop its reservation in one transaction.
+
+        Args:
+            day: UTC date key (YYYY-MM-DD) the spend belongs to.
+            reservation_id: Reservation to drop, or None to record spend only.
+            cost_usd: Actual cost to add to the day's total.
+        """
+        with self._conn() as conn:
+            if reservation_id is not None:
+                conn.execute(
+                    "DELETE FROM cost_reservations WHERE reservation_id = ?", (reservation_id,)
+                )
+            conn.execute(
+                "INSERT INTO cost_ledger(day, spent_usd, updated_at) VALUES(?,?,?) "
+                "ON CONFLICT(day) DO UPDATE SET spent_usd = spent_usd + excluded.spent_usd, "
+                "updated_at = excluded.updated_at",
+                (day, cost_usd, now_utc_iso()),
+            )
+
+    @traced("storage.release_cost")
+    def release_cost(self, reservation_id: str) -> None:
+        """Drop a reservation without recording spend.
+
+        Args:
+            reservation_id: Reservation to drop.
+        """
+        with self._conn() as conn:
+            conn.execute(
+                "DELETE FROM cost_reservations WHERE reservation_id = ?", (reservation_id,)
+            )
+
+    @traced("storage.cost_totals")
+    def cost_totals(self, day: str, *, stale_before_ts: float) -> tuple[float, float]:
+        """Return a day's recorded spend and active (non-stale) reservations.
+
+        Args:
+            day: UTC date key (YYYY-MM-DD).
+            stale_before_ts: Reservations created before this are not counted.
+
+        Returns:
+            (spent_usd, reserved_usd).
+        """
+        with self._conn() as conn:
+            return self._cost_totals(conn, day, stale_before_ts)
+
+    @staticmethod
+    def _cost_totals(
+        conn: sqlite3.Connection, day: str, stale_before_ts: float = 0.0
+    ) -> tuple[float, float]:
+        row = conn.execute("SELECT spent_usd FROM cost_ledger WHERE day = ?", (day,)).fetchone()
+        spent = row[0] if row else 0.0
+        reserved = conn.execute(
+            "SELECT COALESCE(SUM(amount_usd), 0) FROM cost_reservations WHERE day = ? AND created_ts >= ?",
+            (day, stale_before_ts),
+        ).fetchone()[0]
+        return spent, reserved
+
+    @traced("storage.get_circuit_breaker")
+    def get_circuit_breaker(self, name: str) -> dict[str, Any] | None:
+        """Return a circuit breaker's stored state.
+
+        Args:
+            name: Breaker name.
+
+        Returns:
+            Dict with state, failures (timestamps), deadline and
+            probes_in_flight, or None if the breaker has never been stored.
+        """
+        with self._conn() as conn:
+            row = conn.execute("SELECT * FROM circuit_breakers WHERE name = ?", (name,)).fetchone()
+            return _circuit_breaker_record(row) if row else None
+
+    @contextmanager
+    def circuit_breaker_transaction(self, name: str) -> Iterator[dict[str, Any]]:
+        """Read-modify-write a circuit breaker's state under SQLite's write lock.
+
+        Yields the stored record (empty if none) for the caller to mutate in
+        place; the record is written back on exit if it changed. BEGIN
+        IMMEDIATE serialises the update with every other worker's.
+
+        Args:
+            name: Breaker name.
+
+        Yields:
+            Mutable dict with state, failures, deadline and probes_in_flight.
+        """
+        with self._conn() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT * FROM circuit_breakers WHERE name = ?", (name,)).fetchone()
+            record = _circuit_breaker_record(row) if row else {}
+            original = dict(record)
+            yield record
+            if record and record != original:
+                conn.execute(
+                    "INSERT INTO circuit_breakers(name, state, failures_json, deadline, probes_in_flight, updated_at) "
+                    "VALUES(?,?,?,?,?,?) ON CONFLICT(name) DO UPDATE SET state = excluded.state, "
+                    "failures_json = excluded.failures_json, deadline = excluded.deadline, "
+                    "probes_in_flight = excluded.probes_in_flight, updated_at = excluded.updated_at",
+                    (
+                        name,
+                        record["state"],
+                        json_codec.dumps(record["failures"]),
+                        record["deadline"],
+                        record["probes_in_flight"],
+                        now_utc_iso(),
+                    ),
+                )
+
+
+def _circuit_breaker_record(row: sqlite3.Row) -> dict[str, Any]:
+    return {
+        "state": row["state"],
+        "failures": json_codec.loads(row["failures_json"]),
+        "deadline": row["deadline"],
+        "probes_in_flight": row["probes_in_flight"],
+    }
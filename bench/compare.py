@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Compare two benchmark reports and flag regressions.
+
+Matches results by scenario and params, prints throughput and p50/p95/p99
+deltas, and exits non-zero when any p95 latency regresses by more than
+--threshold (default 20%).
+
+Usage:
+    python bench/compare.py bench/results/bench_A.json bench/results/bench_B.json
+    python bench/compare.py base.json head.json --threshold 0.10
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def _key(result: dict[str, Any]) -> str:
+    return f"{result['scenario']} {json.dumps(result['params'], sort_keys=True)}"
+
+
+def _change(base: float, head: float) -> float:
+    return (head - base) / base if base else 0.0
+
+
+def compare(base: dict[str, Any], head: dict[str, Any], threshold: float) -> list[str]:
+    """Print a comparison table and return keys whose p95 regressed past threshold.
+
+    Args:
+        base: Baseline report.
+        head: Candidate report.
+        threshold: Allowed fractional p95 increase.
+
+    Returns:
+        Result keys that regressed.
+    """
+    base_results = {_key(result): result for result in base["results"]}
+    regressions = []
+    print(f"base {base['git_commit']}  →  head {head['git_commit']}")
+    print(f"{'result':<70} {'thrpt Δ':>9} {'p50 Δ':>8} {'p95 Δ':>8} {'p99 Δ':>8}")
+    for result in head["results"]:
+        key = _key(result)
+        previous = base_results.get(key)
+        if previous is None:
+            print(f"{key:<70} {'(new)':>9}")
+            continue
+        deltas = {
+            p: _change(previous["latency_ms"][p], result["latency_ms"][p])
+            for p in ("p50", "p95", "p99")
+        }
+        throughput = _change(previous["throughput_per_s"], result["throughput_per_s"])
+        flag = ""
+        if deltas["p95"] > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(
+            f"{key:<70} {throughput:>+9.1%} {deltas['p50']:>+8.1%} "
+            f"{deltas['p95']:>+8.1%} {deltas['p99']:>+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main() -> None:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports")
+    parser.add_argument("base", type=Path)
+    parser.add_argument("head", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.20)
+    args = parser.parse_args()
+
+    base = json.loads(args.base.read_text())
+    head = json.loads(args.head.read_text())
+    regressions = compare(base, head, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} result(s) regressed by more than {args.threshold:.0%} at p95")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""AI client wrapper that adds configurable latency to MockAIClient responses."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+from app.services.ai.client import AICallResult, AIClient, MockAIClient
+
+
+class LatencyMockAIClient(AIClient):
+    """MockAIClient with a sleep before each response.
+
+    Keeps the mock's deterministic keyword-driven extraction while giving
+    the event loop realistic wait time, so concurrency limits and batch
+    fan-out behave as they would against a real provider.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 0) -> None:
+        """Initialise with a mean latency and uniform jitter.
+
+        Args:
+            latency_ms: Base delay added to every call.
+            jitter_ms: Each call adds a uniform random delay in [0, jitter_ms].
+            seed: Random seed for reproducible jitter.
+        """
+        self._inner = MockAIClient()
+        self._latency_s = latency_ms / 1000
+        self._jitter_s = jitter_ms / 1000
+        self._rng = random.Random(seed)
+
+    async def complete(self, system: str, user: str, *, prompt_version: str = "") -> AICallResult:
+        """Sleep for the configured latency, then return the mock response."""
+        delay = self._latency_s + self._rng.uniform(0, self._jitter_s)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        ai_result = await self._inner.complete(system, user, prompt_version=prompt_version)
+        return ai_result.model_copy(update={"latency_ms": delay * 1000})
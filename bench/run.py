@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""Benchmark runner: throughput and latency percentiles for the HTTP API.
+
+Drives the real FastAPI app in-process (httpx ASGITransport, full lifespan,
+no sockets) with MockAIClient responses delayed by a configurable latency —
+or, with --ai-provider simulated, the SimulatedAIClient configured from the
+SIM_* environment variables (log-normal latency, injected failures, quota) —
+and writes a JSON report to bench/results/ for comparison across commits
+(see bench/compare.py).
+
+Scenarios:
+  ingest   — POST /ingest at each --concurrency level
+  batch    — POST /batch for each --batch-sizes × --concurrency combination
+  review   — GET /review (first page) against each --seed-sizes database
+  metrics  — GET /metrics and /metrics/prom against each --seed-sizes database
+
+Usage:
+    python bench/run.py
+    python bench/run.py --scenarios ingest,batch --ai-latency-ms 800 --ai-jitter-ms 400
+    python bench/run.py --scenarios review,metrics --seed-sizes 10000,100000,1000000
+    SIM_RATE_LIMIT_RATE=0.05 python bench/run.py --ai-provider simulated --scenarios batch
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.main import create_app  # noqa: E402
+from app.services.ai.client import AIClient  # noqa: E402
+from bench.latency import LatencyMockAIClient  # noqa: E402
+from bench.seed import seed_items  # noqa: E402
+from bench.stats import summarise  # noqa: E402
+
+BENCH_DIR = Path(__file__).parent
+RESULTS_DIR = BENCH_DIR / "results"
+ALL_SCENARIOS = ("ingest", "batch", "review", "metrics")
+
+# Bodies chosen so MockAIClient exercises every routing outcome.
+_BODIES = (
+    "Billing portal error HTTP 500 since Monday. Company: Northwind Traders. Urgent.",
+    "Please purchase 4 laptops. Item: ThinkPad T14s, Qty: 4. Due by 2026-04-30.",
+    "Please deploy the config change to production this Friday.",
+    "Hey, can you help?",
+)
+
+RequestFn = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+# ---------------------------------------------------------------------------
+# App harness
+# ---------------------------------------------------------------------------
+
+
+@asynccontextmanager
+async def _running_app(
+    workdir: Path, db_path: Path, ai_client: AIClient | None
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Start the app with isolated storage and the given AI client.
+
+    Args:
+        workdir: Directory for destination output files.
+        db_path: SQLite database to serve from (may be pre-seeded).
+        ai_client: AI client passed to create_app() in place of the configured
+            provider, or None to let the lifespan build one from settings.
+
+    Yields:
+        httpx client bound to the app via ASGITransport.
+    """
+    os.environ["SQLITE_PATH"] = str(db_path)
+    os.environ["SHEETS_CSV_PATH"] = str(workdir / "sheet.csv")
+    os.environ["AIRTABLE_JSONL_PATH"] = str(workdir / "airtable.jsonl")
+    app = create_app(ai_client=ai_client)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None
+        ) as client:
+            yield client
+
+
+def _email(run_tag: str, index: int) -> dict[str, Any]:
+    return {
+        "message_id": f"bench_{run_tag}_{index}",
+        "from": {"name": "Bench User", "email": "bench@example.com"},
+        "subject": f"Benchmark message {index}",
+        "received_at": "2026-03-22T10:00:00Z",
+        "body": _BODIES[index % len(_BODIES)],
+    }
+
+
+async def _drive(
+    client: httpx.AsyncClient,
+    request_fn: RequestFn,
+    *,
+    total: int,
+    concurrency: int,
+    units_per_request: int = 1,
+) -> dict[str, Any]:
+    """Issue total requests from concurrency workers and summarise latencies.
+
+    Args:
+        client: Bound httpx client.
+        request_fn: Coroutine issuing request number i.
+        total: Number of requests.
+        concurrency: Number of concurrent workers.
+        units_per_request: Work units per request for throughput (emails per batch).
+
+    Returns:
+        Summary dict from bench.stats.summarise.
+    """
+    counter = itertools.count()
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        while (index := next(counter)) < total:
+            start = time.perf_counter()
+            try:
+                response = await request_fn(client, index)
+                ok = response.is_success
+            except Exception:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            errors += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarise(
+        latencies,
+        time.perf_counter() - start,
+        errors=errors,
+        units_per_sample=units_per_request,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+
+async def _bench_ingest(args: argparse.Namespace, workdir: Path) -> list[dict[str, Any]]:
+    results = []
+    for concurrency in args.concurrency:
+        run_tag = f"ingest_c{concurrency}"
+        async with _running_app(workdir, workdir / f"{run_tag}.db", _ai_client(args)) as client:
+
+            async def post_ingest(http: httpx.AsyncClient, index: int, tag: str = run_tag):
+                return await http.post("/api/v1/ingest", json=_email(tag, index))
+
+            summary = await _drive(
+                client, post_ingest, total=args.requests, concurrency=concurrency
+            )
+        results.append(_result("ingest", {"concurrency": concurrency}, summary))
+    return results
+
+
+async def _bench_batch(args: argparse.Namespace, workdir: Path) -> list[dict[str, Any]]:
+    results = []
+    for size, concurrency in itertools.product(args.batch_sizes, args.concurrency):
+        run_tag = f"batch_{size}_c{concurrency}"
+        async with _running_app(workdir, workdir / f"{run_tag}.db", _ai_client(args)) as client:
+
+            async def post_batch(
+                http: httpx.AsyncClient, index: int, tag: str = run_tag, n: int = size
+            ):
+                emails = [_email(tag, index * n + offset) for offset in range(n)]
+                return await http.post("/api/v1/batch", json={"emails": emails})
+
+            summary = await _drive(
+                client,
+                post_batch,
+                total=args.batch_repeats,
+                concurrency=concurrency,
+                units_per_request=size,
+            )
+        results.append(_result("batch", {"size": size, "concurrency": concurrency}, summary))
+    return results
+
+
+async def _bench_reads(
+    args: argparse.Namespace, workdir: Path, scenarios: list[str]
+) -> list[dict[str, Any]]:
+    endpoints = {
+        "review": ["/api/v1/review?page=1&page_size=20"],
+        "metrics": ["/api/v1/metrics", "/api/v1/metrics/prom"],
+    }
+    results = []
+    for items in args.seed_sizes:
+        db_path = workdir / f"seeded_{items}.db"
+        seed_start = time.perf_counter()
+        seed_items(str(db_path), items)
+        print(f"  seeded {items:,} items in {time.perf_counter() - seed_start:.1f}s")
+        async with _running_app(workdir, db_path, _ai_client(args)) as client:
+            for scenario in scenarios:
+                for path in endpoints[scenario]:
+
+                    async def get(http: httpx.AsyncClient, index: int, url: str = path):
+                        return await http.get(url)
+
+                    summary = await _drive(
+                        client, get, total=args.read_requests, concurrency=args.read_concurrency
+                    )
+                    params = {"endpoint": path.split("?")[0], "seeded_items": items}
+                    results.append(_result(scenario, params, summary))
+    return results
+
+
+def _ai_client(args: argparse.Namespace) -> AIClient | None:
+    if args.ai_provider == "simulated":
+        return None
+    return LatencyMockAIClient(latency_ms=args.ai_latency_ms, jitter_ms=args.ai_jitter_ms)
+
+
+def _result(name: str, params: dict[str, Any], summary: dict[str, Any]) -> dict[str, Any]:
+    latency = summary["latency_ms"]
+    print(
+        f"  {name:<8} {json.dumps(params):<55} "
+        f"{summary['throughput_per_s']:>9.1f}/s  p50 {latency['p50']:>9.2f}ms  "
+        f"p95 {latency['p95']:>9.2f}ms  p99 {latency['p99']:>9.2f}ms  errors {summary['errors']}"
+    )
+    return {"scenario": name, "params": params, **summary}
+
+
+# ---------------------------------------------------------------------------
+# Report
+# ---------------------------------------------------------------------------
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=BENCH_DIR.parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _write_report(report: dict[str, Any], output: Path | None) -> Path:
+    """Write the report to output, or bench/results/bench_<timestamp>_<commit>.json.
+
+    Args:
+        report: Completed report dict.
+        output: Explicit output path, if given.
+
+    Returns:
+        Path to the written file.
+    """
+    if output is None:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        timestamp_tag = datetime.now(UTC).strftime("%Y-%m-%dT%H-%M-%S")
+        output = RESULTS_DIR / f"bench_{timestamp_tag}_{report['git_commit']}.json"
+    output.write_text(json.dumps(report, indent=2))
+    return output
+
+
+async def run_bench(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected scenarios and return the report.
+
+    Args:
+        args: Parsed CLI arguments.
+
+    Returns:
+        Report dict with environment, configuration, and per-scenario results.
+    """
+    results: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="ops_bench_") as tmp:
+        workdir = Path(tmp)
+        if "ingest" in args.scenarios:
+            print("ingest")
+            results += await _bench_ingest(args, workdir)
+        if "batch" in args.scenarios:
+            print("batch")
+            results += await _bench_batch(args, workdir)
+        read_scenarios = [s for s in ("review", "metrics") if s in args.scenarios]
+        if read_scenarios:
+            print(", ".join(read_scenarios))
+            results += await _bench_reads(args, workdir, read_scenarios)
+
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "ai_provider": args.ai_provider,
+            "ai_latency_ms": args.ai_latency_ms,
+            "ai_jitter_ms": args.ai_jitter_ms,
+            "requests": args.requests,
+            "batch_repeats": args.batch_repeats,
+            "read_requests": args.read_requests,
+            "read_concurrency": args.read_concurrency,
+        },
+        "results": results,
+    }
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part]
+
+
+def main() -> None:
+    """CLI entry point — parse args, run benchmarks, write the JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark the ops workflow API")
+    parser.add_argument("--scenarios", default=",".join(ALL_SCENARIOS))
+    parser.add_argument("--ai-provider", choices=("mock", "simulated"), default="mock")
+    parser.add_argument("--ai-latency-ms", type=float, default=0.0)
+    parser.add_argument("--ai-jitter-ms", type=float, default=0.0)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per ingest run")
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 8, 32])
+    parser.add_argument("--batch-sizes", type=_int_list, default=[10, 50, 200])
+    parser.add_argument("--batch-repeats", type=int, default=5, help="Batches per batch run")
+    parser.add_argument("--seed-sizes", type=_int_list, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--read-requests", type=int, default=20)
+    parser.add_argument("--read-concurrency", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+    args.scenarios = [s for s in args.scenarios.split(",") if s]
+    unknown = set(args.scenarios) - set(ALL_SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    # Benchmark the pipeline, not log output.
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+    os.environ["AI_PROVIDER"] = args.ai_provider
+    logging.disable(logging.INFO)
+
+    report = asyncio.run(run_bench(args))
+    print(f"\nReport written to: {_write_report(report, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Latency and throughput summaries for benchmark runs."""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Return the linearly interpolated percentile of pre-sorted values.
+
+    Args:
+        sorted_values: Ascending samples.
+        fraction: Percentile as a fraction in [0, 1] (0.95 for p95).
+
+    Returns:
+        Interpolated value, or 0.0 for an empty list.
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarise(
+    latencies_s: list[float],
+    wall_s: float,
+    *,
+    errors: int = 0,
+    units_per_sample: int = 1,
+) -> dict[str, Any]:
+    """Summarise one scenario's samples.
+
+    Args:
+        latencies_s: Per-request latencies in seconds.
+        wall_s: Wall-clock duration of the whole scenario in seconds.
+        errors: Requests that returned a non-2xx status or raised.
+        units_per_sample: Work units per request (emails per batch) for throughput.
+
+    Returns:
+        Dict with count, errors, throughput_per_s and latency_ms percentiles.
+    """
+    ordered = sorted(latencies_s)
+    count = len(ordered)
+    to_ms = 1000.0
+    return {
+        "count": count,
+        "errors": errors,
+        "wall_s": round(wall_s, 4),
+        "throughput_per_s": round(count * units_per_sample / wall_s, 2) if wall_s else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ordered) / count * to_ms, 3) if count else 0.0,
+            "p50": round(percentile(ordered, 0.50) * to_ms, 3),
+            "p95": round(percentile(ordered, 0.95) * to_ms, 3),
+            "p99": round(percentile(ordered, 0.99) * to_ms, 3),
+            "max": round(ordered[-1] * to_ms, 3) if count else 0.0,
+        },
+    }
@@ -5,8 +5,20 @@ Loads test cases from eval/test_set.jsonl, runs each through the
 ExtractionService, compares results to expected values, and writes a
 structured JSON report to eval/results/eval_YYYY-MM-DD.json.
 
+With --keyword-tier, each case is also offered to the keyword extraction
+tier. The report gains a "keyword_tier" section comparing the AI-only run
+with the tiered outcome (keyword result where accepted, AI result
+otherwise): skip rate, AI cost saved, and pass-rate / field-accuracy delta.
+
+With --compare-output-modes, the test set is also run in the other AI
+output mode ("text" JSON replies vs "tool" forced tool calls). The report
+gains an "output_mode_comparison" section with pass rate, invalid outputs,
+spend and cost per successful extraction for each mode.
+
 Usage:
     python eval/evaluate.py
+    python eval/evaluate.py --keyword-tier --keyword-tier-threshold 0.85
+    AI_PROVIDER=simulated SIM_MALFORMED_RATE=0.1 python eval/evaluate.py --compare-output-modes
     AI_PROVIDER=anthropic ANTHROPIC_API_KEY=sk-... python eval/evaluate.py
     python eval/evaluate.py --test-set eval/test_set.jsonl
 """
@@ -26,18 +38,27 @@ from typing import Any
 # Project root on path so app modules import correctly.
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.config import get_settings  # noqa: E402
+from app.config import Settings, get_settings  # noqa: E402
 from app.core.exceptions import BaseAppError  # noqa: E402
 from app.models.email import Extraction, InboxMessage  # noqa: E402
-from app.services.ai.client import DailyCostTracker, get_ai_client  # noqa: E402
+from app.services.ai.cascade import CascadingAIClient  # noqa: E402
+from app.services.ai.client import OUTPUT_MODES, DailyCostTracker, get_ai_client  # noqa: E402
 from app.services.ai.prompts import VERSION as PROMPT_VERSION  # noqa: E402
-from app.services.extraction_service import ExtractionService  # noqa: E402
+from app.services.extraction_service import (  # noqa: E402
+    FAILURE_NON_JSON,
+    FAILURE_SCHEMA_MISMATCH,
+    FAILURE_STREAM_ABORTED,
+    ExtractionService,
+)
 from eval.metrics import exact_match_accuracy, field_level_accuracy  # noqa: E402
 
 EVAL_DIR = Path(__file__).parent
 RESULTS_DIR = EVAL_DIR / "results"
 DEFAULT_TEST_SET = EVAL_DIR / "test_set.jsonl"
 
+# ExtractionError failures caused by the AI output itself (not the provider)
+_INVALID_OUTPUT_FAILURES = (FAILURE_NON_JSON, FAILURE_SCHEMA_MISMATCH, FAILURE_STREAM_ABORTED)
+
 logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
 logger = logging.getLogger(__name__)
 
@@ -136,11 +157,38 @@ def _compare_fields(extraction: Extraction, expected: dict[str, Any]) -> dict[st
 # ---------------------------------------------------------------------------
 
 
+def _keyword_tier_result(
+    tier_svc: ExtractionService, message: InboxMessage, expected: dict[str, Any]
+) -> dict[str, Any]:
+    """Offer a message to the keyword tier and score the outcome.
+
+    Args:
+        tier_svc: ExtractionService with a keyword_tier_threshold set.
+        message: Message built from the test case.
+        expected: Expected values dict from the test case.
+
+    Returns:
+        Dict with accepted flag, and confidence / passed / field_matches
+        when the keyword tier accepted the message.
+    """
+    extraction = tier_svc.try_keyword_tier(message)
+    if extraction is None:
+        return {"accepted": False}
+    field_matches = _compare_fields(extraction, expected)
+    return {
+        "accepted": True,
+        "confidence": extraction.confidence,
+        "passed": field_matches.get("request_type") is True,
+        "field_matches": {k: v for k, v in field_matches.items() if v is not None},
+    }
+
+
 async def _run_case(
     svc: ExtractionService,
     cost_tracker: DailyCostTracker,
     case: dict[str, Any],
     received_at: datetime,
+    tier_svc: ExtractionService | None = None,
 ) -> dict[str, Any]:
     """Run a single test case and return a structured result dict.
 
@@ -149,6 +197,8 @@ async def _run_case(
         cost_tracker: Shared cost accumulator (read after each call).
         case: Test case dict with id, input, and expected keys.
         received_at: Timestamp to embed in the InboxMessage.
+        tier_svc: Optional keyword-tier service; when given, the result
+            carries a "keyword_tier" entry.
 
     Returns:
         Result dict with passed, field_matches, extracted values, and metrics.
@@ -156,9 +206,12 @@ async def _run_case(
     expected = case["expected"]
     cost_before = cost_tracker.total_today()
     t_start = time.monotonic()
+    keyword_tier: dict[str, Any] | None = None
 
     try:
         message = _build_message(case["id"], case["input"], received_at)
+        if tier_svc is not None:
+            keyword_tier = _keyword_tier_result(tier_svc, message, expected)
         extraction = await svc.extract(message)
         latency_ms = (time.monotonic() - t_start) * 1000
         cost_usd = cost_tracker.total_today() - cost_before
@@ -180,6 +233,8 @@ async def _run_case(
             "latency_ms": round(latency_ms, 1),
             "cost_usd": round(cost_usd, 6),
             "error": None,
+            "failure": None,
+            "keyword_tier": keyword_tier,
         }
     except (BaseAppError, Exception) as exc:
         latency_ms = (time.monotonic() - t_start) * 1000
@@ -195,6 +250,8 @@ async def _run_case(
             "latency_ms": round(latency_ms, 1),
             "cost_usd": 0.0,
             "error": str(exc),
+            "failure": exc.context.get("failure") if isinstance(exc, BaseAppError) else None,
+            "keyword_tier": keyword_tier,
         }
 
 
@@ -215,10 +272,58 @@ def _compute_field_accuracy(results: list[dict[str, Any]]) -> dict[str, float]:
     return field_level_accuracy(results)
 
 
+def _summarise_keyword_tier(results: list[dict[str, Any]], threshold: float) -> dict[str, Any]:
+    """Compare the AI-only run with the keyword-tiered outcome.
+
+    The tiered outcome uses the keyword result for accepted cases and the
+    AI result for the rest, so the deltas show what enabling the tier with
+    this threshold would change. Cost saved is the AI spend on accepted cases.
+
+    Args:
+        results: Case result dicts carrying a "keyword_tier" entry.
+        threshold: Keyword tier confidence threshold used.
+
+    Returns:
+        Dict with skip rate, cost saved, and pass-rate / field-accuracy deltas.
+    """
+    total = len(results)
+    tiered: list[dict[str, Any]] = []
+    skipped: list[dict[str, Any]] = []
+    for result in results:
+        tier = result.get("keyword_tier") or {"accepted": False}
+        if tier["accepted"]:
+            skipped.append(result)
+            tiered.append({"passed": tier["passed"], "field_matches": tier["field_matches"]})
+        else:
+            tiered.append(result)
+
+    ai_field_accuracy = field_level_accuracy(results)
+    tiered_field_accuracy = field_level_accuracy(tiered)
+    ai_pass_rate = round(sum(1 for r in results if r["passed"]) / total, 4) if total else 0.0
+    tiered_pass_rate = round(sum(1 for r in tiered if r["passed"]) / total, 4) if total else 0.0
+    return {
+        "threshold": threshold,
+        "skipped": len(skipped),
+        "skip_rate": round(len(skipped) / total, 4) if total else 0.0,
+        "cost_saved_usd": round(sum(r["cost_usd"] for r in skipped), 6),
+        "ai_only_pass_rate": ai_pass_rate,
+        "tiered_pass_rate": tiered_pass_rate,
+        "pass_rate_delta": round(tiered_pass_rate - ai_pass_rate, 4),
+        "ai_only_field_accuracy": ai_field_accuracy,
+        "tiered_field_accuracy": tiered_field_accuracy,
+        "field_accuracy_delta": {
+            field: round(tiered_field_accuracy.get(field, 0.0) - accuracy, 4)
+            for field, accuracy in ai_field_accuracy.items()
+        },
+        "skipped_cases": [r["case_id"] for r in skipped],
+    }
+
+
 def _build_report(
     results: list[dict[str, Any]],
     model: str,
     prompt_version: str,
+    keyword_tier_threshold: float | None = None,
 ) -> dict[str, Any]:
     """Aggregate case results into the final evaluation report.
 
@@ -226,6 +331,8 @@ def _build_report(
         results: List of case result dicts from _run_case.
         model: AI model identifier used during the run.
         prompt_version: Prompt template version used.
+        keyword_tier_threshold: Threshold the keyword tier ran with, or None
+            when the tier was not evaluated.
 
     Returns:
         Structured report dict matching the documented report schema.
@@ -237,7 +344,7 @@ def _build_report(
     costs = [r["cost_usd"] for r in results]
     field_accuracy = field_level_accuracy(results)
     overall_accuracy = exact_match_accuracy(field_accuracy.values()) if field_accuracy else 0.0
-    return {
+    report: dict[str, Any] = {
         "timestamp": datetime.now(UTC).isoformat(),
         "model": model,
         "prompt_version": prompt_version,
@@ -254,6 +361,9 @@ def _build_report(
         "by_category": _summarise_by_category(results),
         "cases": results,
     }
+    if keyword_tier_threshold is not None:
+        report["keyword_tier"] = _summarise_keyword_tier(results, keyword_tier_threshold)
+    return report
 
 
 def _summarise_by_category(results: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
@@ -300,32 +410,130 @@ def _write_report(report: dict[str, Any]) -> Path:
 # ---------------------------------------------------------------------------
 
 
-async def run_eval(test_set_path: Path) -> dict[str, Any]:
+async def run_eval(
+    test_set_path: Path,
+    keyword_tier_threshold: float | None = None,
+    cascade_models: list[str] | None = None,
+    output_mode: str | None = None,
+    compare_output_modes: bool = False,
+) -> dict[str, Any]:
     """Load test cases, run the extraction pipeline, and return the report.
 
     Args:
         test_set_path: Path to the JSONL test set file.
+        keyword_tier_threshold: When set, also evaluate the keyword tier at
+            this threshold against the AI-only results.
+        cascade_models: Models to cascade through, cheapest first; None
+            uses the AI_CASCADE_MODELS setting.
+        output_mode: "text" or "tool"; None uses the AI_OUTPUT_MODE setting.
+        compare_output_modes: Also run the test set in every other output
+            mode and add an "output_mode_comparison" section.
 
     Returns:
         Completed evaluation report dict.
     """
     settings = get_settings()
+    if cascade_models is not None:
+        settings = settings.model_copy(update={"ai_cascade_models": cascade_models})
+    if output_mode is not None:
+        settings = settings.model_copy(update={"ai_output_mode": output_mode})
+    test_cases = _load_test_cases(test_set_path)
+
+    report = await _evaluate(settings, test_cases, keyword_tier_threshold)
+    if compare_output_modes:
+        comparison = {settings.ai_output_mode: _output_mode_summary(report)}
+        for mode in OUTPUT_MODES:
+            if mode not in comparison:
+                other = await _evaluate(
+                    settings.model_copy(update={"ai_output_mode": mode}), test_cases, None
+                )
+                comparison[mode] = _output_mode_summary(other)
+        report["output_mode_comparison"] = {mode: comparison[mode] for mode in OUTPUT_MODES}
+    return report
+
+
+async def _evaluate(
+    settings: Settings,
+    test_cases: list[dict[str, Any]],
+    keyword_tier_threshold: float | None,
+) -> dict[str, Any]:
+    """Run every test case through a fresh client built from settings.
+
+    Args:
+        settings: Settings to build the AI client from.
+        test_cases: Loaded test cases.
+        keyword_tier_threshold: Keyword tier threshold, or None to skip it.
+
+    Returns:
+        Evaluation report for this configuration.
+    """
     cost_tracker = DailyCostTracker()
     ai_client = get_ai_client(settings, cost_tracker=cost_tracker)
-    model = settings.ai_model if settings.ai_provider == "anthropic" else "mock"
-    svc = ExtractionService(ai_client=ai_client)
+    cascade = ai_client if isinstance(ai_client, CascadingAIClient) else None
+    if cascade is not None:
+        model = " → ".join(tier.name for tier in cascade.tiers)
+    else:
+        model = settings.ai_model if settings.ai_provider == "anthropic" else "mock"
+    svc = ExtractionService(
+        ai_client=ai_client,
+        review_band=(settings.auto_reject_threshold, settings.auto_approve_threshold),
+        max_repair_attempts=settings.ai_repair_max_attempts,
+    )
+    tier_svc = (
+        ExtractionService(ai_client=ai_client, keyword_tier_threshold=keyword_tier_threshold)
+        if keyword_tier_threshold is not None
+        else None
+    )
 
-    test_cases = _load_test_cases(test_set_path)
     received_at = datetime.now(UTC)
 
     print(
-        f"Running {len(test_cases)} test cases with provider={settings.ai_provider!r} model={model!r}"
+        f"Running {len(test_cases)} test cases with provider={settings.ai_provider!r} "
+        f"model={model!r} output_mode={settings.ai_output_mode!r}"
     )
 
-    tasks = [_run_case(svc, cost_tracker, case, received_at) for case in test_cases]
+    tasks = [_run_case(svc, cost_tracker, case, received_at, tier_svc) for case in test_cases]
     results = await asyncio.gather(*tasks)
 
-    return _build_report(list(results), model=model, prompt_version=PROMPT_VERSION)
+    report = _build_report(
+        list(results),
+        model=model,
+        prompt_version=PROMPT_VERSION,
+        keyword_tier_threshold=keyword_tier_threshold,
+    )
+    run_cost_usd = cost_tracker.total_today()
+    report["output_mode"] = settings.ai_output_mode
+    report["invalid_outputs"] = sum(1 for r in results if r["failure"] in _INVALID_OUTPUT_FAILURES)
+    # From the run's tracker: per-case cost deltas overlap while cases run concurrently
+    report["run_cost_usd"] = round(run_cost_usd, 6)
+    report["cost_per_success_usd"] = (
+        round(run_cost_usd / report["passes"], 6) if report["passes"] else None
+    )
+    if cascade is not None:
+        report["cascade"] = cascade.stats()
+    return report
+
+
+def _output_mode_summary(report: dict[str, Any]) -> dict[str, Any]:
+    """Pick the fields compared across output modes from a report.
+
+    Args:
+        report: Report produced by _evaluate.
+
+    Returns:
+        Pass rate, invalid outputs, spend and cost per successful extraction.
+    """
+    return {
+        key: report[key]
+        for key in (
+            "pass_rate",
+            "passes",
+            "invalid_outputs",
+            "run_cost_usd",
+            "cost_per_success_usd",
+            "avg_latency_ms",
+        )
+    }
 
 
 def main() -> None:
@@ -337,9 +545,55 @@ def main() -> None:
         default=DEFAULT_TEST_SET,
         help="Path to test_set.jsonl (default: eval/test_set.jsonl)",
     )
+    parser.add_argument(
+        "--keyword-tier",
+        action="store_true",
+        help="Also evaluate the keyword extraction tier (skip rate, cost saved, accuracy delta)",
+    )
+    parser.add_argument(
+        "--keyword-tier-threshold",
+        type=float,
+        default=None,
+        help="Keyword tier confidence threshold (default: KEYWORD_TIER_THRESHOLD setting)",
+    )
+    parser.add_argument(
+        "--output-mode",
+        choices=OUTPUT_MODES,
+        default=None,
+        help="AI output mode (default: AI_OUTPUT_MODE setting)",
+    )
+    parser.add_argument(
+        "--compare-output-modes",
+        action="store_true",
+        help="Also run every other output mode and compare cost per successful extraction",
+    )
+    parser.add_argument(
+        "--cascade",
+        default=None,
+        help="Comma-separated models to cascade through, cheapest first "
+        "(default: AI_CASCADE_MODELS setting)",
+    )
     args = parser.parse_args()
 
-    report = asyncio.run(run_eval(args.test_set))
+    threshold = None
+    if args.keyword_tier:
+        threshold = args.keyword_tier_threshold
+        if threshold is None:
+            threshold = get_settings().keyword_tier_threshold
+    cascade_models = (
+        [model.strip() for model in args.cascade.split(",") if model.strip()]
+        if args.cascade
+        else None
+    )
+    report = asyncio.run(
+        run_eval(
+            args.test_set,
+            keyword_tier_threshold=threshold,
+            cascade_models=cascade_models,
+            output_mode=args.output_mode,
+            compare_output_modes=args.compare_output_modes,
+        )
+    )
     output_path = _write_report(report)
 
     print(f"\n{'=' * 60}")
@@ -352,12 +606,47 @@ def main() -> None:
     print(f"  Avg confidence   : {report['avg_confidence']:.3f}")
     print(f"  Avg latency      : {report['avg_latency_ms']:.0f} ms")
     print(f"  Total cost       : ${report['total_cost_usd']:.4f}")
+    if report["cost_per_success_usd"] is not None:
+        print(f"  Cost / success   : ${report['cost_per_success_usd']:.6f}")
+    print(f"  Invalid outputs  : {report['invalid_outputs']}")
     print("\n  Field accuracy:")
     for field, acc in report["field_accuracy"].items():
         print(f"    {field:<20} {acc:.1%}")
     print("\n  By category:")
     for cat, summary in report["by_category"].items():
         print(f"    {cat:<22} {summary['passed']}/{summary['total']} ({summary['pass_rate']:.0%})")
+    tier = report.get("keyword_tier")
+    if tier:
+        print(f"\n  Keyword tier (threshold {tier['threshold']:.2f}):")
+        print(
+            f"    Skip rate        : {tier['skip_rate']:.1%}  ({tier['skipped']} AI calls avoided)"
+        )
+        print(f"    Cost saved       : ${tier['cost_saved_usd']:.4f}")
+        print(
+            f"    Pass rate        : {tier['ai_only_pass_rate']:.1%} AI-only → "
+            f"{tier['tiered_pass_rate']:.1%} tiered ({tier['pass_rate_delta']:+.1%})"
+        )
+        for field, delta in tier["field_accuracy_delta"].items():
+            print(f"    {field:<20} {delta:+.1%}")
+    comparison = report.get("output_mode_comparison")
+    if comparison:
+        print("\n  Output modes:")
+        for mode, summary in comparison.items():
+            per_success = summary["cost_per_success_usd"]
+            print(
+                f"    {mode:<6} pass {summary['pass_rate']:.1%}, "
+                f"{summary['invalid_outputs']} invalid outputs, "
+                f"${summary['run_cost_usd']:.4f} total, "
+                + (f"${per_success:.6f} per success" if per_success is not None else "no successes")
+            )
+    cascade = report.get("cascade")
+    if cascade:
+        print("\n  Model cascade:")
+        for name, stats in cascade.items():
+            print(
+                f"    {name:<20} {stats['calls']} calls, hit rate {stats['hit_rate']:.1%}, "
+                f"avg {stats['avg_latency_ms']:.0f} ms, ${stats['cost_usd']:.4f}"
+            )
     print(f"\n  Report written to: {output_path}")
 
 
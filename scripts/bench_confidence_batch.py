@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: scalar vs vectorised confidence scoring.
+
+Times, per item:
+
+  scalar   — compute_confidence on each Extraction
+  columns  — ConfidenceColumns.from_extractions (gathering inputs from models)
+  batch    — compute_confidence_batch on prebuilt columns
+
+The batch path runs on --items synthetic rows (default 1M). Building that
+many Extraction models would dominate the run, so the scalar and columns
+paths run on a --sample subset and are reported per item; the sample's
+batch scores are checked against the scalar scores first.
+
+Usage:
+    python scripts/bench_confidence_batch.py
+    python scripts/bench_confidence_batch.py --items 1000000 --sample 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.email import Extraction, LineItem, Requester  # noqa: E402
+from app.services.confidence_service import (  # noqa: E402
+    ConfidenceColumns,
+    compute_confidence,
+    compute_confidence_batch,
+)
+
+_TYPES = ["purchase_request", "customer_issue", "ops_change", "general_inquiry", "other"]
+
+
+def _extractions(count: int, rng: random.Random) -> list[Extraction]:
+    line_item = LineItem(item="Dock", qty=1)
+    return [
+        Extraction.model_construct(
+            request_id=f"req_{index}",
+            request_type=rng.choice(_TYPES),
+            priority="medium",
+            due_date=rng.choice(["2026-04-01", None]),
+            company=rng.choice(["Acme Corp", None]),
+            requester=Requester.model_construct(
+                name=rng.choice(["Jane Smith", ""]), email="jane@acme.com"
+            ),
+            description="x" * rng.randint(0, 200),
+            line_items=[line_item] * rng.randint(0, 2),
+            confidence=0.0,
+            extraction_notes=["note"] * rng.randint(0, 4),
+        )
+        for index in range(count)
+    ]
+
+
+def _columns(count: int, seed: int) -> ConfidenceColumns:
+    gen = np.random.default_rng(seed)
+    return ConfidenceColumns(
+        description_lengths=gen.integers(0, 200, count),
+        has_name=gen.random(count) < 0.9,
+        has_email=np.ones(count, dtype=np.bool_),
+        has_company=gen.random(count) < 0.5,
+        has_due_date=gen.random(count) < 0.5,
+        request_types=gen.choice(np.array(_TYPES), count),
+        has_line_items=gen.random(count) < 0.5,
+        note_counts=gen.integers(0, 5, count),
+    )
+
+
+def _cpu_seconds(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark batch confidence scoring")
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--sample", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sample = _extractions(args.sample, random.Random(42))
+    sample_columns = ConfidenceColumns.from_extractions(sample)
+    expected = [compute_confidence(extraction).score for extraction in sample]
+    assert compute_confidence_batch(sample_columns).score.tolist() == expected
+
+    columns = _columns(args.items, seed=42)
+    rows = [
+        ("scalar", args.sample, lambda: [compute_confidence(e) for e in sample]),
+        ("columns", args.sample, lambda: ConfidenceColumns.from_extractions(sample)),
+        ("batch", args.items, lambda: compute_confidence_batch(columns)),
+    ]
+
+    print(f"best of {args.repeat}; scalar/columns on {args.sample} items, batch on {args.items}")
+    print(f"{'path':<10} {'items':>10} {'CPU s':>9} {'µs/item':>9}")
+    for name, count, fn in rows:
+        seconds = _cpu_seconds(fn, args.repeat)
+        print(f"{name:<10} {count:>10} {seconds:>9.3f} {seconds / count * 1e6:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
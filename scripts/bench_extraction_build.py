@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: turning an AI reply into a stored Extraction.
+
+Times the CPU spent per item between receiving the AI reply text and
+producing the storage dict, for:
+
+  legacy  — json.loads + model_validate, a validated Requester and Extraction,
+            compute_confidence on it, model_copy for the score, model_dump
+  current — ExtractionService._parse_and_validate (model_validate_json) and
+            _build_extraction (score the AI output, one model_construct), model_dump
+
+Replies are generated with a mix of request types, line items and notes;
+both paths' dumps are checked to be identical before timing.
+
+Usage:
+    python scripts/bench_extraction_build.py
+    python scripts/bench_extraction_build.py --items 10000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.models.email import (  # noqa: E402
+    AIExtractionOutput,
+    Extraction,
+    InboxMessage,
+    Requester,
+)
+from app.services.ai.client import MockAIClient  # noqa: E402
+from app.services.confidence_service import compute_confidence  # noqa: E402
+from app.services.extraction_service import ExtractionService  # noqa: E402
+from app.utils import stable_id  # noqa: E402
+
+_TYPES = ["purchase_request", "customer_issue", "ops_change", "general_inquiry", "other"]
+_PRIORITIES = ["low", "medium", "high", "urgent"]
+
+
+def _item(index: int, rng: random.Random) -> tuple[InboxMessage, str]:
+    request_type = rng.choice(_TYPES)
+    line_items = (
+        [{"item": f"Item {n}", "qty": rng.randint(1, 9)} for n in range(rng.randint(1, 4))]
+        if request_type == "purchase_request"
+        else []
+    )
+    reply = {
+        "request_type": request_type,
+        "priority": rng.choice(_PRIORITIES),
+        "due_date": rng.choice([None, "2026-04-01"]),
+        "company": rng.choice([None, "Acme Corp"]),
+        "description": "Please handle this request for the team. " * rng.randint(1, 4),
+        "line_items": line_items,
+        "extraction_notes": ["assumed quantity"] * rng.randint(0, 2),
+    }
+    message = InboxMessage(
+        message_id=f"msg_{index}",
+        **{"from": {"name": f"User {index}", "email": f"user{index}@example.com"}},
+        subject="Request",
+        received_at=datetime(2026, 3, 1, 9, 0, tzinfo=UTC),
+        body="body",
+    )
+    return message, json.dumps(reply)
+
+
+def _legacy(message: InboxMessage, reply: str) -> dict[str, Any]:
+    ai_output = AIExtractionOutput.model_validate(json.loads(reply))
+    partial = Extraction(
+        request_id=stable_id(message.message_id, str(message.from_.email), message.subject),
+        request_type=ai_output.request_type,
+        priority=ai_output.priority,
+        due_date=ai_output.due_date,
+        company=ai_output.company,
+        requester=Requester(name=message.from_.name, email=message.from_.email),
+        description=ai_output.description,
+        line_items=ai_output.line_items,
+        confidence=0.0,
+        extraction_notes=ai_output.extraction_notes,
+    )
+    score = compute_confidence(partial).score
+    return partial.model_copy(update={"confidence": score}).model_dump()
+
+
+def _current(svc: ExtractionService) -> Callable[[InboxMessage, str], dict[str, Any]]:
+    def build(message: InboxMessage, reply: str) -> dict[str, Any]:
+        ai_output = svc._parse_and_validate(reply, input_hash="bench")
+        return svc._build_extraction(message, ai_output).model_dump()
+
+    return build
+
+
+def _cpu_us_per_item(
+    build: Callable[[InboxMessage, str], Any], items: list[tuple[InboxMessage, str]], repeat: int
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.process_time()
+        for message, reply in items:
+            build(message, reply)
+        best = min(best, time.process_time() - start)
+    return best / len(items) * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark Extraction construction")
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    items = [_item(index, rng) for index in range(args.items)]
+    impls = {
+        "legacy": _legacy,
+        "current": _current(ExtractionService(ai_client=MockAIClient())),
+    }
+
+    for message, reply in items:
+        expected = _legacy(message, reply)
+        for name, build in impls.items():
+            assert build(message, reply) == expected, name
+
+    print(f"{args.items} items, best of {args.repeat}")
+    print(f"{'path':<10} {'CPU µs/item':>12} {'speedup':>9}")
+    baseline = 0.0
+    for name, build in impls.items():
+        us = _cpu_us_per_item(build, items, args.repeat)
+        baseline = baseline or us
+        print(f"{name:<10} {us:>12.1f} {baseline / us:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
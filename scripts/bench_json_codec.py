@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: JSON codec backends on extraction_json payloads.
+
+Serialises and parses a representative stored extraction dict with each
+available backend and prints per-operation timings in microseconds.
+
+Usage:
+    python scripts/bench_json_codec.py
+    python scripts/bench_json_codec.py --iterations 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.json_codec import OrjsonCodec, StdlibCodec  # noqa: E402
+
+_EXTRACTION: dict[str, Any] = {
+    "request_id": "a1b2c3d4e5f60718",
+    "request_type": "purchase_request",
+    "priority": "high",
+    "due_date": "2026-03-31",
+    "company": "Acme Corp",
+    "requester": {"name": "Alice Smith", "email": "alice@acme.example"},
+    "description": "Purchase request for 4x ThinkPad T14s laptops for the engineering hires.",
+    "line_items": [
+        {"item": "ThinkPad T14s", "qty": 4, "notes": None},
+        {"item": "USB-C dock", "qty": 4, "notes": "same model as last order"},
+    ],
+    "confidence": 0.87,
+    "extraction_notes": ["due date taken from 'Due by' marker"],
+}
+
+
+def _time_per_call_us(fn: Any, iterations: int) -> float:
+    best = min(timeit.repeat(fn, number=iterations, repeat=5))
+    return best / iterations * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark JSON codec backends")
+    parser.add_argument("--iterations", type=int, default=50_000)
+    args = parser.parse_args()
+
+    codecs: list[Any] = [StdlibCodec()]
+    try:
+        codecs.append(OrjsonCodec())
+    except ImportError:
+        print("orjson not installed — benchmarking stdlib only")
+
+    legacy_dumps = _time_per_call_us(lambda: json.dumps(_EXTRACTION), args.iterations)
+    print(f"{'backend':<10} {'dumps µs':>10} {'loads µs':>10}")
+    print(f"{'legacy':<10} {legacy_dumps:>10.2f} {'':>10}")
+    for codec in codecs:
+        encoded = codec.dumps(_EXTRACTION)
+        dumps_us = _time_per_call_us(lambda c=codec: c.dumps(_EXTRACTION), args.iterations)
+        loads_us = _time_per_call_us(lambda c=codec, e=encoded: c.loads(e), args.iterations)
+        print(f"{codec.name:<10} {dumps_us:>10.2f} {loads_us:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
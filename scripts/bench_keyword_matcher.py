@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: keyword hint detection on long email bodies.
+
+Runs request-type + priority detection (one subject + body) and the mock
+response selection on ~10KB bodies with:
+
+  legacy      — the previous per-keyword loops (lower() per call, one scan per keyword)
+  scan        — KeywordMatcher, scan backend
+  automaton   — KeywordMatcher, pyahocorasick backend (if installed)
+  pure-py AC  — a pure-Python Aho–Corasick automaton, for reference
+
+Bodies either contain no keyword (full scans), a keyword at the end, or one
+at the start. Every implementation's answers are checked against legacy
+before timing. A second table times the scan and automaton backends on
+synthetic tables of increasing size to locate the crossover used by
+KeywordMatcher's "auto" backend.
+
+Usage:
+    python scripts/bench_keyword_matcher.py
+    python scripts/bench_keyword_matcher.py --body-chars 10000 --iterations 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import sys
+import timeit
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.keyword_matcher import (  # noqa: E402
+    BACKEND_AUTOMATON,
+    BACKEND_SCAN,
+    DEFAULT_KEYWORD_TABLE,
+    GROUP_MOCK_RESPONSE,
+    GROUP_PRIORITY,
+    GROUP_REQUEST_TYPE,
+    KeywordMatcher,
+)
+
+_FILLER = (
+    "the team would like to confirm the schedule for next quarter and review "
+    "the notes from the last meeting before friday thanks regarding the office"
+).split()
+
+
+class PurePythonAhoCorasick:
+    """Textbook Aho–Corasick with per-state dict transitions."""
+
+    def __init__(self, keywords: list[str]) -> None:
+        self.keywords = keywords
+        goto: list[dict[str, int]] = [{}]
+        fail = [0]
+        out: list[int | None] = [None]
+        for index, keyword in enumerate(keywords):
+            state = 0
+            for char in keyword:
+                if char not in goto[state]:
+                    goto.append({})
+                    fail.append(0)
+                    out.append(None)
+                    goto[state][char] = len(goto) - 1
+                state = goto[state][char]
+            out[state] = index if out[state] is None else min(out[state], index)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(char, 0)
+                inherited = out[fail[child]]
+                if inherited is not None and (out[child] is None or inherited < out[child]):
+                    out[child] = inherited
+        self._goto, self._fail, self._out = goto, fail, out
+
+    def first(self, text: str) -> int | None:
+        """Return the lowest keyword index found in text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        best: int | None = None
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            found = out[state]
+            if found is not None and (best is None or found < best):
+                best = found
+                if best == 0:
+                    break
+        return best
+
+
+def _legacy_first(table: list[tuple[str, str]], text: str) -> tuple[str, str] | None:
+    lowered = text.lower()
+    for keyword, label in table:
+        if keyword in lowered:
+            return keyword, label
+    return None
+
+
+def _body(chars: int, rng: random.Random, prefix: str = "", suffix: str = "") -> str:
+    words: list[str] = []
+    length = len(prefix) + len(suffix)
+    while length < chars:
+        word = rng.choice(_FILLER)
+        words.append(word)
+        length += len(word) + 1
+    return prefix + " ".join(words) + suffix
+
+
+def _time_us(fn: Callable[[], Any], iterations: int) -> float:
+    best = min(timeit.repeat(fn, number=iterations, repeat=3))
+    return best / iterations * 1_000_000
+
+
+def _detect_all(first: Callable[[str, str], Any], subject: str, body: str, prompt: str) -> tuple:
+    text = subject + " " + body
+    return (
+        first(text, GROUP_REQUEST_TYPE),
+        first(text, GROUP_PRIORITY),
+        first(prompt, GROUP_MOCK_RESPONSE),
+    )
+
+
+def _implementations() -> dict[str, Callable[[str, str], Any]]:
+    impls: dict[str, Callable[[str, str], Any]] = {
+        "legacy": lambda text, group: _legacy_first(DEFAULT_KEYWORD_TABLE[group], text),
+        "scan": KeywordMatcher(DEFAULT_KEYWORD_TABLE, backend=BACKEND_SCAN).first_match,
+    }
+    try:
+        impls["automaton"] = KeywordMatcher(
+            DEFAULT_KEYWORD_TABLE, backend=BACKEND_AUTOMATON
+        ).first_match
+    except ImportError:
+        print("pyahocorasick not installed — skipping the automaton backend")
+
+    pure = {
+        group: PurePythonAhoCorasick([keyword for keyword, _ in entries])
+        for group, entries in DEFAULT_KEYWORD_TABLE.items()
+    }
+
+    def pure_first(text: str, group: str) -> tuple[str, str] | None:
+        index = pure[group].first(text)
+        return None if index is None else DEFAULT_KEYWORD_TABLE[group][index]
+
+    impls["pure-py AC"] = pure_first
+    return impls
+
+
+def _crossover(bodies: list[str], iterations: int) -> None:
+    try:
+        import ahocorasick  # noqa: F401
+    except ImportError:
+        return
+    rng = random.Random(7)
+    print(f"\n{'keywords':>8} {'scan µs':>10} {'automaton µs':>13}   (one group, no match)")
+    for size in (8, 16, 24, 32, 48, 96):
+        table = {
+            "group": [
+                ("".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9))), "label")
+                for _ in range(size)
+            ]
+        }
+        timings = []
+        for backend in (BACKEND_SCAN, BACKEND_AUTOMATON):
+            matcher = KeywordMatcher(table, backend=backend)
+
+            def run(m: KeywordMatcher = matcher) -> None:
+                for body in bodies:
+                    m.first_match(body, "group")
+
+            timings.append(_time_us(run, iterations) / len(bodies))
+        print(f"{size:>8} {timings[0]:>10.1f} {timings[1]:>13.1f}")
+
+
+def main() -> None:
+    """Run the benchmark and print comparison tables."""
+    parser = argparse.ArgumentParser(description="Benchmark keyword hint matching")
+    parser.add_argument("--body-chars", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--emails", type=int, default=8, help="Distinct emails per case")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    # Distinct bodies per case, so the matcher's last-text memo only helps
+    # within one email (type and priority share a pass), never across emails.
+    cases: dict[str, list[tuple[str, str, str]]] = {}
+    for case, subject, prefix, suffix in (
+        ("no match", "Weekly sync", "", ""),
+        ("match at end", "Weekly sync", "", " please update"),
+        ("match at start", "Purchase", "Urgent: ", ""),
+    ):
+        emails = []
+        for _ in range(args.emails):
+            body = _body(args.body_chars, rng, prefix=prefix, suffix=suffix)
+            emails.append((subject, body, f"Subject: {subject}\n\n{body}"))
+        cases[case] = emails
+    impls = _implementations()
+
+    for emails in cases.values():
+        for subject, body, prompt in emails:
+            expected = _detect_all(impls["legacy"], subject, body, prompt)
+            for name, first in impls.items():
+                assert _detect_all(first, subject, body, prompt) == expected, name
+
+    print(f"{'µs per email (type + priority + mock)':<40}" + "".join(f"{n:>16}" for n in cases))
+    for name, first in impls.items():
+        iterations = max(1, args.iterations // 10) if name == "pure-py AC" else args.iterations
+        row = []
+        for emails in cases.values():
+
+            def run(f: Callable[[str, str], Any] = first, batch: list = emails) -> None:
+                for subject, body, prompt in batch:
+                    _detect_all(f, subject, body, prompt)
+
+            row.append(_time_us(run, iterations) / len(emails))
+        print(f"{name:<40}" + "".join(f"{us:>16.1f}" for us in row))
+
+    _crossover([body for _, body, _ in cases["no match"]], args.iterations)
+
+
+if __name__ == "__main__":
+    main()
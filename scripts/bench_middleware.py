@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: per-request overhead of the correlation ID middleware.
+
+Drives a trivial Starlette endpoint in-process (httpx ASGITransport, no
+sockets) three ways — no middleware, the previous BaseHTTPMiddleware
+implementation, and the current pure ASGI CorrelationIDMiddleware — and
+prints mean time per request plus the overhead of each middleware.
+
+Usage:
+    python scripts/bench_middleware.py
+    python scripts/bench_middleware.py --requests 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.logging_config import correlation_id_ctx  # noqa: E402
+from app.core.middleware import CorrelationIDMiddleware  # noqa: E402
+
+
+class LegacyCorrelationIDMiddleware(BaseHTTPMiddleware):
+    """The BaseHTTPMiddleware implementation this benchmark compares against."""
+
+    async def dispatch(self, request: Request, call_next) -> Response:  # type: ignore[override]
+        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid.uuid4())
+        token = correlation_id_ctx.set(correlation_id)
+        try:
+            response = await call_next(request)
+        finally:
+            correlation_id_ctx.reset(token)
+        response.headers["X-Correlation-ID"] = correlation_id
+        return response
+
+
+async def _ok(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+def _build_app(middleware: type | None) -> Starlette:
+    app = Starlette(routes=[Route("/ok", _ok)])
+    if middleware is not None:
+        app.add_middleware(middleware)
+    return app
+
+
+async def _mean_request_us(app: Starlette, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)  # type: ignore[arg-type]
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(200):
+            await client.get("/ok")
+        start = time.perf_counter()
+        for _ in range(requests):
+            await client.get("/ok")
+        return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def _run(requests: int) -> None:
+    variants = {
+        "none": None,
+        "BaseHTTPMiddleware (legacy)": LegacyCorrelationIDMiddleware,
+        "pure ASGI (current)": CorrelationIDMiddleware,
+    }
+    results = {
+        name: await _mean_request_us(_build_app(middleware), requests)
+        for name, middleware in variants.items()
+    }
+    baseline = results["none"]
+    print(f"{'middleware':<30} {'µs/request':>12} {'overhead µs':>12}")
+    for name, mean_us in results.items():
+        print(f"{name:<30} {mean_us:>12.1f} {mean_us - baseline:>12.1f}")
+
+
+def main() -> None:
+    """Parse arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark correlation ID middleware overhead")
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+
+    # Measure middleware mechanics, not log output.
+    logging.disable(logging.INFO)
+    asyncio.run(_run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
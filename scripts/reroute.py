@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Re-score and re-route stored items under new routing thresholds.
+
+Prints the transition matrix (stored status → status under the new
+thresholds) as JSON. Dry run by default; --apply moves pending_review items
+to their new status with "rerouted" audit events, one transaction per batch.
+Thresholds default to the current settings (AUTO_APPROVE_THRESHOLD,
+AUTO_REJECT_THRESHOLD), which re-checks stored items against them.
+
+Usage:
+    python scripts/reroute.py --auto-approve 0.80
+    python scripts/reroute.py --auto-approve 0.80 --auto-reject 0.55 --apply
+    python scripts/reroute.py --db /tmp/bench_1m.db --batch-size 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import Settings  # noqa: E402
+from app.services.rerouting_service import ReroutingService  # noqa: E402
+from app.storage import Storage  # noqa: E402
+
+
+def main() -> None:
+    """Run the re-routing job and print its report."""
+    parser = argparse.ArgumentParser(description="Re-route stored items under new thresholds")
+    parser.add_argument("--auto-approve", type=float, default=None)
+    parser.add_argument("--auto-reject", type=float, default=None)
+    parser.add_argument("--apply", action="store_true", help="Move pending_review items")
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument("--db", default=None, help="SQLite path (default: SQLITE_PATH)")
+    args = parser.parse_args()
+
+    settings = Settings()
+    storage = Storage(args.db or settings.sqlite_path)
+    started = time.perf_counter()
+    report = ReroutingService(storage, settings).run(
+        auto_approve_threshold=args.auto_approve,
+        auto_reject_threshold=args.auto_reject,
+        apply=args.apply,
+        batch_size=args.batch_size,
+    )
+    output = report.to_dict()
+    output["elapsed_s"] = round(time.perf_counter() - started, 3)
+    print(json.dumps(output, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,14 +3,20 @@
 The _isolate_test_db fixture runs before every test (autouse=True) and
 redirects all storage paths to temporary directories so tests never share
 state or leave artefacts in the project's data/ directory.
+
+make_message() builds the InboxMessage used by service-level unit tests;
+import it with `from tests.conftest import make_message`.
 """
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
+from app.models.email import InboxMessage
+
 
 @pytest.fixture(autouse=True)
 def _isolate_test_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
@@ -25,3 +31,19 @@ def _isolate_test_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("AIRTABLE_JSONL_PATH", str(tmp_path / "airtable.jsonl"))
     monkeypatch.setenv("AI_PROVIDER", "mock")
     monkeypatch.setenv("APP_ENV", "test")
+
+
+def make_message(
+    *,
+    body: str = "Purchase order for 2x ThinkPad laptops. Item: ThinkPad T14s, Qty: 2.",
+    subject: str = "Purchase request",
+    message_id: str = "msg_001",
+) -> InboxMessage:
+    """Build a test InboxMessage with sensible defaults."""
+    return InboxMessage(
+        message_id=message_id,
+        **{"from": {"name": "Alice", "email": "alice@example.com"}},
+        subject=subject,
+        received_at=datetime(2026, 3, 1, 9, 0, tzinfo=UTC),
+        body=body,
+    )
@@ -4,6 +4,7 @@ Tests:
 - test_batch_processing_creates_job           — POST /batch returns a job with a job_id
 - test_batch_progress_tracks_correctly        — counters reflect every email processed
 - test_failed_email_doesnt_abort_batch        — ExtractionError is isolated; batch completes
+- test_provider_error_fails_only_that_email   — rate limit / open circuit / cost limit isolated
 - test_duplicate_email_skipped                — same message_id processed twice without error
 - test_concurrent_batch_no_corruption         — 10 emails via asyncio.gather → correct counts
 
@@ -18,7 +19,13 @@ from collections.abc import Generator
 import pytest
 from fastapi.testclient import TestClient
 
-from app.core.exceptions import ExtractionError
+from app.core.exceptions import (
+    BaseAppError,
+    CostLimitExceeded,
+    ExtractionError,
+    RateLimitExceeded,
+    RetryableError,
+)
 
 # ---------------------------------------------------------------------------
 # Shared fixtures and helpers
@@ -125,6 +132,41 @@ def test_failed_email_doesnt_abort_batch(client: TestClient) -> None:
         client.app.state.workflow_service.ingest = original_ingest
 
 
+@pytest.mark.parametrize(
+    "error",
+    [
+        RateLimitExceeded("Injected 429", retry_after=1.0),
+        RetryableError("AI circuit breaker is open"),
+        CostLimitExceeded("Daily cost limit exceeded"),
+    ],
+    ids=["rate_limit", "circuit_open", "cost_limit"],
+)
+def test_provider_error_fails_only_that_email(client: TestClient, error: BaseAppError) -> None:
+    """A provider error that outlasts retries marks one email failed; the batch completes."""
+    original_ingest = client.app.state.workflow_service.ingest
+
+    async def patched_ingest(message):  # type: ignore[no-untyped-def]
+        if message.message_id == "msg_batch_2":
+            raise error
+        return await original_ingest(message)
+
+    client.app.state.workflow_service.ingest = patched_ingest
+
+    try:
+        emails = [_make_email(i) for i in range(1, 4)]
+        response = client.post("/api/v1/batch", json={"emails": emails})
+        assert response.status_code == 200, response.text
+
+        job = response.json()
+        assert job["status"] == "complete"
+        assert job["processed"] == 3
+        assert job["failed_count"] == 1
+        assert job["succeeded"] == 2
+        assert client.get(f"/api/v1/batch/{job['job_id']}").json() == job
+    finally:
+        client.app.state.workflow_service.ingest = original_ingest
+
+
 def test_duplicate_email_skipped(client: TestClient) -> None:
     """Submitting the same message_id twice in one batch causes no errors."""
     duplicate = _make_email(1)
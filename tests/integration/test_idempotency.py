@@ -4,15 +4,31 @@ Tests:
 - test_same_email_twice_returns_cached_result        — single-message dedup
 - test_batch_with_duplicate_ids_processes_each_once  — batch-level dedup
 - test_two_batches_same_emails_no_extra_items        — cross-batch dedup
+- test_concurrent_duplicates_share_one_extraction    — single-flight coalescing
+- test_concurrent_duplicates_share_extraction_error  — followers see leader's error
+- test_insert_race_across_workers_returns_stored_item — conflict-safe insert backstop
+- test_message_index_skips_dedup_query_for_new_and_cached — Bloom/LRU front
 """
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Generator
+from datetime import UTC, datetime
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
+from app.config import Settings
+from app.core.exceptions import ExtractionError
+from app.models.email import InboxMessage
+from app.services.ai.client import AICallResult, AIClient, MockAIClient
+from app.services.extraction_service import ExtractionService
+from app.services.message_index import MessageIdIndex
+from app.services.workflow_service import WorkflowService
+from app.storage import Storage
+
 
 @pytest.fixture()
 def client() -> Generator[TestClient, None, None]:
@@ -121,3 +137,122 @@ def test_two_batches_with_same_emails_no_extra_items(client: TestClient) -> None
     all_message_ids = [item["message_id"] for item in items_response.json()]
     xbatch_ids = [mid for mid in all_message_ids if mid.startswith("idemp_xbatch")]
     assert len(xbatch_ids) == 2  # still exactly 2 items, no duplicates
+
+
+# ---------------------------------------------------------------------------
+# Concurrent duplicates (single-flight and insert backstop)
+# ---------------------------------------------------------------------------
+
+
+class _SlowCountingClient(AIClient):
+    """MockAIClient that yields to the event loop and counts calls."""
+
+    def __init__(self, response: str | None = None) -> None:
+        self.calls = 0
+        self._inner = MockAIClient(response=response)
+
+    async def complete(self, system: str, user: str, *, prompt_version: str = "") -> AICallResult:
+        self.calls += 1
+        await asyncio.sleep(0.02)
+        return await self._inner.complete(system, user, prompt_version=prompt_version)
+
+
+def _service(
+    tmp_path: Path,
+    ai_client: AIClient,
+    message_index: MessageIdIndex | None = None,
+    auto_approve_threshold: float = 0.85,
+) -> WorkflowService:
+    settings = Settings(
+        auto_approve_threshold=auto_approve_threshold,
+        sqlite_path=str(tmp_path / "app.db"),
+        sheets_csv_path=str(tmp_path / "sheet.csv"),
+        airtable_jsonl_path=str(tmp_path / "airtable.jsonl"),
+    )
+    return WorkflowService(
+        storage=Storage(settings.sqlite_path),
+        settings=settings,
+        extraction_service=ExtractionService(ai_client=ai_client),
+        message_index=message_index,
+    )
+
+
+def _message(message_id: str) -> InboxMessage:
+    return InboxMessage.model_validate(
+        {**_email_payload(message_id), "received_at": datetime(2026, 3, 22, tzinfo=UTC)}
+    )
+
+
+async def test_concurrent_duplicates_share_one_extraction(tmp_path: Path) -> None:
+    """Five concurrent deliveries of one message_id make one AI call and get one response."""
+    ai_client = _SlowCountingClient()
+    service = _service(tmp_path, ai_client)
+
+    responses = await asyncio.gather(*(service.ingest(_message("sf_msg_1")) for _ in range(5)))
+
+    assert ai_client.calls == 1
+    assert all(response == responses[0] for response in responses)
+    assert responses[0].routed_to != "idempotent_return"
+    assert len(service.list_items()) == 1
+
+
+async def test_concurrent_duplicates_share_extraction_error(tmp_path: Path) -> None:
+    """When the shared run fails, every coalesced caller receives the error."""
+    ai_client = _SlowCountingClient(response="not json")
+    service = _service(tmp_path, ai_client)
+
+    results = await asyncio.gather(
+        *(service.ingest(_message("sf_msg_err")) for _ in range(3)), return_exceptions=True
+    )
+
+    assert ai_client.calls == 1
+    assert all(isinstance(result, ExtractionError) for result in results)
+
+
+async def test_insert_race_across_workers_returns_stored_item(tmp_path: Path) -> None:
+    """Two workers (separate services, shared DB) racing on one message_id store one item."""
+    first = _service(tmp_path, _SlowCountingClient())
+    second = _service(tmp_path, _SlowCountingClient())
+
+    responses = await asyncio.gather(
+        first.ingest(_message("sf_msg_race")), second.ingest(_message("sf_msg_race"))
+    )
+
+    routed = sorted(response.routed_to for response in responses)
+    assert routed.count("idempotent_return") == 1
+    assert responses[0].item_id == responses[1].item_id
+    assert len(first.list_items()) == 1
+
+
+async def test_message_index_skips_dedup_query_for_new_and_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """New messages and repeat deliveries of final items never query get_by_message_id."""
+    message_index = MessageIdIndex(capacity=1_000, lru_size=100)
+    # Low approve threshold so the item reaches a final status and is LRU-cacheable
+    service = _service(tmp_path, MockAIClient(), message_index, auto_approve_threshold=0.5)
+    lookups: list[str] = []
+    original_lookup = service._storage.get_by_message_id
+
+    def counting_lookup(message_id: str) -> dict | None:
+        lookups.append(message_id)
+        return original_lookup(message_id)
+
+    monkeypatch.setattr(service._storage, "get_by_message_id", counting_lookup)
+
+    first = await service.ingest(
+        _message_with_body("index_msg_1", "Billing portal error HTTP 500. Company: Northwind.")
+    )
+    second = await service.ingest(
+        _message_with_body("index_msg_1", "Billing portal error HTTP 500. Company: Northwind.")
+    )
+
+    assert first.status == "approved"
+    assert second.routed_to == "idempotent_return"
+    assert second.item_id == first.item_id
+    assert lookups == []
+    assert message_index.stats()["lru_hit"] == 1
+
+
+def _message_with_body(message_id: str, body: str) -> InboxMessage:
+    return _message(message_id).model_copy(update={"body": body})
@@ -5,16 +5,26 @@ All tests are pure unit tests — no real API calls, no I/O.
 
 from __future__ import annotations
 
+import random
+
 import pytest
 
-from app.core.exceptions import CostLimitExceeded
+from app.core.exceptions import CostLimitExceeded, RateLimitExceeded, RetryableError
 from app.services.ai.client import (
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_OPEN,
     AICallResult,
+    CallEstimate,
     CircuitBreaker,
+    CostReservation,
     DailyCostTracker,
     MockAIClient,
     _call_with_retry,
+    _guarded_complete,
+    estimate_call,
 )
+from app.services.ai.tokens import estimate_tokens
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -84,6 +94,117 @@ def test_cost_tracker_add_resets_on_stale_date() -> None:
     assert abs(tracker.total_today() - 1.0) < 1e-10
 
 
+def test_reservation_counts_against_limit_until_committed() -> None:
+    tracker = DailyCostTracker()
+    tracker.add(9.0)
+
+    reservation = tracker.reserve(0.6, limit_usd=10.0)
+    assert tracker.reserved_usd() == pytest.approx(0.6)
+    with pytest.raises(CostLimitExceeded, match="remaining daily budget"):
+        tracker.reserve(0.6, limit_usd=10.0)
+
+    tracker.commit(reservation, 0.2)
+    assert tracker.reserved_usd() == 0.0
+    assert tracker.total_today() == pytest.approx(9.2)
+    tracker.reserve(0.6, limit_usd=10.0)  # fits again after reconciliation
+
+
+def test_release_returns_budget_and_ignores_stale_reservations() -> None:
+    from datetime import date
+
+    tracker = DailyCostTracker()
+    reservation = tracker.reserve(1.0, limit_usd=10.0)
+    tracker.release(reservation)
+    assert tracker.reserved_usd() == 0.0
+    assert tracker.total_today() == 0.0
+
+    tracker.reserve(0.5, limit_usd=10.0)
+    tracker.release(CostReservation(amount_usd=1.0, day=date(2000, 1, 1)))
+    assert tracker.reserved_usd() == pytest.approx(0.5)
+
+
+def test_estimate_call_prices_worst_case_output() -> None:
+    estimate = estimate_call("system prompt", "x" * 4000, max_output_tokens=1000)
+
+    assert estimate.tokens_in == estimate_tokens("system prompt") + 1000
+    assert estimate.cost_usd == pytest.approx(
+        estimate.tokens_in * 3.0 / 1_000_000 + 1000 * 15.0 / 1_000_000
+    )
+
+
+def test_estimate_tokens_counts_multibyte_text_higher() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("abcdefgh") == 2
+    assert estimate_tokens("日本語のテキスト") > estimate_tokens("abcdefgh")
+
+
+@pytest.mark.asyncio
+async def test_guarded_complete_refuses_call_over_remaining_budget() -> None:
+    tracker = DailyCostTracker()
+    tracker.add(9.99)
+    called = False
+
+    async def fn() -> AICallResult:
+        nonlocal called
+        called = True
+        return _make_result()
+
+    with pytest.raises(CostLimitExceeded):
+        await _guarded_complete(
+            fn,
+            model="test",
+            cost_tracker=tracker,
+            circuit_breaker=CircuitBreaker(),
+            max_daily_cost_usd=10.0,
+            prompt_version="v1",
+            estimate=CallEstimate(tokens_in=100, cost_usd=0.05),
+        )
+    assert not called
+
+
+@pytest.mark.asyncio
+async def test_guarded_complete_reconciles_reservation() -> None:
+    tracker = DailyCostTracker()
+
+    result = await _guarded_complete(
+        lambda: _async_result(_make_result(cost_usd=0.01)),
+        model="test",
+        cost_tracker=tracker,
+        circuit_breaker=CircuitBreaker(),
+        max_daily_cost_usd=10.0,
+        prompt_version="v1",
+        estimate=CallEstimate(tokens_in=110, cost_usd=0.05),
+    )
+
+    assert result.cost_usd == 0.01
+    assert tracker.total_today() == pytest.approx(0.01)
+    assert tracker.reserved_usd() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_guarded_complete_releases_reservation_when_breaker_open() -> None:
+    tracker = DailyCostTracker()
+    breaker = CircuitBreaker(failure_threshold=1)
+    breaker.record_failure()
+
+    with pytest.raises(RetryableError):
+        await _guarded_complete(
+            lambda: _async_result(_make_result()),
+            model="test",
+            cost_tracker=tracker,
+            circuit_breaker=breaker,
+            max_daily_cost_usd=10.0,
+            prompt_version="v1",
+            estimate=CallEstimate(tokens_in=100, cost_usd=0.05),
+        )
+    assert tracker.reserved_usd() == 0.0
+    assert tracker.total_today() == 0.0
+
+
+async def _async_result(result: AICallResult) -> AICallResult:
+    return result
+
+
 # ---------------------------------------------------------------------------
 # CircuitBreaker
 # ---------------------------------------------------------------------------
@@ -105,15 +226,77 @@ def test_circuit_breaker_stays_closed_below_threshold() -> None:
     assert not cb.is_open()
 
 
-def test_circuit_breaker_closes_after_success() -> None:
-    cb = CircuitBreaker(failure_threshold=3, window_seconds=60.0)
+def test_circuit_breaker_closes_after_successful_probe() -> None:
+    now = [0.0]
+    cb = CircuitBreaker(
+        failure_threshold=3, window_seconds=60.0, reset_timeout_s=10.0, clock=lambda: now[0]
+    )
     for _ in range(3):
         cb.record_failure()
     assert cb.is_open()
+    cb.record_success()  # a call that started before the circuit opened
+    assert cb.is_open()
+
+    now[0] = 12.5  # past the reset timeout plus maximum jitter
+    assert cb.state == BREAKER_HALF_OPEN
+    assert cb.allow_request()
     cb.record_success()
+    assert cb.state == BREAKER_CLOSED
     assert not cb.is_open()
 
 
+def test_circuit_breaker_half_open_limits_probes_and_reopens_on_failure() -> None:
+    now = [0.0]
+    cb = CircuitBreaker(
+        failure_threshold=1, reset_timeout_s=10.0, probe_budget=2, clock=lambda: now[0]
+    )
+    cb.record_failure()
+    assert not cb.allow_request()
+
+    now[0] = 12.5
+    assert cb.allow_request()
+    assert cb.allow_request()
+    assert not cb.allow_request()  # probe budget spent
+    cb.release_probe()
+    assert cb.allow_request()
+
+    cb.record_failure()
+    assert cb.state == BREAKER_OPEN
+    assert not cb.allow_request()
+
+
+def test_circuit_breaker_reopen_is_jittered() -> None:
+    deadlines = set()
+    for seed in range(5):
+        now = [0.0]
+        cb = CircuitBreaker(
+            failure_threshold=1,
+            reset_timeout_s=10.0,
+            reopen_jitter=0.5,
+            clock=lambda now=now: now[0],
+            rng=random.Random(seed),
+        )
+        cb.record_failure()
+        now[0] = 10.0
+        assert cb.state == BREAKER_OPEN
+        now[0] = 15.0
+        assert cb.state == BREAKER_HALF_OPEN
+        deadlines.add(cb._deadline)
+    assert len(deadlines) == 5
+
+
+def test_circuit_breaker_writes_off_unreported_probes() -> None:
+    now = [0.0]
+    cb = CircuitBreaker(failure_threshold=1, reset_timeout_s=10.0, clock=lambda: now[0])
+    cb.record_failure()
+    now[0] = 12.5
+    assert cb.allow_request()
+    assert not cb.allow_request()
+
+    now[0] = 23.0  # probe never reported back
+    assert cb.allow_request()
+
+
 def test_circuit_breaker_prunes_stale_failures() -> None:
     """Failures older than window_seconds are evicted and don't count."""
     import time
@@ -190,6 +373,24 @@ async def test_no_retry_on_first_success() -> None:
     assert calls == 1
 
 
+@pytest.mark.asyncio
+async def test_retry_on_rate_limit_does_not_trip_circuit_breaker() -> None:
+    """RateLimitExceeded is retried but not counted as a provider failure."""
+    cb = CircuitBreaker(failure_threshold=10, window_seconds=60.0)
+    calls = 0
+
+    async def throttled_once() -> AICallResult:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RateLimitExceeded(retry_after=0.0)
+        return _make_result()
+
+    await _call_with_retry(throttled_once, circuit_breaker=cb, max_attempts=3, base_delay=0.0)
+    assert calls == 2
+    assert len(cb._failures) == 0
+
+
 # ---------------------------------------------------------------------------
 # MockAIClient
 # ---------------------------------------------------------------------------
@@ -0,0 +1,86 @@
+"""Unit tests for the cheap-model-first extraction cascade."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.config import Settings
+from app.core.exceptions import ExtractionError
+from app.services.ai.cascade import CascadeTier, CascadingAIClient
+from app.services.ai.client import MockAIClient, get_ai_client, price_call
+from app.services.extraction_service import ExtractionService
+from tests.conftest import make_message
+
+
+def _cascade(cheap: MockAIClient, strong: MockAIClient) -> CascadingAIClient:
+    return CascadingAIClient([CascadeTier("cheap", cheap), CascadeTier("strong", strong)])
+
+
+async def test_first_tier_result_is_kept_outside_review_band() -> None:
+    cascade = _cascade(MockAIClient(), MockAIClient(response="not json"))
+    svc = ExtractionService(ai_client=cascade, review_band=(0.0, 0.0))
+
+    extraction = await svc.extract(make_message())
+
+    assert extraction.extraction_notes[-1] == "model_tier:cheap"
+    stats = cascade.stats()
+    assert stats["cheap"]["calls"] == 1
+    assert stats["cheap"]["hit_rate"] == 1.0
+    assert stats["strong"]["calls"] == 0
+
+
+async def test_invalid_output_escalates_to_next_tier() -> None:
+    cascade = _cascade(MockAIClient(response="not json"), MockAIClient())
+    svc = ExtractionService(ai_client=cascade, review_band=(0.0, 0.0))
+
+    extraction = await svc.extract(make_message())
+
+    assert extraction.extraction_notes[-2:] == [
+        "escalated:cheap:invalid_output",
+        "model_tier:strong",
+    ]
+    assert cascade.stats()["cheap"]["escalated"]["invalid_output"] == 1
+
+
+async def test_review_band_escalates_and_last_tier_is_always_kept() -> None:
+    cascade = _cascade(MockAIClient(), MockAIClient())
+    svc = ExtractionService(ai_client=cascade, review_band=(0.0, 1.0))
+
+    extraction = await svc.extract(make_message())
+
+    assert extraction.extraction_notes[-2:] == ["escalated:cheap:review_band", "model_tier:strong"]
+    stats = cascade.stats()
+    assert stats["cheap"]["escalated"]["review_band"] == 1
+    assert stats["strong"]["accepted"] == 1
+
+
+async def test_last_tier_invalid_output_raises() -> None:
+    cascade = _cascade(MockAIClient(response="not json"), MockAIClient(response="still not json"))
+    svc = ExtractionService(ai_client=cascade)
+
+    with pytest.raises(ExtractionError):
+        await svc.extract(make_message())
+    assert cascade.stats()["strong"]["failed"] == 1
+
+
+def test_rejects_empty_or_duplicate_tiers() -> None:
+    with pytest.raises(ValueError):
+        CascadingAIClient([])
+    with pytest.raises(ValueError):
+        CascadingAIClient([CascadeTier("a", MockAIClient()), CascadeTier("a", MockAIClient())])
+
+
+def test_get_ai_client_builds_one_tier_per_model() -> None:
+    settings = Settings(
+        ai_provider="simulated", ai_cascade_models=["claude-haiku-4-5", "claude-sonnet-4-6"]
+    )
+
+    client = get_ai_client(settings)
+
+    assert isinstance(client, CascadingAIClient)
+    assert [tier.name for tier in client.tiers] == ["claude-haiku-4-5", "claude-sonnet-4-6"]
+
+
+def test_price_call_uses_per_model_rates() -> None:
+    assert price_call("claude-haiku-4-5", 1_000_000, 1_000_000) == pytest.approx(6.0)
+    assert price_call("claude-sonnet-4-6", 1_000_000, 1_000_000) == pytest.approx(18.0)
@@ -0,0 +1,102 @@
+"""Property tests: compute_confidence_batch equals compute_confidence item by item."""
+
+from __future__ import annotations
+
+import itertools
+import random
+
+import numpy as np
+
+from app.models.email import Extraction, LineItem, Requester
+from app.services.confidence_service import (
+    ConfidenceColumns,
+    compute_confidence,
+    compute_confidence_batch,
+)
+
+_TYPES = ["purchase_request", "customer_issue", "ops_change", "general_inquiry", "other"]
+# Description lengths either side of each completeness band edge
+_LENGTHS = [0, 1, 14, 15, 16, 39, 40, 41, 99, 100, 101, 300]
+
+
+def _extraction(
+    *,
+    description_length: int,
+    name: str,
+    email: str,
+    company: str | None,
+    due_date: str | None,
+    request_type: str,
+    line_items: int,
+    notes: int,
+) -> Extraction:
+    return Extraction.model_construct(
+        request_id="abc123",
+        request_type=request_type,
+        priority="medium",
+        due_date=due_date,
+        company=company,
+        requester=Requester.model_construct(name=name, email=email),
+        description="  " + "x" * description_length + " ",
+        line_items=[LineItem(item="Dock", qty=1)] * line_items,
+        confidence=0.0,
+        extraction_notes=["note"] * notes,
+    )
+
+
+def _assert_batch_matches_scalar(extractions: list[Extraction]) -> None:
+    batch = compute_confidence_batch(ConfidenceColumns.from_extractions(extractions))
+
+    expected = [compute_confidence(extraction) for extraction in extractions]
+    assert batch.score.tolist() == [result.score for result in expected]
+    assert batch.completeness_score.tolist() == [result.completeness_score for result in expected]
+    assert batch.type_compliance_score.tolist() == [
+        result.type_compliance_score for result in expected
+    ]
+    assert batch.ai_confidence_score.tolist() == [result.ai_confidence_score for result in expected]
+
+
+def test_batch_matches_scalar_on_every_scoring_combination() -> None:
+    extractions = [
+        _extraction(
+            description_length=length,
+            name=name,
+            email="jane@acme.com",
+            company=company,
+            due_date=due_date,
+            request_type=request_type,
+            line_items=line_items,
+            notes=notes,
+        )
+        for length, name, company, due_date, request_type, line_items, notes in itertools.product(
+            _LENGTHS, ["Jane", " "], ["Acme", None], ["2026-04-01", None], _TYPES, [0, 2], range(5)
+        )
+    ]
+
+    _assert_batch_matches_scalar(extractions)
+
+
+def test_batch_matches_scalar_on_random_extractions() -> None:
+    rng = random.Random(49)
+    extractions = [
+        _extraction(
+            description_length=rng.randint(0, 400),
+            name=rng.choice(["Jane Smith", "", "  "]),
+            email=rng.choice(["jane@acme.com", ""]),
+            company=rng.choice(["Acme Corp", "", None]),
+            due_date=rng.choice(["2026-04-01", None]),
+            request_type=rng.choice(_TYPES),
+            line_items=rng.randint(0, 3),
+            notes=rng.randint(0, 6),
+        )
+        for _ in range(5000)
+    ]
+
+    _assert_batch_matches_scalar(extractions)
+
+
+def test_empty_batch() -> None:
+    batch = compute_confidence_batch(ConfidenceColumns.from_extractions([]))
+
+    assert batch.score.shape == (0,)
+    assert batch.score.dtype == np.float64
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import pytest
 
-from app.models.email import Extraction, LineItem, Requester
+from app.models.email import AIExtractionOutput, Extraction, LineItem, Requester
 from app.services.confidence_service import ConfidenceResult, compute_confidence
 
 # ---------------------------------------------------------------------------
@@ -324,3 +324,34 @@ def test_purchase_no_items_produces_missing_line_items_note() -> None:
 def test_missing_company_produces_note() -> None:
     result = compute_confidence(_extraction(company=None))
     assert any("company" in note for note in result.notes)
+
+
+# ---------------------------------------------------------------------------
+# Scoring the AI output before the Extraction is built
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"request_type": "purchase_request", "line_items": [LineItem(item="Dock", qty=2)]},
+        {"company": None, "due_date": None, "description": "Short", "extraction_notes": ["a"]},
+    ],
+)
+def test_ai_output_with_envelope_requester_scores_like_extraction(overrides: dict) -> None:
+    extraction = _extraction(**overrides)
+    ai_output = AIExtractionOutput(
+        **extraction.model_dump(exclude={"request_id", "requester", "confidence"})
+    )
+
+    assert compute_confidence(ai_output, extraction.requester) == compute_confidence(extraction)
+
+
+def test_ai_output_without_requester_raises_value_error() -> None:
+    ai_output = AIExtractionOutput(
+        **_extraction().model_dump(exclude={"request_id", "requester", "confidence"})
+    )
+
+    with pytest.raises(ValueError, match="requester"):
+        compute_confidence(ai_output)  # type: ignore[call-overload]
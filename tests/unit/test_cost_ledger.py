@@ -0,0 +1,82 @@
+"""Unit tests for the storage-backed daily cost ledger."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.core.exceptions import CostLimitExceeded
+from app.services.ai.cost_ledger import LedgerCostTracker
+from app.storage import Storage
+
+
+@pytest.fixture()
+def storage(tmp_path: Path) -> Storage:
+    return Storage(str(tmp_path / "ledger.db"))
+
+
+def test_workers_share_one_budget(storage: Storage) -> None:
+    """Two trackers on the same database (two workers) enforce one limit."""
+    worker_a = LedgerCostTracker(storage)
+    worker_b = LedgerCostTracker(storage)
+
+    reservation = worker_a.reserve(6.0, limit_usd=10.0)
+    with pytest.raises(CostLimitExceeded, match="remaining daily budget"):
+        worker_b.reserve(6.0, limit_usd=10.0)
+
+    worker_a.commit(reservation, 2.0)
+    worker_b.reserve(6.0, limit_usd=10.0)
+    assert worker_a.total_today() == pytest.approx(2.0)
+
+
+def test_spend_survives_restart(storage: Storage) -> None:
+    tracker = LedgerCostTracker(storage)
+    tracker.add(9.5)
+
+    restarted = LedgerCostTracker(storage)
+
+    assert restarted.total_today() == pytest.approx(9.5)
+    with pytest.raises(CostLimitExceeded):
+        restarted.reserve(1.0, limit_usd=10.0)
+
+
+def test_reads_use_cached_view_until_refresh(storage: Storage) -> None:
+    now = [0.0]
+    reader = LedgerCostTracker(storage, refresh_interval_s=1.0, clock=lambda: now[0])
+    writer = LedgerCostTracker(storage)
+
+    writer.add(3.0)
+    assert reader.total_today() == 0.0  # cached
+    now[0] = 1.5
+    assert reader.total_today() == pytest.approx(3.0)
+
+
+def test_gauge_accessors_never_refresh(storage: Storage, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [0.0]
+    tracker = LedgerCostTracker(storage, refresh_interval_s=1.0, clock=lambda: now[0])
+    tracker.reserve(2.0, limit_usd=10.0)
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("gauge read touched the database")
+
+    monkeypatch.setattr(storage, "cost_totals", fail)
+    now[0] = 60.0
+    assert tracker.cached_total_today() == 0.0
+    assert tracker.cached_reserved_usd() == pytest.approx(2.0)
+
+
+def test_release_and_abandoned_reservations_free_budget(storage: Storage) -> None:
+    wall = [1_000_000.0]
+    tracker = LedgerCostTracker(storage, reservation_ttl_s=60.0, wall_clock=lambda: wall[0])
+
+    tracker.release(tracker.reserve(8.0, limit_usd=10.0))
+    assert tracker.reserved_usd() == 0.0
+
+    tracker.reserve(8.0, limit_usd=10.0)  # never committed: the worker "died"
+    with pytest.raises(CostLimitExceeded):
+        tracker.reserve(8.0, limit_usd=10.0)
+
+    wall[0] += 61.0
+    tracker.reserve(8.0, limit_usd=10.0)
+    assert storage.cost_totals(tracker._date.isoformat(), stale_before_ts=0.0)[1] == 8.0
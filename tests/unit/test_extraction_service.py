@@ -6,14 +6,14 @@ All tests use MockAIClient — no real API calls.
 from __future__ import annotations
 
 import json
-from datetime import UTC, datetime
 
 import pytest
 
 from app.core.exceptions import ExtractionError
-from app.models.email import InboxMessage
-from app.services.ai.client import MockAIClient
+from app.models.email import Extraction, Requester
+from app.services.ai.client import AICallResult, MockAIClient
 from app.services.extraction_service import ExtractionService
+from tests.conftest import make_message
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -25,22 +25,6 @@ def _service(response: str | None = None) -> ExtractionService:
     return ExtractionService(ai_client=MockAIClient(response=response))
 
 
-def _message(
-    *,
-    body: str = "Purchase order for 2x ThinkPad laptops. Item: ThinkPad T14s, Qty: 2.",
-    subject: str = "Purchase request",
-    message_id: str = "msg_001",
-) -> InboxMessage:
-    """Build a test InboxMessage with sensible defaults."""
-    return InboxMessage(
-        message_id=message_id,
-        **{"from": {"name": "Alice", "email": "alice@example.com"}},
-        subject=subject,
-        received_at=datetime(2026, 3, 1, 9, 0, tzinfo=UTC),
-        body=body,
-    )
-
-
 # ---------------------------------------------------------------------------
 # Happy path
 # ---------------------------------------------------------------------------
@@ -48,7 +32,7 @@ def _message(
 
 @pytest.mark.asyncio
 async def test_returns_extraction_model() -> None:
-    extraction_result = await _service().extract(_message())
+    extraction_result = await _service().extract(make_message())
     assert extraction_result.request_id
     assert extraction_result.request_type in (
         "purchase_request",
@@ -63,7 +47,7 @@ async def test_returns_extraction_model() -> None:
 @pytest.mark.asyncio
 async def test_purchase_request_body_yields_purchase_type() -> None:
     extraction_result = await _service().extract(
-        _message(body="Please purchase 3 monitors. Item: Dell 27in, Qty: 3.")
+        make_message(body="Please purchase 3 monitors. Item: Dell 27in, Qty: 3.")
     )
     assert extraction_result.request_type == "purchase_request"
 
@@ -71,7 +55,7 @@ async def test_purchase_request_body_yields_purchase_type() -> None:
 @pytest.mark.asyncio
 async def test_issue_body_yields_customer_issue_type() -> None:
     extraction_result = await _service().extract(
-        _message(
+        make_message(
             body="Billing portal shows HTTP 500 error. Cannot access invoices.",
             subject="Billing error report",
         )
@@ -82,7 +66,7 @@ async def test_issue_body_yields_customer_issue_type() -> None:
 @pytest.mark.asyncio
 async def test_requester_populated_from_message_envelope() -> None:
     """request_id, requester.name/email always come from the message, not the AI."""
-    extraction_result = await _service().extract(_message())
+    extraction_result = await _service().extract(make_message())
     assert extraction_result.requester.name == "Alice"
     assert str(extraction_result.requester.email) == "alice@example.com"
 
@@ -101,7 +85,7 @@ async def test_confidence_is_computed_not_from_ai() -> None:
             "extraction_notes": [],
         }
     )
-    extraction_result = await _service(response=raw_response).extract(_message())
+    extraction_result = await _service(response=raw_response).extract(make_message())
     assert 0.0 < extraction_result.confidence <= 1.0
 
 
@@ -118,7 +102,7 @@ async def test_line_items_parsed_correctly() -> None:
             "extraction_notes": [],
         }
     )
-    extraction_result = await _service(response=raw_response).extract(_message())
+    extraction_result = await _service(response=raw_response).extract(make_message())
     assert len(extraction_result.line_items) == 1
     assert extraction_result.line_items[0].item == "Herman Miller Aeron"
     assert extraction_result.line_items[0].qty == 4
@@ -131,12 +115,29 @@ async def test_line_items_parsed_correctly() -> None:
 
 @pytest.mark.asyncio
 async def test_same_message_produces_same_request_id() -> None:
-    test_message = _message()
+    test_message = make_message()
     first_result = await _service().extract(test_message)
     second_result = await _service().extract(test_message)
     assert first_result.request_id == second_result.request_id
 
 
+@pytest.mark.asyncio
+async def test_constructed_extraction_matches_fully_validated_model() -> None:
+    """The model_construct fast path must equal building the Extraction with validation."""
+    message = make_message()
+    extraction_result = await _service().extract(message)
+
+    validated = Extraction(
+        **{
+            **extraction_result.model_dump(),
+            "requester": Requester(name=message.from_.name, email=message.from_.email),
+        }
+    )
+    assert extraction_result == validated
+    assert extraction_result.model_dump() == validated.model_dump()
+    assert extraction_result.model_fields_set == validated.model_fields_set
+
+
 # ---------------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------------
@@ -145,7 +146,7 @@ async def test_same_message_produces_same_request_id() -> None:
 @pytest.mark.asyncio
 async def test_non_json_response_raises_extraction_error() -> None:
     with pytest.raises(ExtractionError, match="non-JSON"):
-        await _service(response="Sorry, I cannot process this.").extract(_message())
+        await _service(response="Sorry, I cannot process this.").extract(make_message())
 
 
 @pytest.mark.asyncio
@@ -162,7 +163,7 @@ async def test_json_with_invalid_enum_raises_extraction_error() -> None:
         }
     )
     with pytest.raises(ExtractionError, match="schema mismatch"):
-        await _service(response=raw_response).extract(_message())
+        await _service(response=raw_response).extract(make_message())
 
 
 @pytest.mark.asyncio
@@ -180,7 +181,7 @@ async def test_markdown_fenced_json_is_parsed() -> None:
         }
     )
     fenced = f"```json\n{inner}\n```"
-    extraction_result = await _service(response=fenced).extract(_message())
+    extraction_result = await _service(response=fenced).extract(make_message())
     assert extraction_result.request_type == "ops_change"
 
 
@@ -196,4 +197,79 @@ async def test_ai_client_exception_raises_extraction_error() -> None:
 
     broken_service = ExtractionService(ai_client=BrokenClient())
     with pytest.raises(ExtractionError, match="unavailable"):
-        await broken_service.extract(_message())
+        await broken_service.extract(make_message())
+
+
+# ---------------------------------------------------------------------------
+# Keyword tier
+# ---------------------------------------------------------------------------
+
+
+class _CountingClient(MockAIClient):
+    """MockAIClient that counts provider calls."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def complete(self, system: str, user: str, *, prompt_version: str = "") -> AICallResult:
+        self.calls += 1
+        return await super().complete(system, user, prompt_version=prompt_version)
+
+
+_CONFIDENT_BODY = (
+    "Please order replacement docking stations for the design team before the office move.\n"
+    "Item: USB-C dock, Qty: 5. Priority: high\n"
+    "Company: Acme Corp"
+)
+
+
+@pytest.mark.asyncio
+async def test_keyword_tier_skips_ai_call_when_confident() -> None:
+    ai_client = _CountingClient()
+    svc = ExtractionService(ai_client=ai_client, keyword_tier_threshold=0.85)
+
+    extraction_result = await svc.extract(
+        make_message(body=_CONFIDENT_BODY, subject="Purchase order")
+    )
+
+    assert ai_client.calls == 0
+    assert extraction_result.request_type == "purchase_request"
+    assert extraction_result.company == "Acme Corp"
+    assert extraction_result.confidence >= 0.85
+    assert extraction_result.extraction_notes[-1] == "tier:keyword"
+
+
+@pytest.mark.asyncio
+async def test_keyword_tier_escalates_when_not_type_compliant() -> None:
+    """A purchase_request without line items fails the type rules and goes to the AI."""
+    ai_client = _CountingClient()
+    svc = ExtractionService(ai_client=ai_client, keyword_tier_threshold=0.0)
+
+    extraction_result = await svc.extract(
+        make_message(body="Please purchase some laptops for the new hires. Company: Acme Corp.")
+    )
+
+    assert ai_client.calls == 1
+    assert "tier:keyword" not in extraction_result.extraction_notes
+
+
+@pytest.mark.asyncio
+async def test_keyword_tier_escalates_below_threshold() -> None:
+    ai_client = _CountingClient()
+    svc = ExtractionService(ai_client=ai_client, keyword_tier_threshold=0.99)
+
+    await svc.extract(make_message(body=_CONFIDENT_BODY, subject="Purchase order"))
+
+    assert ai_client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_keyword_tier_disabled_by_default() -> None:
+    ai_client = _CountingClient()
+
+    await ExtractionService(ai_client=ai_client).extract(
+        make_message(body=_CONFIDENT_BODY, subject="Purchase order")
+    )
+
+    assert ai_client.calls == 1
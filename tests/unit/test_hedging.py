@@ -0,0 +1,180 @@
+"""Unit tests for request hedging: trigger, budget, race, and cost accounting."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.ai.client import (
+    AICallResult,
+    CallEstimate,
+    CircuitBreaker,
+    DailyCostTracker,
+    _call_with_hedge,
+    _guarded_complete,
+)
+from app.services.ai.hedging import HedgePolicy
+
+_ESTIMATE = CallEstimate(tokens_in=1000, cost_usd=0.02, input_cost_usd=0.003)
+
+
+def _result(cost_usd: float = 0.01, text: str = "{}") -> AICallResult:
+    return AICallResult(
+        text=text,
+        tokens_in=1000,
+        tokens_out=100,
+        cost_usd=cost_usd,
+        latency_ms=1.0,
+        model="test",
+        prompt_version="v1",
+    )
+
+
+def _warm_policy(delay_s: float = 0.01, **options) -> HedgePolicy:
+    policy = HedgePolicy(95.0, min_samples=5, **options)
+    for _ in range(10):
+        policy.observe(delay_s)
+    return policy
+
+
+def _scripted(*delays: float, fail: set[int] = frozenset()):
+    """call_fn whose n-th invocation sleeps delays[n] then returns (or raises)."""
+    calls: list[int] = []
+
+    async def call() -> AICallResult:
+        index = len(calls)
+        calls.append(index)
+        await asyncio.sleep(delays[index])
+        if index in fail:
+            raise TimeoutError(f"call {index} failed")
+        return _result(text=f'{{"call": {index}}}')
+
+    return call, calls
+
+
+def test_policy_waits_for_samples_then_uses_percentile() -> None:
+    policy = HedgePolicy(90.0, min_samples=10)
+    for latency in range(1, 10):
+        policy.observe(latency / 10)
+    assert policy.hedge_delay_s() is None
+
+    policy.observe(1.0)
+    assert policy.hedge_delay_s() == pytest.approx(0.9)
+
+
+def test_policy_budget_caps_hedges_per_call() -> None:
+    policy = HedgePolicy(budget_ratio=0.25, max_burst=1.0)
+    granted = 0
+    for _ in range(100):
+        policy.note_call()
+        granted += policy.try_acquire()
+    assert granted == 25
+
+
+def test_policy_rejects_invalid_percentile() -> None:
+    with pytest.raises(ValueError):
+        HedgePolicy(100.0)
+
+
+async def test_fast_call_is_not_hedged() -> None:
+    call, calls = _scripted(0.0)
+    result = await _call_with_hedge(
+        call,
+        _warm_policy(0.05, budget_ratio=1.0),
+        cost_tracker=DailyCostTracker(),
+        estimate=_ESTIMATE,
+        max_daily_cost_usd=10.0,
+    )
+    assert result.text == '{"call": 0}'
+    assert calls == [0]
+
+
+async def test_slow_call_is_hedged_and_loser_charged_input_cost() -> None:
+    tracker = DailyCostTracker()
+    call, calls = _scripted(1.0, 0.0)
+
+    result = await _call_with_hedge(
+        call,
+        _warm_policy(budget_ratio=1.0),
+        cost_tracker=tracker,
+        estimate=_ESTIMATE,
+        max_daily_cost_usd=10.0,
+    )
+
+    assert result.text == '{"call": 1}'
+    assert calls == [0, 1]
+    # Only the cancelled loser is charged here; the caller records the winner
+    assert tracker.total_today() == pytest.approx(_ESTIMATE.input_cost_usd)
+    assert tracker.reserved_usd() == 0.0
+
+
+async def test_hedge_skipped_without_budget() -> None:
+    call, calls = _scripted(0.05)
+    result = await _call_with_hedge(
+        call,
+        _warm_policy(budget_ratio=0.0),
+        cost_tracker=DailyCostTracker(),
+        estimate=_ESTIMATE,
+        max_daily_cost_usd=10.0,
+    )
+    assert result.text == '{"call": 0}'
+    assert calls == [0]
+
+
+async def test_hedge_skipped_when_it_would_exceed_cost_limit() -> None:
+    tracker = DailyCostTracker()
+    tracker.add(9.99)
+    call, calls = _scripted(0.05)
+
+    await _call_with_hedge(
+        call,
+        _warm_policy(budget_ratio=1.0),
+        cost_tracker=tracker,
+        estimate=_ESTIMATE,
+        max_daily_cost_usd=10.0,
+    )
+    assert calls == [0]
+
+
+async def test_primary_failure_waits_for_hedge() -> None:
+    call, _ = _scripted(0.05, 0.1, fail={0})
+    result = await _call_with_hedge(
+        call,
+        _warm_policy(budget_ratio=1.0),
+        cost_tracker=DailyCostTracker(),
+        estimate=_ESTIMATE,
+        max_daily_cost_usd=10.0,
+    )
+    assert result.text == '{"call": 1}'
+
+
+async def test_both_failing_raises_primary_error() -> None:
+    call, _ = _scripted(0.05, 0.0, fail={0, 1})
+    with pytest.raises(TimeoutError, match="call 0"):
+        await _call_with_hedge(
+            call,
+            _warm_policy(budget_ratio=1.0),
+            cost_tracker=DailyCostTracker(),
+            estimate=_ESTIMATE,
+            max_daily_cost_usd=10.0,
+        )
+
+
+async def test_guarded_complete_accounts_for_both_calls() -> None:
+    tracker = DailyCostTracker()
+    call, _ = _scripted(1.0, 0.0)
+
+    result = await _guarded_complete(
+        call,
+        model="test",
+        cost_tracker=tracker,
+        circuit_breaker=CircuitBreaker(),
+        max_daily_cost_usd=10.0,
+        prompt_version="v1",
+        estimate=_ESTIMATE,
+        hedge_policy=_warm_policy(budget_ratio=1.0),
+    )
+
+    assert tracker.total_today() == pytest.approx(result.cost_usd + _ESTIMATE.input_cost_usd)
+    assert tracker.reserved_usd() == 0.0
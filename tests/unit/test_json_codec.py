@@ -0,0 +1,126 @@
+"""Unit tests for the pluggable JSON codec layer.
+
+Verifies both backends round-trip the payloads this application stores,
+produce byte-identical output for them, and differ only in the documented
+places (float spelling, NaN/Infinity) elsewhere.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from app.core import json_codec
+from app.core.json_codec import StdlibCodec
+
+_EXTRACTION_PAYLOAD: dict = {
+    "request_id": "a1b2c3d4e5f60718",
+    "request_type": "purchase_request",
+    "priority": "high",
+    "due_date": "2026-03-31",
+    "company": "Acme Corp — Zürich",
+    "requester": {"name": "Zoë Müller", "email": "zoe@acme.example"},
+    "description": 'Purchase 2x ThinkPad T14s "engineering" laptops\nfor the new hires.',
+    "line_items": [{"item": "ThinkPad T14s", "qty": 2, "notes": None}],
+    "confidence": 0.87,
+    "extraction_notes": ["due date inferred from 'end of month'", "emoji 🚀 in body"],
+}
+
+_AUDIT_PAYLOAD: dict = {
+    "status": "pending_review",
+    "confidence": 0.62,
+    "routing_action": "human_review",
+    "routing_reason": "confidence 0.62 in review band [0.5, 0.85]",
+    "input_hash": "0123456789abcdef",
+    "prompt_version": "email_extraction_v1",
+    "flags": [True, False],
+    "counts": {"1": 3, "2": 0},
+}
+
+
+def _orjson_codec():
+    pytest.importorskip("orjson")
+    return json_codec.OrjsonCodec()
+
+
+@pytest.mark.parametrize("payload", [_EXTRACTION_PAYLOAD, _AUDIT_PAYLOAD, {"error": "boom"}])
+def test_stdlib_codec_round_trips(payload: dict) -> None:
+    codec = StdlibCodec()
+    assert codec.loads(codec.dumps(payload)) == payload
+    assert codec.loads(codec.dumps(payload).encode("utf-8")) == payload
+
+
+@pytest.mark.parametrize("payload", [_EXTRACTION_PAYLOAD, _AUDIT_PAYLOAD, {"error": "boom"}])
+def test_orjson_output_is_byte_identical_to_stdlib(payload: dict) -> None:
+    assert _orjson_codec().dumps(payload) == StdlibCodec().dumps(payload)
+
+
+@pytest.mark.parametrize("value", [1.5e-05, 1e20, 0.1, 1e16, -2.5e-300, 123456789.125])
+def test_orjson_floats_decode_to_the_same_value(value: float) -> None:
+    """Exponent spelling may differ (1e20 vs 1e+20); the decoded value may not."""
+    orjson_text = _orjson_codec().dumps({"confidence": value})
+    assert StdlibCodec().loads(orjson_text)["confidence"] == value
+    assert json_codec.loads(StdlibCodec().dumps({"confidence": value}))["confidence"] == value
+
+
+def test_orjson_writes_non_finite_floats_as_null() -> None:
+    assert _orjson_codec().dumps([math.nan, math.inf]) == "[null,null]"
+    assert StdlibCodec().dumps([math.nan, math.inf]) == "[NaN,Infinity]"
+
+
+@pytest.mark.parametrize("value", [2**64, -(2**63) - 1, 10**30])
+def test_orjson_falls_back_to_stdlib_for_integers_beyond_64_bits(value: int) -> None:
+    payload = {"counts": {"big": value}, "name": "Zoë"}
+    codec = _orjson_codec()
+    assert codec.dumps(payload) == StdlibCodec().dumps(payload)
+    assert codec.dumps_log(payload) == StdlibCodec().dumps_log(payload)
+    assert codec.loads(codec.dumps(payload)) == payload
+    assert codec.loads(codec.dumps(payload).encode("utf-8")) == payload
+
+
+def test_orjson_non_ascii_is_byte_identical_and_unescaped() -> None:
+    payload = {
+        "company": "Acme — Zürich",
+        "note": "emoji 🚀",
+        "cjk": "請求書",
+        "ctrl": "a\tb\u2028",
+    }
+    text = _orjson_codec().dumps(payload)
+    assert text == StdlibCodec().dumps(payload)
+    assert "Zürich" in text and "🚀" in text and "請求書" in text
+
+
+def test_log_serialisation_stringifies_unknown_types_identically() -> None:
+    """datetime/UUID extras render via str() in both backends, as before."""
+    entry = {
+        "message": "Ingest complete",
+        "received_at": datetime(2026, 3, 22, 10, 0, tzinfo=UTC),
+        "trace": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "errors": [{"loc": ("body", "qty"), "msg": "bad"}],
+    }
+    stdlib_line = StdlibCodec().dumps_log(entry)
+    assert json.loads(stdlib_line)["received_at"] == "2026-03-22 10:00:00+00:00"
+    assert _orjson_codec().dumps_log(entry) == stdlib_line
+
+
+def test_loads_accepts_legacy_stdlib_formatting() -> None:
+    """Rows written before the codec layer (spaced, ASCII-escaped) still decode."""
+    legacy_text = json.dumps(_EXTRACTION_PAYLOAD)
+    assert json_codec.loads(legacy_text) == _EXTRACTION_PAYLOAD
+
+
+def test_configure_json_codec_selects_backend() -> None:
+    try:
+        assert json_codec.configure_json_codec("stdlib").name == "stdlib"
+        assert json_codec.get_codec().name == "stdlib"
+    finally:
+        json_codec.configure_json_codec("auto")
+
+
+def test_configure_json_codec_rejects_unknown_backend() -> None:
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        json_codec.configure_json_codec("yaml")
@@ -41,3 +41,12 @@ def test_extraction_low_signal_goes_other() -> None:
 
     assert extraction_result.request_type == "other"
     assert extraction_result.confidence <= 0.6
+
+
+def test_unvalidated_extraction_matches_strict_extraction() -> None:
+    """Skipping schema validation must not change the result for valid extractions."""
+    schema_validator = load_schema_validator(_SCHEMA_PATH)
+    for fixture in sorted(_FIXTURES.glob("*.json")):
+        test_message = InboxMessage.model_validate_json(fixture.read_text(encoding="utf-8"))
+
+        assert extract(test_message) == extract(test_message, schema_validator)
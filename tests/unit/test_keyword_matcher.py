@@ -0,0 +1,175 @@
+"""Unit tests for the shared keyword matcher and its reloadable table."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+from pathlib import Path
+
+import pytest
+
+from app.services.keyword_extractor import detect_priority, detect_request_type
+from app.services.keyword_matcher import (
+    BACKEND_AUTOMATON,
+    BACKEND_SCAN,
+    DEFAULT_KEYWORD_TABLE,
+    GROUP_PRIORITY,
+    GROUP_REQUEST_TYPE,
+    KeywordMatcher,
+    ReloadingKeywordMatcher,
+    configure_keyword_table,
+    get_keyword_matcher,
+)
+
+_WORDS = [
+    "please",
+    "Change Request",
+    "ORDER",
+    "border",
+    "update",
+    "low",
+    "below",
+    "asap",
+    "the",
+    "billing",
+    "errors",
+    "Item:",
+    "high",
+    "500",
+    "issue",
+]
+
+
+def _reference(text: str, group: str) -> tuple[str, str] | None:
+    lowered = text.lower()
+    for keyword, label in DEFAULT_KEYWORD_TABLE[group]:
+        if keyword in lowered:
+            return keyword, label
+    return None
+
+
+def _backends() -> list[str]:
+    backends = [BACKEND_SCAN]
+    try:
+        import ahocorasick  # noqa: F401
+
+        backends.append(BACKEND_AUTOMATON)
+    except ImportError:
+        pass
+    return backends
+
+
+@pytest.fixture(autouse=True)
+def _restore_default_table():
+    yield
+    configure_keyword_table(None)
+
+
+@pytest.mark.parametrize("backend", _backends())
+def test_first_match_preserves_table_precedence(backend: str) -> None:
+    """Table order wins over position in the text, for every group."""
+    matcher = KeywordMatcher(DEFAULT_KEYWORD_TABLE, backend=backend)
+    rng = random.Random(1234)
+    for _ in range(500):
+        text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(0, 8)))
+        for group in DEFAULT_KEYWORD_TABLE:
+            assert matcher.first_match(text, group) == _reference(text, group), (text, group)
+
+
+def test_first_match_example_and_unknown_group() -> None:
+    matcher = KeywordMatcher(DEFAULT_KEYWORD_TABLE)
+
+    # "change request" precedes "change"; "update" appears first but ranks last
+    assert matcher.first_match("update the change request", GROUP_REQUEST_TYPE) == (
+        "change request",
+        "ops_change",
+    )
+    assert matcher.first_match("nothing relevant", GROUP_REQUEST_TYPE) is None
+    assert matcher.first_match("urgent order", "no_such_group") is None
+
+
+def test_detectors_match_previous_behaviour() -> None:
+    assert detect_request_type("Invoice", "Billing ERROR on order 42") == (
+        "purchase_request",
+        ["type_hint:order->purchase_request"],
+    )
+    assert detect_priority("Fix this", "Slow page, not urgent but high impact") == (
+        "urgent",
+        ["priority_hint:urgent"],
+    )
+    assert detect_priority("Hi", "Priority: LOW") == ("low", ["priority_explicit:body"])
+
+
+def test_auto_backend_uses_scan_for_small_tables() -> None:
+    assert KeywordMatcher(DEFAULT_KEYWORD_TABLE).backend == BACKEND_SCAN
+
+
+def test_rejects_empty_keyword_and_unknown_backend() -> None:
+    with pytest.raises(ValueError):
+        KeywordMatcher({"group": [("", "label")]})
+    with pytest.raises(ValueError):
+        KeywordMatcher(DEFAULT_KEYWORD_TABLE, backend="regex")
+
+
+def _write_table(path: Path, table: dict, mtime_ns: int) -> None:
+    path.write_text(json.dumps(table), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_reloading_matcher_picks_up_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "keywords.json"
+    _write_table(path, {GROUP_REQUEST_TYPE: [["refund", "customer_issue"]]}, 1_000_000_000)
+    now = [0.0]
+    reloading = ReloadingKeywordMatcher(path, reload_interval_s=5.0, clock=lambda: now[0])
+
+    assert reloading.matcher.first_match("refund please", GROUP_REQUEST_TYPE) == (
+        "refund",
+        "customer_issue",
+    )
+    # Groups absent from the file keep the defaults
+    assert reloading.matcher.first_match("asap", GROUP_PRIORITY) == ("asap", "urgent")
+
+    _write_table(path, {GROUP_REQUEST_TYPE: [["rollback", "ops_change"]]}, 2_000_000_000)
+    now[0] = 1.0
+    assert reloading.matcher.first_match("rollback", GROUP_REQUEST_TYPE) is None  # not checked yet
+    now[0] = 6.0
+    assert reloading.matcher.first_match("rollback", GROUP_REQUEST_TYPE) == (
+        "rollback",
+        "ops_change",
+    )
+
+
+def test_reloading_matcher_keeps_previous_table_on_invalid_file(tmp_path: Path) -> None:
+    path = tmp_path / "keywords.json"
+    _write_table(path, {GROUP_REQUEST_TYPE: [["refund", "customer_issue"]]}, 1_000_000_000)
+    now = [0.0]
+    reloading = ReloadingKeywordMatcher(path, reload_interval_s=0.0, clock=lambda: now[0])
+
+    path.write_text('{"request_type": [["missing label"]]}', encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    now[0] = 1.0
+
+    assert reloading.matcher.first_match("refund", GROUP_REQUEST_TYPE) == (
+        "refund",
+        "customer_issue",
+    )
+
+
+def test_missing_file_falls_back_to_defaults(tmp_path: Path) -> None:
+    reloading = ReloadingKeywordMatcher(tmp_path / "absent.json")
+    assert reloading.matcher.first_match("order", GROUP_REQUEST_TYPE) == (
+        "order",
+        "purchase_request",
+    )
+
+
+def test_configured_table_drives_detectors(tmp_path: Path) -> None:
+    path = tmp_path / "keywords.json"
+    _write_table(path, {GROUP_REQUEST_TYPE: [["refund", "customer_issue"]]}, 1_000_000_000)
+
+    configure_keyword_table(path)
+
+    assert get_keyword_matcher().first_match("refund", GROUP_REQUEST_TYPE) is not None
+    assert detect_request_type("Refund", "for invoice 7")[0] == "customer_issue"
+    assert detect_request_type("Purchase", "laptops")[0] == "other"
@@ -0,0 +1,180 @@
+"""Unit tests for the queue-based structured logging setup.
+
+Covers emit-time capture of correlation_id, overflow accounting under the
+drop and block policies, flushing on shutdown, and 1-in-N sampling.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+
+import pytest
+
+from app.core.logging_config import (
+    BoundedQueueHandler,
+    JSONFormatter,
+    LogSamplingFilter,
+    configure_logging,
+    correlation_id_ctx,
+    dropped_log_records,
+    shutdown_logging,
+)
+
+
+def _record(message: str = "hello") -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_prepare_captures_correlation_id_at_emit_time() -> None:
+    handler = BoundedQueueHandler(queue.Queue(maxsize=10))
+    token = correlation_id_ctx.set("cid-emit")
+    try:
+        handler.handle(_record())
+    finally:
+        correlation_id_ctx.reset(token)
+
+    queued = handler.queue.get_nowait()
+    entry = json.loads(JSONFormatter().format(queued))
+    assert entry["correlation_id"] == "cid-emit"
+
+
+def test_prepare_merges_args_without_formatting_json() -> None:
+    handler = BoundedQueueHandler(queue.Queue(maxsize=10))
+    handler.handle(logging.LogRecord("test", logging.INFO, __file__, 1, "n=%d", (3,), None))
+
+    queued = handler.queue.get_nowait()
+    assert queued.msg == "n=3"
+    assert queued.args is None
+
+
+def test_drop_policy_counts_and_reports_dropped_records() -> None:
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(_record("first"))
+    handler.handle(_record("second"))
+    handler.handle(_record("third"))
+    assert handler.dropped_total == 2
+
+    assert handler.queue.get_nowait().msg == "first"
+
+
+def test_drop_summary_enqueued_when_space_available() -> None:
+    handler = BoundedQueueHandler(queue.Queue(maxsize=3))
+    for index in range(5):
+        handler.handle(_record(f"msg {index}"))
+    assert handler.dropped_total == 2
+
+    handler.queue.get_nowait()
+    handler.queue.get_nowait()
+    handler.handle(_record("after drain"))
+
+    queued = [handler.queue.get_nowait() for _ in range(handler.queue.qsize())]
+    summary = queued[-1]
+    assert summary.levelno == logging.WARNING
+    assert summary.dropped_count == 2
+
+
+def test_block_policy_drops_after_timeout() -> None:
+    handler = BoundedQueueHandler(
+        queue.Queue(maxsize=1), overflow_policy="block", block_timeout_s=0.01
+    )
+    handler.handle(_record("first"))
+    handler.handle(_record("second"))
+    assert handler.dropped_total == 1
+
+
+def test_unknown_overflow_policy_rejected() -> None:
+    with pytest.raises(ValueError, match="overflow policy"):
+        BoundedQueueHandler(queue.Queue(), overflow_policy="spill")
+
+
+def test_listener_writes_json_and_flushes_on_shutdown(capsys: pytest.CaptureFixture) -> None:
+    configure_logging("INFO", queue_size=100)
+    try:
+        token = correlation_id_ctx.set("cid-listener")
+        try:
+            logging.getLogger("app.test").info("Queued line", extra={"item_id": "abc"})
+        finally:
+            correlation_id_ctx.reset(token)
+    finally:
+        shutdown_logging()
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if "Queued line" in line]
+    entry = json.loads(lines[0])
+    assert entry["correlation_id"] == "cid-listener"
+    assert entry["item_id"] == "abc"
+    assert dropped_log_records() == 0
+
+
+def test_synchronous_mode_when_queue_size_zero(capsys: pytest.CaptureFixture) -> None:
+    configure_logging("INFO", queue_size=0)
+    logging.getLogger("app.test").info("Sync line")
+    assert "Sync line" in capsys.readouterr().out
+
+
+# ---------------------------------------------------------------------------
+# Sampling
+# ---------------------------------------------------------------------------
+
+
+def _routing_record(level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(
+        "app.services.routing_service", level, __file__, 1, "Routing decision made", None, None
+    )
+
+
+def test_sampling_keeps_one_in_n_with_weights_summing_to_total() -> None:
+    sampler = LogSamplingFilter({"app.services.routing_service": 5})
+    records = [_routing_record() for _ in range(23)]
+    kept = [record for record in records if sampler.filter(record)]
+
+    assert len(kept) == 5  # occurrences 1, 6, 11, 16, 21
+    residual = sampler.drain_pending()
+    total_weight = sum(record.sample_weight for record in kept)
+    assert total_weight + sum(residual.values()) == 23
+    assert all(record.sample_rate == 5 for record in kept)
+
+
+def test_sampling_never_drops_warnings() -> None:
+    sampler = LogSamplingFilter({"app.services.routing_service": 100})
+    assert all(sampler.filter(_routing_record(logging.WARNING)) for _ in range(10))
+
+
+def test_event_rule_overrides_logger_rule_and_parents_apply() -> None:
+    sampler = LogSamplingFilter({"app.services": 10, "app.services.routing_service:Other": 1})
+    other = logging.LogRecord(
+        "app.services.routing_service", logging.INFO, __file__, 1, "Other", None, None
+    )
+    assert all(sampler.filter(other) for _ in range(5))
+
+    kept = sum(sampler.filter(_routing_record()) for _ in range(10))
+    assert kept == 1
+
+
+def test_unsampled_loggers_pass_through_untouched() -> None:
+    sampler = LogSamplingFilter({"app.services.routing_service": 5})
+    record = logging.LogRecord("app.main", logging.INFO, __file__, 1, "Started", None, None)
+    assert sampler.filter(record)
+    assert not hasattr(record, "sample_weight")
+
+
+def test_sampling_stats_report_seen_and_suppressed() -> None:
+    sampler = LogSamplingFilter({"app.services.routing_service": 4})
+    for _ in range(8):
+        sampler.filter(_routing_record())
+    stats = sampler.stats()["app.services.routing_service:Routing decision made"]
+    assert stats == {"seen": 8, "emitted": 2, "suppressed": 6}
+
+
+def test_invalid_sample_rate_rejected() -> None:
+    with pytest.raises(ValueError, match=">= 1"):
+        LogSamplingFilter({"app": 0})
+
+
+def test_logger_level_overrides_applied_and_reset() -> None:
+    configure_logging("INFO", queue_size=0, logger_levels={"app.test.noisy": "WARNING"})
+    assert logging.getLogger("app.test.noisy").level == logging.WARNING
+
+    configure_logging("INFO", queue_size=0)
+    assert logging.getLogger("app.test.noisy").level == logging.NOTSET
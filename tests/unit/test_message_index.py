@@ -0,0 +1,78 @@
+"""Unit tests for the message_id Bloom filter / LRU index."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.models.email import IngestResponse
+from app.services.message_index import BloomFilter, MessageIdIndex
+
+
+def _response(status: str = "approved", item_id: str = "item_1") -> IngestResponse:
+    return IngestResponse(item_id=item_id, status=status, confidence=0.9, routed_to="auto_approve")
+
+
+def test_bloom_has_no_false_negatives_and_near_target_fp_rate() -> None:
+    bloom = BloomFilter(capacity=10_000, fp_rate=0.01)
+    for index in range(10_000):
+        bloom.add(f"msg_{index}")
+
+    assert all(f"msg_{index}" in bloom for index in range(10_000))
+    false_positives = sum(f"other_{index}" in bloom for index in range(20_000))
+    assert false_positives / 20_000 < 0.02
+    assert bloom.estimated_fp_rate() == pytest.approx(0.01, rel=0.2)
+
+
+def test_bloom_sizing_matches_formula() -> None:
+    bloom = BloomFilter(capacity=1_000_000, fp_rate=0.01)
+    # ~9.59 bits per item and 7 hashes for 1%
+    assert 1_150_000 < bloom.size_bytes < 1_250_000
+    assert bloom.num_hashes == 7
+
+
+def test_bloom_rejects_invalid_parameters() -> None:
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=0, fp_rate=0.01)
+    with pytest.raises(ValueError):
+        BloomFilter(capacity=10, fp_rate=1.5)
+
+
+def test_index_caches_only_final_statuses_as_idempotent_return() -> None:
+    index = MessageIdIndex(capacity=100, lru_size=10)
+    index.record("msg_final", _response("approved"))
+    index.record("msg_pending", _response("pending_review"))
+
+    cached = index.get_recent("msg_final")
+    assert cached is not None
+    assert cached.routed_to == "idempotent_return"
+    assert index.get_recent("msg_pending") is None
+    assert index.might_contain("msg_pending")
+
+
+def test_index_lru_evicts_least_recently_used() -> None:
+    index = MessageIdIndex(capacity=100, lru_size=2)
+    index.record("a", _response(item_id="a"))
+    index.record("b", _response(item_id="b"))
+    index.get_recent("a")
+    index.record("c", _response(item_id="c"))
+
+    assert index.get_recent("b") is None
+    assert index.get_recent("a") is not None
+    assert index.get_recent("c") is not None
+
+
+def test_index_load_and_stats() -> None:
+    index = MessageIdIndex(capacity=1_000, fp_rate=0.01)
+    assert index.load(f"seed_{i}" for i in range(500)) == 500
+
+    assert not index.might_contain("brand_new_message")
+    assert index.might_contain("seed_42")
+    index.record_false_positive()
+
+    stats = index.stats()
+    assert stats["bloom_items"] == 500
+    assert stats["bloom_negative"] == 1
+    assert stats["bloom_positive"] == 1
+    assert stats["false_positive"] == 1
+    assert stats["bloom_bytes"] > 0
+    assert 0.0 < stats["estimated_fp_rate"] < 0.01
@@ -0,0 +1,74 @@
+"""Unit tests for the in-process metrics registry and Prometheus rendering."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.core.metrics import MetricsRegistry
+
+
+def test_counter_renders_labelled_totals() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs run.", ["outcome"])
+    counter.inc(outcome="ok")
+    counter.inc(2, outcome="ok")
+    counter.inc(outcome="failed")
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{outcome="ok"} 3' in text
+    assert 'jobs_total{outcome="failed"} 1' in text
+
+
+def test_counter_rejects_negative_and_mismatched_labels() -> None:
+    counter = MetricsRegistry().counter("c", "c", ["a"])
+    with pytest.raises(ValueError):
+        counter.inc(-1, a="x")
+    with pytest.raises(ValueError):
+        counter.inc(b="x")
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "Latency.", ["stage"], buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, stage="ai_call")
+
+    text = registry.render_prometheus()
+
+    assert 'latency_seconds_bucket{stage="ai_call",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{stage="ai_call",le="1"} 3' in text
+    assert 'latency_seconds_bucket{stage="ai_call",le="+Inf"} 4' in text
+    assert 'latency_seconds_sum{stage="ai_call"} 4.05' in text
+    assert 'latency_seconds_count{stage="ai_call"} 4' in text
+
+
+def test_histogram_time_context_manager_observes_once() -> None:
+    histogram = MetricsRegistry().histogram("t", "t", ["stage"])
+    with histogram.time(stage="persist"):
+        pass
+    assert histogram.count(stage="persist") == 1
+
+
+def test_gauge_function_evaluated_at_render() -> None:
+    registry = MetricsRegistry()
+    values = iter([1.5, 2.5])
+    registry.gauge("queue_depth", "Depth.").set_function(lambda: next(values))
+
+    assert "queue_depth 1.5" in registry.render_prometheus()
+    assert "queue_depth 2.5" in registry.render_prometheus()
+
+
+def test_registry_returns_existing_metric_and_rejects_type_clash() -> None:
+    registry = MetricsRegistry()
+    first = registry.counter("shared_total", "Shared.")
+    assert registry.counter("shared_total", "Shared.") is first
+    with pytest.raises(ValueError):
+        registry.gauge("shared_total", "Shared.")
+
+
+def test_label_values_are_escaped() -> None:
+    registry = MetricsRegistry()
+    registry.counter("e_total", "Escapes.", ["v"]).inc(v='a"b\\c')
+    assert 'e_total{v="a\\"b\\\\c"} 1' in registry.render_prometheus()
@@ -0,0 +1,62 @@
+"""Unit tests for the pure ASGI CorrelationIDMiddleware.
+
+Uses a minimal Starlette app so the middleware is exercised without the
+full application lifespan.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.core.logging_config import correlation_id_ctx
+from app.core.middleware import CorrelationIDMiddleware
+
+
+async def _echo_context(request: Request) -> JSONResponse:
+    return JSONResponse({"correlation_id": correlation_id_ctx.get("")})
+
+
+async def _stream(request: Request) -> StreamingResponse:
+    async def chunks() -> AsyncIterator[bytes]:
+        for index in range(3):
+            yield f'{{"chunk": {index}, "cid": "{correlation_id_ctx.get("")}"}}\n'.encode()
+
+    return StreamingResponse(chunks(), media_type="application/x-ndjson")
+
+
+def _client() -> TestClient:
+    app = Starlette(routes=[Route("/echo", _echo_context), Route("/stream", _stream)])
+    app.add_middleware(CorrelationIDMiddleware)
+    return TestClient(app)
+
+
+def test_generates_correlation_id_and_sets_context() -> None:
+    response = _client().get("/echo")
+    header_cid = response.headers["x-correlation-id"]
+    assert header_cid
+    assert response.json()["correlation_id"] == header_cid
+
+
+def test_supplied_correlation_id_is_propagated_to_context_and_header() -> None:
+    response = _client().get("/echo", headers={"X-Correlation-ID": "trace-xyz"})
+    assert response.headers["x-correlation-id"] == "trace-xyz"
+    assert response.json()["correlation_id"] == "trace-xyz"
+
+
+def test_streaming_response_passes_through_with_header() -> None:
+    response = _client().get("/stream", headers={"X-Correlation-ID": "stream-1"})
+    assert response.headers["x-correlation-id"] == "stream-1"
+    lines = response.text.strip().splitlines()
+    assert len(lines) == 3
+    assert all('"cid": "stream-1"' in line for line in lines)
+
+
+def test_context_is_reset_after_request() -> None:
+    _client().get("/echo", headers={"X-Correlation-ID": "leak-check"})
+    assert correlation_id_ctx.get("") == ""
@@ -0,0 +1,201 @@
+"""Unit tests for email body pre-processing and prompt budget enforcement."""
+
+from __future__ import annotations
+
+import base64
+
+import pytest
+
+from app.core.constants import MAX_PROMPT_BODY_CHARS
+from app.services.ai.client import MockAIClient
+from app.services.ai.preprocess import prepare_body, truncate_middle
+from app.services.ai.prompts import build_prompt
+from app.services.extraction_service import ExtractionService
+from tests.conftest import make_message
+
+_REQUEST = (
+    "Please order 4 ThinkPad T14s laptops for the new engineering hires starting in April. "
+    "Item: ThinkPad T14s, Qty: 4."
+)
+
+
+def _kinds(notes: list[str]) -> list[str]:
+    return [note.split(":")[1] if note.startswith("prompt_trimmed") else note for note in notes]
+
+
+def test_clean_body_is_unchanged() -> None:
+    prepared = prepare_body(_REQUEST)
+
+    assert prepared.text == _REQUEST
+    assert prepared.notes == []
+    assert prepared.tokens_saved == 0
+
+
+def test_strips_reply_history_and_quoted_lines() -> None:
+    body = (
+        f"{_REQUEST}\n\n"
+        "On Mon, 2 Mar 2026 at 09:14, Bob Lee <bob@example.com> wrote:\n"
+        "> Can you send the laptop specs?\n"
+        "> Thanks, Bob\n"
+    )
+
+    prepared = prepare_body(body)
+
+    assert prepared.text == _REQUEST
+    assert _kinds(prepared.notes) == ["reply_history"]
+    assert prepared.tokens_saved > 0
+
+
+def test_keeps_forwarded_thread_under_a_short_note() -> None:
+    body = (
+        "FYI, see below.\n\n"
+        "From: Carol Wang\n"
+        "Sent: Monday, March 2, 2026 9:00 AM\n"
+        "Subject: Laptops\n\n"
+        f"{_REQUEST}"
+    )
+
+    prepared = prepare_body(body)
+
+    assert _REQUEST in prepared.text
+    assert prepared.notes == []
+
+
+def test_strips_inline_quotes_without_a_reply_header() -> None:
+    body = f"> earlier message line\n{_REQUEST}"
+
+    prepared = prepare_body(body)
+
+    assert prepared.text == _REQUEST
+    assert _kinds(prepared.notes) == ["quoted_reply"]
+
+
+def test_strips_signature_sent_from_and_disclaimer() -> None:
+    body = (
+        f"{_REQUEST}\n"
+        "Sent from my iPhone\n\n"
+        "CONFIDENTIALITY NOTICE: This email and any attachments are confidential and intended "
+        "solely for the addressee.\n\n"
+        "-- \nAlice Smith\nHead of IT, Acme Corp\n+1 555 0100"
+    )
+
+    prepared = prepare_body(body)
+
+    assert prepared.text == _REQUEST
+    assert sorted(_kinds(prepared.notes)) == ["disclaimer", "sent_from", "signature"]
+
+
+def test_first_paragraph_is_never_treated_as_disclaimer() -> None:
+    body = f"Confidential: {_REQUEST}"
+
+    assert prepare_body(body).text == body
+
+
+@pytest.mark.parametrize(
+    "paragraph",
+    [
+        "Privileged access needed for Bob on prod by Friday",
+        "PRIVILEGED access needed for Bob on prod by Friday",
+        "Confidential project kickoff: please order 2 monitors for the war room",
+        "This message is to request 3 monitors for the design team, needed by Friday",
+        "This message is intended for the finance team: please approve PO 4471",
+    ],
+)
+def test_keeps_request_paragraphs_that_look_like_notices(paragraph: str) -> None:
+    body = f"Hi team,\n\n{paragraph}\n\nThanks,\nAlice"
+
+    prepared = prepare_body(body)
+
+    assert prepared.text == body
+    assert prepared.notes == []
+
+
+def test_strips_only_disclaimers_after_the_last_content_paragraph() -> None:
+    notice = "DISCLAIMER: This email is confidential."
+    body = (
+        f"Hi team,\n\n{notice}\n\n{_REQUEST}\n\nThanks,\nAlice\n\n"
+        "This e-mail and any attachments are confidential and intended solely for the "
+        "addressee.\n\n"
+        "LEGAL NOTICE: Acme Corp is registered in England."
+    )
+
+    prepared = prepare_body(body)
+
+    assert prepared.text == f"Hi team,\n\n{notice}\n\n{_REQUEST}\n\nThanks,\nAlice"
+    assert _kinds(prepared.notes) == ["disclaimer"]
+
+
+def test_bare_double_dash_separator_is_not_a_signature() -> None:
+    body = (
+        f"Section 1: {_REQUEST}\n"
+        "--\n"
+        "Section 2: also add 4 USB-C docks, Qty: 4.\n"
+        "--\n"
+        "Section 3: needed by 2026-04-01."
+    )
+
+    prepared = prepare_body(body)
+
+    assert prepared.text == body
+    assert prepared.notes == []
+
+
+def test_signature_delimiter_far_from_the_end_is_kept() -> None:
+    lines = "\n".join(f"Item {n}: USB-C dock, Qty: 1" for n in range(20))
+    body = f"{_REQUEST}\n-- \n{lines}"
+
+    prepared = prepare_body(body)
+
+    assert prepared.text == body
+    assert prepared.notes == []
+
+
+def test_replaces_base64_blobs() -> None:
+    blob = base64.b64encode(bytes(range(256)) * 4).decode()
+    body = f"{_REQUEST}\n\ndata:image/png;base64,{blob}\n"
+
+    prepared = prepare_body(body)
+
+    assert blob not in prepared.text
+    assert "[base64 data removed]" in prepared.text
+    assert _kinds(prepared.notes) == ["base64"]
+
+
+def test_truncates_to_budget_keeping_head_and_tail() -> None:
+    filler = "lorem ipsum dolor sit amet " * 400
+    body = f"HEAD {_REQUEST} {filler} Needed by 2026-04-01 TAIL"
+
+    prepared = prepare_body(body, max_tokens=250)
+
+    assert prepared.text.startswith("HEAD ")
+    assert prepared.text.endswith("TAIL")
+    assert "characters omitted" in prepared.text
+    assert len(prepared.text) <= 250 * 4 + 50
+    assert prepared.notes[-1].startswith("prompt_truncated:")
+    assert prepared.tokens <= 265
+
+
+def test_truncate_middle_short_text_untouched() -> None:
+    assert truncate_middle("short", 100) == "short"
+
+
+def test_build_prompt_enforces_max_body_chars() -> None:
+    prompt = build_prompt(
+        from_name="A",
+        from_email="a@example.com",
+        subject="S",
+        received_at="2026-03-01T09:00:00+00:00",
+        body="x " * MAX_PROMPT_BODY_CHARS,
+    )
+
+    assert len(prompt) < MAX_PROMPT_BODY_CHARS + 200
+
+
+async def test_trim_notes_are_appended_after_confidence_scoring() -> None:
+    svc = ExtractionService(ai_client=MockAIClient())
+    clean = await svc.extract(make_message(body=_REQUEST))
+    trimmed = await svc.extract(make_message(body=f"{_REQUEST}\n-- \nAlice Smith\nAcme Corp"))
+
+    assert trimmed.confidence == clean.confidence
+    assert trimmed.extraction_notes[: len(clean.extraction_notes)] == clean.extraction_notes
+    assert trimmed.extraction_notes[-1].startswith("prompt_trimmed:signature:")
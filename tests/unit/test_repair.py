@@ -0,0 +1,125 @@
+"""Unit tests for the repair turn after invalid AI output."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from app.core.exceptions import ExtractionError
+from app.core.metrics import AI_CASCADE_COST_USD, AI_REPAIR_ATTEMPTS_TOTAL
+from app.services.ai.cascade import CascadeTier, CascadingAIClient
+from app.services.ai.client import AICallResult, AIClient, MockAIClient
+from app.services.ai.prompts import REPAIR_SYSTEM_PROMPT, REPAIR_VERSION
+from app.services.extraction_service import (
+    FAILURE_SCHEMA_MISMATCH,
+    FAILURE_STREAM_ABORTED,
+    ExtractionService,
+)
+from tests.conftest import make_message
+
+_VALID = json.dumps(
+    {
+        "request_type": "purchase_request",
+        "priority": "high",
+        "description": "Two laptops for engineering.",
+        "line_items": [{"item": "ThinkPad T14s", "qty": 2}],
+    }
+)
+_BAD_PRIORITY = _VALID.replace('"high"', '"whenever"')
+
+
+class _ScriptedClient(AIClient):
+    """Returns the scripted responses in order and records each request."""
+
+    def __init__(self, *responses: str, stream_abort: str | None = None) -> None:
+        self._responses = list(responses)
+        self._stream_abort = stream_abort
+        self.calls: list[tuple[str, str, str]] = []
+
+    async def complete(self, system: str, user: str, *, prompt_version: str = "") -> AICallResult:
+        self.calls.append((system, user, prompt_version))
+        return AICallResult(
+            text=self._responses[len(self.calls) - 1],
+            tokens_in=100,
+            tokens_out=50,
+            cost_usd=0.001,
+            latency_ms=5.0,
+            model="test",
+            prompt_version=prompt_version,
+            stream_abort=self._stream_abort,
+        )
+
+
+async def test_non_json_output_is_repaired_by_a_short_follow_up_turn() -> None:
+    client = _ScriptedClient('{"request_type": "purchase_request", "prio', _VALID)
+    before = AI_REPAIR_ATTEMPTS_TOTAL.value(failure="non_json", outcome="repaired")
+
+    extraction = await ExtractionService(ai_client=client, max_repair_attempts=1).extract(
+        make_message()
+    )
+
+    assert extraction.priority == "high"
+    assert extraction.extraction_notes[-1] == "repaired:non_json:1"
+    system, user, version = client.calls[1]
+    assert (system, version) == (REPAIR_SYSTEM_PROMPT, REPAIR_VERSION)
+    assert '"prio' in user and "invalid JSON" in user
+    assert make_message().body not in user  # the email is not resent
+    assert AI_REPAIR_ATTEMPTS_TOTAL.value(failure="non_json", outcome="repaired") == before + 1
+
+
+async def test_repair_is_bounded_and_raises_the_last_error() -> None:
+    client = _ScriptedClient(_BAD_PRIORITY, _BAD_PRIORITY, _BAD_PRIORITY)
+
+    with pytest.raises(ExtractionError) as excinfo:
+        await ExtractionService(ai_client=client, max_repair_attempts=2).extract(make_message())
+
+    assert len(client.calls) == 3
+    assert excinfo.value.context["failure"] == FAILURE_SCHEMA_MISMATCH
+    assert any("priority" in error for error in excinfo.value.context["errors"])
+
+
+async def test_repair_disabled_by_default() -> None:
+    client = _ScriptedClient(_BAD_PRIORITY, _VALID)
+
+    with pytest.raises(ExtractionError):
+        await ExtractionService(ai_client=client).extract(make_message())
+    assert len(client.calls) == 1
+
+
+async def test_aborted_stream_is_not_repaired() -> None:
+    client = _ScriptedClient("Sorry", _VALID, stream_abort="not_json")
+
+    with pytest.raises(ExtractionError) as excinfo:
+        await ExtractionService(ai_client=client, max_repair_attempts=1).extract(make_message())
+    assert excinfo.value.context["failure"] == FAILURE_STREAM_ABORTED
+    assert len(client.calls) == 1
+
+
+async def test_cascade_repairs_before_escalating() -> None:
+    cheap = _ScriptedClient(_BAD_PRIORITY, _VALID)
+    cascade = CascadingAIClient(
+        [CascadeTier("cheap", cheap), CascadeTier("strong", MockAIClient())]
+    )
+    svc = ExtractionService(ai_client=cascade, review_band=(0.0, 0.0), max_repair_attempts=1)
+
+    extraction = await svc.extract(make_message())
+
+    assert extraction.extraction_notes[-2:] == ["repaired:schema_mismatch:1", "model_tier:cheap"]
+    assert cascade.stats()["strong"]["calls"] == 0
+
+
+async def test_cascade_stats_include_repair_turns() -> None:
+    cheap = _ScriptedClient(_BAD_PRIORITY, _BAD_PRIORITY, _VALID)
+    cascade = CascadingAIClient([CascadeTier("cheap_sum", cheap)])
+    svc = ExtractionService(ai_client=cascade, max_repair_attempts=2)
+    before = AI_CASCADE_COST_USD.value(tier="cheap_sum")
+
+    await svc.extract(make_message())
+
+    stats = cascade.stats()["cheap_sum"]
+    assert len(cheap.calls) == 3
+    assert stats["calls"] == 1
+    assert stats["cost_usd"] == pytest.approx(0.003)
+    assert stats["avg_latency_ms"] == pytest.approx(15.0)
+    assert AI_CASCADE_COST_USD.value(tier="cheap_sum") == pytest.approx(before + 0.003)
@@ -0,0 +1,167 @@
+"""Unit tests for offline re-routing of stored items."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from app.config import Settings
+from app.core.constants import EVENT_DESTINATIONS_WRITTEN, EVENT_REROUTED
+from app.models.email import Extraction, InboxMessage, Requester
+from app.services.ai.client import MockAIClient
+from app.services.confidence_service import compute_confidence
+from app.services.extraction_service import ExtractionService, scored_note_count
+from app.services.rerouting_service import ReroutingService
+from app.services.workflow_service import WorkflowService
+from app.storage import Storage
+
+_FIXTURES = Path("tests/fixtures/sample_inputs")
+
+
+@pytest.fixture
+def settings(tmp_path: Path) -> Settings:
+    return Settings(
+        sqlite_path=str(tmp_path / "app.db"),
+        sheets_csv_path=str(tmp_path / "sheet.csv"),
+        airtable_jsonl_path=str(tmp_path / "airtable.jsonl"),
+    )
+
+
+def _store(storage: Storage, item_id: str, status: str, description_length: int) -> float:
+    """Store an item whose confidence is set by its description length."""
+    extraction = Extraction(
+        request_id=item_id,
+        request_type="customer_issue",
+        priority="high",
+        requester=Requester(name="Jane Smith", email="jane@acme.com"),
+        description="x" * description_length,
+        confidence=0.0,
+        extraction_notes=["model_tier:cheap"],
+    )
+    confidence = compute_confidence(extraction.model_copy(update={"extraction_notes": []})).score
+    extraction = extraction.model_copy(update={"confidence": confidence})
+    storage.create_item(item_id, f"msg_{item_id}", status, confidence, extraction.model_dump())
+    return confidence
+
+
+def _seed(storage: Storage) -> None:
+    # Scores: 100 chars → 0.84, 40 → 0.79, 15 → 0.73 (review band under defaults)
+    for index, length in enumerate([100, 40, 15, 100, 40]):
+        _store(storage, f"pending_{index}", "pending_review", length)
+    _store(storage, "approved_0", "approved", 15)
+    _store(storage, "rejected_0", "rejected", 100)
+    storage.create_item("failed_0", "msg_failed_0", "failed", 0.0, {"error": "boom"})
+
+
+async def test_unchanged_thresholds_reproduce_stored_routing(settings: Settings) -> None:
+    storage = Storage(settings.sqlite_path)
+    for keyword_tier in (None, 0.0):
+        workflow = WorkflowService(
+            storage=storage,
+            settings=settings,
+            extraction_service=ExtractionService(
+                ai_client=MockAIClient(), keyword_tier_threshold=keyword_tier
+            ),
+        )
+        for fixture in sorted(_FIXTURES.glob("*.json")):
+            message = InboxMessage.model_validate_json(fixture.read_text(encoding="utf-8"))
+            await workflow.ingest(
+                message.model_copy(update={"message_id": f"{message.message_id}_{keyword_tier}"})
+            )
+
+    report = ReroutingService(storage, settings).run()
+
+    assert report.scanned == 8
+    assert report.rescored_changed == 0
+    assert report.changed == 0
+
+
+def test_dry_run_reports_transitions_without_writing(settings: Settings) -> None:
+    storage = Storage(settings.sqlite_path)
+    _seed(storage)
+
+    report = ReroutingService(storage, settings).run(
+        auto_approve_threshold=0.8, auto_reject_threshold=0.75, batch_size=2
+    )
+
+    assert report.scanned == 7  # failed items are skipped
+    assert report.rescored_changed == 0
+    assert report.transitions["pending_review"] == {
+        "approved": 2,
+        "pending_review": 2,
+        "rejected": 1,
+    }
+    assert report.transitions["approved"]["rejected"] == 1
+    assert report.transitions["rejected"]["approved"] == 1
+    assert report.changed == 5
+    assert report.applied == 0
+    assert len(storage.list_items(status="pending_review")) == 5
+
+
+def test_apply_moves_only_pending_items_with_audit_events(settings: Settings) -> None:
+    storage = Storage(settings.sqlite_path)
+    _seed(storage)
+
+    report = ReroutingService(storage, settings).run(
+        auto_approve_threshold=0.8, auto_reject_threshold=0.75, apply=True, batch_size=2
+    )
+
+    assert report.applied == 3
+    assert storage.get_item("pending_0")["status"] == "approved"
+    assert storage.get_item("pending_1")["status"] == "pending_review"
+    assert storage.get_item("pending_2")["status"] == "rejected"
+    assert storage.get_item("approved_0")["status"] == "approved"
+    assert storage.get_item("rejected_0")["status"] == "rejected"
+
+    events = [event["event_type"] for event in storage.list_audit("pending_0")]
+    assert events == [EVENT_REROUTED, EVENT_DESTINATIONS_WRITTEN]
+    details = json.loads(storage.list_audit("pending_2")[0]["details_json"])
+    assert details["from_status"] == "pending_review" and details["to_status"] == "rejected"
+    assert details["auto_approve_threshold"] == 0.8
+    assert len(Path(settings.airtable_jsonl_path).read_text().splitlines()) == 2
+
+
+def test_inverted_thresholds_raise_before_any_write(settings: Settings) -> None:
+    storage = Storage(settings.sqlite_path)
+    _seed(storage)
+
+    with pytest.raises(ValueError, match="auto_reject_threshold"):
+        ReroutingService(storage, settings).run(
+            auto_approve_threshold=0.6, auto_reject_threshold=0.9, apply=True
+        )
+
+    assert len(storage.list_items(status="pending_review")) == 5
+    assert storage.list_audit("pending_0") == []
+
+
+def test_reroute_skips_items_whose_status_changed(settings: Settings) -> None:
+    storage = Storage(settings.sqlite_path)
+    _seed(storage)
+    storage.update_status("pending_0", "approved")
+
+    applied = storage.reroute_items(
+        [
+            {
+                "item_id": item_id,
+                "from_status": "pending_review",
+                "to_status": "rejected",
+                "confidence": 0.1,
+                "extraction": {},
+                "details": {},
+            }
+            for item_id in ("pending_0", "pending_1")
+        ],
+        event_type=EVENT_REROUTED,
+        actor="system",
+    )
+
+    assert [change["item_id"] for change in applied] == ["pending_1"]
+    assert storage.get_item("pending_0")["status"] == "approved"
+    assert storage.list_audit("pending_0") == []
+
+
+def test_scored_note_count_ignores_notes_added_after_scoring() -> None:
+    assert scored_note_count(["assumed qty", "prompt_trimmed:signature:40", "model_tier:a"]) == 1
+    assert scored_note_count(["type_hint:none", "company_explicit", "tier:keyword"]) == 1
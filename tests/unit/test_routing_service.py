@@ -5,9 +5,10 @@ route() is a pure function — no mocks, no I/O.
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
-from app.services.routing_service import RoutingDecision, route
+from app.services.routing_service import RoutingDecision, route, route_batch
 
 # ---------------------------------------------------------------------------
 # Core three-way routing
@@ -161,3 +162,22 @@ def test_routing_with_custom_thresholds(
     """route() respects custom threshold arguments correctly."""
     decision = route(confidence, auto_approve_threshold=approve_t, auto_reject_threshold=reject_t)
     assert decision.action == expected_action
+
+
+# ---------------------------------------------------------------------------
+# Vectorised routing
+# ---------------------------------------------------------------------------
+
+
+def test_route_batch_matches_route() -> None:
+    scores = np.array([0.0, 0.2, 0.49, 0.5, 0.51, 0.7, 0.84, 0.85, 0.86, 1.0])
+    thresholds = {"auto_approve_threshold": 0.85, "auto_reject_threshold": 0.5}
+
+    actions = route_batch(scores, **thresholds)
+
+    assert actions.tolist() == [route(float(score), **thresholds).action for score in scores]
+
+
+def test_route_batch_rejects_inverted_thresholds() -> None:
+    with pytest.raises(ValueError, match="auto_reject_threshold"):
+        route_batch(np.array([0.5]), auto_approve_threshold=0.6, auto_reject_threshold=0.7)
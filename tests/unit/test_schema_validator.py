@@ -0,0 +1,100 @@
+"""Unit tests for the compiled JSON Schema validator."""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import random
+from pathlib import Path
+from typing import Any
+
+from jsonschema import Draft202012Validator
+
+from app.services.schema_validator import SchemaError, compile_validator, load_validator
+
+_SCHEMA = json.loads(Path("schemas/extraction_schema.json").read_text(encoding="utf-8"))
+_VALID = {
+    "request_id": "abc123",
+    "request_type": "purchase_request",
+    "priority": "high",
+    "due_date": None,
+    "company": "Acme Corp",
+    "requester": {"name": "Alice", "email": "alice@example.com"},
+    "description": "Two laptops.",
+    "line_items": [{"item": "ThinkPad", "qty": 2, "notes": None}],
+    "confidence": 0.8,
+    "extraction_notes": ["assumed model"],
+}
+_REPLACEMENTS: list[Any] = [None, True, 0, 1, -1, 2.0, 1.5, "x", "low", [], [1], {}, {"qty": 0}]
+
+
+def _paths(value: Any, path: tuple = ()) -> list[tuple]:
+    found = [path]
+    if isinstance(value, dict):
+        for key, child in value.items():
+            found += _paths(child, (*path, key))
+    elif isinstance(value, list):
+        for index, child in enumerate(value):
+            found += _paths(child, (*path, index))
+    return found
+
+
+def _mutate(rng: random.Random) -> dict[str, Any]:
+    instance = copy.deepcopy(_VALID)
+    for _ in range(rng.randint(1, 3)):
+        path = rng.choice(_paths(instance)[1:])
+        parent = instance
+        for part in path[:-1]:
+            parent = parent[part]
+        roll = rng.random()
+        if roll < 0.2 and isinstance(parent, dict):
+            del parent[path[-1]]
+        elif roll < 0.3 and isinstance(parent, dict):
+            parent[f"extra_{rng.randint(0, 2)}"] = 1
+        else:
+            parent[path[-1]] = copy.deepcopy(rng.choice(_REPLACEMENTS))
+    return instance
+
+
+def _reference(schema: dict[str, Any], instance: Any) -> list[SchemaError]:
+    return [
+        SchemaError(tuple(err.path), err.message)
+        for err in Draft202012Validator(schema).iter_errors(instance)
+    ]
+
+
+def test_compiled_validator_reports_the_same_errors_as_jsonschema() -> None:
+    validate = compile_validator(_SCHEMA)
+    rng = random.Random(48)
+
+    assert validate(_VALID) == []
+    for _ in range(2000):
+        instance = _mutate(rng)
+        assert validate(instance) == _reference(_SCHEMA, instance), instance
+
+
+def test_unsupported_keywords_fall_back_to_jsonschema() -> None:
+    schema = {"type": "object", "properties": {"code": {"type": "string", "pattern": "^[A-Z]+$"}}}
+    validate = compile_validator(schema)
+
+    assert validate({"code": "ABC"}) == []
+    assert validate({"code": "abc"}) == _reference(schema, {"code": "abc"})
+    assert validate({"code": "abc"})[0].path == ("code",)
+
+
+def test_load_validator_is_cached_until_the_file_changes(tmp_path: Path) -> None:
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps({"type": "string"}), encoding="utf-8")
+
+    first = load_validator(schema_path)
+    assert load_validator(schema_path) is first
+    assert first(1) == [SchemaError((), "1 is not of type 'string'")]
+
+    schema_path.write_text(json.dumps({"type": "integer"}), encoding="utf-8")
+    stat = schema_path.stat()
+    os.utime(schema_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = load_validator(schema_path)
+    assert second is not first
+    assert second(1) == []
@@ -0,0 +1,120 @@
+"""Unit tests for the storage-backed, cross-worker circuit breaker."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from app.core.metrics import AI_CIRCUIT_TRANSITIONS_TOTAL
+from app.services.ai.client import BREAKER_CLOSED, BREAKER_HALF_OPEN, BREAKER_OPEN
+from app.services.ai.shared_breaker import SharedCircuitBreaker
+from app.storage import Storage
+
+
+@pytest.fixture()
+def storage(tmp_path: Path) -> Storage:
+    return Storage(str(tmp_path / "breaker.db"))
+
+
+def _workers(storage: Storage, now: list[float], count: int = 2, **options):
+    return [
+        SharedCircuitBreaker(
+            storage,
+            failure_threshold=3,
+            reset_timeout_s=10.0,
+            refresh_interval_s=0.0,
+            clock=lambda: now[0],
+            **options,
+        )
+        for _ in range(count)
+    ]
+
+
+def test_failures_from_all_workers_open_one_circuit(storage: Storage) -> None:
+    now = [1_000.0]
+    worker_a, worker_b = _workers(storage, now)
+
+    worker_a.record_failure()
+    worker_b.record_failure()
+    assert worker_a.allow_request()
+    worker_b.record_failure()
+
+    assert worker_a.state == BREAKER_OPEN
+    assert not worker_a.allow_request()
+    assert not worker_b.allow_request()
+
+
+def test_probe_budget_is_shared_and_success_closes(storage: Storage) -> None:
+    now = [1_000.0]
+    worker_a, worker_b, worker_c = _workers(storage, now, count=3, probe_budget=1)
+    for _ in range(3):
+        worker_a.record_failure()
+
+    now[0] += 12.5
+    assert worker_b.state == BREAKER_HALF_OPEN
+    assert worker_b.allow_request()
+    assert not worker_a.allow_request()  # the one probe is in flight on worker_b
+    assert not worker_c.allow_request()
+
+    worker_b.record_success()
+    assert worker_a.state == BREAKER_CLOSED
+    assert worker_c.allow_request()
+
+
+def test_failed_probe_reopens_for_everyone(storage: Storage) -> None:
+    now = [1_000.0]
+    worker_a, worker_b = _workers(storage, now)
+    for _ in range(3):
+        worker_a.record_failure()
+    now[0] += 12.5
+    assert worker_b.allow_request()
+
+    worker_b.record_failure()
+
+    assert worker_a.state == BREAKER_OPEN
+    assert not worker_a.allow_request()
+
+
+def test_closed_hot_path_uses_cache(storage: Storage) -> None:
+    now = [1_000.0]
+    breaker = SharedCircuitBreaker(storage, refresh_interval_s=5.0, clock=lambda: now[0])
+    other = SharedCircuitBreaker(storage, failure_threshold=1, clock=lambda: now[0])
+
+    assert breaker.allow_request()
+    other.record_failure()
+    assert breaker.allow_request()  # cached "closed" view
+    now[0] += 5.0
+    assert not breaker.allow_request()
+
+
+def test_cached_state_never_reads_storage(
+    storage: Storage, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [1_000.0]
+    worker_a, worker_b = _workers(storage, now)
+    for _ in range(3):
+        worker_b.record_failure()
+
+    def fail(*args: object, **kwargs: object) -> None:
+        raise AssertionError("gauge read touched the database")
+
+    monkeypatch.setattr(storage, "get_circuit_breaker", fail)
+    assert worker_a.cached_state == BREAKER_CLOSED  # last-loaded view
+    assert worker_b.cached_state == BREAKER_OPEN
+    now[0] += 20.0
+    assert worker_b.cached_state == BREAKER_HALF_OPEN
+
+
+def test_transitions_are_counted_once(storage: Storage) -> None:
+    now = [1_000.0]
+    worker_a, worker_b = _workers(storage, now)
+    before = AI_CIRCUIT_TRANSITIONS_TOTAL.value(from_state=BREAKER_CLOSED, to_state=BREAKER_OPEN)
+
+    for _ in range(3):
+        worker_a.record_failure()
+    worker_b.record_failure()
+    assert worker_b.is_open()
+
+    after = AI_CIRCUIT_TRANSITIONS_TOTAL.value(from_state=BREAKER_CLOSED, to_state=BREAKER_OPEN)
+    assert after - before == 1
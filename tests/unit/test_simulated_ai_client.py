@@ -0,0 +1,98 @@
+"""Unit tests for SimulatedAIClient: latency model, tokens, injected failures, quota."""
+
+from __future__ import annotations
+
+import json
+import statistics
+
+import pytest
+
+from app.config import Settings
+from app.core.exceptions import RateLimitExceeded
+from app.services.ai.client import CircuitBreaker, get_ai_client
+from app.services.ai.simulated import SimulatedAIClient
+
+
+def _fast_client(**overrides: object) -> SimulatedAIClient:
+    options: dict = {"latency_median_ms": 1.0, "latency_sigma": 0.0, "seed": 7}
+    options.update(overrides)
+    return SimulatedAIClient(**options)
+
+
+def test_latency_is_lognormal_around_median() -> None:
+    client = SimulatedAIClient(
+        latency_median_ms=800.0, latency_sigma=0.5, tail_probability=0.0, seed=1
+    )
+    samples = [client.sample_latency_s() for _ in range(5000)]
+    assert statistics.median(samples) == pytest.approx(0.8, rel=0.05)
+    assert max(samples) > 2 * statistics.median(samples)
+
+
+def test_tail_multiplier_applied() -> None:
+    client = SimulatedAIClient(
+        latency_median_ms=100.0, latency_sigma=0.0, tail_probability=1.0, tail_multiplier=10.0
+    )
+    assert client.sample_latency_s() == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_tokens_and_cost_derived_from_text_length() -> None:
+    client = _fast_client()
+    short = await client.complete(system="s" * 40, user="purchase order")
+    long = await client.complete(system="s" * 40, user="purchase order " + "x" * 4000)
+
+    assert long.tokens_in - short.tokens_in == 1000
+    assert short.tokens_out > 0
+    assert long.cost_usd > short.cost_usd > 0
+    assert json.loads(short.text)["request_type"] == "purchase_request"
+
+
+@pytest.mark.asyncio
+async def test_injected_rate_limit_raises_after_retries() -> None:
+    client = _fast_client(rate_limit_rate=1.0)
+    with pytest.raises(RateLimitExceeded):
+        await client._raw_complete("", "hello", prompt_version="v1")
+
+
+@pytest.mark.asyncio
+async def test_injected_timeouts_trip_circuit_breaker(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def no_backoff(delay: float) -> None:
+        return None
+
+    monkeypatch.setattr("app.services.ai.client.asyncio.sleep", no_backoff)
+    breaker = CircuitBreaker(failure_threshold=3)
+    client = _fast_client(timeout_rate=1.0, timeout_s=0.0, circuit_breaker=breaker)
+    with pytest.raises(TimeoutError):
+        await client.complete(system="", user="hello")
+    assert breaker.is_open()
+
+
+@pytest.mark.asyncio
+async def test_malformed_response_is_not_valid_json() -> None:
+    client = _fast_client(malformed_rate=1.0)
+    result = await client.complete(system="", user="purchase order")
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(result.text)
+
+
+def test_tokens_per_minute_quota_rejects_and_recovers() -> None:
+    now = [1000.0]
+    client = _fast_client(tokens_per_minute=100, clock=lambda: now[0])
+
+    client._admit(80)
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        client._admit(40)
+    assert exc_info.value.retry_after == pytest.approx(60.0)
+
+    now[0] += 30
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        client._admit(40)
+    assert exc_info.value.retry_after == pytest.approx(30.0)
+
+    now[0] += 30
+    client._admit(40)
+
+
+def test_factory_selects_simulated_provider() -> None:
+    settings = Settings(ai_provider="simulated", sim_latency_median_ms=5.0)
+    assert isinstance(get_ai_client(settings), SimulatedAIClient)
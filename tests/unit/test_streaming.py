@@ -0,0 +1,158 @@
+"""Unit tests for streamed AI responses and the incremental JSON guard."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import ExtractionError
+from app.services.ai.client import (
+    AICallResult,
+    AnthropicClient,
+    CircuitBreaker,
+    DailyCostTracker,
+    MockAIClient,
+)
+from app.services.ai.simulated import SimulatedAIClient
+from app.services.ai.streaming import (
+    ABORT_INVALID_ENUM,
+    ABORT_INVALID_JSON,
+    ABORT_NOT_JSON,
+    ABORT_WRONG_TYPE,
+    JSONStreamGuard,
+)
+from app.services.extraction_service import ExtractionService
+from tests.conftest import make_message
+
+_OBJECT = json.dumps(
+    {
+        "request_type": "purchase_request",
+        "priority": "high",
+        "due_date": None,
+        "company": "Acme {Corp}",
+        "description": 'Two "quoted" laptops \\ [urgent]',
+        "line_items": [{"item": "ThinkPad", "qty": 2}],
+        "extraction_notes": [],
+        "score": 1.5,
+    }
+)
+
+
+def _feed(text: str, chunk_chars: int = 3) -> JSONStreamGuard:
+    guard = JSONStreamGuard()
+    for i in range(0, len(text), chunk_chars):
+        if guard.feed(text[i : i + chunk_chars]):
+            break
+    return guard
+
+
+@pytest.mark.parametrize("chunk_chars", [1, 3, 7, 1000])
+def test_guard_completes_at_closing_brace_for_any_chunking(chunk_chars: int) -> None:
+    guard = _feed(f"```json\n{_OBJECT}\n```\nHope this helps!", chunk_chars)
+
+    assert guard.complete
+    assert guard.text == _OBJECT
+    # Reading stopped within one chunk of the closing brace
+    assert len(guard.raw) < len("```json\n") + len(_OBJECT) + chunk_chars
+
+
+@pytest.mark.parametrize(
+    ("text", "reason"),
+    [
+        ("I'm sorry, I can't help with that.", ABORT_NOT_JSON),
+        ('{"request_type" "purchase_request"}', ABORT_INVALID_JSON),
+        ('{"request_type": "refund", "priority": "high"}', ABORT_INVALID_ENUM),
+        ('{"priority": "low", "line_items": {"item": "x"}}', ABORT_WRONG_TYPE),
+        ('{"description": null}', ABORT_WRONG_TYPE),
+    ],
+)
+def test_guard_aborts_on_malformed_or_off_schema_output(text: str, reason: str) -> None:
+    guard = _feed(text + " " + "x" * 500)
+
+    assert guard.done and not guard.complete
+    assert guard.abort_reason == reason
+    assert len(guard.raw) < len(text) + 5
+
+
+def test_guard_reports_truncated_stream_as_not_done() -> None:
+    guard = _feed(_OBJECT[: len(_OBJECT) // 2])
+
+    assert not guard.done
+    assert guard.abort_reason is None
+    assert guard.text == _OBJECT[: len(_OBJECT) // 2]
+
+
+async def test_simulated_streaming_reports_ttft_and_object_text() -> None:
+    client = SimulatedAIClient(latency_median_ms=20.0, latency_sigma=0.0, streaming=True, seed=1)
+
+    result = await client.complete(system="s", user="purchase order for laptops")
+
+    assert json.loads(result.text)["request_type"] == "purchase_request"
+    assert result.ttft_ms is not None
+    assert 0 < result.ttft_ms < result.latency_ms
+    assert result.stream_abort is None
+
+
+class _FakeStream:
+    def __init__(self, deltas: list[str]) -> None:
+        self.read = 0
+        self.closed = False
+        self.current_message_snapshot = SimpleNamespace(
+            usage=SimpleNamespace(input_tokens=120, output_tokens=1)
+        )
+
+        async def text_stream():
+            for delta in deltas:
+                self.read += 1
+                yield delta
+
+        self.text_stream = text_stream()
+
+    async def __aenter__(self) -> _FakeStream:
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.closed = True
+
+
+async def test_anthropic_streaming_stops_reading_after_abort() -> None:
+    stream = _FakeStream(["Sorry, ", "I cannot ", "do that.", " More prose."])
+    client = AnthropicClient(
+        api_key="test",
+        model="claude-haiku-4-5",
+        cost_tracker=DailyCostTracker(),
+        circuit_breaker=CircuitBreaker(),
+        max_daily_cost_usd=10.0,
+        streaming=True,
+    )
+    client._client = SimpleNamespace(messages=SimpleNamespace(stream=lambda **kwargs: stream))
+
+    result = await client.complete(system="s", user="u")
+
+    assert result.stream_abort == ABORT_NOT_JSON
+    assert stream.read == 1 and stream.closed
+    assert result.tokens_in == 120 and result.tokens_out >= 1
+
+
+class _AbortedClient(MockAIClient):
+    async def complete(self, system: str, user: str, *, prompt_version: str = "") -> AICallResult:
+        return AICallResult(
+            text="Sorry",
+            tokens_in=10,
+            tokens_out=2,
+            cost_usd=0.0,
+            latency_ms=5.0,
+            model="test",
+            prompt_version=prompt_version,
+            ttft_ms=4.0,
+            stream_abort=ABORT_NOT_JSON,
+        )
+
+
+async def test_extraction_fails_fast_on_aborted_stream() -> None:
+    message = make_message()
+
+    with pytest.raises(ExtractionError, match="stream aborted: not_json"):
+        await ExtractionService(ai_client=_AbortedClient()).extract(message)
@@ -0,0 +1,116 @@
+"""Unit tests for the tool-use structured output mode."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import ExtractionError
+from app.services.ai.client import (
+    OUTPUT_MODE_TOOL,
+    TOOL_INPUT_TOKENS,
+    AICallResult,
+    AnthropicClient,
+    CircuitBreaker,
+    DailyCostTracker,
+    MockAIClient,
+)
+from app.services.ai.prompts import EXTRACTION_TOOL, EXTRACTION_TOOL_NAME
+from app.services.ai.simulated import SimulatedAIClient
+from app.services.extraction_service import FAILURE_SCHEMA_MISMATCH, ExtractionService
+from tests.conftest import make_message
+
+_PAYLOAD = {
+    "request_type": "purchase_request",
+    "priority": "high",
+    "description": "Two laptops for engineering.",
+    "line_items": [{"item": "ThinkPad T14s", "qty": 2}],
+}
+
+
+class _ToolClient(MockAIClient):
+    def __init__(self, tool_input: dict) -> None:
+        super().__init__()
+        self._tool_input = tool_input
+
+    async def complete(self, system: str, user: str, *, prompt_version: str = "") -> AICallResult:
+        return AICallResult(
+            text="not parsed in tool mode",
+            tokens_in=10,
+            tokens_out=5,
+            cost_usd=0.0,
+            latency_ms=1.0,
+            model="test",
+            prompt_version=prompt_version,
+            tool_input=self._tool_input,
+        )
+
+
+def test_tool_schema_is_the_extraction_model() -> None:
+    schema = EXTRACTION_TOOL["input_schema"]
+
+    assert EXTRACTION_TOOL["name"] == EXTRACTION_TOOL_NAME
+    assert set(schema["required"]) == {"request_type", "priority", "description"}
+    assert "purchase_request" in schema["properties"]["request_type"]["enum"]
+
+
+async def test_tool_input_is_validated_without_text_parsing() -> None:
+    extraction = await ExtractionService(ai_client=_ToolClient(_PAYLOAD)).extract(make_message())
+
+    assert extraction.request_type == "purchase_request"
+    assert extraction.line_items[0].qty == 2
+
+
+async def test_invalid_tool_input_raises_schema_mismatch() -> None:
+    svc = ExtractionService(ai_client=_ToolClient({**_PAYLOAD, "priority": "whenever"}))
+
+    with pytest.raises(ExtractionError) as excinfo:
+        await svc.extract(make_message())
+    assert excinfo.value.context["failure"] == FAILURE_SCHEMA_MISMATCH
+
+
+async def test_simulated_tool_mode_skips_truncation_and_counts_tool_tokens() -> None:
+    options = {"latency_median_ms": 1.0, "latency_sigma": 0.0, "malformed_rate": 1.0, "seed": 3}
+    text_client = SimulatedAIClient(**options)
+    tool_client = SimulatedAIClient(output_mode=OUTPUT_MODE_TOOL, **options)
+
+    text_result = await text_client.complete(system="s", user="purchase order")
+    tool_result = await tool_client.complete(system="s", user="purchase order")
+
+    assert text_result.tool_input is None
+    assert tool_result.tool_input is not None
+    assert tool_result.tool_input["request_type"] == "purchase_request"
+    assert tool_result.tokens_in - text_result.tokens_in == TOOL_INPUT_TOKENS
+
+
+async def test_anthropic_tool_mode_forces_the_extraction_tool() -> None:
+    calls: list[dict] = []
+
+    async def create(**kwargs: object) -> SimpleNamespace:
+        calls.append(kwargs)
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="tool_use", name=EXTRACTION_TOOL_NAME, input=_PAYLOAD)],
+            usage=SimpleNamespace(input_tokens=900, output_tokens=80),
+        )
+
+    client = AnthropicClient(
+        api_key="test",
+        model="claude-haiku-4-5",
+        cost_tracker=DailyCostTracker(),
+        circuit_breaker=CircuitBreaker(),
+        max_daily_cost_usd=10.0,
+        output_mode=OUTPUT_MODE_TOOL,
+    )
+    client._client = SimpleNamespace(messages=SimpleNamespace(create=create))
+
+    result = await client.complete(system="s", user="u")
+
+    assert calls[0]["tool_choice"] == {"type": "tool", "name": EXTRACTION_TOOL_NAME}
+    assert calls[0]["tools"] == [EXTRACTION_TOOL]
+    assert result.tool_input == _PAYLOAD
+
+
+def test_unknown_output_mode_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        SimulatedAIClient(output_mode="xml")
@@ -0,0 +1,161 @@
+"""Unit tests for span tracing: no-op path, nesting, propagation, exporters."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Generator
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from app.config import Settings
+from app.core import tracing
+from app.core.tracing import (
+    NOOP_SPAN,
+    STATUS_ERROR,
+    InMemorySpanExporter,
+    attach_remote_context,
+    configure_tracing,
+    detach_context,
+    parse_traceparent,
+    start_span,
+    trace_id_from_correlation_id,
+    traced,
+)
+from app.models.email import InboxMessage
+from app.services.ai.client import MockAIClient
+from app.services.extraction_service import ExtractionService
+from app.services.workflow_service import WorkflowService
+from app.storage import Storage
+
+
+@pytest.fixture()
+def exporter() -> Generator[InMemorySpanExporter, None, None]:
+    active = configure_tracing(True, exporter="memory")
+    assert isinstance(active, InMemorySpanExporter)
+    yield active
+    configure_tracing(False)
+
+
+def test_disabled_tracing_yields_noop_span() -> None:
+    configure_tracing(False)
+    with start_span("anything", key="value") as span:
+        assert span is NOOP_SPAN
+    assert attach_remote_context(None, "cid") is None
+
+
+def test_nested_spans_share_trace_and_link_parent(exporter: InMemorySpanExporter) -> None:
+    with start_span("outer") as outer, start_span("inner", step=1) as inner:
+        pass
+
+    spans = {span.name: span for span in exporter.finished_spans()}
+    assert spans["inner"].context.trace_id == outer.context.trace_id
+    assert spans["inner"].parent_span_id == outer.context.span_id
+    assert spans["outer"].parent_span_id is None
+    assert inner.attributes == {"step": 1}
+    assert spans["outer"].end_time_ns >= spans["inner"].end_time_ns
+
+
+def test_exception_marks_span_error(exporter: InMemorySpanExporter) -> None:
+    with pytest.raises(ValueError), start_span("failing"):
+        raise ValueError("boom")
+
+    (span,) = exporter.finished_spans()
+    assert span.status == STATUS_ERROR
+    assert span.attributes["exception.type"] == "ValueError"
+
+
+def test_traced_decorator_records_call(exporter: InMemorySpanExporter) -> None:
+    @traced("storage.fake")
+    def fake(value: int) -> int:
+        return value * 2
+
+    assert fake(21) == 42
+    assert [span.name for span in exporter.finished_spans()] == ["storage.fake"]
+
+
+def test_parse_traceparent_accepts_valid_and_rejects_invalid() -> None:
+    context = parse_traceparent("00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01")
+    assert context is not None
+    assert context.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert context.span_id == "00f067aa0ba902b7"
+    assert parse_traceparent("00-" + "0" * 32 + "-00f067aa0ba902b7-01") is None
+    assert parse_traceparent("not-a-traceparent") is None
+
+
+def test_remote_context_from_traceparent_and_correlation_id(
+    exporter: InMemorySpanExporter,
+) -> None:
+    token = attach_remote_context(
+        "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01", "ignored"
+    )
+    with start_span("child"):
+        pass
+    detach_context(token)
+
+    correlation_id = "5f0c6a8e-2f4b-4c7a-9d3e-1a2b3c4d5e6f"
+    token = attach_remote_context(None, correlation_id)
+    with start_span("root"):
+        pass
+    detach_context(token)
+
+    child, root = exporter.finished_spans()
+    assert child.context.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert child.parent_span_id == "00f067aa0ba902b7"
+    assert root.context.trace_id == correlation_id.replace("-", "")
+    assert root.parent_span_id is None
+    assert len(trace_id_from_correlation_id("not-a-uuid")) == 32
+
+
+def test_jsonl_exporter_writes_one_line_per_span(tmp_path: Path) -> None:
+    path = tmp_path / "traces" / "spans.jsonl"
+    configure_tracing(True, exporter="jsonl", path=str(path))
+    try:
+        with start_span("a"), start_span("b"):
+            pass
+    finally:
+        configure_tracing(False)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["name"] for record in records] == ["b", "a"]
+    assert records[0]["parentSpanId"] == records[1]["spanId"]
+
+
+def test_unknown_exporter_rejected() -> None:
+    with pytest.raises(ValueError):
+        configure_tracing(True, exporter="zipkin")
+    assert not tracing.tracing_enabled()
+
+
+async def test_ingest_produces_single_trace(exporter: InMemorySpanExporter, tmp_path: Path) -> None:
+    settings = Settings(
+        sqlite_path=str(tmp_path / "app.db"),
+        sheets_csv_path=str(tmp_path / "sheet.csv"),
+        airtable_jsonl_path=str(tmp_path / "airtable.jsonl"),
+    )
+    service = WorkflowService(
+        storage=Storage(settings.sqlite_path),
+        settings=settings,
+        extraction_service=ExtractionService(ai_client=MockAIClient()),
+    )
+    message = InboxMessage.model_validate(
+        {
+            "message_id": "trace_msg_1",
+            "from": {"name": "Alice", "email": "alice@example.com"},
+            "subject": "Customer issue - portal error",
+            "received_at": datetime(2026, 1, 23, tzinfo=UTC),
+            "body": "Company: Northwind Traders. Urgent. Billing portal error HTTP 500.",
+        }
+    )
+    exporter.clear()
+
+    await service.ingest(message)
+
+    spans = exporter.finished_spans()
+    names = {span.name for span in spans}
+    assert {"workflow.ingest", "extraction.call_ai", "storage.get_by_message_id"} <= names
+    assert "storage.create_item" in names
+    assert len({span.context.trace_id for span in spans}) == 1
+    root = next(span for span in spans if span.name == "workflow.ingest")
+    assert root.attributes["message_id"] == "trace_msg_1"